@@ -3,22 +3,88 @@ Defines the `create_app` function for initializing the Flask application.
 Reads in the configuration from app/config.py
 
 Functions:
+    load_all_data:                  load all datasets and the default user with progress
     load_charging_stations_data:    load all charging stations to database
+    load_district_data:             load the districts and assign postal codes and stations
     load_postal_code_data:          load all postal codes to database
+    load_snapshot_data:             load both datasets from a binary snapshot
+    start_background_ingestion:     run `load_all_data` on a background thread
     create_app:                     creates and configures the Flask app.
 """
 
 import csv
 import os
+import threading
+from typing import Optional
 
 from app.domain.entities.charging_station import (
     ChargingStation,
     ChargingType,
     OperationStatus,
 )
-from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.dataset_metadata import DatasetMetadata  # noqa
+from app.domain.entities.district import DISTRICT_GEOMETRIES, District  # noqa
+from app.domain.entities.ingestion_checkpoint import IngestionCheckpoint  # noqa
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES, PostalCode
+from app.domain.entities.station_catchment import StationCatchment  # noqa
 from app.domain.entities.templates.base import db
 from app.domain.entities.user import User, UserValidationError
+from app.domain.geometry.caches import STATION_INDEX
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.ingestion_checkpoint_operations import (
+    IngestionCheckpointOperations,
+)
+from app.infrastructure.ingestion.bulk_loader import (
+    bulk_load_charging_stations,
+    bulk_load_postal_codes,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    REASON_POSTAL_CODE_MISSING,
+)
+from app.infrastructure.ingestion.copy_loader import (
+    copy_load_charging_stations,
+    copy_load_postal_codes,
+)
+from app.infrastructure.ingestion.dataset_fingerprint import (
+    dataset_is_unchanged,
+    record_fingerprint,
+)
+from app.infrastructure.ingestion.dataset_snapshot import (
+    SnapshotError,
+    load_dataset_snapshot,
+    open_matching_snapshot,
+)
+from app.infrastructure.ingestion.district_loader import (
+    DISTRICTS_DATASET,
+    assign_postal_code_districts,
+    assign_station_districts,
+    bulk_load_districts,
+)
+from app.infrastructure.ingestion.ingestion_progress import (
+    INGESTION_PROGRESS,
+    PHASE_CHARGING_STATIONS,
+    PHASE_DISTRICTS,
+    PHASE_POSTAL_CODES,
+    PHASE_SNAPSHOT,
+    PHASE_USERS,
+    IngestionProgress,
+    count_data_rows,
+    get_ingestion_progress,
+)
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.parallel_parser import (
+    parallel_load_charging_stations,
+)
+from app.infrastructure.ingestion.shapefile import ShapefileError, is_shapefile
+from app.infrastructure.ingestion.streaming_loader import (
+    CHARGING_STATIONS_DATASET,
+    POSTAL_CODES_DATASET,
+    StaleImportError,
+    stream_load_charging_stations,
+    stream_load_postal_codes,
+)
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
@@ -45,110 +111,444 @@ def init_user(application):
             application.logger.error(f"User validation error: {str(validation_err)}")
 
 
+def _dataset_failed(application, message: str) -> None:
+    """
+    Log the error that stopped loading a dataset.
+
+    A background ingestion also records it as failed phase, so `/ready` and
+    the API answer with 503 instead of serving the incomplete data, while a
+    startup ingestion reports it in the log before any request is served.
+
+    Args:
+        application (Flask): The Flask application instance.
+        message (str): Message of the error.
+    """
+    application.logger.error(message)
+    progress = get_ingestion_progress(application)
+    if progress is not None and application.config.get("BACKGROUND_INGESTION"):
+        progress.fail_phase(message)
+
+
+def _load_charging_stations_file(
+    application, file_path: str
+) -> Optional[IngestionStats]:
+    """
+    Load the charging station CSV file with the configured ingestion mode.
+
+    With `INGESTION_MODE = "streaming"` the file is committed in chunks and
+    can be resumed, `"parallel"` additionally parses the chunks in a process
+    pool, with `"bulk"` the rows are written with batched inserts in one
+    transaction, `"copy"` streams them with PostgreSQL COPY, otherwise every
+    row is added as ChargingStation object.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+
+    Returns:
+        Optional[IngestionStats]: Counters of the run, None for ORM objects.
+    """
+    if application.config.get("INGESTION_MODE") == "parallel":
+        return parallel_load_charging_stations(
+            application,
+            file_path,
+            workers=application.config.get("INGESTION_WORKERS"),
+            shard_bytes=application.config.get("INGESTION_SHARD_BYTES"),
+        )
+    if application.config.get("INGESTION_MODE") == "streaming":
+        return stream_load_charging_stations(
+            application,
+            file_path,
+            chunk_size=application.config.get("INGESTION_BATCH_SIZE"),
+        )
+    if application.config.get("INGESTION_MODE") == "copy":
+        return copy_load_charging_stations(
+            application,
+            file_path,
+            batch_size=application.config.get("INGESTION_BATCH_SIZE"),
+        )
+
+    if application.config.get("INGESTION_MODE") == "bulk":
+        return bulk_load_charging_stations(
+            application,
+            file_path,
+            batch_size=application.config.get("INGESTION_BATCH_SIZE"),
+        )
+
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.DictReader(csvfile, delimiter=";")
+        for row in reader:
+            # Filter only entries where Bundesland is Berlin
+            try:
+                if not PostalCode.number_is_valid(int(row["Postleitzahl"])):
+                    continue
+            except (TypeError, ValueError):
+                continue
+
+            postal_code = PostalCode.query.filter_by(
+                number=int(row["Postleitzahl"])
+            ).first()
+            if not postal_code:
+                application.logger.warning(
+                    f"Postal code {row['Postleitzahl']} not found in the database."
+                )
+                continue
+
+            latitude = float(row["Breitengrad"].replace(",", "."))
+            longitude = float(row["Längengrad"].replace(",", "."))
+            nominal_power = (
+                float(row["Nennleistung Ladeeinrichtung [kW]"].replace(",", "."))
+                if row.get("Nennleistung Ladeeinrichtung [kW]")
+                else None
+            )
+            charging_type = ChargingType.convert(row.get("Art der Ladeeinrichung"))
+            num_charging_points = (
+                int(row["Anzahl Ladepunkte"]) if row.get("Anzahl Ladepunkte") else None
+            )
+
+            charging_station = ChargingStation(
+                functional=OperationStatus.OPERATIONAL,
+                postal_code_id=postal_code.number,
+                street=row["Straße"],
+                house_number=row["Hausnummer"],
+                latitude=latitude,
+                longitude=longitude,
+                operator=row["\ufeffBetreiber"],
+                address_suffix=row["Adresszusatz"],
+                nominal_power=nominal_power,
+                charging_type=charging_type,
+                num_charging_points=num_charging_points,
+            )
+            db.session.add(charging_station)
+        db.session.commit()
+
+
+def _charging_stations_complete(application, stats: Optional[IngestionStats]) -> bool:
+    """
+    Check if a load of the register may be skipped on the next start.
+
+    Without stored stations the checkpoint is deleted as well, so the next
+    start reads the register from the beginning again.
+
+    Args:
+        application (Flask): The Flask application instance.
+        stats (Optional[IngestionStats]): Counters of the load, None for ORM objects.
+
+    Returns:
+        bool: True if stations are stored and no row was rejected for a
+        missing postal code.
+    """
+    with ChargingStationOperations() as repository:
+        stored = repository.has_charging_stations()
+    if not stored:
+        with IngestionCheckpointOperations() as checkpoints:
+            checkpoints.delete_checkpoint(CHARGING_STATIONS_DATASET)
+            db.session.commit()
+        application.logger.warning(
+            "No charging stations stored, the register is loaded again on the "
+            "next start"
+        )
+        return False
+
+    missing = stats.reject_reasons[REASON_POSTAL_CODE_MISSING] if stats else 0
+    if missing:
+        application.logger.warning(
+            f"{missing} charging stations rejected for postal codes missing in "
+            "the database, apply the register with `flask diff-import` once "
+            "they are loaded"
+        )
+        return False
+    return True
+
+
 def load_charging_stations_data(application):
     """
     Load charging station data from the CSV file into the database.
 
+    The file is skipped if it matches the fingerprint stored by the last
+    successful load and `SKIP_UNCHANGED_DATASETS` is set. A load counts as
+    successful once stations are stored and none was rejected for a postal
+    code missing in the database.
+
     Args:
         application (Flask): The Flask application instance.
     """
     file_path = os.path.abspath(application.config.get("CHARGING_STATION_CSV"))
     with application.app_context():
         try:
-            with open(file_path, newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile, delimiter=";")
-                for row in reader:
-                    # Filter only entries where Bundesland is Berlin
-                    try:
-                        if not PostalCode.number_is_valid(int(row["Postleitzahl"])):
-                            continue
-                    except (TypeError, ValueError):
-                        continue
-
-                    postal_code = PostalCode.query.filter_by(
-                        number=int(row["Postleitzahl"])
-                    ).first()
-                    if not postal_code:
-                        application.logger.warning(
-                            f"Postal code {row['Postleitzahl']} not found in the database."
-                        )
-                        continue
-
-                    latitude = float(row["Breitengrad"].replace(",", "."))
-                    longitude = float(row["Längengrad"].replace(",", "."))
-                    nominal_power = (
-                        float(
-                            row["Nennleistung Ladeeinrichtung [kW]"].replace(",", ".")
-                        )
-                        if row.get("Nennleistung Ladeeinrichtung [kW]")
-                        else None
-                    )
-                    charging_type = ChargingType.convert(
-                        row.get("Art der Ladeeinrichung")
-                    )
-                    num_charging_points = (
-                        int(row["Anzahl Ladepunkte"])
-                        if row.get("Anzahl Ladepunkte")
-                        else None
-                    )
-
-                    charging_station = ChargingStation(
-                        functional=OperationStatus.OPERATIONAL,
-                        postal_code_id=postal_code.number,
-                        street=row["Straße"],
-                        house_number=row["Hausnummer"],
-                        latitude=latitude,
-                        longitude=longitude,
-                        operator=row["\ufeffBetreiber"],
-                        address_suffix=row["Adresszusatz"],
-                        nominal_power=nominal_power,
-                        charging_type=charging_type,
-                        num_charging_points=num_charging_points,
-                    )
-                    db.session.add(charging_station)
-                db.session.commit()
+            unchanged, fingerprint = dataset_is_unchanged(
+                CHARGING_STATIONS_DATASET, file_path
+            )
+            if unchanged and application.config.get("SKIP_UNCHANGED_DATASETS"):
+                application.logger.info(f"Charging stations unchanged: {file_path}")
+                return
+
+            stats = _load_charging_stations_file(application, file_path)
+            STATION_INDEX.invalidate()
+            if _charging_stations_complete(application, stats):
+                record_fingerprint(CHARGING_STATIONS_DATASET, fingerprint)
         except FileNotFoundError:
-            application.logger.error(f"CSV file not found at {file_path}")
+            _dataset_failed(application, f"CSV file not found at {file_path}")
         except csv.Error as csv_err:
-            application.logger.error(f"Error processing CSV file: {csv_err}")
+            _dataset_failed(application, f"Error processing CSV file: {csv_err}")
+        except StaleImportError as stale_err:
+            _dataset_failed(application, str(stale_err))
         except SQLAlchemyError as db_err:
-            application.logger.error(f"Database error: {db_err}")
+            db.session.rollback()
+            _dataset_failed(application, f"Database error: {db_err}")
+
+
+def _load_postal_code_file(application, file_path: str):
+    """
+    Load the postal code CSV file with the configured ingestion mode.
+
+    With `INGESTION_MODE = "streaming"` a CSV file is committed in chunks and
+    can be resumed, `"copy"` streams it with PostgreSQL COPY, otherwise the
+    missing postal codes are written with batched inserts in one transaction.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the postal code CSV file or shapefile.
+    """
+    if application.config.get("INGESTION_MODE") == "copy":
+        copy_load_postal_codes(
+            application,
+            file_path,
+            batch_size=application.config.get("INGESTION_BATCH_SIZE"),
+        )
+        return
+
+    streaming = application.config.get("INGESTION_MODE") == "streaming"
+    if streaming and not is_shapefile(file_path):
+        stream_load_postal_codes(
+            application,
+            file_path,
+            chunk_size=application.config.get("INGESTION_BATCH_SIZE"),
+        )
+        return
+
+    bulk_load_postal_codes(
+        application,
+        file_path,
+        batch_size=application.config.get("INGESTION_BATCH_SIZE"),
+    )
+
+
+def _geodata_path(application, dataset: str) -> str:
+    """
+    Path of the CSV file or shapefile of a geodata set, as set by `GEODATA_SOURCE`.
+
+    Args:
+        application (Flask): The Flask application instance.
+        dataset (str): Config key prefix of the dataset, e.g. "POSTAL_CODE".
+    """
+    if application.config.get("GEODATA_SOURCE") == "shapefile":
+        return os.path.abspath(application.config.get(f"{dataset}_SHAPEFILE"))
+    return os.path.abspath(application.config.get(f"{dataset}_CSV"))
 
 
 def load_postal_code_data(application):
     """
-    Load postal codes and their polygons into the database from a CSV file.
+    Load postal codes and their polygons into the database from the CSV file,
+    or from the shapefile if `GEODATA_SOURCE` is "shapefile".
+
+    The file is skipped if it matches the fingerprint stored by the last
+    successful load and `SKIP_UNCHANGED_DATASETS` is set.
 
     Args:
         application (Flask): The Flask application instance.
     """
-    file_path = os.path.abspath(application.config.get("POSTAL_CODE_CSV"))
+    file_path = _geodata_path(application, "POSTAL_CODE")
     with application.app_context():
         try:
-            with open(file_path, newline="", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile, delimiter=";")
-                next(reader, None)  # Skip the header row
-                for row in reader:
-                    try:
-                        number = int(row[0])
-                        polygon = row[1]
-                        if not PostalCode.query.filter_by(number=number).first():
-                            postal_code = PostalCode(number=number, polygon=polygon)
-                            db.session.add(postal_code)
-                    except ValueError as ve:
-                        application.logger.error(f"Data format error in CSV file: {ve}")
-                db.session.commit()
+            unchanged, fingerprint = dataset_is_unchanged(
+                POSTAL_CODES_DATASET, file_path
+            )
+            if unchanged and application.config.get("SKIP_UNCHANGED_DATASETS"):
+                application.logger.info(f"Postal codes unchanged: {file_path}")
+                return
+
+            _load_postal_code_file(application, file_path)
+            POSTAL_CODE_GEOMETRIES.clear()
+            record_fingerprint(POSTAL_CODES_DATASET, fingerprint)
         except FileNotFoundError as fnfe:
-            application.logger.error(f"CSV file not found: {file_path}, Error: {fnfe}")
+            _dataset_failed(
+                application, f"CSV file not found: {file_path}, Error: {fnfe}"
+            )
         except IOError as ioe:
-            application.logger.error(
-                f"Error reading the file: {file_path}, Error: {ioe}"
+            _dataset_failed(
+                application, f"Error reading the file: {file_path}, Error: {ioe}"
+            )
+        except SQLAlchemyError as sqle:
+            db.session.rollback()  # Rollback the transaction to maintain database integrity
+            _dataset_failed(
+                application, f"Database error during postal code loading: {sqle}"
+            )
+        except ShapefileError as shape_err:
+            _dataset_failed(
+                application, f"Invalid shapefile: {file_path}, Error: {shape_err}"
+            )
+
+
+def load_district_data(application):
+    """
+    Load the districts into the database from the CSV file or shapefile set by
+    `GEODATA_SOURCE` and assign every postal code and charging station without
+    district to its district.
+
+    The districts file is skipped if it matches the fingerprint stored by the
+    last successful load and `SKIP_UNCHANGED_DATASETS` is set, the assignment
+    only touches rows without district.
+
+    Args:
+        application (Flask): The Flask application instance.
+    """
+    file_path = _geodata_path(application, "DISTRICT")
+    with application.app_context():
+        try:
+            unchanged, fingerprint = dataset_is_unchanged(DISTRICTS_DATASET, file_path)
+            if unchanged and application.config.get("SKIP_UNCHANGED_DATASETS"):
+                application.logger.info(f"Districts unchanged: {file_path}")
+            else:
+                bulk_load_districts(application, file_path)
+                DISTRICT_GEOMETRIES.clear()
+                record_fingerprint(DISTRICTS_DATASET, fingerprint)
+
+            assign_postal_code_districts(application)
+            assign_station_districts(application)
+        except FileNotFoundError as fnfe:
+            _dataset_failed(
+                application, f"CSV file not found: {file_path}, Error: {fnfe}"
+            )
+        except IOError as ioe:
+            _dataset_failed(
+                application, f"Error reading the file: {file_path}, Error: {ioe}"
             )
         except SQLAlchemyError as sqle:
             db.session.rollback()  # Rollback the transaction to maintain database integrity
+            _dataset_failed(
+                application, f"Database error during district loading: {sqle}"
+            )
+        except ShapefileError as shape_err:
+            _dataset_failed(
+                application, f"Invalid shapefile: {file_path}, Error: {shape_err}"
+            )
+
+
+def load_snapshot_data(application) -> bool:
+    """
+    Load postal codes and charging stations from the binary snapshot.
+
+    The snapshot is only used for an empty database and if it was built
+    from the configured source files. It is unmapped once its rows and
+    postal code geometries are loaded.
+
+    Args:
+        application (Flask): The Flask application instance.
+
+    Returns:
+        bool: True if the datasets were loaded from the snapshot.
+    """
+    snapshot_path = application.config.get("DATASET_SNAPSHOT")
+    if not snapshot_path or not os.path.exists(snapshot_path):
+        return False
+
+    with application.app_context():
+        try:
+            if PostalCode.query.first() or ChargingStation.query.first():
+                return False
+
+            snapshot = open_matching_snapshot(
+                snapshot_path,
+                {
+                    POSTAL_CODES_DATASET: application.config.get("POSTAL_CODE_CSV"),
+                    CHARGING_STATIONS_DATASET: application.config.get(
+                        "CHARGING_STATION_CSV"
+                    ),
+                },
+            )
+            if not snapshot:
+                application.logger.info(f"Snapshot outdated: {snapshot_path}")
+                return False
+
+            try:
+                counts = load_dataset_snapshot(snapshot)
+            finally:
+                snapshot.close()
+            for dataset, fingerprint in snapshot.sources.items():
+                record_fingerprint(dataset, fingerprint)
+            application.logger.info(f"Loaded snapshot {snapshot_path}: {counts}")
+            return True
+        except FileNotFoundError as fnfe:
+            application.logger.error(f"Source file of the snapshot not found: {fnfe}")
+        except SnapshotError as snapshot_err:
+            application.logger.warning(f"Snapshot not usable: {snapshot_err}")
+        except SQLAlchemyError as db_err:
+            db.session.rollback()
             application.logger.error(
-                f"Database error during postal code loading: {sqle}"
+                f"Database error during snapshot loading: {db_err}"
             )
+    return False
+
+
+def load_all_data(application):
+    """
+    Load all datasets and the default user, in the order of their dependencies.
+
+    Every step is reported as phase of the ingestion progress in
+    `application.extensions["ingestion_progress"]`, which is finished when
+    all data is usable or when a step raised an unexpected error.
+
+    Args:
+        application (Flask): The Flask application instance.
+    """
+    progress = get_ingestion_progress(application)
+    try:
+        postal_code_rows = count_data_rows(_geodata_path(application, "POSTAL_CODE"))
+        station_rows = count_data_rows(
+            os.path.abspath(application.config.get("CHARGING_STATION_CSV"))
+        )
+        district_rows = count_data_rows(_geodata_path(application, "DISTRICT"))
+        progress.plan(postal_code_rows + station_rows + district_rows)
+
+        progress.start_phase(PHASE_SNAPSHOT)
+        if not load_snapshot_data(application):
+            progress.start_phase(PHASE_POSTAL_CODES, postal_code_rows)
+            load_postal_code_data(application)
+            progress.start_phase(PHASE_CHARGING_STATIONS, station_rows)
+            load_charging_stations_data(application)
+        progress.start_phase(PHASE_DISTRICTS, district_rows)
+        load_district_data(application)
+        progress.start_phase(PHASE_USERS)
+        init_user(application)
+    except Exception as err:
+        progress.finish(error=f"{type(err).__name__}: {err}")
+        raise
+    progress.finish()
+
+
+def start_background_ingestion(application) -> threading.Thread:
+    """
+    Run `load_all_data` on a daemon thread, so the application answers
+    requests while the data is loading. The readiness endpoint reports the
+    progress and the API answers with 503 until the ingestion is finished.
+
+    Args:
+        application (Flask): The Flask application instance.
+
+    Returns:
+        threading.Thread: The started ingestion thread.
+    """
+
+    def ingest():
+        try:
+            load_all_data(application)
+        except Exception:  # The thread has no caller to raise to
+            application.logger.exception("Background ingestion failed")
+
+    worker = threading.Thread(target=ingest, name="ingestion", daemon=True)
+    worker.start()
+    return worker
 
 
 def create_app(config_class="config.Config"):
@@ -174,14 +574,24 @@ def create_app(config_class="config.Config"):
         db.create_all()
         inspector = inspect(db.engine)
         application.logger.debug(f"Existing tables: {inspector.get_table_names()}")
-    if application.config.get("INIT_DATA"):
-        load_postal_code_data(application)
-        load_charging_stations_data(application)
-        init_user(application)
+    # The station index is process-wide, but built from the database of one app
+    STATION_INDEX.invalidate()
+
+    progress = IngestionProgress()
+    application.extensions[INGESTION_PROGRESS] = progress
+    background = application.config.get("BACKGROUND_INGESTION")
+    if not application.config.get("INIT_DATA"):
+        progress.finish()
+    elif not background:
+        load_all_data(application)
 
     # Register Blueprints
+    from app.commands import register_commands
     from app.events.charging_station_events import charging_stations
-    from app.events.test_connection_event import home
+    from app.events.district_events import districts
+    from app.events.map_tile_events import map_tiles
+    from app.events.postal_code_events import postal_codes
+    from app.events.test_connection_event import home, require_ready
     from app.events.user_events import login_user, register_user
 
     # Register the blueprint
@@ -189,10 +599,19 @@ def create_app(config_class="config.Config"):
     application.register_blueprint(
         charging_stations, url_prefix="/api/charging_stations"
     )
+    application.register_blueprint(postal_codes, url_prefix="/api/postal_codes")
+    application.register_blueprint(districts, url_prefix="/api/districts")
+    application.register_blueprint(map_tiles, url_prefix="/api/tiles")
     application.register_blueprint(register_user, url_prefix="/api/register_user")
     application.register_blueprint(login_user, url_prefix="/api/login_user")
 
+    application.before_request(require_ready)
+    register_commands(application)
+
     for rule in application.url_map.iter_rules():
         print(f"{rule.endpoint}: {rule}")
 
+    if application.config.get("INIT_DATA") and background:
+        start_background_ingestion(application)
+
     return application
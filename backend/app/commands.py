@@ -0,0 +1,188 @@
+"""Command line interface module.
+Defines maintenance commands of the Flask CLI, e.g.
+`flask --app "app:create_app('app.config.Config')" diff-import <file>`.
+
+Functions:
+    register_commands:  register all commands on the Flask app
+"""
+
+import time
+
+import click
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES
+from app.domain.services.charging_staion_services.catchment_service import (
+    store_station_catchments,
+)
+from app.domain.services.postal_code_services.postal_code_topology_service import (
+    get_postal_code_topology_service,
+)
+from app.infrastructure.database_operations.district_operations import (
+    DistrictOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.dataset_snapshot import build_dataset_snapshot
+from app.infrastructure.ingestion.diff_import import diff_import_charging_stations
+from app.infrastructure.ingestion.ingestion_progress import get_ingestion_progress
+from app.infrastructure.ingestion.postal_code_reconciliation import (
+    reconcile_station_postal_codes,
+)
+from flask import Flask
+
+
+def register_commands(application: Flask) -> None:
+    """
+    Register the maintenance commands on the Flask application.
+
+    Args:
+        application (Flask): The Flask application instance.
+    """
+
+    @application.cli.command("diff-import")
+    @click.argument("file_path", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Rows per statement (default: INGESTION_BATCH_SIZE).",
+    )
+    @click.option("--dry-run", is_flag=True, help="Only report the changes.")
+    def diff_import_command(file_path, batch_size, dry_run):
+        """Apply a new charging station register release to the database."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()  # Let a background ingestion finish first
+        diff = diff_import_charging_stations(
+            application,
+            file_path,
+            batch_size=batch_size or application.config["INGESTION_BATCH_SIZE"],
+            dry_run=dry_run,
+        )
+        click.echo(f"{'Would apply' if dry_run else 'Applied'}: {diff}")
+
+    @application.cli.command("build-snapshot")
+    @click.option(
+        "--output",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Snapshot file (default: DATASET_SNAPSHOT).",
+    )
+    def build_snapshot_command(output):
+        """Write the binary snapshot of the postal codes and charging stations."""
+        output = output or application.config["DATASET_SNAPSHOT"]
+        counts = build_dataset_snapshot(
+            application.config["POSTAL_CODE_CSV"],
+            application.config["CHARGING_STATION_CSV"],
+            output,
+        )
+        click.echo(f"Wrote {output}: {counts}")
+
+    @application.cli.command("geometry-cache")
+    def geometry_cache_command():
+        """Parse all postal code polygons and report the memory of the geometry store."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()
+        with PostalCodeOperations() as repository:
+            repository.get_postal_code_geometries()
+        info = POSTAL_CODE_GEOMETRIES.info()
+        click.echo(
+            f"{info['entries']} {info['name']} with {info['vertices']} vertices: "
+            f"{info['geometry_bytes'] / 1024:.1f} KiB geometry, "
+            f"{info['text_bytes'] / 1024:.1f} KiB WKT keys "
+            f"({info['hits']} hits, {info['misses']} misses)"
+        )
+
+    @application.cli.command("polygon-levels")
+    def polygon_levels_command():
+        """Simplify the postal codes and districts and report the payload per zoom level."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()
+        with PostalCodeOperations() as postal_codes, DistrictOperations() as districts:
+            datasets = {
+                "postal codes": postal_codes.get_simplified_postal_codes(),
+                "districts": districts.get_simplified_districts(),
+            }
+        for name, simplified in datasets.items():
+            for level in simplified.levels:
+                zoom = "full" if level["zoom"] is None else f"zoom {level['zoom']}"
+                click.echo(
+                    f"{name} {zoom}: {level['vertices']} vertices, "
+                    f"{level['wkt_bytes'] / 1024:.1f} KiB WKT"
+                )
+
+    @application.cli.command("polygon-topology")
+    def polygon_topology_command():
+        """Build the postal code topology and compare its size with the polygons."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()
+        with PostalCodeOperations() as repository:
+            repository.get_postal_code_geometries()
+            topology = repository.get_postal_code_topology()
+        topojson = get_postal_code_topology_service()
+        info = POSTAL_CODE_GEOMETRIES.info()
+        click.echo(
+            f"polygons: {info['vertices']} vertices, "
+            f"{info['geometry_bytes'] / 1024:.1f} KiB geometry, "
+            f"{info['text_bytes'] / 1024:.1f} KiB WKT"
+        )
+        click.echo(
+            f"topology: {len(topology.arcs)} arcs, {topology.vertex_count} vertices, "
+            f"{topology.nbytes / 1024:.1f} KiB arcs, "
+            f"{len(topojson) / 1024:.1f} KiB TopoJSON"
+        )
+
+    @application.cli.command("catchments")
+    @click.option(
+        "--show", type=int, default=10, help="Number of largest catchments to list."
+    )
+    def catchments_command(show):
+        """Compute and store the Voronoi catchments of the stations in service."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()
+        started = time.perf_counter()
+        catchments = store_station_catchments()
+        elapsed = time.perf_counter() - started
+        catchments.sort(key=lambda catchment: catchment["area"], reverse=True)
+        for catchment in catchments[:show]:
+            click.echo(
+                f"Stations {', '.join(map(str, catchment['station_ids']))}: "
+                f"{catchment['area'] / 1e6:.2f} km²"
+            )
+        total = sum(catchment["area"] for catchment in catchments)
+        click.echo(
+            f"{len(catchments)} catchments covering {total / 1e6:.1f} km² "
+            f"computed and stored in {elapsed:.2f} s"
+        )
+
+    @application.cli.command("reconcile-postal-codes")
+    @click.option(
+        "--fix", is_flag=True, help="Set the located postal code on mismatches."
+    )
+    @click.option(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Stations per statement (default: INGESTION_BATCH_SIZE).",
+    )
+    @click.option("--show", type=int, default=20, help="Number of mismatches to list.")
+    def reconcile_postal_codes_command(fix, batch_size, show):
+        """Compare the postal codes of the stations with the postal code polygons."""
+        progress = get_ingestion_progress(application)
+        if progress is not None:
+            progress.wait()
+        result = reconcile_station_postal_codes(
+            application,
+            fix=fix,
+            batch_size=batch_size or application.config["INGESTION_BATCH_SIZE"],
+        )
+        for mismatch in result.mismatches[:show]:
+            click.echo(
+                f"Station {mismatch['station_id']}: {mismatch['postal_code']} "
+                f"-> {mismatch['located_postal_code']}"
+            )
+        click.echo(f"Reconciled: {result}")
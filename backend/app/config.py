@@ -12,12 +12,29 @@ Classes:
     - (Optional) ProductionConfig: Configuration for production deployment.
 
 Attributes:
+    - BACKGROUND_INGESTION (bool): Load the datasets on a background thread after startup,
+      `/ready` and the API answer with 503 and the progress until they are loaded, or with the
+      error if a dataset could not be loaded.
     - DEBUG (bool): Enables or disables debug mode.
     - CHARGING_STATION_CSV (str): Path to the `Ladesaeulenregister.csv` file.
+    - DISTRICT_CSV (str): Path to the `geodata_berlin_dis.csv` file with the district boundaries.
+    - DISTRICT_SHAPEFILE (str): Path to the `bezirksgrenzen.shp` file with the district boundaries.
+    - DATASET_SNAPSHOT (str): Path of the binary snapshot written by `flask build-snapshot`,
+      loaded instead of the CSV files into an empty database while it matches them.
+    - GEODATA_SOURCE (str): "csv" to load postal codes and districts from the CSV files,
+      "shapefile" to read the bundled shapefiles instead (batched inserts or COPY, never streaming).
+    - INGESTION_BATCH_SIZE (int): Number of rows per batched insert or committed chunk during data loading.
+    - INGESTION_MODE (str): "streaming" for chunked commits with resume, "parallel" for streaming
+      with a multi-core parse stage, "bulk" for batched inserts in one transaction, "copy" for
+      PostgreSQL COPY (batched inserts on other databases), "orm" to add every row as ORM object.
+    - INGESTION_SHARD_BYTES (int): Size of the byte ranges parsed per worker in "parallel" mode.
+    - INGESTION_WORKERS (int): Number of parser processes in "parallel" mode, None uses all cores.
     - INIT_DATA (bool): Flag to determine if initial data should be loaded into the database.
     - JWT_SECRET_KEY (str): Secret key for JWT-based session management.
     - POSTAL_CODE_CSV (str): Path to the `geodata_berlin_plz.csv` file.
+    - POSTAL_CODE_SHAPEFILE (str): Path to the `berlin_postleitzahlen.shp` file.
     - SERVER_PORT (int): The port on which the server listens for requests.
+    - SKIP_UNCHANGED_DATASETS (bool): Skip loading a source file whose fingerprint matches the last load.
     - SQLALCHEMY_DATABASE_URI (str): Database URI for the application.
     - SQLALCHEMY_TRACK_MODIFICATIONS (bool): Disables SQLAlchemy event system to improve performance.
     - TESTING (bool): Indicates if the application is running in a testing environment.
@@ -41,17 +58,39 @@ class Config:
     Base configuration class.
     """
 
+    BACKGROUND_INGESTION = True
     DEBUG = False
     CHARGING_STATION_CSV = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "data/Ladesaeulenregister.csv"
     )
+    DATASET_SNAPSHOT = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "data/datasets/datasets.snapshot"
+    )
+    DISTRICT_CSV = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "data/datasets/geodata_berlin_dis.csv",
+    )
+    DISTRICT_SHAPEFILE = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "data/datasets/berlin_bezirke/bezirksgrenzen.shp",
+    )
+    GEODATA_SOURCE = "csv"
+    INGESTION_BATCH_SIZE = 5000
+    INGESTION_MODE = "streaming"
+    INGESTION_SHARD_BYTES = 4 * 1024 * 1024
+    INGESTION_WORKERS = None
     INIT_DATA = True
     JWT_SECRET_KEY = "super_secret_key"
     POSTAL_CODE_CSV = os.path.join(
         os.path.dirname(os.path.dirname(__file__)),
         "data/datasets/geodata_berlin_plz.csv",
     )
+    POSTAL_CODE_SHAPEFILE = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "data/datasets/berlin_postleitzahlen/berlin_postleitzahlen.shp",
+    )
     SERVER_PORT = 5000
+    SKIP_UNCHANGED_DATASETS = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"  # Default to in-memory database
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     TESTING = False
@@ -67,6 +106,8 @@ class DevelopmentConfig(Config):
     SQLALCHEMY_DATABASE_URI = (
         "postgresql+psycopg2://postgres:postgres@db:5432/chargeHub"
     )
+    INGESTION_BATCH_SIZE = 50000
+    INGESTION_MODE = "copy"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 
@@ -75,6 +116,7 @@ class TestingConfig(Config):
     Testing-specific configurations.
     """
 
+    BACKGROUND_INGESTION = False
     TESTING = True
 
 
@@ -58,6 +58,7 @@ class ChargingStation(BaseModel):
         nominal_power (int): Nominal power of the charging station (in kW).
         charging_type (ChargingType): Type of the charging station (e.g., fast, normal).
         num_charging_points (int): Number of charging points at the station.
+        district_id (int): Foreign key to the District containing the station.
     """
 
     __tablename__ = "charging_stations"
@@ -78,6 +79,9 @@ class ChargingStation(BaseModel):
     nominal_power = db.Column(Integer, nullable=True)
     charging_type = db.Column(SQLAlchemyEnum(ChargingType), nullable=True)
     num_charging_points = db.Column(Integer, nullable=True)
+    district_id = db.Column(
+        Integer, ForeignKey("districts.id"), nullable=True, index=True
+    )
 
     def __init__(
         self,
@@ -0,0 +1,39 @@
+"""Dataset metadata entity module.
+Stores the fingerprint of every source file loaded into the database.
+
+Classes:
+    DatasetMetadata: Database model for the fingerprint of a loaded dataset.
+"""
+
+from app.domain.entities.templates.base import BaseModel, db
+from sqlalchemy import BigInteger, Float, String
+
+
+class DatasetMetadata(BaseModel):
+    """
+    Model for DatasetMetadata.
+
+    Attributes:
+        dataset (str): Name of the dataset, e.g. "postal_codes".
+        source_path (str): Path of the file the dataset was loaded from.
+        size (int): File size in bytes.
+        mtime (float): Modification time of the file.
+        content_hash (str): SHA-256 of the file content.
+    """
+
+    __tablename__ = "dataset_metadata"
+
+    dataset = db.Column(String(64), nullable=False, unique=True)
+    source_path = db.Column(String(1024), nullable=False)
+    size = db.Column(BigInteger, nullable=False)
+    mtime = db.Column(Float, nullable=False)
+    content_hash = db.Column(String(64), nullable=False)
+
+    def __init__(
+        self, dataset: str, source_path: str, size: int, mtime: float, content_hash: str
+    ):
+        self.dataset = dataset
+        self.source_path = source_path
+        self.size = size
+        self.mtime = mtime
+        self.content_hash = content_hash
@@ -0,0 +1,76 @@
+"""District entity module.
+Defines the Berlin districts (Bezirke) and their boundaries.
+
+Classes:
+    DistrictValidationError: Custom exception for district validation errors.
+    District: Database model for districts.
+
+Attributes:
+    DISTRICT_GEOMETRIES: Process-wide store of the parsed district boundaries.
+"""
+
+from app.domain.entities.templates.base import BaseModel, db
+from app.domain.entities.templates.geometry import PolygonGeometryMixin
+from app.domain.geometry.geometry_store import GeometryStore, PolygonGeometry
+from app.domain.geometry.wkt import WktError
+from sqlalchemy import String, Text
+
+
+class DistrictValidationError(Exception):
+    """
+    Custom exception for district validation errors.
+    """
+
+    pass
+
+
+DISTRICT_GEOMETRIES = GeometryStore("districts")
+
+
+class District(PolygonGeometryMixin, BaseModel):
+    """
+    Model for District.
+
+    Attributes:
+        name (str): Name of the district, e.g. "Mitte".
+        polygon (str): The boundary as WKT POLYGON or MULTIPOLYGON.
+        Geometry columns (bounding box, centroid, area, vertex count) come
+        from PolygonGeometryMixin.
+    """
+
+    __tablename__ = "districts"
+
+    name = db.Column(String(100), nullable=False, unique=True)
+    polygon = db.Column(Text, nullable=False)
+
+    def __init__(self, name: str, polygon: str):
+        if not self.name_is_valid(name):
+            raise DistrictValidationError("District name must be a non-empty string.")
+        self.name = name
+        try:
+            self.set_geometry(polygon)
+        except WktError as wkt_err:
+            raise DistrictValidationError(f"Invalid district boundary: {wkt_err}")
+
+    @property
+    def geometry(self) -> PolygonGeometry:
+        """
+        The parsed boundary, memoized per process by district name.
+
+        Returns:
+            PolygonGeometry: Rings as `array("d")` with bounding box.
+        """
+        return DISTRICT_GEOMETRIES.get(self.name, self.polygon)
+
+    @staticmethod
+    def name_is_valid(name: str) -> bool:
+        """
+        Validate the district name.
+
+        Args:
+            name (str): The district name.
+
+        Returns:
+            bool: True if valid, False otherwise.
+        """
+        return isinstance(name, str) and bool(name.strip())
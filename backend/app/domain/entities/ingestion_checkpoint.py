@@ -0,0 +1,44 @@
+"""Ingestion checkpoint entity module.
+Stores how far the import of a source dataset has progressed.
+
+Classes:
+    IngestionCheckpoint: Database model for the progress of a streaming import.
+"""
+
+from app.domain.entities.templates.base import BaseModel, db
+from sqlalchemy import BigInteger, Boolean, Integer, String
+
+
+class IngestionCheckpoint(BaseModel):
+    """
+    Model for IngestionCheckpoint.
+
+    Attributes:
+        dataset (str): Name of the imported dataset, e.g. "charging_stations".
+        dataset_hash (str): SHA-256 of the source file the checkpoint belongs to.
+        byte_offset (int): File offset behind the last committed row.
+        rows_committed (int): Number of rows read up to the byte offset.
+        completed (bool): True once the whole file was imported.
+    """
+
+    __tablename__ = "ingestion_checkpoints"
+
+    dataset = db.Column(String(64), nullable=False, unique=True)
+    dataset_hash = db.Column(String(64), nullable=False)
+    byte_offset = db.Column(BigInteger, nullable=False, default=0)
+    rows_committed = db.Column(Integer, nullable=False, default=0)
+    completed = db.Column(Boolean, nullable=False, default=False)
+
+    def __init__(
+        self,
+        dataset: str,
+        dataset_hash: str,
+        byte_offset: int = 0,
+        rows_committed: int = 0,
+        completed: bool = False,
+    ):
+        self.dataset = dataset
+        self.dataset_hash = dataset_hash
+        self.byte_offset = byte_offset
+        self.rows_committed = rows_committed
+        self.completed = completed
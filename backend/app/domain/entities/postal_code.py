@@ -4,12 +4,17 @@ Defines how a postal code is defined.
 Classes:
     PostalCodeValidationError: Custom exception for postal code validation errors.
     PostalCode: Database model for postal codes.
+
+Attributes:
+    POSTAL_CODE_GEOMETRIES: Process-wide store of the parsed postal code polygons.
 """
 
 import re
 
 from app.domain.entities.templates.base import BaseModel, db
-from sqlalchemy import Integer, Text
+from app.domain.entities.templates.geometry import PolygonGeometryMixin
+from app.domain.geometry.geometry_store import GeometryStore, PolygonGeometry
+from sqlalchemy import ForeignKey, Integer, Text
 
 
 class PostalCodeValidationError(Exception):
@@ -24,20 +29,28 @@ RE_POLYGON_VALIDATION_REGEX = (
     r"^POLYGON \(\((\d+\.\d+\s\d+\.\d+,\s)*\d+\.\d+\s\d+\.\d+\)\)$"
 )
 
+POSTAL_CODE_GEOMETRIES = GeometryStore("postal codes")
+
 
-class PostalCode(BaseModel):
+class PostalCode(PolygonGeometryMixin, BaseModel):
     """
     Model for PostalCode.
 
     Attributes:
         number (int): The postal code number.
         polygon (str): The polygon data as WKT (Well-Known Text).
+        district_id (int): Foreign key to the District with the largest overlap.
+        Geometry columns (bounding box, centroid, area, vertex count) come
+        from PolygonGeometryMixin.
     """
 
     __tablename__ = "postal_codes"
 
     number = db.Column(Integer, nullable=False, unique=True)
     polygon = db.Column(Text, nullable=False)
+    district_id = db.Column(
+        Integer, ForeignKey("districts.id"), nullable=True, index=True
+    )
 
     def __init__(self, number: int, polygon: str):
         if not self.number_is_valid(number):
@@ -49,7 +62,17 @@ class PostalCode(BaseModel):
                 "Polygon must be a valid WKT format: 'Polygon ((x1 y1, x2 y2, ...))'."
             )
         self.number = number
-        self.polygon = polygon
+        self.set_geometry(polygon)
+
+    @property
+    def geometry(self) -> PolygonGeometry:
+        """
+        The parsed polygon, memoized per process by postal code number.
+
+        Returns:
+            PolygonGeometry: Rings as `array("d")` with bounding box.
+        """
+        return POSTAL_CODE_GEOMETRIES.get(self.number, self.polygon)
 
     @staticmethod
     def number_is_valid(number: int) -> bool:
@@ -0,0 +1,36 @@
+"""Station catchment entity module.
+Stores the catchments computed by `flask catchments`, so the web workers
+serve them instead of computing the Voronoi cells again.
+
+Classes:
+    StationCatchment: Database model for the catchment of a station location.
+"""
+
+from app.domain.entities.templates.base import BaseModel, db
+from sqlalchemy import Float, String, Text
+
+
+class StationCatchment(BaseModel):
+    """
+    Model for StationCatchment.
+
+    Attributes:
+        fingerprint (str): SHA-256 of the stations and outline the catchment
+            was computed for.
+        station_ids (str): Comma-separated ids of the stations at the location.
+        area (float): Area of the catchment in square meters.
+        polygon (str): The catchment as WKT, None outside the city outline.
+    """
+
+    __tablename__ = "station_catchments"
+
+    fingerprint = db.Column(String(64), nullable=False, index=True)
+    station_ids = db.Column(Text, nullable=False)
+    area = db.Column(Float, nullable=False)
+    polygon = db.Column(Text, nullable=True)
+
+    def __init__(self, fingerprint: str, station_ids: str, area: float, polygon: str):
+        self.fingerprint = fingerprint
+        self.station_ids = station_ids
+        self.area = area
+        self.polygon = polygon
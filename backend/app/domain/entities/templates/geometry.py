@@ -0,0 +1,68 @@
+"""
+Geometry module for polygon entities.
+Defines the columns derived from a WKT polygon, shared by all tables that
+store one.
+
+Classes:
+    PolygonGeometryMixin: Bounding box, centroid, area and vertex count columns.
+"""
+
+from app.domain.entities.templates.base import db
+from app.domain.geometry.polygon import polygon_metrics
+from app.domain.geometry.wkt import parse_wkt_polygons
+from sqlalchemy import Float, Integer
+
+
+class PolygonGeometryMixin:
+    """
+    Mixin with the geometry columns derived from a WKT polygon.
+
+    Attributes:
+        min_longitude (float): West edge of the polygon's bounding box.
+        min_latitude (float): South edge of the polygon's bounding box.
+        max_longitude (float): East edge of the polygon's bounding box.
+        max_latitude (float): North edge of the polygon's bounding box.
+        centroid_longitude (float): Longitude of the polygon's centroid.
+        centroid_latitude (float): Latitude of the polygon's centroid.
+        area (float): Area of the polygon in square meters.
+        vertex_count (int): Number of points of the polygon.
+    """
+
+    min_longitude = db.Column(Float, nullable=False)
+    min_latitude = db.Column(Float, nullable=False)
+    max_longitude = db.Column(Float, nullable=False)
+    max_latitude = db.Column(Float, nullable=False)
+    centroid_longitude = db.Column(Float, nullable=False)
+    centroid_latitude = db.Column(Float, nullable=False)
+    area = db.Column(Float, nullable=False)
+    vertex_count = db.Column(Integer, nullable=False)
+
+    @staticmethod
+    def geometry_columns(polygon: str) -> dict:
+        """
+        Parse a valid polygon once into the derived geometry columns.
+
+        Args:
+            polygon (str): The polygon or multipolygon as WKT.
+
+        Returns:
+            dict: Bounding box, centroid, area and vertex count keyed by column name.
+
+        Raises:
+            WktError: If the polygon cannot be parsed.
+        """
+        return polygon_metrics(parse_wkt_polygons(polygon)).as_columns()
+
+    def set_geometry(self, polygon: str) -> None:
+        """
+        Store a polygon together with its derived geometry columns.
+
+        Args:
+            polygon (str): The polygon or multipolygon as WKT.
+
+        Raises:
+            WktError: If the polygon cannot be parsed.
+        """
+        self.polygon = polygon
+        for column, value in self.geometry_columns(polygon).items():
+            setattr(self, column, value)
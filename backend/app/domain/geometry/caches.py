@@ -0,0 +1,24 @@
+"""Caches module.
+Process-wide caches of the charging stations, shared by the repositories
+that change the stations and the services that serve them.
+
+Attributes:
+    STATION_INDEX:      index of the stored charging stations for viewport queries
+    MAP_TILES:          map tiles of the stations and postal codes
+    STATION_FEATURES:   GeoJSON of all charging stations for the map layer
+    STATION_CATCHMENTS: Voronoi catchments of the charging stations
+"""
+
+from app.domain.geometry.catchments import StationCatchmentsCache
+from app.domain.geometry.geojson import FeatureCollectionCache
+from app.domain.geometry.station_index import StationIndexCache
+from app.domain.geometry.tile_cache import TileCache
+
+# Process-wide index of the stored charging stations for viewport queries
+STATION_INDEX = StationIndexCache()
+# Process-wide cache of the map tiles of stations and postal codes
+MAP_TILES = TileCache()
+# Process-wide GeoJSON of all charging stations for the map layer
+STATION_FEATURES = FeatureCollectionCache()
+# Process-wide Voronoi catchments of the charging stations
+STATION_CATCHMENTS = StationCatchmentsCache()
@@ -0,0 +1,313 @@
+"""Catchments module.
+Catchment areas of the charging stations: the part of the city closer to a
+station than to any other station in service, as Voronoi cells clipped to
+the city outline.
+
+The catchments follow the station index. Stations added to the index or
+whose status changed are added to or removed from the Voronoi cells, which
+computes only the cells of their neighbours again. A new index, e.g. after
+stations were moved or reloaded, computes all cells again.
+
+Computing all cells takes about 2.4 s for 2,000 stations, so `flask
+catchments` stores its result under a fingerprint of the stations in
+service and the outline. A process serves the stored catchments as long as
+its stations have the same fingerprint, meanwhile it computes the cells on
+a background thread, so the first change of the stations only updates the
+cells around it.
+
+Functions:
+    catchments_fingerprint: SHA-256 of the stations in service and the outline.
+
+Classes:
+    StationCatchments:      Voronoi cells of the stations of an index.
+    StationCatchmentsCache: Thread-safe memo of the catchments of the current index.
+"""
+
+import hashlib
+import threading
+from array import array
+from typing import Callable, Collection, Optional
+
+from app.domain.geometry.station_index import StationIndex
+from app.domain.geometry.voronoi import VoronoiCells
+from app.domain.geometry.wkt import format_wkt_polygons
+
+DEFAULT_EXCLUDED_STATUSES = ("malfunctioning",)
+
+
+def catchments_fingerprint(
+    station_index: StationIndex,
+    outline: list[list[array]],
+    excluded_statuses: Collection[str] = DEFAULT_EXCLUDED_STATUSES,
+) -> str:
+    """
+    Fingerprint the input of the catchments, equal in every process with
+    the same stations in service and outline.
+
+    Args:
+        station_index (StationIndex): The stations.
+        outline (list[list[array]]): Polygons of the city outline.
+        excluded_statuses (Collection[str]): `functional` values of the
+            stations without catchment.
+
+    Returns:
+        str: Hex SHA-256 of the ids and positions of the stations in service
+        and the outline.
+    """
+    digest = hashlib.sha256()
+    for station in sorted(
+        list(station_index.stations), key=lambda station: station["id"]
+    ):
+        if station["functional"] not in excluded_statuses:
+            digest.update(
+                f"{station['id']},{station['longitude']!r},"
+                f"{station['latitude']!r};".encode()
+            )
+    for polygon in outline:
+        for ring in polygon:
+            digest.update(b"|")
+            digest.update(ring.tobytes())
+        digest.update(b"#")
+    return digest.hexdigest()
+
+
+class StationCatchments:
+    """
+    Voronoi cells of the stations of an index, clipped to an outline.
+
+    Attributes:
+        station_index (StationIndex): The stations the cells are computed for.
+        outline (list[list[array]]): Polygons of the city outline.
+        excluded_statuses (Collection[str]): `functional` values of the stations
+            without catchment.
+    """
+
+    def __init__(
+        self,
+        station_index: StationIndex,
+        outline: list[list[array]],
+        excluded_statuses: Collection[str] = DEFAULT_EXCLUDED_STATUSES,
+    ):
+        """
+        Compute the cells of all stations in service.
+
+        Args:
+            station_index (StationIndex): The stations.
+            outline (list[list[array]]): One list of rings per polygon of the
+                city outline, as `array("d")` of interleaved longitude and
+                latitude values.
+            excluded_statuses (Collection[str]): `functional` values of the
+                stations without catchment.
+        """
+        self.station_index = station_index
+        self.outline = outline
+        self.excluded_statuses = excluded_statuses
+        self._lock = threading.Lock()
+        self._revision = station_index.revision
+        self._cells = VoronoiCells(
+            outline,
+            [
+                (station["id"], station["longitude"], station["latitude"])
+                for station in list(station_index.stations)
+                if station["functional"] not in excluded_statuses
+            ],
+        )
+
+    def sync(self) -> int:
+        """
+        Apply the stations added to the index or changed since the last call.
+
+        Returns:
+            int: Number of stations added to or removed from the cells.
+        """
+        with self._lock:
+            revision = self.station_index.revision
+            if revision == self._revision:
+                return 0
+            changes = 0
+            for station in list(self.station_index.stations):
+                serves = station["functional"] not in self.excluded_statuses
+                if serves and station["id"] not in self._cells:
+                    self._cells.add(
+                        station["id"], station["longitude"], station["latitude"]
+                    )
+                    changes += 1
+                elif not serves and self._cells.remove(station["id"]):
+                    changes += 1
+            self._revision = revision
+            return changes
+
+    def catchments(self) -> list[dict]:
+        """
+        Get the catchments of all stations in service.
+
+        Returns:
+            list[dict]: Per location, the `station_ids` sharing it, the `area`
+            of their catchment in square meters and its `polygon` as WKT,
+            None for stations outside the outline. Ordered by station id.
+        """
+        with self._lock:
+            cells = list(self._cells.cells())
+        return sorted(
+            (
+                {
+                    "station_ids": keys,
+                    "area": round(area, 1),
+                    "polygon": format_wkt_polygons(polygons) if polygons else None,
+                }
+                for keys, polygons, area in cells
+            ),
+            key=lambda catchment: catchment["station_ids"][0],
+        )
+
+
+class StationCatchmentsCache:
+    """
+    Process-wide memo of the station catchments.
+
+    Attributes:
+        builds (int): Number of times all cells were computed.
+    """
+
+    def __init__(self):
+        self.builds = 0
+        self._catchments: Optional[StationCatchments] = None
+        # Stored catchments with the index, revision and outline they match
+        self._stored: Optional[tuple[StationIndex, int, list, list[dict]]] = None
+        # Background computation of the cells behind the stored catchments
+        self._building: Optional[tuple[StationIndex, list, threading.Thread]] = None
+        self._lock = threading.Lock()
+
+    def _build(self, station_index: StationIndex, outline: list[list[array]]) -> None:
+        catchments = StationCatchments(station_index, outline)
+        catchments.catchments()  # Clip all cells ahead of the first request
+        with self._lock:
+            self.builds += 1
+            kept = self._catchments
+            if (
+                kept is None
+                or kept.station_index is not station_index
+                or kept.outline is not outline
+            ):
+                self._catchments = catchments
+
+    def _build_in_background(
+        self, station_index: StationIndex, outline: list[list[array]]
+    ) -> None:
+        with self._lock:
+            building = self._building
+            if (
+                building is not None
+                and building[0] is station_index
+                and building[1] is outline
+            ):
+                return
+            worker = threading.Thread(
+                target=self._build,
+                args=(station_index, outline),
+                name="catchments",
+                daemon=True,
+            )
+            self._building = (station_index, outline, worker)
+        worker.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the cells computed in the background are ready.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, None waits forever.
+
+        Returns:
+            bool: True if no computation is running anymore.
+        """
+        building = self._building
+        if building is None:
+            return True
+        building[2].join(timeout)
+        return not building[2].is_alive()
+
+    def get(
+        self, station_index: StationIndex, outline: list[list[array]]
+    ) -> StationCatchments:
+        """
+        Get the catchments of an index, updated to its current stations.
+
+        The kept catchments are updated if they belong to the same index and
+        outline, otherwise all cells are computed again. The cells of the
+        index computed in the background are waited for instead.
+
+        Args:
+            station_index (StationIndex): The current station index.
+            outline (list[list[array]]): The current city outline.
+
+        Returns:
+            StationCatchments: The catchments.
+        """
+        building = self._building
+        if (
+            building is not None
+            and building[0] is station_index
+            and building[1] is outline
+        ):
+            building[2].join()
+        catchments = self._catchments
+        if (
+            catchments is not None
+            and catchments.station_index is station_index
+            and catchments.outline is outline
+        ):
+            catchments.sync()
+            return catchments
+        catchments = StationCatchments(station_index, outline)
+        with self._lock:
+            self.builds += 1
+            self._catchments = catchments
+        return catchments
+
+    def catchments(
+        self,
+        station_index: StationIndex,
+        outline: list[list[array]],
+        load_stored: Callable[[str], Optional[list[dict]]],
+    ) -> list[dict]:
+        """
+        Get the catchments of an index, preferring stored ones over computing
+        all cells.
+
+        The stored catchments of the fingerprint of the index are served
+        until its stations change, while their cells are computed in the
+        background. Then the cells are updated to the changed stations.
+        Only without stored catchments all cells are computed in the request.
+
+        Args:
+            station_index (StationIndex): The current station index.
+            outline (list[list[array]]): The current city outline.
+            load_stored (Callable[[str], Optional[list[dict]]]): Returns the
+                stored catchments of a fingerprint, None if there are none.
+
+        Returns:
+            list[dict]: The catchments as returned by `StationCatchments.catchments`.
+        """
+        revision = station_index.revision
+        stored = self._stored
+        if (
+            stored is not None
+            and stored[0] is station_index
+            and stored[1] == revision
+            and stored[2] is outline
+        ):
+            return stored[3]
+        catchments = self._catchments
+        if (
+            catchments is None
+            or catchments.station_index is not station_index
+            or catchments.outline is not outline
+        ):
+            loaded = load_stored(catchments_fingerprint(station_index, outline))
+            if loaded is not None:
+                with self._lock:
+                    self._stored = (station_index, revision, outline, loaded)
+                self._build_in_background(station_index, outline)
+                return loaded
+        return self.get(station_index, outline).catchments()
@@ -0,0 +1,249 @@
+"""Point clustering module.
+Hierarchical clusters of points per zoom level of a web map, in the manner
+of supercluster, so zoomed-out map views show a few clusters with counts
+instead of every station.
+
+The points are projected to Web Mercator in the unit square. Starting
+from the points at the largest zoom level, every level merges the items
+of the level below that lie within a radius of a few screen pixels of
+each other into one cluster at their weighted center. Every item keeps
+the index of its parent one level up. The items of a level are bucketed
+into a grid whose cells are twice the merge radius of the next coarser
+level, which serves both the merging and the viewport queries.
+
+Every point carries a tag, e.g. the operational status of a station, and
+clusters count the tags of their points. Changing the tag of a point only
+updates the counts along its chain of parents.
+
+Classes:
+    PointClusters: Cluster hierarchy over points answering viewport queries.
+"""
+
+from typing import Hashable, Optional, Sequence
+
+from app.domain.geometry.distance import inverse_web_mercator, web_mercator
+
+DEFAULT_MIN_ZOOM = 0
+DEFAULT_MAX_ZOOM = 16
+# Merge radius in pixels of a tile with DEFAULT_EXTENT pixels per side
+DEFAULT_RADIUS = 60
+DEFAULT_EXTENT = 512
+
+
+class _Level:
+    """
+    Clusters of one zoom level.
+
+    `points` holds the point of single-point clusters, -1 for merged
+    clusters, whose tag counts are kept in `tags`.
+    """
+
+    __slots__ = ("xs", "ys", "counts", "points", "tags", "parents", "cells", "cell")
+
+    def __init__(self, cell: float):
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.counts: list[int] = []
+        self.points: list[int] = []
+        self.tags: dict[int, dict[Hashable, int]] = {}
+        self.parents: list[int] = []
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.cell = cell
+
+    def add(self, x: float, y: float, count: int, point: int) -> int:
+        item = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.counts.append(count)
+        self.points.append(point)
+        self.cells.setdefault((int(x / self.cell), int(y / self.cell)), []).append(item)
+        return item
+
+
+class PointClusters:
+    """
+    Cluster hierarchy over points.
+
+    Attributes:
+        min_zoom (int): Coarsest zoom level with clusters.
+        max_zoom (int): Finest zoom level with clusters, larger zoom levels
+            show the single points.
+        size (int): Number of points.
+    """
+
+    def __init__(
+        self,
+        lons: Sequence[float],
+        lats: Sequence[float],
+        tags: Optional[Sequence[Hashable]] = None,
+        min_zoom: int = DEFAULT_MIN_ZOOM,
+        max_zoom: int = DEFAULT_MAX_ZOOM,
+        radius: float = DEFAULT_RADIUS,
+        extent: int = DEFAULT_EXTENT,
+    ):
+        """
+        Build the clusters of all zoom levels.
+
+        Args:
+            lons (Sequence[float]): Longitude per point.
+            lats (Sequence[float]): Latitude per point.
+            tags (Optional[Sequence[Hashable]]): Tag per point.
+            min_zoom (int): Coarsest zoom level with clusters.
+            max_zoom (int): Finest zoom level with clusters.
+            radius (float): Merge radius in pixels.
+            extent (int): Pixels per tile side.
+        """
+        self.min_zoom, self.max_zoom = min_zoom, max_zoom
+        self.size = len(lons)
+        self._radius = radius / extent
+        self._tags = list(tags) if tags is not None else [None] * self.size
+
+        points = _Level(2 * self._radius_at(max_zoom))
+        for point, (lon, lat) in enumerate(zip(lons, lats)):
+            points.add(*web_mercator(lon, lat), 1, point)
+        self._levels = {max_zoom + 1: points}
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            self._levels[zoom] = self._merge(self._levels[zoom + 1], zoom)
+
+    def _radius_at(self, zoom: int) -> float:
+        return self._radius / 2**zoom
+
+    def _tag_counts(self, level: _Level, item: int) -> dict[Hashable, int]:
+        point = level.points[item]
+        if point >= 0:
+            return {self._tags[point]: 1}
+        return level.tags[item]
+
+    def _merge(self, finer: _Level, zoom: int) -> _Level:
+        """
+        Cluster the items of the finer level within the radius of the zoom level.
+        """
+        radius = self._radius_at(zoom)
+        radius_sq = radius * radius
+        level = _Level(2 * self._radius_at(zoom - 1))
+        xs, ys, counts, cell = finer.xs, finer.ys, finer.counts, finer.cell
+        cells = finer.cells.get
+        parents = finer.parents = [-1] * len(xs)
+        for item in range(len(xs)):
+            if parents[item] >= 0:
+                continue
+            x, y = xs[item], ys[item]
+            # Cells are twice the radius, so the circle reaches one neighbour per axis
+            col, row = int(x / cell), int(y / cell)
+            cols = (col - 1, col) if x - col * cell < radius else (col, col + 1)
+            rows = (row - 1, row) if y - row * cell < radius else (row, row + 1)
+            members = [item]
+            for cell_col in cols:
+                for cell_row in rows:
+                    for other in cells((cell_col, cell_row), ()):
+                        if parents[other] < 0 and other != item:
+                            dx, dy = xs[other] - x, ys[other] - y
+                            if dx * dx + dy * dy <= radius_sq:
+                                members.append(other)
+
+            if len(members) == 1:
+                parent = level.add(x, y, counts[item], finer.points[item])
+                if finer.points[item] < 0:
+                    level.tags[parent] = dict(finer.tags[item])
+            else:
+                count = sum(counts[member] for member in members)
+                parent = level.add(
+                    sum(xs[member] * counts[member] for member in members) / count,
+                    sum(ys[member] * counts[member] for member in members) / count,
+                    count,
+                    -1,
+                )
+                tag_counts: dict[Hashable, int] = {}
+                for member in members:
+                    for tag, tag_count in self._tag_counts(finer, member).items():
+                        tag_counts[tag] = tag_counts.get(tag, 0) + tag_count
+                level.tags[parent] = tag_counts
+            for member in members:
+                parents[member] = parent
+        return level
+
+    def set_tag(self, point: int, tag: Hashable) -> None:
+        """
+        Change the tag of a point and the tag counts of its clusters.
+
+        Args:
+            point (int): Position of the point in the sequences the clusters
+                were built from.
+            tag (Hashable): The new tag.
+        """
+        old = self._tags[point]
+        if old == tag:
+            return
+        self._tags[point] = tag
+        item = point
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            item = self._levels[zoom + 1].parents[item]
+            tag_counts = self._levels[zoom].tags.get(item)
+            if tag_counts is None:
+                continue
+            tag_counts[old] -= 1
+            if not tag_counts[old]:
+                del tag_counts[old]
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+    def query(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+        zoom: int,
+    ) -> tuple[list[dict], list[int]]:
+        """
+        Find the clusters and single points of a zoom level inside a bounding box.
+
+        Args:
+            min_lon (float): West edge of the box.
+            min_lat (float): South edge of the box.
+            max_lon (float): East edge of the box.
+            max_lat (float): North edge of the box.
+            zoom (int): Zoom level of the map.
+
+        Returns:
+            tuple[list[dict], list[int]]: The clusters with `cluster_id`,
+            `longitude`, `latitude`, `count` and `tags` counts, and the
+            positions of the single points.
+        """
+        zoom = min(max(zoom, self.min_zoom), self.max_zoom + 1)
+        level = self._levels[zoom]
+        min_x, max_y = web_mercator(min_lon, min_lat)
+        max_x, min_y = web_mercator(max_lon, max_lat)
+
+        cols = range(int(min_x / level.cell), int(max_x / level.cell) + 1)
+        rows = range(int(min_y / level.cell), int(max_y / level.cell) + 1)
+        if len(cols) * len(rows) > len(level.cells):
+            # A box much larger than the screen, e.g. all of Berlin at street level
+            candidates = range(len(level.xs))
+        else:
+            candidates = [
+                item
+                for col in cols
+                for row in rows
+                for item in level.cells.get((col, row), ())
+            ]
+
+        clusters, points = [], []
+        for item in candidates:
+            x, y = level.xs[item], level.ys[item]
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            point = level.points[item]
+            if point >= 0:
+                points.append(point)
+            else:
+                lon, lat = inverse_web_mercator(x, y)
+                clusters.append(
+                    {
+                        "cluster_id": item << 5 | zoom,
+                        "longitude": lon,
+                        "latitude": lat,
+                        "count": level.counts[item],
+                        "tags": dict(level.tags[item]),
+                    }
+                )
+        return clusters, points
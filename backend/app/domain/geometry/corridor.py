@@ -0,0 +1,122 @@
+"""Route corridor module.
+Finds the points within a distance of a route given as polyline, ordered
+by their position along the route.
+
+The route is projected around its mean latitude and cut into pieces of at
+most `piece_length` meters. Each piece, widened by the search distance,
+gives a small bounding box, so long diagonal segments do not query the
+large box around their end points. The points inside the boxes are
+measured against their segment and kept with the closest one.
+
+Classes:
+    RouteCorridor: Pieces of a route with their bounding boxes and distances of points.
+"""
+
+import math
+from typing import Iterator, Optional, Sequence
+
+from app.domain.geometry.distance import LocalProjection
+from app.domain.geometry.polygon import METERS_PER_DEGREE
+
+DEFAULT_PIECE_LENGTH = 1000.0
+
+
+class RouteCorridor:
+    """
+    A route with the band of a given distance on both sides.
+
+    Attributes:
+        distance (float): Largest distance of a point from the route in meters.
+        length (float): Length of the route in meters.
+    """
+
+    def __init__(
+        self,
+        route: Sequence[tuple[float, float]],
+        distance: float,
+        piece_length: float = DEFAULT_PIECE_LENGTH,
+    ):
+        """
+        Project the route and cut it into pieces.
+
+        Args:
+            route (Sequence[tuple[float, float]]): Longitude and latitude of the
+                route points in driving order, at least one.
+            distance (float): Largest distance of a point from the route in meters.
+            piece_length (float): Largest length of a piece in meters.
+        """
+        self.distance = distance
+        self._piece_length = piece_length
+        self._projection = LocalProjection(sum(lat for _, lat in route) / len(route))
+        self._route = list(route)
+        self._points = [self._projection.project(lon, lat) for lon, lat in route]
+        if len(self._points) == 1:
+            self._points.append(self._points[0])
+            self._route.append(self._route[0])
+        # Distance along the route at the start of every segment
+        self._offsets = [0.0]
+        for (x1, y1), (x2, y2) in zip(self._points, self._points[1:]):
+            self._offsets.append(self._offsets[-1] + math.hypot(x2 - x1, y2 - y1))
+        self.length = self._offsets[-1]
+
+    def boxes(self) -> Iterator[tuple[int, tuple[float, float, float, float]]]:
+        """
+        Get the bounding boxes of the pieces, widened by the distance.
+
+        Yields:
+            tuple[int, tuple[float, float, float, float]]: Index of the segment
+            of the piece and the box as min lon, min lat, max lon, max lat.
+        """
+        lat_margin = self.distance / METERS_PER_DEGREE
+        reference_lat = self._projection.reference_latitude
+        for segment, ((lon1, lat1), (lon2, lat2)) in enumerate(
+            zip(self._route, self._route[1:])
+        ):
+            length = self._offsets[segment + 1] - self._offsets[segment]
+            pieces = max(math.ceil(length / self._piece_length), 1)
+            for piece in range(pieces):
+                start, end = piece / pieces, (piece + 1) / pieces
+                lons = (lon1 + (lon2 - lon1) * start, lon1 + (lon2 - lon1) * end)
+                lats = (lat1 + (lat2 - lat1) * start, lat1 + (lat2 - lat1) * end)
+                # The longitude margin must hold at the reference latitude of
+                # the projection as well, which measures the distances
+                widest = min(
+                    max(max(map(abs, lats)) + lat_margin, abs(reference_lat)), 89.9
+                )
+                lon_margin = self.distance / (
+                    METERS_PER_DEGREE * math.cos(math.radians(widest))
+                )
+                yield segment, (
+                    min(lons) - lon_margin,
+                    min(lats) - lat_margin,
+                    max(lons) + lon_margin,
+                    max(lats) + lat_margin,
+                )
+
+    def measure(
+        self, segment: int, lon: float, lat: float
+    ) -> Optional[tuple[float, float]]:
+        """
+        Measure a point against a segment of the route.
+
+        Args:
+            segment (int): Index of the segment, as yielded by `boxes`.
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+
+        Returns:
+            Optional[tuple[float, float]]: Distance of the point from the
+            segment and position of its closest point along the route, both
+            in meters, None if the point is farther than the distance.
+        """
+        (x1, y1), (x2, y2) = self._points[segment], self._points[segment + 1]
+        x, y = self._projection.project(lon, lat)
+        dx, dy = x2 - x1, y2 - y1
+        length_sq = dx * dx + dy * dy
+        t = 0.0
+        if length_sq:
+            t = min(max(((x - x1) * dx + (y - y1) * dy) / length_sq, 0.0), 1.0)
+        distance = math.hypot(x - x1 - t * dx, y - y1 - t * dy)
+        if distance > self.distance:
+            return None
+        return distance, self._offsets[segment] + t * math.sqrt(length_sq)
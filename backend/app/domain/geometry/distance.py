@@ -0,0 +1,136 @@
+"""Distance module.
+Great-circle distances and planar projections for spatial indexes and maps.
+
+Indexes work on planar coordinates in meters from `LocalProjection`. Its
+planar distances are close to the true ones in a city-sized area, and
+`LocalProjection.distance_factor` bounds how much shorter the true distance
+can be, so a search in the plane can be refined to exact great-circle results.
+
+Classes:
+    LocalProjection: Equirectangular projection around a reference latitude.
+
+Functions:
+    haversine_distance:   great-circle distance of two points in meters
+    web_mercator:         project a point to Web Mercator in the unit square
+    inverse_web_mercator: longitude and latitude of a Web Mercator point
+"""
+
+import math
+
+from app.domain.geometry.polygon import EARTH_RADIUS_M, METERS_PER_DEGREE
+
+MAX_MERCATOR_LATITUDE = 85.05112878
+
+
+def haversine_distance(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """
+    Compute the great-circle distance of two points with the haversine formula.
+
+    Args:
+        lon1 (float): Longitude of the first point.
+        lat1 (float): Latitude of the first point.
+        lon2 (float): Longitude of the second point.
+        lat2 (float): Latitude of the second point.
+
+    Returns:
+        float: Distance in meters.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    h = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(h)))
+
+
+def web_mercator(lon: float, lat: float) -> tuple[float, float]:
+    """
+    Project a point to Web Mercator, the projection of web map tiles.
+
+    Args:
+        lon (float): Longitude of the point.
+        lat (float): Latitude of the point, clamped to the square world.
+
+    Returns:
+        tuple[float, float]: x from west to east and y from north to south,
+        both from 0 to 1.
+    """
+    lat = min(max(lat, -MAX_MERCATOR_LATITUDE), MAX_MERCATOR_LATITUDE)
+    sin = math.sin(math.radians(lat))
+    return lon / 360 + 0.5, 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+
+
+def inverse_web_mercator(x: float, y: float) -> tuple[float, float]:
+    """
+    Get the longitude and latitude of a Web Mercator point.
+
+    Args:
+        x (float): x in the unit square.
+        y (float): y in the unit square.
+
+    Returns:
+        tuple[float, float]: Longitude and latitude.
+    """
+    lat = math.degrees(2 * math.atan(math.exp((0.5 - y) * 2 * math.pi))) - 90
+    return (x - 0.5) * 360, lat
+
+
+class LocalProjection:
+    """
+    Equirectangular projection in meters, true to scale along the reference latitude.
+
+    Attributes:
+        reference_latitude (float): Latitude without east-west distortion.
+    """
+
+    def __init__(self, reference_latitude: float):
+        self.reference_latitude = reference_latitude
+        self._x_scale = METERS_PER_DEGREE * math.cos(math.radians(reference_latitude))
+
+    def project(self, lon: float, lat: float) -> tuple[float, float]:
+        """
+        Project a point into the plane.
+
+        Args:
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+
+        Returns:
+            tuple[float, float]: x and y in meters.
+        """
+        return lon * self._x_scale, lat * METERS_PER_DEGREE
+
+    def unproject(self, x: float, y: float) -> tuple[float, float]:
+        """
+        Get the longitude and latitude of a point in the plane.
+
+        Args:
+            x (float): x in meters.
+            y (float): y in meters.
+
+        Returns:
+            tuple[float, float]: Longitude and latitude.
+        """
+        return x / self._x_scale, y / METERS_PER_DEGREE
+
+    def distance_factor(self, min_lat: float, max_lat: float) -> float:
+        """
+        Lower bound of the ratio of great-circle and planar distance.
+
+        Holds for two points between the given latitudes, with half a degree
+        of margin for great circles bending towards the pole.
+
+        Args:
+            min_lat (float): Southern latitude of both points.
+            max_lat (float): Northern latitude of both points.
+
+        Returns:
+            float: Factor at most 1, the true distance is at least the planar
+            distance times the factor.
+        """
+        widest = min(max(abs(min_lat), abs(max_lat)) + 0.5, 90.0)
+        ratio = math.cos(math.radians(widest)) / math.cos(
+            math.radians(self.reference_latitude)
+        )
+        # Margin for rounding errors
+        return min(ratio, 1.0) * 0.999
@@ -0,0 +1,180 @@
+"""Geohash grid module.
+Uniform grid of geohash cells over points for radius searches, e.g. the
+charging stations within walking distance of a position.
+
+A geohash of precision p splits longitude into ceil(5p / 2) and latitude
+into floor(5p / 2) bits, so all cells of one precision have the same size
+in degrees. A cell is addressed by its column and row, `geohash` gives the
+usual base32 name. Points can be added at any time without a rebuild.
+
+At precision 6 a cell covers about 0.74 km by 0.61 km in Berlin. A 2 km
+search touches about 40 cells, the cells of its bounding box that reach
+into the circle. Precision 5 (3 km by 4.9 km) touches only 4 cells but
+tests 5 times more points, which makes it slower from a few thousand
+stations on, see `benchmarks/station_radius_benchmark.py`.
+
+Classes:
+    GeohashGrid: Points bucketed by geohash cell.
+
+Functions:
+    geohash: base32 geohash of a point
+"""
+
+import math
+from typing import Hashable
+
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.polygon import METERS_PER_DEGREE
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+DEFAULT_PRECISION = 6
+
+
+def _cell_bits(precision: int) -> tuple[int, int]:
+    return (5 * precision + 1) // 2, 5 * precision // 2
+
+
+def geohash(lon: float, lat: float, precision: int) -> str:
+    """
+    Compute the geohash of a point.
+
+    Args:
+        lon (float): Longitude of the point.
+        lat (float): Latitude of the point.
+        precision (int): Number of characters.
+
+    Returns:
+        str: The base32 geohash.
+    """
+    lon_bits, lat_bits = _cell_bits(precision)
+    col = min(int((lon + 180) / 360 * (1 << lon_bits)), (1 << lon_bits) - 1)
+    row = min(int((lat + 90) / 180 * (1 << lat_bits)), (1 << lat_bits) - 1)
+    # Bits alternate starting with longitude, from the most significant one
+    value = 0
+    for bit in range(5 * precision):
+        if bit % 2 == 0:
+            lon_bits -= 1
+            value = value << 1 | (col >> lon_bits) & 1
+        else:
+            lat_bits -= 1
+            value = value << 1 | (row >> lat_bits) & 1
+    return "".join(
+        BASE32[(value >> shift) & 31] for shift in range(5 * precision - 5, -1, -5)
+    )
+
+
+class GeohashGrid:
+    """
+    Points bucketed by the geohash cell containing them.
+
+    Attributes:
+        precision (int): Geohash precision of the cells.
+        cell_width (float): Width of a cell in degrees of longitude.
+        cell_height (float): Height of a cell in degrees of latitude.
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        self.precision = precision
+        lon_bits, lat_bits = _cell_bits(precision)
+        self._cols, self._rows = 1 << lon_bits, 1 << lat_bits
+        self.cell_width = 360 / self._cols
+        self.cell_height = 180 / self._rows
+        self._cells: dict[tuple[int, int], list[tuple[Hashable, float, float]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(points) for points in self._cells.values())
+
+    def _col(self, lon: float) -> int:
+        return min(max(int((lon + 180) / self.cell_width), 0), self._cols - 1)
+
+    def _row(self, lat: float) -> int:
+        return min(max(int((lat + 90) / self.cell_height), 0), self._rows - 1)
+
+    def add(self, key: Hashable, lon: float, lat: float) -> None:
+        """
+        Add a point.
+
+        Args:
+            key (Hashable): Key of the point returned by searches.
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+        """
+        cell = (self._col(lon), self._row(lat))
+        self._cells.setdefault(cell, []).append((key, lon, lat))
+
+    def cells_within(
+        self, lon: float, lat: float, radius: float
+    ) -> list[tuple[int, int]]:
+        """
+        Find the cells that may hold points within a radius of a position.
+
+        Args:
+            lon (float): Longitude of the position.
+            lat (float): Latitude of the position.
+            radius (float): Radius in meters.
+
+        Returns:
+            list[tuple[int, int]]: Column and row of the cells touching the circle.
+        """
+        delta_lat = radius / METERS_PER_DEGREE
+        widest = min(abs(lat) + delta_lat, 89.9)
+        delta_lon = min(delta_lat / math.cos(math.radians(widest)), 180.0)
+
+        cells = []
+        for row in range(self._row(lat - delta_lat), self._row(lat + delta_lat) + 1):
+            south = row * self.cell_height - 90
+            nearest_lat = min(max(lat, south), south + self.cell_height)
+            for col in range(
+                self._col(lon - delta_lon), self._col(lon + delta_lon) + 1
+            ):
+                west = col * self.cell_width - 180
+                nearest_lon = min(max(lon, west), west + self.cell_width)
+                # The closest point of the cell, up to the curvature of the parallels
+                if (
+                    haversine_distance(lon, lat, nearest_lon, nearest_lat)
+                    <= radius * 1.001
+                ):
+                    cells.append((col, row))
+        return cells
+
+    def within(
+        self, lon: float, lat: float, radius: float
+    ) -> list[tuple[float, Hashable]]:
+        """
+        Find the points within a radius of a position.
+
+        Args:
+            lon (float): Longitude of the position.
+            lat (float): Latitude of the position.
+            radius (float): Radius in meters, points on the circle are included.
+
+        Returns:
+            list[tuple[float, Hashable]]: Great-circle distance in meters and
+            key of the points, closest first.
+        """
+        found = []
+        cells = self._cells
+        for cell in self.cells_within(lon, lat, radius):
+            for key, point_lon, point_lat in cells.get(cell, ()):
+                distance = haversine_distance(lon, lat, point_lon, point_lat)
+                if distance <= radius:
+                    found.append((distance, key))
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def geohash(self, cell: tuple[int, int]) -> str:
+        """
+        Get the geohash naming a cell.
+
+        Args:
+            cell (tuple[int, int]): Column and row of the cell.
+
+        Returns:
+            str: The base32 geohash of the cell.
+        """
+        col, row = cell
+        return geohash(
+            (col + 0.5) * self.cell_width - 180,
+            (row + 0.5) * self.cell_height - 90,
+            self.precision,
+        )
@@ -0,0 +1,150 @@
+"""GeoJSON module.
+Encodes points and polygons as GeoJSON FeatureCollection bytes, so a map
+layer loads in one request, and keeps the encoded bytes until the data
+they were built from changes.
+
+Polygon rings are wound as RFC 7946 asks, exterior rings counterclockwise
+and holes clockwise, whatever the winding of the input.
+
+Classes:
+    FeatureCollectionCache: Thread-safe memo of an encoded FeatureCollection.
+
+Functions:
+    point_feature:             Feature of a point
+    polygon_feature:           Feature of a (multi)polygon
+    encode_feature_collection: FeatureCollection of features as compact JSON bytes
+"""
+
+import json
+import threading
+from typing import Callable, Hashable, Iterable, Optional, Sequence
+
+GEOJSON_MIMETYPE = "application/geo+json"
+
+
+def _signed_area(ring: Sequence[float]) -> float:
+    """
+    Twice the signed area of a flat ring, positive if counterclockwise.
+    """
+    xs, ys = ring[0::2], ring[1::2]
+    return sum(
+        xs[index - 1] * ys[index] - xs[index] * ys[index - 1]
+        for index in range(len(xs))
+    )
+
+
+def point_feature(
+    lon: float, lat: float, properties: dict, feature_id: Optional[Hashable] = None
+) -> dict:
+    """
+    Build the Feature of a point.
+
+    Args:
+        lon (float): Longitude of the point.
+        lat (float): Latitude of the point.
+        properties (dict): Properties of the feature.
+        feature_id (Optional[Hashable]): Id of the feature, left out if None.
+
+    Returns:
+        dict: The GeoJSON Feature.
+    """
+    feature = {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": properties,
+    }
+    if feature_id is not None:
+        feature["id"] = feature_id
+    return feature
+
+
+def polygon_feature(
+    polygons: list[list[Sequence[float]]],
+    properties: dict,
+    feature_id: Optional[Hashable] = None,
+) -> dict:
+    """
+    Build the Feature of a (multi)polygon.
+
+    Args:
+        polygons (list[list[Sequence[float]]]): One list of rings per polygon,
+            the exterior ring first. A ring is a closed flat sequence of
+            interleaved longitude and latitude values.
+        properties (dict): Properties of the feature.
+        feature_id (Optional[Hashable]): Id of the feature, left out if None.
+
+    Returns:
+        dict: The GeoJSON Feature, a Polygon for a single polygon and a
+        MultiPolygon otherwise.
+    """
+    coordinates = []
+    for rings in polygons:
+        polygon = []
+        for index, ring in enumerate(rings):
+            points = [[lon, lat] for lon, lat in zip(ring[0::2], ring[1::2])]
+            if (_signed_area(ring) > 0) != (index == 0):
+                points.reverse()
+            polygon.append(points)
+        coordinates.append(polygon)
+    if len(coordinates) == 1:
+        geometry = {"type": "Polygon", "coordinates": coordinates[0]}
+    else:
+        geometry = {"type": "MultiPolygon", "coordinates": coordinates}
+    feature = {"type": "Feature", "geometry": geometry, "properties": properties}
+    if feature_id is not None:
+        feature["id"] = feature_id
+    return feature
+
+
+def encode_feature_collection(features: Iterable[dict]) -> bytes:
+    """
+    Encode features as FeatureCollection.
+
+    Args:
+        features (Iterable[dict]): The GeoJSON Features.
+
+    Returns:
+        bytes: UTF-8 JSON without whitespace.
+    """
+    return json.dumps(
+        {"type": "FeatureCollection", "features": list(features)},
+        separators=(",", ":"),
+    ).encode()
+
+
+class FeatureCollectionCache:
+    """
+    Memo of one encoded FeatureCollection.
+
+    The bytes are kept with the sources they were built from, e.g. the
+    station index and its revision, and built again for other sources.
+
+    Attributes:
+        builds (int): Number of times the bytes were built.
+    """
+
+    def __init__(self):
+        self.builds = 0
+        self._entry: Optional[tuple[tuple, bytes]] = None
+        self._lock = threading.Lock()
+
+    def get(self, sources: tuple, build: Callable[[], bytes]) -> bytes:
+        """
+        Get the encoded FeatureCollection, built if missing or built from other sources.
+
+        Args:
+            sources (tuple): The objects and revisions the bytes are built from,
+                read before the build so a change during it builds again.
+            build (Callable[[], bytes]): Builds the encoded FeatureCollection.
+
+        Returns:
+            bytes: The encoded FeatureCollection.
+        """
+        entry = self._entry
+        if entry is not None and entry[0] == sources:
+            return entry[1]
+        data = build()
+        with self._lock:
+            self.builds += 1
+            self._entry = (sources, data)
+        return data
@@ -0,0 +1,229 @@
+"""Geometry store module.
+Keeps parsed polygons in memory, so geometry work on a stored WKT polygon
+parses its text only once per process.
+
+Every entry remembers the WKT text it was parsed from. A lookup with a
+different text, e.g. after the dataset was reloaded, parses it again, and
+`GeometryStore.clear` drops all entries at once. Geometries that were read
+without parsing, e.g. from a dataset snapshot, are added with
+`GeometryStore.put`. Structures built from many
+entries, e.g. a spatial index, are memoized with `GeometryStore.derived`
+until an entry changes.
+
+Classes:
+    PolygonGeometry: Parsed rings of a (multi)polygon with bounding box.
+    GeometryStore:   Thread-safe memo of parsed polygons by key.
+"""
+
+import sys
+import threading
+from array import array
+from typing import Any, Callable, Hashable, Optional
+
+from app.domain.geometry.prepared_polygon import PreparedPolygon
+from app.domain.geometry.wkt import parse_wkt_polygons
+
+
+class PolygonGeometry:
+    """
+    Parsed (multi)polygon in compact float arrays.
+
+    Attributes:
+        polygons (list[list[array]]): One list of rings per polygon, the exterior
+            ring first. A ring is an `array("d")` of interleaved longitude and
+            latitude values.
+        bbox (tuple[float, float, float, float]): min lon, min lat, max lon, max lat.
+        vertex_count (int): Number of points of all rings.
+    """
+
+    __slots__ = ("polygons", "bbox", "vertex_count", "_prepared")
+
+    def __init__(self, polygons: list[list[array]]):
+        self.polygons = polygons
+        rings = [ring for rings in polygons for ring in rings]
+        self.bbox = (
+            min(min(ring[0::2]) for ring in rings),
+            min(min(ring[1::2]) for ring in rings),
+            max(max(ring[0::2]) for ring in rings),
+            max(max(ring[1::2]) for ring in rings),
+        )
+        self.vertex_count = sum(len(ring) for ring in rings) // 2
+        self._prepared = None
+
+    @classmethod
+    def from_wkt(cls, text: str) -> "PolygonGeometry":
+        """
+        Parse a POLYGON or MULTIPOLYGON.
+
+        Args:
+            text (str): The geometry as WKT.
+
+        Returns:
+            PolygonGeometry: The parsed geometry.
+
+        Raises:
+            WktError: If the text is not a valid POLYGON or MULTIPOLYGON.
+        """
+        return cls(parse_wkt_polygons(text))
+
+    @property
+    def prepared(self) -> PreparedPolygon:
+        """
+        Returns:
+            PreparedPolygon: The polygon with edge index, built on first use.
+        """
+        if self._prepared is None:
+            self._prepared = PreparedPolygon(self.polygons)
+        return self._prepared
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """
+        Test if a point lies inside the polygon.
+
+        Args:
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+
+        Returns:
+            bool: True if the point is inside.
+        """
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+            return False
+        return self.prepared.contains(lon, lat)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Memory held by the rings and their lists, without the edge index.
+        """
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.polygons)
+            + sum(sys.getsizeof(rings) for rings in self.polygons)
+            + sum(sys.getsizeof(ring) for rings in self.polygons for ring in rings)
+        )
+
+
+class GeometryStore:
+    """
+    Process-wide memo of parsed polygons.
+
+    Attributes:
+        name (str): Name of the stored dataset, used in reports.
+        hits (int): Number of lookups answered from the store.
+        misses (int): Number of lookups that parsed the text.
+        version (int): Incremented whenever an entry is added, replaced or dropped.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._entries: dict[Hashable, tuple[str, PolygonGeometry]] = {}
+        self._derived: dict[str, tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, text: str) -> PolygonGeometry:
+        """
+        Get the parsed geometry of a WKT polygon.
+
+        Args:
+            key (Hashable): Key of the polygon, e.g. the postal code number.
+            text (str): The polygon as WKT.
+
+        Returns:
+            PolygonGeometry: The memoized geometry, parsed again if the text changed.
+
+        Raises:
+            WktError: If the text is not a valid POLYGON or MULTIPOLYGON.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (entry[0] is text or entry[0] == text):
+            self.hits += 1
+            return entry[1]
+
+        geometry = PolygonGeometry.from_wkt(text)
+        with self._lock:
+            self.misses += 1
+            self.version += 1
+            self._entries[key] = (text, geometry)
+        return geometry
+
+    def put(self, key: Hashable, text: str, geometry: PolygonGeometry) -> None:
+        """
+        Store a geometry that was read without parsing its text.
+
+        Args:
+            key (Hashable): Key of the polygon.
+            text (str): The polygon as WKT, later lookups with it are hits.
+            geometry (PolygonGeometry): The geometry of the text.
+        """
+        with self._lock:
+            self.version += 1
+            self._entries[key] = (text, geometry)
+
+    def peek(self, key: Hashable) -> Optional[PolygonGeometry]:
+        """
+        Get a stored geometry without parsing.
+
+        Args:
+            key (Hashable): Key of the polygon.
+
+        Returns:
+            Optional[PolygonGeometry]: The geometry, None if not stored.
+        """
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """
+        Drop all stored geometries, e.g. after the dataset was reloaded.
+        """
+        with self._lock:
+            self.version += 1
+            self._entries = {}
+            self._derived = {}
+
+    def derived(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Memoize a structure built from the stored geometries until the store changes.
+
+        Args:
+            name (str): Name of the structure.
+            build (Callable[[], Any]): Builds the structure, may add entries to the store.
+
+        Returns:
+            Any: The memoized or newly built structure.
+        """
+        entry = self._derived.get(name)
+        if entry is not None and entry[0] == self.version:
+            return entry[1]
+        value = build()
+        with self._lock:
+            self._derived[name] = (self.version, value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> dict:
+        """
+        Report the size and the memory footprint of the store.
+
+        Returns:
+            dict: Name, number of entries and vertices, bytes held by the
+            parsed rings and the WKT keys, hits and misses.
+        """
+        entries = list(self._entries.values())
+        return {
+            "name": self.name,
+            "entries": len(entries),
+            "vertices": sum(geometry.vertex_count for _, geometry in entries),
+            "geometry_bytes": sum(geometry.nbytes for _, geometry in entries),
+            "text_bytes": sum(sys.getsizeof(text) for text, _ in entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
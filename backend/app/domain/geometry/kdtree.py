@@ -0,0 +1,199 @@
+"""KD-tree module.
+KD-tree over planar points for nearest neighbour searches, e.g. the closest
+charging stations of a position.
+
+Every point carries a tag, e.g. the operational status of a station. The
+nodes count the tags of the points below them, so a search for some tags
+skips subtrees without such points. Tags can be changed in place, which
+updates the counts on the path of the point up to the root.
+
+Classes:
+    PointKDTree: KD-tree yielding the points in order of their distance.
+"""
+
+import heapq
+import math
+from typing import Collection, Hashable, Iterator, Optional, Sequence
+
+DEFAULT_LEAF_SIZE = 8
+
+
+class PointKDTree:
+    """
+    KD-tree over planar points with tag counts per node.
+
+    The nodes are stored in flat lists, node 0 is the root. Every node
+    covers a contiguous range of the points sorted into tree order.
+
+    Attributes:
+        size (int): Number of indexed points.
+        leaf_size (int): Maximum number of points per leaf.
+    """
+
+    def __init__(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        tags: Optional[Sequence[Hashable]] = None,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+    ):
+        """
+        Build the tree by splitting at the median, alternately along x and y.
+
+        Args:
+            xs (Sequence[float]): x coordinate per point.
+            ys (Sequence[float]): y coordinate per point.
+            tags (Optional[Sequence[Hashable]]): Tag per point, None tags all
+                points alike.
+            leaf_size (int): Maximum number of points per leaf.
+        """
+        self.size = len(xs)
+        self.leaf_size = leaf_size
+        self._xs, self._ys = list(xs), list(ys)
+        self._tag_ids: dict[Hashable, int] = {}
+        self._tags = [
+            self._tag_id(tag)
+            for tag in (tags if tags is not None else [None] * self.size)
+        ]
+
+        self._order = list(range(self.size))
+        self._bboxes: list[tuple[float, float, float, float]] = []
+        self._ranges: list[tuple[int, int]] = []
+        self._children: list[Optional[tuple[int, int]]] = []
+        self._parents: list[int] = []
+        self._counts: list[list[int]] = []
+        self._leaf_of = [0] * self.size
+        if self.size:
+            self._build()
+
+    def _tag_id(self, tag: Hashable) -> int:
+        return self._tag_ids.setdefault(tag, len(self._tag_ids))
+
+    def _add_node(self, start: int, end: int, parent: int) -> int:
+        self._ranges.append((start, end))
+        self._children.append(None)
+        self._parents.append(parent)
+        return len(self._ranges) - 1
+
+    def _build(self) -> None:
+        order, xs, ys, tags = self._order, self._xs, self._ys, self._tags
+        stack = [(self._add_node(0, self.size, -1), 0)]
+        while stack:
+            node, depth = stack.pop()
+            start, end = self._ranges[node]
+            if end - start <= self.leaf_size:
+                continue
+            axis = xs if depth % 2 == 0 else ys
+            order[start:end] = sorted(order[start:end], key=axis.__getitem__)
+            middle = (start + end) // 2
+            left = self._add_node(start, middle, node)
+            right = self._add_node(middle, end, node)
+            self._children[node] = (left, right)
+            stack.extend(((left, depth + 1), (right, depth + 1)))
+
+        # Children are added after their parent, so in reverse every node
+        # is reached after its children and merges their boxes and counts
+        tag_count = len(self._tag_ids)
+        self._bboxes = [None] * len(self._ranges)
+        self._counts = [None] * len(self._ranges)
+        for node in range(len(self._ranges) - 1, -1, -1):
+            children = self._children[node]
+            if children is None:
+                start, end = self._ranges[node]
+                points = order[start:end]
+                node_xs = [xs[point] for point in points]
+                node_ys = [ys[point] for point in points]
+                bbox = (min(node_xs), min(node_ys), max(node_xs), max(node_ys))
+                counts = [0] * tag_count
+                for point in points:
+                    counts[tags[point]] += 1
+                    self._leaf_of[point] = node
+            else:
+                left, right = self._bboxes[children[0]], self._bboxes[children[1]]
+                bbox = (
+                    min(left[0], right[0]),
+                    min(left[1], right[1]),
+                    max(left[2], right[2]),
+                    max(left[3], right[3]),
+                )
+                counts = list(
+                    map(sum, zip(self._counts[children[0]], self._counts[children[1]]))
+                )
+            self._bboxes[node] = bbox
+            self._counts[node] = counts
+
+    def set_tag(self, point: int, tag: Hashable) -> None:
+        """
+        Change the tag of a point.
+
+        Args:
+            point (int): Position of the point in the sequences the tree was built from.
+            tag (Hashable): The new tag.
+        """
+        old, new = self._tags[point], self._tag_id(tag)
+        if old == new:
+            return
+        self._tags[point] = new
+        node = self._leaf_of[point]
+        while node >= 0:
+            counts = self._counts[node]
+            if new >= len(counts):
+                counts.extend([0] * (new + 1 - len(counts)))
+            counts[old] -= 1
+            counts[new] += 1
+            node = self._parents[node]
+
+    def _has_tags(self, node: int, tag_ids: Optional[list[int]]) -> bool:
+        if tag_ids is None:
+            return True
+        counts = self._counts[node]
+        return any(tag_id < len(counts) and counts[tag_id] for tag_id in tag_ids)
+
+    def _box_distance_sq(self, node: int, x: float, y: float) -> float:
+        min_x, min_y, max_x, max_y = self._bboxes[node]
+        dx = min_x - x if x < min_x else x - max_x if x > max_x else 0.0
+        dy = min_y - y if y < min_y else y - max_y if y > max_y else 0.0
+        return dx * dx + dy * dy
+
+    def iter_nearest(
+        self, x: float, y: float, tags: Optional[Collection[Hashable]] = None
+    ) -> Iterator[tuple[float, int]]:
+        """
+        Yield the points in order of their distance to a position.
+
+        The search is best first: nodes and points wait in one heap by their
+        distance, so taking the first few points only visits nearby nodes.
+
+        Args:
+            x (float): x coordinate of the position.
+            y (float): y coordinate of the position.
+            tags (Optional[Collection[Hashable]]): Only points with one of these
+                tags, None for all points.
+
+        Yields:
+            tuple[float, int]: Distance and position of the point in the
+            sequences the tree was built from.
+        """
+        if not self.size:
+            return
+        tag_ids = None
+        if tags is not None:
+            tag_ids = [self._tag_ids[tag] for tag in tags if tag in self._tag_ids]
+
+        xs, ys, point_tags = self._xs, self._ys, self._tags
+        heap = [(0.0, 1, 0)]  # distance squared, 0 for points and 1 for nodes, id
+        while heap:
+            distance_sq, is_node, item = heapq.heappop(heap)
+            if not is_node:
+                yield math.sqrt(distance_sq), item
+            elif not self._has_tags(item, tag_ids):
+                continue
+            elif self._children[item] is None:
+                start, end = self._ranges[item]
+                for point in self._order[start:end]:
+                    if tag_ids is None or point_tags[point] in tag_ids:
+                        dx, dy = xs[point] - x, ys[point] - y
+                        heapq.heappush(heap, (dx * dx + dy * dy, 0, point))
+            else:
+                for child in self._children[item]:
+                    heapq.heappush(heap, (self._box_distance_sq(child, x, y), 1, child))
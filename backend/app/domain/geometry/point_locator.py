@@ -0,0 +1,258 @@
+"""Point locator module.
+Finds the polygon containing a point among many polygons, e.g. the postal
+code of a GPS position.
+
+A regular grid is laid over the bounding box of all polygons. Grid cells
+that lie completely inside one polygon answer a lookup directly, cells
+crossed by polygon edges keep the few polygons whose edges cross them and
+fall back to the point-in-polygon test of `PreparedPolygon`.
+
+Classes:
+    PolygonLocator: Grid index answering point-in-polygon lookups.
+"""
+
+from bisect import bisect, bisect_left
+from typing import Hashable, Iterable, Optional
+
+from app.domain.geometry.geometry_store import PolygonGeometry
+
+DEFAULT_GRID = 256
+
+
+class PolygonLocator:
+    """
+    Grid index over polygons.
+
+    Where polygons overlap, a lookup returns the first of them in the order
+    they were given, like testing all polygons one after the other.
+
+    Attributes:
+        bbox (tuple[float, float, float, float]): min lon, min lat, max lon, max lat
+            of all polygons.
+        grid (int): Number of grid cells per axis.
+    """
+
+    def __init__(
+        self, geometries: dict[Hashable, PolygonGeometry], grid: int = DEFAULT_GRID
+    ):
+        """
+        Build the grid index.
+
+        Args:
+            geometries (dict[Hashable, PolygonGeometry]): Polygons by key.
+            grid (int): Number of grid cells per axis.
+        """
+        self.grid = grid
+        if not geometries:
+            self.bbox = None
+            self._cells = []
+            return
+
+        bboxes = [geometry.bbox for geometry in geometries.values()]
+        self.bbox = (
+            min(bbox[0] for bbox in bboxes),
+            min(bbox[1] for bbox in bboxes),
+            max(bbox[2] for bbox in bboxes),
+            max(bbox[3] for bbox in bboxes),
+        )
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        self._cell_width = (max_lon - min_lon) / grid or 1.0
+        self._cell_height = (max_lat - min_lat) / grid or 1.0
+
+        edges = {key: self._edges(geometry) for key, geometry in geometries.items()}
+        boundaries: dict[int, dict] = {}  # cell -> polygons crossing it by key
+        for key, geometry in geometries.items():
+            for x1, y1, x2, y2 in edges[key]:
+                first_col, last_col = self._col(min(x1, x2)), self._col(max(x1, x2))
+                for row in range(self._row(min(y1, y2)), self._row(max(y1, y2)) + 1):
+                    for col in range(first_col, last_col + 1):
+                        boundaries.setdefault(row * grid + col, {})[key] = geometry
+        interiors: dict[int, Hashable] = {}  # cell -> key of the polygon covering it
+        for key, geometry in geometries.items():
+            self._fill_interior(key, geometry, edges[key], boundaries, interiors)
+
+        # Per cell the key covering it, or the candidates in the order of the input
+        order = {key: index for index, key in enumerate(geometries)}
+        self._cells = [(None, ())] * (grid * grid)
+        for cell, candidates in boundaries.items():
+            self._cells[cell] = (
+                None,
+                tuple(sorted(candidates.items(), key=lambda item: order[item[0]])),
+            )
+        for cell, key in interiors.items():
+            self._cells[cell] = (key, ())
+
+    @staticmethod
+    def _edges(geometry: PolygonGeometry) -> list[tuple[float, float, float, float]]:
+        edges = []
+        for rings in geometry.polygons:
+            for ring in rings:
+                xs, ys = ring[0::2], ring[1::2]
+                edges.extend(zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]))
+        return edges
+
+    def _col(self, lon: float) -> int:
+        return min(max(int((lon - self.bbox[0]) / self._cell_width), 0), self.grid - 1)
+
+    def _row(self, lat: float) -> int:
+        return min(max(int((lat - self.bbox[1]) / self._cell_height), 0), self.grid - 1)
+
+    def _fill_interior(
+        self,
+        key: Hashable,
+        geometry: PolygonGeometry,
+        edges: list[tuple[float, float, float, float]],
+        boundaries: dict[int, dict],
+        interiors: dict[int, Hashable],
+    ) -> None:
+        """
+        Mark the cells without edges of the polygon whose center lies inside it.
+
+        Such a cell lies completely inside the polygon. If no other polygon
+        crosses the cell either, the polygon answers every lookup in it,
+        otherwise it becomes one more candidate of the cell, as polygons of
+        real data may overlap a little.
+
+        Scans every row of cells along its center line, the crossings of the
+        line with the edges decide by the even-odd rule which centers are inside.
+        """
+        min_lon, min_lat = self.bbox[0], self.bbox[1]
+        first_col, last_col = self._col(geometry.bbox[0]), self._col(geometry.bbox[2])
+        for row in range(self._row(geometry.bbox[1]), self._row(geometry.bbox[3]) + 1):
+            lat = min_lat + (row + 0.5) * self._cell_height
+            crossings = sorted(
+                x1 + (lat - y1) * (x2 - x1) / (y2 - y1)
+                for x1, y1, x2, y2 in edges
+                if (y1 > lat) != (y2 > lat)
+            )
+            if not crossings:
+                continue
+            for col in range(first_col, last_col + 1):
+                cell = row * self.grid + col
+                lon = min_lon + (col + 0.5) * self._cell_width
+                if not bisect(crossings, lon) % 2:
+                    continue
+                crossing = boundaries.get(cell)
+                if crossing is None:
+                    interiors.setdefault(cell, key)
+                elif key not in crossing:
+                    crossing[key] = geometry
+
+    def locate(self, lon: float, lat: float) -> Optional[Hashable]:
+        """
+        Find the polygon containing a point.
+
+        Args:
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+
+        Returns:
+            Optional[Hashable]: Key of the polygon, None if no polygon contains the point.
+        """
+        if self.bbox is None:
+            return None
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+            return None
+
+        col = min(int((lon - min_lon) / self._cell_width), self.grid - 1)
+        row = min(int((lat - min_lat) / self._cell_height), self.grid - 1)
+        key, candidates = self._cells[row * self.grid + col]
+        if key is not None:
+            return key
+        for key, geometry in candidates:
+            if geometry.contains(lon, lat):
+                return key
+        return None
+
+    def locate_many(
+        self, lons: Iterable[float], lats: Iterable[float]
+    ) -> list[Optional[Hashable]]:
+        """
+        Find the polygons containing many points.
+
+        Args:
+            lons (Iterable[float]): Longitudes of the points.
+            lats (Iterable[float]): Latitudes of the points, in the same order.
+
+        Points in cells covered by one polygon are answered by the grid. The
+        others are tested per candidate polygon all at once, in one pass over
+        the edges of the polygon.
+
+        Returns:
+            list[Optional[Hashable]]: Key of the containing polygon per point, or None.
+        """
+        lons, lats = list(lons), list(lats)
+        keys: list[Optional[Hashable]] = [None] * len(lons)
+        if self.bbox is None:
+            return keys
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+
+        unresolved: dict[int, tuple] = {}  # point -> candidates of its cell
+        tested: dict[Hashable, tuple[PolygonGeometry, list[int]]] = {}
+        for i, (lon, lat) in enumerate(zip(lons, lats)):
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            col = min(int((lon - min_lon) / self._cell_width), self.grid - 1)
+            row = min(int((lat - min_lat) / self._cell_height), self.grid - 1)
+            key, candidates = self._cells[row * self.grid + col]
+            if key is not None:
+                keys[i] = key
+                continue
+            if candidates:
+                unresolved[i] = candidates
+                for key, geometry in candidates:
+                    tested.setdefault(key, (geometry, []))[1].append(i)
+
+        inside = {
+            key: self._contained(geometry, points, lons, lats)
+            for key, (geometry, points) in tested.items()
+        }
+        for i, candidates in unresolved.items():
+            keys[i] = next((key for key, _ in candidates if i in inside[key]), None)
+        return keys
+
+    def _contained(
+        self,
+        geometry: PolygonGeometry,
+        points: list[int],
+        lons: list[float],
+        lats: list[float],
+    ) -> set[int]:
+        """
+        Find the points inside a polygon by the even-odd rule of
+        `PreparedPolygon.contains`.
+
+        The points are sorted by latitude, so every edge only visits the
+        points whose horizontal ray it crosses.
+        """
+        min_lon, _, max_lon, _ = geometry.bbox
+        points = sorted(
+            (i for i in points if min_lon <= lons[i] <= max_lon),
+            key=lats.__getitem__,
+        )
+        ys = [lats[i] for i in points]
+        inside: set[int] = set()
+        for x1, y1, x2, y2 in self._edges(geometry):
+            if y1 == y2:
+                continue  # horizontal edges never cross a ray
+            low, high = (y1, y2) if y1 < y2 else (y2, y1)
+            for i in points[bisect_left(ys, low) : bisect_left(ys, high)]:
+                if lons[i] < x1 + (lats[i] - y1) * (x2 - x1) / (y2 - y1):
+                    if i in inside:
+                        inside.remove(i)
+                    else:
+                        inside.add(i)
+        return inside
+
+    @property
+    def resolved_share(self) -> float:
+        """
+        Returns:
+            float: Share of the cells inside the bounding box answered without
+            a point-in-polygon test.
+        """
+        if not self._cells:
+            return 0.0
+        crossed = sum(1 for key, candidates in self._cells if candidates)
+        return 1 - crossed / len(self._cells)
@@ -0,0 +1,167 @@
+"""Prepared polygon module.
+Indexes the edges of a (multi)polygon in horizontal bands, so repeated
+point-in-polygon tests only look at the few edges crossing the latitude
+of the point instead of the whole boundary.
+
+Classes:
+    PreparedPolygon: Polygon with bounding box and banded edge index.
+
+Functions:
+    overlap_shares: estimate how a polygon is split among other polygons
+    dominant_key:   pick the polygon with the largest share
+"""
+
+from typing import Hashable, Sequence
+
+EDGES_PER_BAND = 4
+MAX_BANDS = 512
+
+
+class PreparedPolygon:
+    """
+    Polygon prepared for fast point-in-polygon tests.
+
+    Holes and the parts of a multipolygon are handled by the even-odd rule.
+
+    Attributes:
+        bbox (tuple[float, float, float, float]): min lon, min lat, max lon, max lat.
+    """
+
+    def __init__(self, polygons: list[list[Sequence[float]]]):
+        """
+        Build the edge index.
+
+        Args:
+            polygons (list[list[Sequence[float]]]): Rings per polygon as
+                interleaved longitude and latitude values.
+        """
+        edges = []
+        for rings in polygons:
+            for ring in rings:
+                xs, ys = ring[0::2], ring[1::2]
+                edges.extend(
+                    (x1, y1, x2, y2)
+                    for x1, y1, x2, y2 in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1])
+                    if y1 != y2  # horizontal edges never cross a ray
+                )
+
+        xs = [x for rings in polygons for ring in rings for x in ring[0::2]]
+        ys = [y for rings in polygons for ring in rings for y in ring[1::2]]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        self._points = list(zip(xs, ys))
+
+        self._band_count = max(1, min(MAX_BANDS, len(edges) // EDGES_PER_BAND))
+        height = self.bbox[3] - self.bbox[1]
+        self._band_height = height / self._band_count if height > 0 else 1.0
+        self._bands = [[] for _ in range(self._band_count)]
+        min_lat, last_band = self.bbox[1], self._band_count - 1
+        for edge in edges:
+            low, high = (edge[1], edge[3]) if edge[1] < edge[3] else (edge[3], edge[1])
+            first = min(int((low - min_lat) / self._band_height), last_band)
+            last = min(int((high - min_lat) / self._band_height), last_band)
+            for band in range(first, last + 1):
+                self._bands[band].append(edge)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """
+        Test if a point lies inside the polygon.
+
+        Args:
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+
+        Returns:
+            bool: True if the point is inside. Points on the boundary may
+                count as inside or outside.
+        """
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+            return False
+
+        band = min(int((lat - min_lat) / self._band_height), self._band_count - 1)
+        inside = False
+        for x1, y1, x2, y2 in self._bands[band]:
+            if (y1 > lat) != (y2 > lat):
+                if lon < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+        return inside
+
+    def interior_samples(self, grid: int) -> list[tuple[float, float]]:
+        """
+        Sample the polygon with the centers of a regular grid over its bounding box.
+
+        Args:
+            grid (int): Number of grid cells per axis.
+
+        Returns:
+            list[tuple[float, float]]: The grid centers inside the polygon,
+                or the polygon's points if the grid misses it completely.
+        """
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        step_lon = (max_lon - min_lon) / grid
+        step_lat = (max_lat - min_lat) / grid
+        samples = [
+            (min_lon + (i + 0.5) * step_lon, min_lat + (j + 0.5) * step_lat)
+            for i in range(grid)
+            for j in range(grid)
+        ]
+        inside = [(lon, lat) for lon, lat in samples if self.contains(lon, lat)]
+        return inside or list(self._points)
+
+
+def _bboxes_intersect(a: tuple, b: tuple) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def overlap_shares(
+    polygon: PreparedPolygon,
+    candidates: dict[Hashable, PreparedPolygon],
+    grid: int = 16,
+) -> dict[Hashable, float]:
+    """
+    Estimate which share of a polygon's area lies in each candidate polygon.
+
+    The polygon is sampled on a regular grid, candidates whose bounding box
+    misses the polygon are skipped.
+
+    Args:
+        polygon (PreparedPolygon): The polygon to split.
+        candidates (dict[Hashable, PreparedPolygon]): Candidate polygons by key.
+        grid (int): Number of grid cells per axis.
+
+    Returns:
+        dict[Hashable, float]: Share of the sampled area per candidate key,
+            candidates without overlap are left out.
+    """
+    nearby = {
+        key: candidate
+        for key, candidate in candidates.items()
+        if _bboxes_intersect(polygon.bbox, candidate.bbox)
+    }
+    samples = polygon.interior_samples(grid)
+    hits = dict.fromkeys(nearby, 0)
+    last_key = None
+    for lon, lat in samples:
+        # Neighbouring samples usually fall into the same candidate
+        if last_key is not None and nearby[last_key].contains(lon, lat):
+            hits[last_key] += 1
+            continue
+        for key, candidate in nearby.items():
+            if key != last_key and candidate.contains(lon, lat):
+                hits[key] += 1
+                last_key = key
+                break
+    return {key: count / len(samples) for key, count in hits.items() if count}
+
+
+def dominant_key(shares: dict[Hashable, float]) -> Hashable:
+    """
+    Pick the key with the largest share.
+
+    Args:
+        shares (dict[Hashable, float]): Shares as returned by `overlap_shares`.
+
+    Returns:
+        Hashable: The key with the largest share, None if there is none.
+    """
+    return max(shares, key=shares.get) if shares else None
@@ -0,0 +1,150 @@
+"""R-tree module.
+Static R-tree over points, bulk loaded with Sort-Tile-Recursive (STR)
+packing for rectangle queries, e.g. the charging stations in a map viewport.
+
+The points are sorted once into STR order: into vertical slabs by
+longitude, within every slab by latitude. Leaves hold consecutive runs of
+these points and every inner node consecutive runs of the nodes below, so
+each node covers a contiguous range of the sorted points. A node inside the
+query rectangle therefore adds its whole range without visiting its leaves.
+
+Classes:
+    PointRTree: STR-packed R-tree answering rectangle queries.
+"""
+
+import math
+from typing import Sequence
+
+DEFAULT_NODE_CAPACITY = 16
+
+# Positions in the node tuples
+_MIN_X, _MIN_Y, _MAX_X, _MAX_Y, _FIRST_POINT, _END_POINT, _FIRST_CHILD, _END_CHILD = (
+    range(8)
+)
+
+
+class PointRTree:
+    """
+    STR-packed R-tree over points.
+
+    Attributes:
+        size (int): Number of indexed points.
+        node_capacity (int): Maximum number of entries per node.
+    """
+
+    def __init__(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        node_capacity: int = DEFAULT_NODE_CAPACITY,
+    ):
+        """
+        Bulk load the tree.
+
+        Args:
+            xs (Sequence[float]): x coordinate (longitude) per point.
+            ys (Sequence[float]): y coordinate (latitude) per point.
+            node_capacity (int): Maximum number of entries per node.
+        """
+        self.size = len(xs)
+        self.node_capacity = node_capacity
+        capacity = node_capacity
+
+        order = sorted(range(self.size), key=xs.__getitem__)
+        leaf_count = math.ceil(self.size / capacity)
+        slab_size = max(math.ceil(math.sqrt(leaf_count)), 1) * capacity
+        packed = []
+        for start in range(0, self.size, slab_size):
+            packed.extend(sorted(order[start : start + slab_size], key=ys.__getitem__))
+
+        self._indices = packed
+        self._xs = [xs[index] for index in packed]
+        self._ys = [ys[index] for index in packed]
+
+        level = []
+        for start in range(0, self.size, capacity):
+            end = min(start + capacity, self.size)
+            node_xs, node_ys = self._xs[start:end], self._ys[start:end]
+            level.append(
+                (
+                    min(node_xs),
+                    min(node_ys),
+                    max(node_xs),
+                    max(node_ys),
+                    start,
+                    end,
+                    0,
+                    0,
+                )
+            )
+        self._levels = [level]
+        while len(level) > 1:
+            parents = []
+            for start in range(0, len(level), capacity):
+                children = level[start : start + capacity]
+                parents.append(
+                    (
+                        min(child[_MIN_X] for child in children),
+                        min(child[_MIN_Y] for child in children),
+                        max(child[_MAX_X] for child in children),
+                        max(child[_MAX_Y] for child in children),
+                        children[0][_FIRST_POINT],
+                        children[-1][_END_POINT],
+                        start,
+                        start + len(children),
+                    )
+                )
+            level = parents
+            self._levels.append(level)
+
+    def query(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[int]:
+        """
+        Find the points inside a rectangle, borders included.
+
+        Args:
+            min_x (float): West edge of the rectangle.
+            min_y (float): South edge of the rectangle.
+            max_x (float): East edge of the rectangle.
+            max_y (float): North edge of the rectangle.
+
+        Returns:
+            list[int]: Positions of the points in the sequences the tree was built
+            from, in no particular order.
+        """
+        found = []
+        if not self.size:
+            return found
+
+        levels, indices, xs, ys = self._levels, self._indices, self._xs, self._ys
+        stack = [(len(levels) - 1, 0)]
+        while stack:
+            depth, position = stack.pop()
+            node = levels[depth][position]
+            if (
+                node[_MIN_X] > max_x
+                or node[_MAX_X] < min_x
+                or node[_MIN_Y] > max_y
+                or node[_MAX_Y] < min_y
+            ):
+                continue
+            if (
+                min_x <= node[_MIN_X]
+                and node[_MAX_X] <= max_x
+                and min_y <= node[_MIN_Y]
+                and node[_MAX_Y] <= max_y
+            ):
+                found.extend(indices[node[_FIRST_POINT] : node[_END_POINT]])
+            elif depth == 0:
+                found.extend(
+                    indices[point]
+                    for point in range(node[_FIRST_POINT], node[_END_POINT])
+                    if min_x <= xs[point] <= max_x and min_y <= ys[point] <= max_y
+                )
+            else:
+                stack.extend(
+                    (depth - 1, child)
+                    for child in range(node[_FIRST_CHILD], node[_END_CHILD])
+                )
+        return found
@@ -0,0 +1,269 @@
+"""Polygon simplification module.
+Simplified versions of a set of neighbouring polygons per zoom level of a
+web map, so zoomed-out maps download a fraction of the vertices.
+
+The polygons are split into shared arcs with `PolygonTopology`, and every
+arc is simplified once with Douglas-Peucker, keeping its end points. Both
+neighbours of a border get the same simplified arc, so the simplified
+shapes have no gaps or overlaps along shared borders. The tolerance is one
+screen pixel of the zoom level in meters, and coordinates are rounded to a
+tenth of a pixel, which shortens the WKT further.
+
+Arcs of rings made of fewer than three arcs keep at least one interior
+point, so every ring keeps an area. Rings that still collapse when rounded
+are smaller than a pixel and left out.
+
+Classes:
+    SimplifiedPolygons: WKT of a set of polygons per zoom level with payload sizes.
+
+Functions:
+    douglas_peucker:  simplify a line of planar points
+    meters_per_pixel: ground resolution of a zoom level at a latitude
+"""
+
+import heapq
+import math
+from typing import Hashable, Optional, Sequence
+
+from app.domain.geometry.distance import LocalProjection
+from app.domain.geometry.polygon import EARTH_RADIUS_M
+from app.domain.geometry.topology import Point, PolygonTopology
+from app.domain.geometry.wkt import format_wkt_polygons
+
+DEFAULT_ZOOMS = (8, 10, 12, 14)
+DEFAULT_PIXEL_TOLERANCE = 1.0
+TILE_SIZE = 256
+
+
+def meters_per_pixel(zoom: int, lat: float) -> float:
+    """
+    Compute the ground resolution of a web map.
+
+    Args:
+        zoom (int): Zoom level with 256 pixel tiles.
+        lat (float): Latitude of the map center.
+
+    Returns:
+        float: Meters per pixel.
+    """
+    circumference = 2 * math.pi * EARTH_RADIUS_M * math.cos(math.radians(lat))
+    return circumference / (TILE_SIZE * 2**zoom)
+
+
+def _segment_distance_sq(point: Point, start: Point, end: Point) -> float:
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    px, py = point[0] - start[0], point[1] - start[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq:
+        t = min(max((px * dx + py * dy) / length_sq, 0.0), 1.0)
+        px, py = px - t * dx, py - t * dy
+    return px * px + py * py
+
+
+def _farthest(points: Sequence[Point], first: int, last: int) -> tuple[float, int]:
+    start, end = points[first], points[last]
+    return max(
+        (_segment_distance_sq(points[index], start, end), index)
+        for index in range(first + 1, last)
+    )
+
+
+def douglas_peucker(
+    points: Sequence[Point], tolerance: float, min_interior: int = 0
+) -> list[int]:
+    """
+    Simplify a line with the Douglas-Peucker algorithm.
+
+    Points are added farthest first, so `min_interior` keeps the points that
+    matter most for the shape even if they are within the tolerance.
+
+    Args:
+        points (Sequence[tuple[float, float]]): Planar points of the line.
+        tolerance (float): Largest distance of a dropped point from the
+            simplified line.
+        min_interior (int): Smallest number of points kept besides the end points.
+
+    Returns:
+        list[int]: Positions of the kept points in order, the end points included.
+    """
+    last = len(points) - 1
+    if last < 2:
+        return list(range(last + 1))
+    tolerance_sq = tolerance * tolerance
+    kept = [0, last]
+    ranges = []  # negated distance of the farthest point, its position and range
+    distance_sq, index = _farthest(points, 0, last)
+    heapq.heappush(ranges, (-distance_sq, index, 0, last))
+    while ranges:
+        distance_sq, index, first, end = heapq.heappop(ranges)
+        if -distance_sq <= tolerance_sq and len(kept) - 2 >= min_interior:
+            break
+        kept.append(index)
+        for low, high in ((first, index), (index, end)):
+            if high - low > 1:
+                distance_sq, farthest = _farthest(points, low, high)
+                heapq.heappush(ranges, (-distance_sq, farthest, low, high))
+    return sorted(kept)
+
+
+def _simplify_arc(
+    points: list[Point], tolerance: float, min_interior: int
+) -> list[int]:
+    """
+    Simplify an arc, closed arcs are split at the point farthest from their start.
+    """
+    if len(points) > 3 and points[0] == points[-1]:
+        _, middle = max(
+            (_segment_distance_sq(point, points[0], points[0]), index)
+            for index, point in enumerate(points)
+        )
+        head = douglas_peucker(points[: middle + 1], tolerance, 1)
+        tail = douglas_peucker(points[middle:], tolerance, 1)
+        return head + [middle + index for index in tail[1:]]
+    return douglas_peucker(points, tolerance, min_interior)
+
+
+def _round_arc(arc: list[Point], decimals: int) -> list[Point]:
+    rounded: list[Point] = []
+    for lon, lat in arc:
+        point = (round(lon, decimals), round(lat, decimals))
+        if not rounded or rounded[-1] != point:
+            rounded.append(point)
+    return rounded
+
+
+class SimplifiedPolygons:
+    """
+    WKT of a set of neighbouring polygons per zoom level.
+
+    Attributes:
+        zooms (tuple[int, ...]): Zoom levels with simplified polygons, larger
+            zoom levels get the full resolution.
+        levels (list[dict]): Per level, the `zoom` (None for the full
+            resolution), the number of `vertices` and the `wkt_bytes` of all polygons.
+    """
+
+    def __init__(
+        self,
+        geometries: dict[Hashable, list[list[Sequence[float]]]],
+        zooms: Sequence[int] = DEFAULT_ZOOMS,
+        pixel_tolerance: float = DEFAULT_PIXEL_TOLERANCE,
+    ):
+        """
+        Simplify the polygons for every zoom level.
+
+        Args:
+            geometries (dict[Hashable, list[list[Sequence[float]]]]): Per key,
+                one list of rings per polygon as closed flat sequences of
+                interleaved longitude and latitude values.
+            zooms (Sequence[int]): Zoom levels to simplify for.
+            pixel_tolerance (float): Tolerance in pixels of the zoom level.
+        """
+        self.zooms = tuple(sorted(zooms))
+        topology = PolygonTopology(geometries)
+        self._wkt: dict[Optional[int], dict[Hashable, str]] = {}
+        self.levels: list[dict] = []
+        self._add_level(
+            None,
+            {
+                key: format_wkt_polygons(polygons)
+                for key, polygons in geometries.items()
+            },
+            sum(
+                len(ring) // 2
+                for polygons in geometries.values()
+                for rings in polygons
+                for ring in rings
+            ),
+        )
+
+        lats = [lat for arc in topology.arcs for _, lat in arc]
+        reference_lat = (min(lats) + max(lats)) / 2 if lats else 0.0
+        projection = LocalProjection(reference_lat)
+        planar_arcs = [
+            [projection.project(lon, lat) for lon, lat in arc] for arc in topology.arcs
+        ]
+        # Arcs of rings with fewer than three arcs keep an interior point
+        min_interior = [0] * len(topology.arcs)
+        for polygons in topology.polygons.values():
+            for polygon in polygons:
+                for refs in polygon:
+                    if len(refs) < 3:
+                        for ref in refs:
+                            min_interior[ref if ref >= 0 else ~ref] = 1
+
+        for zoom in self.zooms:
+            tolerance = pixel_tolerance * meters_per_pixel(zoom, reference_lat)
+            degrees_per_pixel = 360 / (TILE_SIZE * 2**zoom)
+            decimals = math.ceil(-math.log10(degrees_per_pixel / 10))
+            arcs = [
+                _round_arc(
+                    [arc[index] for index in _simplify_arc(planar, tolerance, keep)],
+                    decimals,
+                )
+                for arc, planar, keep in zip(topology.arcs, planar_arcs, min_interior)
+            ]
+            self._add_level(zoom, *self._format(topology, arcs))
+
+    def _add_level(
+        self, zoom: Optional[int], texts: dict[Hashable, str], vertices: int
+    ) -> None:
+        self._wkt[zoom] = texts
+        self.levels.append(
+            {
+                "zoom": zoom,
+                "vertices": vertices,
+                "wkt_bytes": sum(len(text.encode()) for text in texts.values()),
+            }
+        )
+
+    @staticmethod
+    def _format(
+        topology: PolygonTopology, arcs: list[list[Point]]
+    ) -> tuple[dict[Hashable, str], int]:
+        """
+        Join the rings from the simplified arcs, without collapsed rings,
+        and count their points.
+        """
+        texts, vertices = {}, 0
+        for key, polygons in topology.polygons.items():
+            simplified = []
+            for polygon in polygons:
+                rings = [topology.ring_points(refs, arcs) for refs in polygon]
+                # A polygon whose exterior collapsed is left out with its holes
+                if not rings or len(set(rings[0])) < 3:
+                    continue
+                rings = rings[:1] + [ring for ring in rings[1:] if len(set(ring)) >= 3]
+                vertices += sum(len(ring) for ring in rings)
+                simplified.append(
+                    [[value for point in ring for value in point] for ring in rings]
+                )
+            if simplified:
+                texts[key] = format_wkt_polygons(simplified)
+        return texts, vertices
+
+    def level_zoom(self, zoom: int) -> Optional[int]:
+        """
+        Get the level serving a zoom level.
+
+        Args:
+            zoom (int): Zoom level of the map.
+
+        Returns:
+            Optional[int]: The smallest simplified zoom level at least as
+            large, None for the full resolution.
+        """
+        return next((level for level in self.zooms if level >= zoom), None)
+
+    def wkt_at_level(self, level: Optional[int]) -> dict[Hashable, str]:
+        """
+        Get the polygons of a level.
+
+        Args:
+            level (Optional[int]): One of `zooms`, None for the full resolution.
+
+        Returns:
+            dict[Hashable, str]: WKT by key. Polygons smaller than a pixel
+            of the level are left out.
+        """
+        return self._wkt[level]
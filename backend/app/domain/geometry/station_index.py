@@ -0,0 +1,408 @@
+"""Station index module.
+Keeps the charging stations in memory with spatial indexes over their
+locations, so map viewports, clusters, nearest station, radius and route
+corridor searches are answered without a database query.
+
+New stations are added to the geohash grid right away. The R-tree, the
+KD-tree and the clusters are static, they are built on first use and again
+after stations were added.
+
+Classes:
+    StationIndex:      Station dictionaries with spatial indexes over their locations.
+    StationIndexCache: Thread-safe memo of the station index until the stations change.
+"""
+
+import heapq
+import threading
+from typing import Callable, Collection, Optional
+
+from app.domain.geometry.clustering import PointClusters
+from app.domain.geometry.corridor import RouteCorridor
+from app.domain.geometry.distance import LocalProjection, haversine_distance
+from app.domain.geometry.geohash_grid import DEFAULT_PRECISION, GeohashGrid
+from app.domain.geometry.kdtree import PointKDTree
+from app.domain.geometry.rtree import PointRTree
+
+
+class StationIndex:
+    """
+    Charging stations with spatial indexes over their locations.
+
+    Attributes:
+        stations (list[dict]): The stations as returned by `ChargingStation.get_dict`.
+        max_id (int): Largest station id in the index, 0 without stations.
+        grid (GeohashGrid): Geohash grid over the stations, keyed by position.
+        revision (int): Incremented whenever stations are added or changed.
+    """
+
+    def __init__(self, stations: list[dict], grid_precision: int = DEFAULT_PRECISION):
+        """
+        Build the index.
+
+        Args:
+            stations (list[dict]): The stations as returned by `ChargingStation.get_dict`.
+            grid_precision (int): Geohash precision of the grid cells.
+        """
+        self.stations: list[dict] = []
+        self.max_id = 0
+        self.grid = GeohashGrid(grid_precision)
+        self.revision = 0
+        self._positions: dict[int, int] = {}
+        self._rtree: Optional[PointRTree] = None
+        self._clusters: Optional[PointClusters] = None
+        self._kdtree: Optional[tuple[PointKDTree, LocalProjection, tuple]] = None
+        self._lock = threading.Lock()
+        self.add_stations(stations)
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def add_stations(self, stations: list[dict]) -> None:
+        """
+        Add new stations. Stations already in the index are skipped.
+
+        Args:
+            stations (list[dict]): The stations as returned by `ChargingStation.get_dict`.
+        """
+        with self._lock:
+            for station in stations:
+                if station["id"] in self._positions:
+                    continue
+                index = len(self.stations)
+                self.stations.append(station)
+                self._positions[station["id"]] = index
+                self.max_id = max(self.max_id, station["id"])
+                self.grid.add(index, station["longitude"], station["latitude"])
+            if stations:
+                self.revision += 1
+                self._rtree = self._kdtree = self._clusters = None
+
+    @property
+    def rtree(self) -> PointRTree:
+        """
+        Returns:
+            PointRTree: R-tree over the longitude and latitude of the stations.
+        """
+        with self._lock:
+            if self._rtree is None:
+                self._rtree = PointRTree(
+                    [station["longitude"] for station in self.stations],
+                    [station["latitude"] for station in self.stations],
+                )
+            return self._rtree
+
+    @property
+    def clusters(self) -> PointClusters:
+        """
+        Returns:
+            PointClusters: Clusters of the stations per zoom level, tagged with
+            their `functional` status.
+        """
+        with self._lock:
+            if self._clusters is None:
+                self._clusters = PointClusters(
+                    [station["longitude"] for station in self.stations],
+                    [station["latitude"] for station in self.stations],
+                    [station["functional"] for station in self.stations],
+                )
+            return self._clusters
+
+    def _nearest_index(self) -> tuple[PointKDTree, LocalProjection, tuple]:
+        """
+        Get the KD-tree over the stations projected around their mean latitude,
+        tagged with their `functional` status, with projection and latitude range.
+        """
+        with self._lock:
+            if self._kdtree is None:
+                lons = [station["longitude"] for station in self.stations]
+                lats = [station["latitude"] for station in self.stations]
+                projection = LocalProjection(sum(lats) / len(lats) if lats else 0.0)
+                projected = list(map(projection.project, lons, lats))
+                kdtree = PointKDTree(
+                    [x for x, _ in projected],
+                    [y for _, y in projected],
+                    [station["functional"] for station in self.stations],
+                )
+                lat_range = (min(lats), max(lats)) if lats else (0.0, 0.0)
+                self._kdtree = (kdtree, projection, lat_range)
+            return self._kdtree
+
+    def within_bbox(
+        self, min_lon: float, min_lat: float, max_lon: float, max_lat: float
+    ) -> list[dict]:
+        """
+        Find the stations inside a bounding box, borders included.
+
+        Args:
+            min_lon (float): West edge of the box.
+            min_lat (float): South edge of the box.
+            max_lon (float): East edge of the box.
+            max_lat (float): North edge of the box.
+
+        Returns:
+            list[dict]: The stations in no particular order.
+        """
+        stations = self.stations
+        return [
+            stations[index]
+            for index in self.rtree.query(min_lon, min_lat, max_lon, max_lat)
+        ]
+
+    def nearest(
+        self,
+        lon: float,
+        lat: float,
+        k: int,
+        functional: Optional[Collection[str]] = None,
+        charging_type: Optional[str] = None,
+        min_nominal_power: Optional[int] = None,
+    ) -> list[tuple[float, dict]]:
+        """
+        Find the stations closest to a position.
+
+        The KD-tree yields the stations by planar distance, each is refined to
+        its great-circle distance. The search stops once the planar distance,
+        scaled by the bound of `LocalProjection.distance_factor`, exceeds the
+        k-th best great-circle distance, so the result is exact.
+
+        Args:
+            lon (float): Longitude of the position.
+            lat (float): Latitude of the position.
+            k (int): Maximum number of stations.
+            functional (Optional[Collection[str]]): Accepted `functional` status
+                values, None for all.
+            charging_type (Optional[str]): Required `charging_type`, None for all.
+            min_nominal_power (Optional[int]): Smallest accepted `nominal_power`.
+
+        Returns:
+            list[tuple[float, dict]]: Distance in meters and station, closest first.
+        """
+        if k <= 0:
+            return []
+        kdtree, projection, lat_range = self._nearest_index()
+        factor = projection.distance_factor(
+            min(lat, lat_range[0]), max(lat, lat_range[1])
+        )
+        x, y = projection.project(lon, lat)
+        stations = self.stations
+        best = []  # negated distance and position of the k closest stations
+        for planar, index in kdtree.iter_nearest(x, y, functional):
+            if len(best) == k and planar * factor > -best[0][0]:
+                break
+            station = stations[index]
+            if charging_type is not None and station["charging_type"] != charging_type:
+                continue
+            if min_nominal_power is not None and (
+                station["nominal_power"] is None
+                or station["nominal_power"] < min_nominal_power
+            ):
+                continue
+            distance = haversine_distance(
+                lon, lat, station["longitude"], station["latitude"]
+            )
+            if len(best) < k:
+                heapq.heappush(best, (-distance, -index))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, -index))
+        return [
+            (-distance, stations[-index])
+            for distance, index in sorted(best, reverse=True)
+        ]
+
+    def within(self, lon: float, lat: float, radius: float) -> list[tuple[float, dict]]:
+        """
+        Find the stations within a radius of a position.
+
+        Args:
+            lon (float): Longitude of the position.
+            lat (float): Latitude of the position.
+            radius (float): Radius in meters, stations on the circle are included.
+
+        Returns:
+            list[tuple[float, dict]]: Great-circle distance in meters and station,
+            closest first.
+        """
+        stations = self.stations
+        return [
+            (distance, stations[index])
+            for distance, index in self.grid.within(lon, lat, radius)
+        ]
+
+    def along_route(
+        self, route: list[tuple[float, float]], distance: float
+    ) -> list[tuple[float, float, dict]]:
+        """
+        Find the stations within a distance of a route.
+
+        Every piece of the route queries the R-tree with its bounding box,
+        widened by the distance, and the stations found are measured against
+        the segment of the piece. A station near several segments, e.g. where
+        the route comes back, is kept with the closest one.
+
+        Args:
+            route (list[tuple[float, float]]): Longitude and latitude of the
+                route points in driving order, at least one.
+            distance (float): Largest distance from the route in meters,
+                stations on the border are included.
+
+        Returns:
+            list[tuple[float, float, dict]]: Position along the route and
+            distance from it in meters, and station, in driving order.
+        """
+        corridor = RouteCorridor(route, distance)
+        rtree, stations = self.rtree, self.stations
+        best: dict[int, tuple[float, float]] = {}
+        measured = set()
+        for segment, box in corridor.boxes():
+            for index in rtree.query(*box):
+                if (segment, index) in measured:
+                    continue
+                measured.add((segment, index))
+                station = stations[index]
+                found = corridor.measure(
+                    segment, station["longitude"], station["latitude"]
+                )
+                if found is not None and (index not in best or found < best[index]):
+                    best[index] = found
+        return [
+            (offset, from_route, stations[index])
+            for index, (from_route, offset) in sorted(
+                best.items(), key=lambda item: (item[1][1], item[1][0], item[0])
+            )
+        ]
+
+    def clusters_in_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+        zoom: int,
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        Find the clusters and single stations of a zoom level inside a bounding box.
+
+        Args:
+            min_lon (float): West edge of the box.
+            min_lat (float): South edge of the box.
+            max_lon (float): East edge of the box.
+            max_lat (float): North edge of the box.
+            zoom (int): Zoom level of the map.
+
+        Returns:
+            tuple[list[dict], list[dict]]: The clusters with `cluster_id`,
+            `longitude`, `latitude`, `count` and the count per `functional`
+            status as `statuses`, and the stations not in a cluster.
+        """
+        clusters, points = self.clusters.query(min_lon, min_lat, max_lon, max_lat, zoom)
+        for cluster in clusters:
+            cluster["statuses"] = cluster.pop("tags")
+        stations = self.stations
+        return clusters, [stations[index] for index in points]
+
+    def update_station(self, station_id: int, values: dict) -> bool:
+        """
+        Change attributes of a station other than its location.
+
+        The station dictionary is replaced, not modified, so lists returned
+        before keep the old values.
+
+        Args:
+            station_id (int): Id of the station.
+            values (dict): The changed attributes.
+
+        Returns:
+            bool: False if the station is not in the index.
+        """
+        with self._lock:
+            index = self._positions.get(station_id)
+            if index is None:
+                return False
+            self.stations[index] = {**self.stations[index], **values}
+            self.revision += 1
+            if "functional" in values and self._kdtree is not None:
+                self._kdtree[0].set_tag(index, values["functional"])
+            if "functional" in values and self._clusters is not None:
+                self._clusters.set_tag(index, values["functional"])
+            return True
+
+
+class StationIndexCache:
+    """
+    Process-wide memo of the station index.
+
+    Attributes:
+        version (int): Incremented whenever stations are moved or deleted.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._index: Optional[StationIndex] = None
+        self._added = False
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        build: Callable[[], StationIndex],
+        load_added: Optional[Callable[[int], list[dict]]] = None,
+    ) -> StationIndex:
+        """
+        Get the station index, built on first use and after every invalidation.
+
+        An index whose build overlapped an invalidation is returned but not kept.
+        After `stations_added`, the kept index is extended by the stations
+        with larger ids than the ones it holds.
+
+        Args:
+            build (Callable[[], StationIndex]): Builds the index from the database.
+            load_added (Optional[Callable[[int], list[dict]]]): Loads the stations
+                with an id larger than the given one.
+
+        Returns:
+            StationIndex: The memoized or newly built index.
+        """
+        index, version = self._index, self.version
+        if index is not None:
+            if self._added and load_added is not None:
+                with self._lock:
+                    self._added = False
+                index.add_stations(load_added(index.max_id))
+            return index
+        index = build()
+        with self._lock:
+            if self.version == version:
+                self._index = index
+        return index
+
+    def stations_added(self) -> None:
+        """
+        Note that stations were inserted, the next `get` adds them to the kept index.
+        """
+        with self._lock:
+            self._added = True
+
+    def invalidate(self) -> None:
+        """
+        Drop the index, e.g. after stations were moved or deleted.
+        """
+        with self._lock:
+            self.version += 1
+            self._index = None
+
+    def update_station(self, station_id: int, values: dict) -> None:
+        """
+        Change attributes of a station other than its location in the kept index.
+
+        Without kept index, a build in progress is discarded as it may have
+        read the old values.
+
+        Args:
+            station_id (int): Id of the station.
+            values (dict): The changed attributes.
+        """
+        with self._lock:
+            if self._index is None or not self._index.update_station(
+                station_id, values
+            ):
+                self.version += 1
+                self._index = None
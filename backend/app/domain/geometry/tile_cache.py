@@ -0,0 +1,133 @@
+"""Tile cache module.
+Least recently used cache of encoded map tiles.
+
+Every tile remembers the objects it was built from, e.g. the station index
+and the postal code geometries. A lookup with other objects, e.g. after the
+stations were reloaded, builds the tile again. Changes to single stations
+drop only the tiles showing them with `TileCache.discard_point`.
+
+Classes:
+    TileCache: Thread-safe LRU cache of tiles by zoom, column and row.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from app.domain.geometry.vector_tile import (
+    DEFAULT_BUFFER,
+    DEFAULT_EXTENT,
+    tiles_containing,
+)
+
+DEFAULT_MAX_TILES = 4096
+
+
+class TileCache:
+    """
+    LRU cache of encoded tiles.
+
+    Attributes:
+        max_tiles (int): Number of tiles kept, the least recently used go first.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that built the tile.
+        version (int): Incremented whenever tiles are dropped.
+    """
+
+    def __init__(self, max_tiles: int = DEFAULT_MAX_TILES):
+        self.max_tiles = max_tiles
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._tiles: OrderedDict[tuple[int, int, int], tuple[tuple, bytes]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def get(
+        self, tile: tuple[int, int, int], sources: tuple, build: Callable[[], bytes]
+    ) -> bytes:
+        """
+        Get an encoded tile, built if missing or built from other sources.
+
+        A tile whose build overlapped dropping tiles is returned but not kept.
+
+        Args:
+            tile (tuple[int, int, int]): Zoom, column and row of the tile.
+            sources (tuple): The objects the tile is built from, compared by identity.
+            build (Callable[[], bytes]): Builds the encoded tile.
+
+        Returns:
+            bytes: The encoded tile.
+        """
+        with self._lock:
+            entry = self._tiles.get(tile)
+            if (
+                entry is not None
+                and len(entry[0]) == len(sources)
+                and all(kept is source for kept, source in zip(entry[0], sources))
+            ):
+                self._tiles.move_to_end(tile)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            version = self.version
+
+        data = build()
+        with self._lock:
+            if self.version == version:
+                self._tiles[tile] = (sources, data)
+                self._tiles.move_to_end(tile)
+                while len(self._tiles) > self.max_tiles:
+                    self._tiles.popitem(last=False)
+        return data
+
+    def discard_point(
+        self,
+        lon: float,
+        lat: float,
+        extent: int = DEFAULT_EXTENT,
+        buffer: int = DEFAULT_BUFFER,
+    ) -> None:
+        """
+        Drop the tiles of all zoom levels showing a point, e.g. a station
+        whose status changed.
+
+        Args:
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+            extent (int): Grid units per tile side of the cached tiles.
+            buffer (int): Grid units around the cached tiles.
+        """
+        with self._lock:
+            self.version += 1
+            for z in {z for z, _, _ in self._tiles}:
+                for x, y in tiles_containing(lon, lat, z, extent, buffer):
+                    self._tiles.pop((z, x, y), None)
+
+    def clear(self) -> None:
+        """
+        Drop all tiles.
+        """
+        with self._lock:
+            self.version += 1
+            self._tiles.clear()
+
+    def info(self) -> dict:
+        """
+        Report the size of the cache.
+
+        Returns:
+            dict: Number of tiles, bytes held by them, hits and misses.
+        """
+        with self._lock:
+            tiles = list(self._tiles.values())
+        return {
+            "tiles": len(tiles),
+            "bytes": sum(len(data) for _, data in tiles),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
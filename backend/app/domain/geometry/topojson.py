@@ -0,0 +1,181 @@
+"""TopoJSON module.
+Compact form of neighbouring polygons in the TopoJSON format, which web
+maps decode into the original shapes.
+
+The arcs of a `PolygonTopology` are quantized to an integer grid over the
+bounding box of all polygons and delta-encoded: the first point of an arc
+is stored on the grid, every further point as the step from the previous
+one. Shared borders are stored once and the polygons reference their arcs
+by index, `~i` walking the arc `i` backwards. Quantization merges points
+closer than a grid step, so arcs keep only the points that differ on the grid.
+
+Classes:
+    QuantizedTopology: Delta-encoded arcs of a polygon topology, encoded as TopoJSON.
+"""
+
+import json
+from array import array
+from typing import Hashable
+
+from app.domain.geometry.topology import PolygonTopology
+
+DEFAULT_QUANTIZATION = 100_000
+
+
+class QuantizedTopology:
+    """
+    Quantized and delta-encoded arcs of a polygon topology.
+
+    Attributes:
+        quantization (int): Grid points per side of the bounding box.
+        bbox (tuple[float, float, float, float]): min lon, min lat, max lon, max lat.
+        scale (tuple[float, float]): Longitude and latitude of one grid step.
+        arcs (list[array]): Per arc, an `array("i")` of interleaved x and y
+            values, the first point on the grid and the others as steps.
+        polygons (dict[Hashable, list[list[list[int]]]]): Per key, one list of
+            rings per polygon as arc references, as in `PolygonTopology`.
+    """
+
+    def __init__(
+        self, topology: PolygonTopology, quantization: int = DEFAULT_QUANTIZATION
+    ):
+        """
+        Quantize the arcs.
+
+        Args:
+            topology (PolygonTopology): Arcs of the polygons.
+            quantization (int): Grid points per side of the bounding box, at least 2.
+        """
+        self.quantization = quantization
+        points = [point for arc in topology.arcs for point in arc]
+        lons, lats = [lon for lon, _ in points], [lat for _, lat in points]
+        self.bbox = (
+            (min(lons), min(lats), max(lons), max(lats)) if points else (0.0,) * 4
+        )
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        self.scale = (
+            (max_lon - min_lon) / (quantization - 1) or 1.0,
+            (max_lat - min_lat) / (quantization - 1) or 1.0,
+        )
+        self.arcs = [self._encode_arc(arc) for arc in topology.arcs]
+        self.polygons = topology.polygons
+
+    def _encode_arc(self, arc: list[tuple[float, float]]) -> array:
+        """
+        Quantize an arc and encode every point but the first as step.
+        Points on the grid point of their predecessor are dropped, the
+        last point is always kept so the arc still ends at its junction.
+        """
+        (min_lon, min_lat, _, _), (scale_x, scale_y) = self.bbox, self.scale
+        values = array("i")
+        last_x = last_y = 0
+        for index, (lon, lat) in enumerate(arc):
+            x = round((lon - min_lon) / scale_x)
+            y = round((lat - min_lat) / scale_y)
+            if 0 < index < len(arc) - 1 and (x, y) == (last_x, last_y):
+                continue
+            values.append(x - last_x)
+            values.append(y - last_y)
+            last_x, last_y = x, y
+        return values
+
+    def decode_arc(self, index: int) -> list[tuple[float, float]]:
+        """
+        Get the points of an arc on the quantization grid.
+
+        Args:
+            index (int): Index of the arc.
+
+        Returns:
+            list[tuple[float, float]]: Longitude and latitude of the points.
+        """
+        (min_lon, min_lat, _, _), (scale_x, scale_y) = self.bbox, self.scale
+        points = []
+        x = y = 0
+        values = self.arcs[index]
+        for dx, dy in zip(values[0::2], values[1::2]):
+            x, y = x + dx, y + dy
+            points.append((min_lon + x * scale_x, min_lat + y * scale_y))
+        return points
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Returns:
+            int: Number of points of all arcs.
+        """
+        return sum(len(values) for values in self.arcs) // 2
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Bytes held by the encoded arcs.
+        """
+        return sum(values.itemsize * len(values) for values in self.arcs)
+
+    def to_topojson(self, object_name: str) -> dict:
+        """
+        Build the TopoJSON topology.
+
+        Args:
+            object_name (str): Name of the geometry collection of the polygons.
+
+        Returns:
+            dict: Topology with `transform`, the `arcs` and one Polygon or
+            MultiPolygon per key, the key as its `id`.
+        """
+        geometries = []
+        for key, polygons in self.polygons.items():
+            if len(polygons) == 1:
+                geometry = {"type": "Polygon", "arcs": polygons[0]}
+            else:
+                geometry = {"type": "MultiPolygon", "arcs": polygons}
+            geometries.append({**geometry, "id": key})
+        return {
+            "type": "Topology",
+            "bbox": list(self.bbox),
+            "transform": {
+                "scale": list(self.scale),
+                "translate": list(self.bbox[:2]),
+            },
+            "objects": {
+                object_name: {"type": "GeometryCollection", "geometries": geometries}
+            },
+            "arcs": [
+                [list(point) for point in zip(values[0::2], values[1::2])]
+                for values in self.arcs
+            ],
+        }
+
+    def encode(self, object_name: str) -> bytes:
+        """
+        Encode the topology as compact TopoJSON.
+
+        Args:
+            object_name (str): Name of the geometry collection of the polygons.
+
+        Returns:
+            bytes: UTF-8 JSON without whitespace.
+        """
+        return json.dumps(self.to_topojson(object_name), separators=(",", ":")).encode()
+
+    @classmethod
+    def from_geometries(
+        cls,
+        geometries: dict[Hashable, list[list]],
+        quantization: int = DEFAULT_QUANTIZATION,
+    ) -> "QuantizedTopology":
+        """
+        Build the topology of a set of polygons and quantize its arcs.
+
+        Args:
+            geometries (dict[Hashable, list[list]]): Per key, one list of rings
+                per polygon as closed flat sequences of interleaved longitude
+                and latitude values.
+            quantization (int): Grid points per side of the bounding box.
+
+        Returns:
+            QuantizedTopology: The quantized topology.
+        """
+        return cls(PolygonTopology(geometries), quantization)
@@ -0,0 +1,240 @@
+"""Polygon topology module.
+Splits the rings of neighbouring polygons into arcs, so a border shared by
+two polygons is one arc used by both instead of two copies of its vertices.
+
+A vertex is a junction where the rings through it do not continue alike,
+e.g. where the borders of three postal codes meet or a shared border ends
+at the city boundary. Rings are cut at their junctions, so a shared border
+becomes the same arc in both rings, walked in opposite directions. A ring
+without junctions, e.g. an island or an enclave, is one closed arc. Shapes
+built from the arcs, e.g. simplified ones, stay free of gaps and overlaps
+along the shared borders as long as every arc is changed only once.
+Arcs used by a single ring form the outline of the union of all polygons.
+
+Classes:
+    PolygonTopology: Arcs of a set of (multi)polygons with the arcs of every ring.
+"""
+
+from array import array
+from collections import Counter
+from typing import Hashable, Optional, Sequence
+
+from app.domain.geometry.polygon import ring_signed_area
+from app.domain.geometry.prepared_polygon import PreparedPolygon
+
+Point = tuple[float, float]
+
+
+def _ring_points(ring: Sequence[float]) -> list[Point]:
+    """
+    Get the points of a ring without repeated points and closing point.
+    """
+    points: list[Point] = []
+    for point in zip(ring[0::2], ring[1::2]):
+        if not points or points[-1] != point:
+            points.append(point)
+    while len(points) > 1 and points[-1] == points[0]:
+        points.pop()
+    return points
+
+
+class PolygonTopology:
+    """
+    Arcs of a set of (multi)polygons.
+
+    Attributes:
+        arcs (list[list[tuple[float, float]]]): Longitude and latitude of the
+            points of every arc. Closed arcs end with their first point.
+        polygons (dict[Hashable, list[list[list[int]]]]): Per key, one list of
+            rings per polygon, the exterior ring first, as arc references.
+            A reference `~i` walks the arc `i` backwards.
+    """
+
+    def __init__(self, geometries: dict[Hashable, list[list[Sequence[float]]]]):
+        """
+        Build the arcs.
+
+        Args:
+            geometries (dict[Hashable, list[list[Sequence[float]]]]): Per key,
+                one list of rings per polygon as closed flat sequences of
+                interleaved longitude and latitude values.
+        """
+        rings = {
+            key: [[_ring_points(ring) for ring in rings] for rings in polygons]
+            for key, polygons in geometries.items()
+        }
+        junctions = self._junctions(
+            ring for polygons in rings.values() for rings in polygons for ring in rings
+        )
+
+        self.arcs: list[list[Point]] = []
+        self._arc_ids: dict[tuple[Point, ...], int] = {}
+        self.polygons = {
+            key: [
+                [
+                    [self._arc_ref(arc) for arc in self._cut(ring, junctions)]
+                    for ring in polygon
+                    if len(ring) >= 3
+                ]
+                for polygon in polygons
+            ]
+            for key, polygons in rings.items()
+        }
+        del self._arc_ids
+
+    @staticmethod
+    def _junctions(rings) -> set[Point]:
+        """
+        Find the points whose previous and next point differ between the
+        rings passing through them.
+        """
+        neighbours: dict[Point, tuple[Point, Point]] = {}
+        junctions: set[Point] = set()
+        for ring in rings:
+            count = len(ring)
+            for index, point in enumerate(ring):
+                previous, following = ring[index - 1], ring[(index + 1) % count]
+                seen = neighbours.setdefault(point, (previous, following))
+                if seen != (previous, following) and seen != (following, previous):
+                    junctions.add(point)
+        return junctions
+
+    @staticmethod
+    def _cut(ring: list[Point], junctions: set[Point]) -> list[list[Point]]:
+        """
+        Cut a ring into the arcs between its junctions.
+        """
+        count = len(ring)
+        starts = [index for index, point in enumerate(ring) if point in junctions]
+        if not starts:
+            # Start closed arcs at their smallest point, so a ring shared by
+            # two polygons, e.g. an enclave and its hole, gives the same arc
+            first = ring.index(min(ring))
+            return [ring[first:] + ring[: first + 1]]
+        return [
+            [ring[index % count] for index in range(start, end + 1)]
+            for start, end in zip(starts, starts[1:] + [starts[0] + count])
+        ]
+
+    def _arc_ref(self, arc: list[Point]) -> int:
+        key = tuple(arc)
+        arc_id = self._arc_ids.get(key)
+        if arc_id is not None:
+            return arc_id
+        arc_id = self._arc_ids.get(key[::-1])
+        if arc_id is not None:
+            return ~arc_id
+        self._arc_ids[key] = len(self.arcs)
+        self.arcs.append(arc)
+        return len(self.arcs) - 1
+
+    def ring_points(
+        self, refs: list[int], arcs: Optional[list[list[Point]]] = None
+    ) -> list[Point]:
+        """
+        Join the arcs of a ring.
+
+        Args:
+            refs (list[int]): Arc references of the ring.
+            arcs (Optional[list[list[Point]]]): Replacements of `arcs` with the
+                same end points, e.g. simplified arcs.
+
+        Returns:
+            list[tuple[float, float]]: The points of the closed ring.
+        """
+        arcs = self.arcs if arcs is None else arcs
+        points: list[Point] = []
+        for ref in refs:
+            arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            points.extend(arc[1:] if points else arc)
+        return points
+
+    def geometries(
+        self, arcs: Optional[list[list[Point]]] = None
+    ) -> dict[Hashable, list[list[array]]]:
+        """
+        Rebuild the (multi)polygons from the arcs.
+
+        Args:
+            arcs (Optional[list[list[Point]]]): Replacements of `arcs` with the
+                same end points, e.g. simplified arcs.
+
+        Returns:
+            dict[Hashable, list[list[array]]]: Per key, one list of rings per
+            polygon as `array("d")` of interleaved longitude and latitude values.
+        """
+        return {
+            key: [
+                [
+                    array(
+                        "d",
+                        [
+                            value
+                            for point in self.ring_points(refs, arcs)
+                            for value in point
+                        ],
+                    )
+                    for refs in polygon
+                ]
+                for polygon in polygons
+            ]
+            for key, polygons in self.polygons.items()
+        }
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        Returns:
+            int: Number of points of all arcs.
+        """
+        return sum(len(arc) for arc in self.arcs)
+
+    def outline(self) -> list[list[array]]:
+        """
+        Join the arcs used by a single ring into the outline of the union
+        of all polygons, e.g. the city boundary from its postal codes.
+
+        Returns:
+            list[list[array]]: One list of rings per polygon of the union,
+            the exterior ring first and counterclockwise, holes clockwise,
+            as `array("d")` of interleaved longitude and latitude values.
+        """
+        uses = Counter(
+            ref if ref >= 0 else ~ref
+            for polygons in self.polygons.values()
+            for polygon in polygons
+            for refs in polygon
+            for ref in refs
+        )
+        # Wind exteriors counterclockwise and holes clockwise, so the outline
+        # arcs of neighbouring rings line up head to tail
+        following: dict[Point, list[list[Point]]] = {}
+        for polygons in self.polygons.values():
+            for polygon in polygons:
+                for index, refs in enumerate(polygon):
+                    points = self.ring_points(refs)
+                    flat = [value for point in points for value in point]
+                    if (ring_signed_area(flat) > 0) != (index == 0):
+                        refs = [~ref for ref in reversed(refs)]
+                    for ref in refs:
+                        if uses[ref if ref >= 0 else ~ref] == 1:
+                            arc = self.arcs[ref] if ref >= 0 else self.arcs[~ref][::-1]
+                            following.setdefault(arc[0], []).append(arc)
+
+        rings = []
+        for start in list(following):
+            while following.get(start):
+                points = list(following[start].pop())
+                while points[-1] != start and following.get(points[-1]):
+                    points.extend(following[points[-1]].pop()[1:])
+                rings.append(array("d", [value for point in points for value in point]))
+
+        exteriors = [[ring] for ring in rings if ring_signed_area(ring) > 0]
+        prepared = [PreparedPolygon([polygon]) for polygon in exteriors]
+        for ring in rings:
+            if ring_signed_area(ring) < 0:
+                for polygon, exterior in zip(exteriors, prepared):
+                    if exterior.contains(ring[0], ring[1]):
+                        polygon.append(ring)
+                        break
+        return exteriors
@@ -0,0 +1,372 @@
+"""Vector tile module.
+Encodes points and polygons as Mapbox Vector Tiles (MVT), the protobuf
+format web maps render tiles from, without a protobuf library.
+
+Tiles are addressed by zoom, column and row of the Web Mercator tile
+pyramid. Geometries are projected into the integer grid of a tile with
+`extent` units per side and clipped to the tile plus `buffer` units on
+every side, so polygon fills and outlines continue across tile borders.
+Rounding to the grid merges vertices closer than one unit, which thins
+out the polygons at low zoom levels.
+
+Classes:
+    VectorTile: Layers of features of one tile, encoded to MVT bytes.
+
+Functions:
+    tile_bounds:      longitude and latitude bounds of a tile
+    tiles_containing: tiles of a zoom level whose buffered area holds a point
+"""
+
+import math
+import struct
+from typing import Optional, Sequence
+
+from app.domain.geometry.distance import inverse_web_mercator, web_mercator
+
+DEFAULT_EXTENT = 4096
+DEFAULT_BUFFER = 64
+MAX_TILE_ZOOM = 24
+
+# Geometry types and commands of the MVT specification
+_POINT, _POLYGON = 1, 3
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+# Protobuf wire types
+_VARINT, _FIXED64, _BYTES = 0, 1, 2
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """
+    Compute the bounds of a tile.
+
+    Args:
+        z (int): Zoom level.
+        x (int): Column from west to east.
+        y (int): Row from north to south.
+
+    Returns:
+        tuple[float, float, float, float]: min lon, min lat, max lon, max lat.
+    """
+    scale = 1 << z
+    min_lon, max_lat = inverse_web_mercator(x / scale, y / scale)
+    max_lon, min_lat = inverse_web_mercator((x + 1) / scale, (y + 1) / scale)
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def tiles_containing(
+    lon: float,
+    lat: float,
+    z: int,
+    extent: int = DEFAULT_EXTENT,
+    buffer: int = DEFAULT_BUFFER,
+) -> list[tuple[int, int]]:
+    """
+    Find the tiles of a zoom level that show a point, within their buffer.
+
+    Args:
+        lon (float): Longitude of the point.
+        lat (float): Latitude of the point.
+        z (int): Zoom level.
+        extent (int): Grid units per tile side.
+        buffer (int): Grid units around the tile.
+
+    Returns:
+        list[tuple[int, int]]: Column and row of up to four tiles.
+    """
+    scale = 1 << z
+    margin = buffer / extent
+    x, y = web_mercator(lon, lat)
+    cols = range(
+        max(math.ceil(x * scale - 1 - margin), 0),
+        min(math.floor(x * scale + margin), scale - 1) + 1,
+    )
+    rows = range(
+        max(math.ceil(y * scale - 1 - margin), 0),
+        min(math.floor(y * scale + margin), scale - 1) + 1,
+    )
+    return [(col, row) for col in cols for row in rows]
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(number: int, wire_type: int) -> bytes:
+    return _varint(number << 3 | wire_type)
+
+
+def _message(number: int, data: bytes) -> bytes:
+    return _key(number, _BYTES) + _varint(len(data)) + data
+
+
+def _packed(number: int, values: list[int]) -> bytes:
+    return _message(number, b"".join(map(_varint, values)))
+
+
+def _encode_value(value) -> bytes:
+    if isinstance(value, bool):
+        return _key(7, _VARINT) + _varint(int(value))
+    if isinstance(value, int):
+        if value >= 0:
+            return _key(5, _VARINT) + _varint(value)
+        return _key(6, _VARINT) + _varint(_zigzag(value))
+    if isinstance(value, float):
+        return _key(3, _FIXED64) + struct.pack("<d", value)
+    return _message(1, str(value).encode())
+
+
+def _clip_ring(
+    ring: list[tuple[float, float]], low: float, high: float
+) -> list[tuple[float, float]]:
+    """
+    Clip a ring to the square from low to high with Sutherland-Hodgman.
+    """
+    for axis in (0, 1):
+        for bound, side in ((low, 1), (high, -1)):
+            if not ring:
+                return ring
+            clipped = []
+            previous = ring[-1]
+            previous_inside = (previous[axis] - bound) * side >= 0
+            for point in ring:
+                inside = (point[axis] - bound) * side >= 0
+                if inside != previous_inside:
+                    t = (bound - previous[axis]) / (point[axis] - previous[axis])
+                    clipped.append(
+                        (
+                            previous[0] + t * (point[0] - previous[0]),
+                            previous[1] + t * (point[1] - previous[1]),
+                        )
+                    )
+                if inside:
+                    clipped.append(point)
+                previous, previous_inside = point, inside
+            ring = clipped
+    return ring
+
+
+def _quantize(ring: list[tuple[float, float]]) -> list[tuple[int, int]]:
+    """
+    Round a ring to the grid without repeated points and closing point.
+    """
+    points: list[tuple[int, int]] = []
+    for x, y in ring:
+        point = (round(x), round(y))
+        if not points or points[-1] != point:
+            points.append(point)
+    while len(points) > 1 and points[-1] == points[0]:
+        points.pop()
+    return points
+
+
+def _ring_area(ring: list[tuple[int, int]]) -> int:
+    """
+    Twice the signed area of a ring, positive if clockwise with y pointing down.
+    """
+    area = 0
+    x0, y0 = ring[-1]
+    for x1, y1 in ring:
+        area += x0 * y1 - x1 * y0
+        x0, y0 = x1, y1
+    return area
+
+
+class _Layer:
+    """
+    Features of one layer with the shared tables of property keys and values.
+    """
+
+    __slots__ = ("features", "keys", "values")
+
+    def __init__(self):
+        self.features: list[bytes] = []
+        self.keys: dict[str, int] = {}
+        self.values: dict[tuple, int] = {}
+
+    def add(
+        self,
+        geometry_type: int,
+        geometry: list[int],
+        properties: dict,
+        feature_id: Optional[int],
+    ) -> None:
+        tags = []
+        for key, value in properties.items():
+            if value is None:
+                continue
+            tags.append(self.keys.setdefault(key, len(self.keys)))
+            # The type keeps True and 1 apart
+            tags.append(self.values.setdefault((type(value), value), len(self.values)))
+        feature = b""
+        if feature_id is not None:
+            feature += _key(1, _VARINT) + _varint(feature_id)
+        if tags:
+            feature += _packed(2, tags)
+        feature += _key(3, _VARINT) + _varint(geometry_type)
+        feature += _packed(4, geometry)
+        self.features.append(feature)
+
+    def encode(self, name: str, extent: int) -> bytes:
+        return b"".join(
+            [
+                _key(15, _VARINT) + _varint(2),
+                _message(1, name.encode()),
+                *(_message(2, feature) for feature in self.features),
+                *(_message(3, key.encode()) for key in self.keys),
+                *(_message(4, _encode_value(value)) for _, value in self.values),
+                _key(5, _VARINT) + _varint(extent),
+            ]
+        )
+
+
+class VectorTile:
+    """
+    Features of one map tile in named layers.
+
+    Attributes:
+        z (int): Zoom level.
+        x (int): Column from west to east.
+        y (int): Row from north to south.
+        extent (int): Grid units per tile side.
+        buffer (int): Grid units around the tile that features are kept in.
+        bbox (tuple[float, float, float, float]): min lon, min lat, max lon,
+            max lat of the tile with its buffer, to select the features to add.
+    """
+
+    def __init__(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        extent: int = DEFAULT_EXTENT,
+        buffer: int = DEFAULT_BUFFER,
+    ):
+        self.z, self.x, self.y = z, x, y
+        self.extent, self.buffer = extent, buffer
+        scale, margin = 1 << z, buffer / extent
+        min_lon, max_lat = inverse_web_mercator(
+            (x - margin) / scale, (y - margin) / scale
+        )
+        max_lon, min_lat = inverse_web_mercator(
+            (x + 1 + margin) / scale, (y + 1 + margin) / scale
+        )
+        self.bbox = (min_lon, min_lat, max_lon, max_lat)
+        self._scale = scale * extent
+        self._layers: dict[str, _Layer] = {}
+
+    def _project(self, lon: float, lat: float) -> tuple[float, float]:
+        x, y = web_mercator(lon, lat)
+        return (
+            x * self._scale - self.x * self.extent,
+            y * self._scale - self.y * self.extent,
+        )
+
+    def _layer(self, name: str) -> _Layer:
+        if name not in self._layers:
+            self._layers[name] = _Layer()
+        return self._layers[name]
+
+    def add_point(
+        self,
+        layer: str,
+        lon: float,
+        lat: float,
+        properties: dict,
+        feature_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Add a point feature.
+
+        Args:
+            layer (str): Name of the layer.
+            lon (float): Longitude of the point.
+            lat (float): Latitude of the point.
+            properties (dict): Property values by name, None values are left out.
+            feature_id (Optional[int]): Non-negative id of the feature.
+
+        Returns:
+            bool: False if the point lies outside the tile and its buffer.
+        """
+        x, y = self._project(lon, lat)
+        low, high = -self.buffer, self.extent + self.buffer
+        if not (low <= x <= high and low <= y <= high):
+            return False
+        geometry = [_MOVE_TO | 1 << 3, _zigzag(round(x)), _zigzag(round(y))]
+        self._layer(layer).add(_POINT, geometry, properties, feature_id)
+        return True
+
+    def add_polygons(
+        self,
+        layer: str,
+        polygons: list[list[Sequence[float]]],
+        properties: dict,
+        feature_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Add a (multi)polygon feature, clipped to the tile and its buffer.
+
+        Exterior rings are wound clockwise and holes counterclockwise in
+        tile coordinates, as the specification requires, whatever the
+        winding of the input. Rings that collapse on the grid are dropped.
+
+        Args:
+            layer (str): Name of the layer.
+            polygons (list[list[Sequence[float]]]): One list of rings per polygon,
+                the exterior ring first. A ring is a closed flat sequence of
+                interleaved longitude and latitude values.
+            properties (dict): Property values by name, None values are left out.
+            feature_id (Optional[int]): Non-negative id of the feature.
+
+        Returns:
+            bool: False if nothing of the polygons is left in the tile.
+        """
+        low, high = -self.buffer, self.extent + self.buffer
+        geometry: list[int] = []
+        cursor_x = cursor_y = 0
+        for rings in polygons:
+            for ring_index, ring in enumerate(rings):
+                points = list(map(self._project, ring[0::2], ring[1::2]))
+                xs, ys = [x for x, _ in points], [y for _, y in points]
+                if min(xs) < low or max(xs) > high or min(ys) < low or max(ys) > high:
+                    points = _clip_ring(points, low, high)
+                points = _quantize(points)
+                area = _ring_area(points) if len(points) >= 3 else 0
+                if not area:
+                    if ring_index == 0:
+                        break  # The holes of a collapsed polygon are dropped too
+                    continue
+                if (area > 0) != (ring_index == 0):
+                    points.reverse()
+
+                geometry.append(_MOVE_TO | 1 << 3)
+                for point_index, (x, y) in enumerate(points):
+                    if point_index == 1:
+                        geometry.append(_LINE_TO | (len(points) - 1) << 3)
+                    geometry.append(_zigzag(x - cursor_x))
+                    geometry.append(_zigzag(y - cursor_y))
+                    cursor_x, cursor_y = x, y
+                geometry.append(_CLOSE_PATH | 1 << 3)
+        if not geometry:
+            return False
+        self._layer(layer).add(_POLYGON, geometry, properties, feature_id)
+        return True
+
+    def encode(self) -> bytes:
+        """
+        Encode the tile.
+
+        Returns:
+            bytes: The tile as MVT protobuf message, empty without features.
+        """
+        return b"".join(
+            _message(3, layer.encode(name, self.extent))
+            for name, layer in self._layers.items()
+        )
@@ -0,0 +1,396 @@
+"""Voronoi module.
+Catchment areas of sites, the part of an area closer to a site than to any
+other, as Voronoi cells clipped to the outline of the area.
+
+Cells are computed in the plane of a `LocalProjection`. The cell of a site
+starts as a frame around the outline and is cut by the perpendicular
+bisector with every other site, nearest first, until the next site is
+more than twice as far as the farthest corner of the cell. Every edge of a
+cell remembers the site it was cut by. Adding or removing a site changes
+only the cells sharing an edge with it, so only those are computed again.
+
+Cells inside the outline are kept as they are, cells crossing it are
+clipped to every ring of the outline with Sutherland-Hodgman. Parts of a
+ring split by a cell stay joined along the cell border by edges without area.
+
+Classes:
+    VoronoiCells: Voronoi cells of keyed sites clipped to an outline.
+"""
+
+import heapq
+from array import array
+from typing import Hashable, Iterable, Iterator, Optional, Sequence
+
+from app.domain.geometry.distance import LocalProjection
+from app.domain.geometry.polygon import polygon_metrics
+from app.domain.geometry.prepared_polygon import PreparedPolygon
+
+DEFAULT_BUCKET_SIZE = 1000.0
+
+Point = tuple[float, float]
+
+
+def _cut(
+    vertices: list[Point], sources: list, site: Point, other: Point
+) -> tuple[list[Point], list]:
+    """
+    Cut a convex cell by the bisector of two sites, keeping the side of
+    `site`. The new edge along the bisector gets `other` as its source.
+    """
+    dx, dy = other[0] - site[0], other[1] - site[1]
+    offset = ((site[0] + other[0]) * dx + (site[1] + other[1]) * dy) / 2
+    sides = [x * dx + y * dy - offset for x, y in vertices]
+    cut_vertices, cut_sources = [], []
+    count = len(vertices)
+    for index in range(count):
+        following = (index + 1) % count
+        side, next_side = sides[index], sides[following]
+        if side <= 0:
+            cut_vertices.append(vertices[index])
+            cut_sources.append(sources[index])
+        if (side <= 0) != (next_side <= 0):
+            (x1, y1), (x2, y2) = vertices[index], vertices[following]
+            t = side / (side - next_side)
+            cut_vertices.append((x1 + t * (x2 - x1), y1 + t * (y2 - y1)))
+            # Leaving the half-plane starts the edge along the bisector
+            cut_sources.append(other if side <= 0 else sources[index])
+    return cut_vertices, cut_sources
+
+
+def _clip_ring(ring: list[Point], cell: list[Point]) -> list[Point]:
+    """
+    Clip a ring to a counterclockwise convex cell with Sutherland-Hodgman.
+    """
+    count = len(cell)
+    for index in range(count):
+        if not ring:
+            break
+        (ax, ay), (bx, by) = cell[index], cell[(index + 1) % count]
+        ex, ey = bx - ax, by - ay
+        clipped = []
+        previous = ring[-1]
+        previous_side = ex * (previous[1] - ay) - ey * (previous[0] - ax)
+        for point in ring:
+            side = ex * (point[1] - ay) - ey * (point[0] - ax)
+            if (side >= 0) != (previous_side >= 0):
+                t = previous_side / (previous_side - side)
+                clipped.append(
+                    (
+                        previous[0] + t * (point[0] - previous[0]),
+                        previous[1] + t * (point[1] - previous[1]),
+                    )
+                )
+            if side >= 0:
+                clipped.append(point)
+            previous, previous_side = point, side
+        ring = clipped
+    return ring
+
+
+def _strictly_inside(point: Point, cell: list[Point]) -> bool:
+    count = len(cell)
+    for index in range(count):
+        (ax, ay), (bx, by) = cell[index], cell[(index + 1) % count]
+        if (bx - ax) * (point[1] - ay) - (by - ay) * (point[0] - ax) <= 0:
+            return False
+    return True
+
+
+class VoronoiCells:
+    """
+    Voronoi cells of keyed sites, clipped to an outline.
+
+    Keys at the same location share one site and its cell.
+    """
+
+    def __init__(
+        self,
+        outline: list[list[Sequence[float]]],
+        points: Iterable[tuple[Hashable, float, float]] = (),
+        bucket_size: float = DEFAULT_BUCKET_SIZE,
+    ):
+        """
+        Compute the cells of the initial sites.
+
+        Args:
+            outline (list[list[Sequence[float]]]): One list of rings per polygon,
+                the exterior ring first, as closed flat sequences of interleaved
+                longitude and latitude values.
+            points (Iterable[tuple[Hashable, float, float]]): Key, longitude
+                and latitude of the initial sites.
+            bucket_size (float): Side of the grid cells indexing the sites, in meters.
+        """
+        lats = [lat for rings in outline for ring in rings for lat in ring[1::2]]
+        self._projection = LocalProjection((min(lats) + max(lats)) / 2)
+        self._bucket_size = bucket_size
+        self._outline = [
+            [
+                list(map(self._projection.project, ring[0::2], ring[1::2]))[:-1]
+                for ring in rings
+            ]
+            for rings in outline
+        ]
+        self._prepared = PreparedPolygon(
+            [
+                [[value for point in ring for value in point] for ring in rings]
+                for rings in self._outline
+            ]
+        )
+        # Outline points by grid cell, to find the cells crossing the outline
+        self._outline_points: dict[tuple[int, int], list[Point]] = {}
+        for rings in self._outline:
+            for ring in rings:
+                for point in ring:
+                    self._outline_points.setdefault(self._bucket(point), []).append(
+                        point
+                    )
+        min_x, min_y, max_x, max_y = self._prepared.bbox
+        margin = max(max_x - min_x, max_y - min_y) / 2
+        self._frame = [
+            (min_x - margin, min_y - margin),
+            (max_x + margin, min_y - margin),
+            (max_x + margin, max_y + margin),
+            (min_x - margin, max_y + margin),
+        ]
+
+        self._grid: dict[tuple[int, int], set[Point]] = {}
+        self._grid_bounds: Optional[list[int]] = None
+        self._keys: dict[Point, set[Hashable]] = {}
+        self._sites: dict[Hashable, Point] = {}
+        self._cells: dict[Point, tuple[list[Point], set[Point]]] = {}
+        # Sites whose cell has an edge cut by the site
+        self._bordering: dict[Point, set[Point]] = {}
+        self._clipped: dict[Point, tuple[list[list[array]], float]] = {}
+
+        for key, lon, lat in points:
+            self._add_site(key, lon, lat)
+        for site in self._keys:
+            self._update_cell(site)
+
+    def __len__(self) -> int:
+        return len(self._sites)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sites
+
+    def _bucket(self, point: Point) -> tuple[int, int]:
+        return (
+            int(point[0] // self._bucket_size),
+            int(point[1] // self._bucket_size),
+        )
+
+    def _add_site(self, key: Hashable, lon: float, lat: float) -> Optional[Point]:
+        """
+        Register a key, returns its site if the site is new.
+        """
+        site = self._projection.project(lon, lat)
+        self._sites[key] = site
+        if site in self._keys:
+            self._keys[site].add(key)
+            return None
+        self._keys[site] = {key}
+        bucket = self._bucket(site)
+        self._grid.setdefault(bucket, set()).add(site)
+        if self._grid_bounds is None:
+            self._grid_bounds = [bucket[0], bucket[1], bucket[0], bucket[1]]
+        else:
+            bounds = self._grid_bounds
+            bounds[0], bounds[1] = min(bounds[0], bucket[0]), min(bounds[1], bucket[1])
+            bounds[2], bounds[3] = max(bounds[2], bucket[0]), max(bounds[3], bucket[1])
+        return site
+
+    def _iter_nearest(self, site: Point) -> Iterator[tuple[float, Point]]:
+        """
+        Yield the other sites by increasing squared distance, searching the
+        grid in rings of cells around the site.
+        """
+        if self._grid_bounds is None:
+            return
+        bx, by = self._bucket(site)
+        min_bx, min_by, max_bx, max_by = self._grid_bounds
+        last_ring = max(bx - min_bx, max_bx - bx, by - min_by, max_by - by)
+        found: list[tuple[float, Point]] = []
+        for ring in range(last_ring + 1):
+            if ring == 0:
+                buckets = [(bx, by)]
+            else:
+                buckets = [
+                    (bx + i, by + side)
+                    for i in range(-ring, ring + 1)
+                    for side in (-ring, ring)
+                ]
+                buckets += [
+                    (bx + side, by + j)
+                    for j in range(-ring + 1, ring)
+                    for side in (-ring, ring)
+                ]
+            for bucket in buckets:
+                for other in self._grid.get(bucket, ()):
+                    if other != site:
+                        distance_sq = (other[0] - site[0]) ** 2 + (
+                            other[1] - site[1]
+                        ) ** 2
+                        heapq.heappush(found, (distance_sq, other))
+            # Sites outside the searched rings are farther than this
+            limit = (ring * self._bucket_size) ** 2
+            while found and found[0][0] <= limit:
+                yield heapq.heappop(found)
+        while found:
+            yield heapq.heappop(found)
+
+    def _compute_cell(self, site: Point) -> tuple[list[Point], set[Point]]:
+        """
+        Cut the frame by the bisectors with the nearest sites.
+        """
+        vertices, sources = list(self._frame), [None] * len(self._frame)
+        radius_sq = max((x - site[0]) ** 2 + (y - site[1]) ** 2 for x, y in vertices)
+        for distance_sq, other in self._iter_nearest(site):
+            if distance_sq > 4 * radius_sq:
+                break
+            vertices, sources = _cut(vertices, sources, site, other)
+            if not vertices:
+                break
+            radius_sq = max(
+                (x - site[0]) ** 2 + (y - site[1]) ** 2 for x, y in vertices
+            )
+        return vertices, {source for source in sources if source is not None}
+
+    def _update_cell(self, site: Point) -> None:
+        vertices, neighbours = self._compute_cell(site)
+        previous = self._cells.get(site)
+        if previous is not None:
+            for neighbour in previous[1] - neighbours:
+                self._bordering.get(neighbour, set()).discard(site)
+        for neighbour in neighbours:
+            self._bordering.setdefault(neighbour, set()).add(site)
+        self._cells[site] = (vertices, neighbours)
+        self._clipped.pop(site, None)
+
+    def add(self, key: Hashable, lon: float, lat: float) -> None:
+        """
+        Add a site and compute the cells it changes.
+
+        Args:
+            key (Hashable): Key of the site, a key already added is moved.
+            lon (float): Longitude of the site.
+            lat (float): Latitude of the site.
+        """
+        if key in self._sites:
+            self.remove(key)
+        site = self._add_site(key, lon, lat)
+        if site is None:
+            return
+        self._update_cell(site)
+        for neighbour in self._cells[site][1]:
+            self._update_cell(neighbour)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a site and compute the cells taking over its area.
+
+        Args:
+            key (Hashable): Key of the site.
+
+        Returns:
+            bool: False if the key is unknown.
+        """
+        site = self._sites.pop(key, None)
+        if site is None:
+            return False
+        keys = self._keys[site]
+        keys.discard(key)
+        if keys:
+            return True
+        del self._keys[site]
+        self._grid[self._bucket(site)].discard(site)
+        _, neighbours = self._cells.pop(site)
+        self._clipped.pop(site, None)
+        for neighbour in neighbours:
+            self._bordering.get(neighbour, set()).discard(site)
+        for bordering in self._bordering.pop(site, set()):
+            self._update_cell(bordering)
+        return True
+
+    def _inside_outline(self, vertices: list[Point]) -> bool:
+        """
+        Test if a cell lies inside the outline: its corners are inside and
+        no outline point is inside the cell.
+        """
+        if not all(self._prepared.contains(x, y) for x, y in vertices):
+            return False
+        xs, ys = [x for x, _ in vertices], [y for _, y in vertices]
+        min_bx, min_by = self._bucket((min(xs), min(ys)))
+        max_bx, max_by = self._bucket((max(xs), max(ys)))
+        return not any(
+            _strictly_inside(point, vertices)
+            for bx in range(min_bx, max_bx + 1)
+            for by in range(min_by, max_by + 1)
+            for point in self._outline_points.get((bx, by), ())
+        )
+
+    def _clip(self, site: Point) -> tuple[list[list[array]], float]:
+        """
+        Clip the cell of a site to the outline, in longitude and latitude.
+        """
+        clipped = self._clipped.get(site)
+        if clipped is not None:
+            return clipped
+        vertices, _ = self._cells[site]
+        if len(vertices) < 3:
+            polygons = []
+        elif self._inside_outline(vertices):
+            polygons = [[vertices]]
+        else:
+            polygons = []
+            for rings in self._outline:
+                parts = [_clip_ring(ring, vertices) for ring in rings]
+                if len(parts[0]) >= 3:
+                    polygons.append(
+                        [parts[0]] + [ring for ring in parts[1:] if len(ring) >= 3]
+                    )
+        unprojected = [
+            [
+                array(
+                    "d",
+                    [
+                        value
+                        for point in ring + ring[:1]
+                        for value in self._projection.unproject(*point)
+                    ],
+                )
+                for ring in rings
+            ]
+            for rings in polygons
+        ]
+        area = polygon_metrics(unprojected).area if unprojected else 0.0
+        clipped = self._clipped[site] = (unprojected, area)
+        return clipped
+
+    def cell(self, key: Hashable) -> tuple[list[list[array]], float]:
+        """
+        Get the cell of a site, clipped to the outline.
+
+        Args:
+            key (Hashable): Key of the site.
+
+        Returns:
+            tuple[list[list[array]], float]: One list of rings per polygon as
+            `array("d")` of interleaved longitude and latitude values, empty
+            if the cell lies outside the outline, and its area in square meters.
+
+        Raises:
+            KeyError: If the key is unknown.
+        """
+        return self._clip(self._sites[key])
+
+    def cells(self) -> Iterator[tuple[list[Hashable], list[list[array]], float]]:
+        """
+        Iterate over the cells of all sites, clipped to the outline.
+
+        Yields:
+            tuple[list[Hashable], list[list[array]], float]: The sorted keys
+            of the site, the polygons of its cell and their area in square meters.
+        """
+        for site, keys in list(self._keys.items()):
+            polygons, area = self._clip(site)
+            yield sorted(keys), polygons, area
@@ -0,0 +1,113 @@
+"""Well-Known Text parsing module.
+Parses the POLYGON and MULTIPOLYGON geometries of the geodata files into
+flat coordinate arrays.
+
+Classes:
+    WktError: Custom exception for malformed WKT.
+
+Functions:
+    parse_wkt_polygons:  parse a (multi)polygon into rings of coordinates
+    format_wkt_polygons: write rings of coordinates as a (multi)polygon
+"""
+
+import re
+from array import array
+from typing import Sequence
+
+_TOKENS = re.compile(r"[()]|[^()]+")
+_RING_DEPTH = {"POLYGON": 2, "MULTIPOLYGON": 3}
+
+
+class WktError(Exception):
+    """
+    Custom exception for malformed or unsupported WKT.
+    """
+
+    pass
+
+
+def _parse_ring(text: str) -> array:
+    points = text.split(",")
+    values = text.replace(",", " ").split()
+    if len(values) != 2 * len(points):
+        raise WktError("Every point of a ring needs 2 coordinates.")
+    try:
+        return array("d", map(float, values))
+    except ValueError:
+        raise WktError("Coordinates must be numbers.")
+
+
+def parse_wkt_polygons(text: str) -> list[list[array]]:
+    """
+    Parse a POLYGON or MULTIPOLYGON.
+
+    Args:
+        text (str): The geometry as WKT.
+
+    Returns:
+        list[list[array]]: One list of rings per polygon, the exterior ring first.
+            A ring is an `array("d")` of interleaved longitude and latitude values.
+
+    Raises:
+        WktError: If the text is not a valid POLYGON or MULTIPOLYGON.
+    """
+    tag, parenthesis, body = text.partition("(")
+    ring_depth = _RING_DEPTH.get(tag.strip().upper())
+    if ring_depth is None:
+        raise WktError(f"Unsupported geometry type: {tag.strip()!r}")
+
+    polygons, rings, depth = [], [], 0
+    for token in _TOKENS.findall(parenthesis + body):
+        if token == "(":
+            depth += 1
+            if depth > ring_depth:
+                raise WktError("Unexpected parenthesis.")
+            if depth == ring_depth - 1:
+                rings = []
+        elif token == ")":
+            if depth == ring_depth - 1:
+                polygons.append(rings)
+            depth -= 1
+            if depth < 0:
+                raise WktError("Unbalanced parentheses.")
+        elif depth == ring_depth:
+            rings.append(_parse_ring(token))
+        elif token.strip(" ,\n"):
+            raise WktError(f"Unexpected text: {token.strip()[:20]!r}")
+
+    if depth != 0 or not polygons or not all(polygons):
+        raise WktError("Incomplete geometry.")
+    return polygons
+
+
+def _format_ring(ring: Sequence[float]) -> str:
+    values = list(map(repr, ring))
+    return ", ".join(map(" ".join, zip(values[0::2], values[1::2])))
+
+
+def format_wkt_polygons(polygons: list[list[Sequence[float]]]) -> str:
+    """
+    Write polygons as POLYGON, or as MULTIPOLYGON if there are several.
+
+    The shortest round-trip representation of every coordinate is used, so
+    `parse_wkt_polygons` returns the same coordinates again.
+
+    Args:
+        polygons (list[list[Sequence[float]]]): One list of rings per polygon,
+            the exterior ring first, as interleaved longitude and latitude values.
+
+    Returns:
+        str: The geometry as WKT.
+
+    Raises:
+        WktError: If there is no polygon.
+    """
+    if not polygons or not all(polygons):
+        raise WktError("Incomplete geometry.")
+    bodies = [
+        "(" + ", ".join(f"({_format_ring(ring)})" for ring in rings) + ")"
+        for rings in polygons
+    ]
+    if len(bodies) == 1:
+        return f"POLYGON {bodies[0]}"
+    return f"MULTIPOLYGON ({', '.join(bodies)})"
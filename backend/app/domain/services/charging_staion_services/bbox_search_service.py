@@ -0,0 +1,29 @@
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.domain.validation.coordinates import parse_bbox
+
+
+def search_bbox_service(min_lat, min_lon, max_lat, max_lon) -> dict:
+    """
+    Find the charging stations inside a bounding box, e.g. a map viewport.
+
+    Args:
+        min_lat: South edge of the box in degrees.
+        min_lon: West edge of the box in degrees.
+        max_lat: North edge of the box in degrees.
+        max_lon: East edge of the box in degrees.
+
+    Returns:
+        dict: The charging stations inside the box, borders included.
+
+    Raises:
+        BadRequest: If an edge is missing or invalid, or the box is inverted.
+        InternalServerError: If the charging stations cannot be read.
+    """
+    bbox = parse_bbox(min_lat, min_lon, max_lat, max_lon)
+
+    return {
+        "message": "Successfully found charging stations.",
+        "stations": get_station_index().within_bbox(*bbox),
+    }
@@ -0,0 +1,109 @@
+from typing import Optional
+
+from app.domain.geometry.caches import STATION_CATCHMENTS
+from app.domain.geometry.catchments import StationCatchments, catchments_fingerprint
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.database_operations.station_catchment_operations import (
+    StationCatchmentOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+
+def _get_outline() -> list:
+    """
+    Get the outline of the postal codes.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return repository.get_postal_code_outline()
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def _load_stored_catchments(fingerprint: str) -> Optional[list[dict]]:
+    """
+    Load the catchments stored by `flask catchments` for a fingerprint.
+
+    Raises:
+        InternalServerError: If the catchments cannot be read.
+    """
+    try:
+        with StationCatchmentOperations() as repository:
+            return repository.get_station_catchments(fingerprint)
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def get_station_catchments() -> StationCatchments:
+    """
+    Get the Voronoi catchments of the charging stations, updated to the
+    current stations.
+
+    Raises:
+        InternalServerError: If the stations or postal codes cannot be read.
+    """
+    station_index = get_station_index()
+    return STATION_CATCHMENTS.get(station_index, _get_outline())
+
+
+def store_station_catchments() -> list[dict]:
+    """
+    Compute the catchments of the charging stations and store them, so
+    every process with the same stations serves them without computing.
+
+    Returns:
+        list[dict]: The stored catchments.
+
+    Raises:
+        InternalServerError: If the data cannot be read or the catchments
+        cannot be stored.
+    """
+    station_catchments = get_station_catchments()
+    catchments = station_catchments.catchments()
+    fingerprint = catchments_fingerprint(
+        station_catchments.station_index,
+        station_catchments.outline,
+        station_catchments.excluded_statuses,
+    )
+    try:
+        with StationCatchmentOperations() as repository:
+            repository.replace_station_catchments(fingerprint, catchments)
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+    return catchments
+
+
+def get_catchments_service() -> dict:
+    """
+    Get the catchment area of every charging station in service: the part
+    of Berlin closer to it than to any other station in service.
+
+    The catchments stored by `flask catchments` are served while the
+    stations in service are unchanged. Otherwise the first request of a
+    process computes all cells, about 2.4 s for 2,000 stations, and later
+    requests only update the cells around changed stations.
+
+    Returns:
+        dict: The catchments with the `station_ids` at their location, the
+        `area` in square meters and the `polygon` as WKT.
+
+    Raises:
+        InternalServerError: If the stations, postal codes or stored
+        catchments cannot be read.
+    """
+    station_index = get_station_index()
+    return {
+        "message": "Successfully computed catchments.",
+        "catchments": STATION_CATCHMENTS.catchments(
+            station_index, _get_outline(), _load_stored_catchments
+        ),
+    }
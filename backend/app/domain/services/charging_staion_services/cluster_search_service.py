@@ -0,0 +1,33 @@
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.domain.validation.coordinates import parse_bbox, parse_zoom
+
+
+def search_clusters_service(min_lat, min_lon, max_lat, max_lon, zoom) -> dict:
+    """
+    Find the station clusters of a map viewport at a zoom level.
+
+    Args:
+        min_lat: South edge of the viewport in degrees.
+        min_lon: West edge of the viewport in degrees.
+        max_lat: North edge of the viewport in degrees.
+        max_lon: East edge of the viewport in degrees.
+        zoom: Zoom level of the map, from 0 to `MAX_MAP_ZOOM`.
+
+    Returns:
+        dict: The clusters with position, station count and count per
+        status, and the stations shown on their own.
+
+    Raises:
+        BadRequest: If an argument is missing or invalid.
+        InternalServerError: If the charging stations cannot be read.
+    """
+    bbox = parse_bbox(min_lat, min_lon, max_lat, max_lon)
+    zoom = parse_zoom(zoom)
+    clusters, stations = get_station_index().clusters_in_bbox(*bbox, zoom)
+    return {
+        "message": "Successfully found charging station clusters.",
+        "clusters": clusters,
+        "stations": stations,
+    }
@@ -0,0 +1,65 @@
+import math
+
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.domain.validation.coordinates import parse_coordinate
+from werkzeug.exceptions import BadRequest
+
+MAX_ROUTE_POINTS = 10000
+MAX_CORRIDOR_WIDTH_M = 10000
+
+
+def search_corridor_service(route, width_m) -> dict:
+    """
+    Find the charging stations in a corridor along a route.
+
+    Args:
+        route: List of [latitude, longitude] pairs in driving order, at least
+            two and at most `MAX_ROUTE_POINTS`.
+        width_m: Width of the corridor in meters, centered on the route, at
+            most `MAX_CORRIDOR_WIDTH_M`.
+
+    Returns:
+        dict: The stations in driving order, each with its `route_position`
+        along the route and its `distance` from the route in meters.
+
+    Raises:
+        BadRequest: If an argument is missing or invalid.
+        InternalServerError: If the charging stations cannot be read.
+    """
+    if not isinstance(route, list) or len(route) < 2:
+        raise BadRequest("'route' must be a list of at least 2 [lat, lon] pairs.")
+    if len(route) > MAX_ROUTE_POINTS:
+        raise BadRequest(f"At most {MAX_ROUTE_POINTS} route points per request.")
+    points = []
+    for point in route:
+        if not isinstance(point, (list, tuple)) or len(point) != 2:
+            raise BadRequest("'route' must be a list of at least 2 [lat, lon] pairs.")
+        latitude = parse_coordinate(point[0], -90, 90, "lat")
+        longitude = parse_coordinate(point[1], -180, 180, "lon")
+        points.append((longitude, latitude))
+
+    if isinstance(width_m, bool):
+        raise BadRequest("'width_m' must be a number.")
+    try:
+        width_m = float(width_m)
+    except (TypeError, ValueError):
+        raise BadRequest("'width_m' must be a number.")
+    if not (math.isfinite(width_m) and 0 < width_m <= MAX_CORRIDOR_WIDTH_M):
+        raise BadRequest(
+            f"'width_m' must be above 0 and at most {MAX_CORRIDOR_WIDTH_M}."
+        )
+
+    along_route = get_station_index().along_route(points, width_m / 2)
+    return {
+        "message": "Successfully found charging stations.",
+        "stations": [
+            {
+                **station,
+                "route_position": round(offset, 1),
+                "distance": round(distance, 1),
+            }
+            for offset, distance, station in along_route
+        ],
+    }
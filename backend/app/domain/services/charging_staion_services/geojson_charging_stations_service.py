@@ -0,0 +1,50 @@
+from app.domain.geometry.caches import STATION_FEATURES
+from app.domain.geometry.geojson import encode_feature_collection, point_feature
+from app.domain.geometry.station_index import StationIndex
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+
+POINT_KEYS = ("id", "longitude", "latitude")
+
+
+def build_charging_stations_geojson(station_index: StationIndex) -> bytes:
+    """
+    Encode all stations of an index as GeoJSON FeatureCollection.
+
+    Args:
+        station_index (StationIndex): The stations to encode.
+
+    Returns:
+        bytes: One point Feature per station with its id, the other
+        attributes as properties.
+    """
+    return encode_feature_collection(
+        point_feature(
+            station["longitude"],
+            station["latitude"],
+            {key: value for key, value in station.items() if key not in POINT_KEYS},
+            station["id"],
+        )
+        for station in station_index.stations
+    )
+
+
+def get_charging_stations_geojson_service() -> bytes:
+    """
+    Get all charging stations as GeoJSON for the map layer.
+
+    The bytes are encoded once and kept until stations are added, changed
+    or reloaded.
+
+    Returns:
+        bytes: The encoded FeatureCollection.
+
+    Raises:
+        InternalServerError: If the charging stations cannot be read.
+    """
+    station_index = get_station_index()
+    return STATION_FEATURES.get(
+        (station_index, station_index.revision),
+        lambda: build_charging_stations_geojson(station_index),
+    )
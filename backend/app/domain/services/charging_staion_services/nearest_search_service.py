@@ -0,0 +1,82 @@
+from app.domain.entities.charging_station import ChargingType, OperationStatus
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.domain.validation.coordinates import parse_coordinate
+from werkzeug.exceptions import BadRequest
+
+DEFAULT_NEAREST_STATIONS = 5
+MAX_NEAREST_STATIONS = 100
+
+
+def _positive_int(value, name: str) -> int:
+    """
+    Validate a positive integer argument.
+
+    Raises:
+        BadRequest: If the value is not a positive integer.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"'{name}' must be an integer.")
+    if value < 1:
+        raise BadRequest(f"'{name}' must be at least 1.")
+    return value
+
+
+def search_nearest_service(
+    latitude,
+    longitude,
+    k=None,
+    functional=None,
+    charging_type=None,
+    min_nominal_power=None,
+) -> dict:
+    """
+    Find the charging stations closest to a position.
+
+    Args:
+        latitude: Latitude of the position in degrees.
+        longitude: Longitude of the position in degrees.
+        k: Number of stations, `DEFAULT_NEAREST_STATIONS` if None.
+        functional: Only stations with this operational status, e.g. "operational".
+        charging_type: Only stations of this charging type, "fast" or "normal".
+        min_nominal_power: Only stations with at least this nominal power in kW.
+
+    Returns:
+        dict: The stations closest first, each with its `distance` in meters.
+
+    Raises:
+        BadRequest: If an argument is missing or invalid.
+        InternalServerError: If the charging stations cannot be read.
+    """
+    latitude = parse_coordinate(latitude, -90, 90, "lat")
+    longitude = parse_coordinate(longitude, -180, 180, "lon")
+    k = DEFAULT_NEAREST_STATIONS if k is None else _positive_int(k, "k")
+    if k > MAX_NEAREST_STATIONS:
+        raise BadRequest(f"'k' must be at most {MAX_NEAREST_STATIONS}.")
+
+    statuses = None
+    if functional is not None:
+        if functional.upper() not in OperationStatus.__members__:
+            raise BadRequest(
+                "Invalid status. Must be one of: operational, used, malfunctioning."
+            )
+        statuses = [str(OperationStatus[functional.upper()])]
+    if charging_type is not None:
+        if charging_type.upper() not in ChargingType.__members__:
+            raise BadRequest("Invalid charging type. Must be one of: fast, normal.")
+        charging_type = str(ChargingType[charging_type.upper()])
+    if min_nominal_power is not None:
+        min_nominal_power = _positive_int(min_nominal_power, "min_nominal_power")
+
+    nearest = get_station_index().nearest(
+        longitude, latitude, k, statuses, charging_type, min_nominal_power
+    )
+    return {
+        "message": "Successfully found charging stations.",
+        "stations": [
+            {**station, "distance": round(distance, 1)} for distance, station in nearest
+        ],
+    }
@@ -0,0 +1,43 @@
+import math
+
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.domain.validation.coordinates import parse_coordinate
+from werkzeug.exceptions import BadRequest
+
+MAX_RADIUS_M = 10000
+
+
+def search_radius_service(latitude, longitude, radius_m) -> dict:
+    """
+    Find the charging stations within a radius of a position.
+
+    Args:
+        latitude: Latitude of the position in degrees.
+        longitude: Longitude of the position in degrees.
+        radius_m: Radius in meters, at most `MAX_RADIUS_M`.
+
+    Returns:
+        dict: The stations closest first, each with its `distance` in meters.
+
+    Raises:
+        BadRequest: If an argument is missing or invalid.
+        InternalServerError: If the charging stations cannot be read.
+    """
+    latitude = parse_coordinate(latitude, -90, 90, "lat")
+    longitude = parse_coordinate(longitude, -180, 180, "lon")
+    try:
+        radius_m = float(radius_m)
+    except (TypeError, ValueError):
+        raise BadRequest("'radius_m' must be a number.")
+    if not (math.isfinite(radius_m) and 0 < radius_m <= MAX_RADIUS_M):
+        raise BadRequest(f"'radius_m' must be above 0 and at most {MAX_RADIUS_M}.")
+
+    within = get_station_index().within(longitude, latitude, radius_m)
+    return {
+        "message": "Successfully found charging stations.",
+        "stations": [
+            {**station, "distance": round(distance, 1)} for distance, station in within
+        ],
+    }
@@ -0,0 +1,20 @@
+from app.domain.geometry.station_index import StationIndex
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+
+def get_station_index() -> StationIndex:
+    """
+    Get the in-memory index of the charging stations.
+
+    Raises:
+        InternalServerError: If the charging stations cannot be read.
+    """
+    try:
+        with ChargingStationOperations() as repository:
+            return repository.get_station_index()
+    except SQLAlchemyError as db_err:
+        raise InternalServerError(f"Database error: {db_err}")
@@ -0,0 +1,48 @@
+from app.domain.geometry.simplification import SimplifiedPolygons
+from app.domain.validation.coordinates import parse_zoom
+from app.infrastructure.database_operations.district_operations import (
+    DistrictOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+
+def _simplified_districts() -> SimplifiedPolygons:
+    """
+    Get the district boundaries simplified per zoom level.
+
+    Raises:
+        InternalServerError: If the districts cannot be read.
+    """
+    try:
+        with DistrictOperations() as repository:
+            return repository.get_simplified_districts()
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def get_district_polygons_service(zoom=None) -> dict:
+    """
+    Get the boundaries of all districts in the detail of a map zoom level.
+
+    Args:
+        zoom: Zoom level of the map, None for the full resolution.
+
+    Returns:
+        dict: The simplified `level` serving the zoom level (None for the full
+        resolution) and the name and WKT boundary of every district.
+
+    Raises:
+        BadRequest: If the zoom level is invalid.
+        InternalServerError: If the districts cannot be read.
+    """
+    zoom = None if zoom is None else parse_zoom(zoom)
+    simplified = _simplified_districts()
+    level = None if zoom is None else simplified.level_zoom(zoom)
+    return {
+        "level": level,
+        "districts": [
+            {"name": name, "polygon": polygon}
+            for name, polygon in sorted(simplified.wkt_at_level(level).items())
+        ],
+    }
@@ -0,0 +1,107 @@
+from app.domain.geometry.caches import MAP_TILES
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.station_index import StationIndex
+from app.domain.geometry.vector_tile import MAX_TILE_ZOOM, VectorTile
+from app.domain.services.charging_staion_services.station_index_service import (
+    get_station_index,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError, NotFound
+
+STATIONS_LAYER = "charging_stations"
+POSTAL_CODES_LAYER = "postal_codes"
+STATION_PROPERTIES = ("functional", "charging_type", "nominal_power", "operator")
+
+
+def _postal_code_geometries() -> dict[int, PolygonGeometry]:
+    """
+    Get the parsed postal code polygons.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return repository.get_cached_postal_code_geometries()
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def build_map_tile(
+    z: int,
+    x: int,
+    y: int,
+    station_index: StationIndex,
+    postal_codes: dict[int, PolygonGeometry],
+) -> bytes:
+    """
+    Encode the postal code polygons and the stations of a tile.
+
+    Args:
+        z (int): Zoom level.
+        x (int): Column of the tile.
+        y (int): Row of the tile.
+        station_index (StationIndex): Index of the charging stations.
+        postal_codes (dict[int, PolygonGeometry]): Geometry by postal code number.
+
+    Returns:
+        bytes: The encoded tile.
+    """
+    tile = VectorTile(z, x, y)
+    min_lon, min_lat, max_lon, max_lat = tile.bbox
+    for number, geometry in sorted(postal_codes.items()):
+        bbox = geometry.bbox
+        if bbox[0] <= max_lon and bbox[2] >= min_lon:
+            if bbox[1] <= max_lat and bbox[3] >= min_lat:
+                tile.add_polygons(
+                    POSTAL_CODES_LAYER,
+                    geometry.polygons,
+                    {"postal_code": number},
+                    number,
+                )
+
+    stations = station_index.within_bbox(*tile.bbox)
+    for station in sorted(stations, key=lambda station: station["id"]):
+        tile.add_point(
+            STATIONS_LAYER,
+            station["longitude"],
+            station["latitude"],
+            {name: station[name] for name in STATION_PROPERTIES},
+            station["id"],
+        )
+    return tile.encode()
+
+
+def get_map_tile_service(z: int, x: int, y: int) -> bytes:
+    """
+    Get a vector tile of the postal codes and charging stations.
+
+    Tiles are cached until the stations or postal codes are reloaded, a
+    status change drops the cached tiles showing that station.
+
+    Args:
+        z (int): Zoom level, from 0 to `MAX_TILE_ZOOM`.
+        x (int): Column of the tile from west to east.
+        y (int): Row of the tile from north to south.
+
+    Returns:
+        bytes: The tile as Mapbox Vector Tile with the layers
+        `postal_codes` and `charging_stations`.
+
+    Raises:
+        NotFound: If the tile does not exist.
+        InternalServerError: If the data cannot be read.
+    """
+    if not (0 <= z <= MAX_TILE_ZOOM and 0 <= x < 1 << z and 0 <= y < 1 << z):
+        raise NotFound(f"Tile {z}/{x}/{y} does not exist.")
+
+    station_index = get_station_index()
+    postal_codes = _postal_code_geometries()
+    return MAP_TILES.get(
+        (z, x, y),
+        (station_index.rtree, postal_codes),
+        lambda: build_map_tile(z, x, y, station_index, postal_codes),
+    )
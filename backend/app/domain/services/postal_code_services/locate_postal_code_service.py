@@ -0,0 +1,79 @@
+from app.domain.geometry.point_locator import PolygonLocator
+from app.domain.validation.coordinates import parse_coordinate
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import BadRequest, InternalServerError, NotFound
+
+MAX_LOCATE_POINTS = 10000
+
+
+def _postal_code_locator() -> PolygonLocator:
+    """
+    Get the grid index of the postal code polygons.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return repository.get_postal_code_locator()
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def locate_postal_code_service(latitude, longitude) -> dict:
+    """
+    Find the postal code whose polygon contains a point.
+
+    Args:
+        latitude: Latitude of the point in degrees.
+        longitude: Longitude of the point in degrees.
+
+    Returns:
+        dict: The validated coordinates and the postal code number.
+
+    Raises:
+        BadRequest: If a coordinate is missing or invalid.
+        NotFound: If no Berlin postal code contains the point.
+        InternalServerError: If the postal codes cannot be read.
+    """
+    latitude = parse_coordinate(latitude, -90, 90, "lat")
+    longitude = parse_coordinate(longitude, -180, 180, "lon")
+
+    postal_code = _postal_code_locator().locate(longitude, latitude)
+    if postal_code is None:
+        raise NotFound(f"No postal code found at {latitude}, {longitude}.")
+
+    return {"latitude": latitude, "longitude": longitude, "postal_code": postal_code}
+
+
+def locate_postal_codes_service(points) -> dict:
+    """
+    Find the postal codes of many points.
+
+    Args:
+        points: List of [latitude, longitude] pairs.
+
+    Returns:
+        dict: The postal code number per point in input order, None for points
+        outside all postal codes.
+
+    Raises:
+        BadRequest: If the points are missing, invalid or more than `MAX_LOCATE_POINTS`.
+        InternalServerError: If the postal codes cannot be read.
+    """
+    if not isinstance(points, list):
+        raise BadRequest("'points' must be a list of [lat, lon] pairs.")
+    if len(points) > MAX_LOCATE_POINTS:
+        raise BadRequest(f"At most {MAX_LOCATE_POINTS} points per request.")
+
+    latitudes, longitudes = [], []
+    for point in points:
+        if not isinstance(point, (list, tuple)) or len(point) != 2:
+            raise BadRequest("'points' must be a list of [lat, lon] pairs.")
+        latitudes.append(parse_coordinate(point[0], -90, 90, "lat"))
+        longitudes.append(parse_coordinate(point[1], -180, 180, "lon"))
+
+    return {"postal_codes": _postal_code_locator().locate_many(longitudes, latitudes)}
@@ -0,0 +1,36 @@
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES
+from app.domain.geometry.geojson import encode_feature_collection, polygon_feature
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+
+def get_postal_code_geojson_service() -> bytes:
+    """
+    Get the polygons of all postal codes as GeoJSON for the map layer.
+
+    The bytes are encoded once per process and again when the postal code
+    geometries change.
+
+    Returns:
+        bytes: FeatureCollection with one Feature per postal code, its
+        number as id and property.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return POSTAL_CODE_GEOMETRIES.derived(
+                "geojson",
+                lambda: encode_feature_collection(
+                    polygon_feature(geometry.polygons, {"number": number}, number)
+                    for number, geometry in sorted(
+                        repository.get_postal_code_geometries().items()
+                    )
+                ),
+            )
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
@@ -0,0 +1,48 @@
+from app.domain.geometry.simplification import SimplifiedPolygons
+from app.domain.validation.coordinates import parse_zoom
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+
+def _simplified_postal_codes() -> SimplifiedPolygons:
+    """
+    Get the postal code polygons simplified per zoom level.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return repository.get_simplified_postal_codes()
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
+
+
+def get_postal_code_polygons_service(zoom=None) -> dict:
+    """
+    Get the polygons of all postal codes in the detail of a map zoom level.
+
+    Args:
+        zoom: Zoom level of the map, None for the full resolution.
+
+    Returns:
+        dict: The simplified `level` serving the zoom level (None for the full
+        resolution) and the number and WKT polygon of every postal code.
+
+    Raises:
+        BadRequest: If the zoom level is invalid.
+        InternalServerError: If the postal codes cannot be read.
+    """
+    zoom = None if zoom is None else parse_zoom(zoom)
+    simplified = _simplified_postal_codes()
+    level = None if zoom is None else simplified.level_zoom(zoom)
+    return {
+        "level": level,
+        "postal_codes": [
+            {"number": number, "polygon": polygon}
+            for number, polygon in sorted(simplified.wkt_at_level(level).items())
+        ],
+    }
@@ -0,0 +1,32 @@
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+TOPOLOGY_OBJECT = "postal_codes"
+
+
+def get_postal_code_topology_service() -> bytes:
+    """
+    Get the polygons of all postal codes as TopoJSON.
+
+    The document is encoded once per process and again when the postal
+    code geometries change.
+
+    Returns:
+        bytes: TopoJSON topology with the postal codes in the `postal_codes`
+        object, their numbers as ids.
+
+    Raises:
+        InternalServerError: If the postal codes cannot be read.
+    """
+    try:
+        with PostalCodeOperations() as repository:
+            return POSTAL_CODE_GEOMETRIES.derived(
+                "topojson",
+                lambda: repository.get_postal_code_topology().encode(TOPOLOGY_OBJECT),
+            )
+    except SQLAlchemyError as e:
+        raise InternalServerError(f"Database error: {str(e)}")
@@ -0,0 +1,236 @@
+"""Batch validation of charging stations.
+
+Applies the validation rules of `ChargingStation.__init__` to whole columns
+of a batch instead of one row at a time. Every rule first checks the column
+with a few reductions running in C (`min`, `max`, `sum`, `set(map(type, ...))`),
+which settles the common case of a clean column without a Python-level loop.
+Only a failing column is compared row by row into a mask with one byte per
+row. The masks are combined as big integers, so finding the first failing
+rule of every row costs a few bitwise operations per rule.
+
+The batch check pays off for data already held as columns, like the shards
+of the parallel register loader. Collecting the columns of row mappings
+costs about what it saves, so the other register loaders keep the
+single-row checks of `parse_charging_station_row`.
+
+Classes:
+    StationBatchReport: Reject mask and reject reasons of a validated batch.
+
+Functions:
+    station_columns:          transpose row mappings into typed columns
+    validate_station_columns: validate the columns of a batch
+    validate_station_rows:    validate a batch of row mappings
+"""
+
+import math
+from itertools import repeat
+from operator import ge, itemgetter, le
+from typing import Optional, Sequence
+
+REASON_LATITUDE = "invalid latitude"
+REASON_LONGITUDE = "invalid longitude"
+REASON_NOMINAL_POWER = "invalid nominal power"
+REASON_NUM_CHARGING_POINTS = "invalid number of charging points"
+REASON_OPERATOR = "invalid operator"
+REASON_ADDRESS_SUFFIX = "invalid address suffix"
+# In the order of the checks in ChargingStation.__init__
+REASONS = (
+    REASON_LATITUDE,
+    REASON_LONGITUDE,
+    REASON_NOMINAL_POWER,
+    REASON_NUM_CHARGING_POINTS,
+    REASON_OPERATOR,
+    REASON_ADDRESS_SUFFIX,
+)
+
+
+class StationBatchReport:
+    """
+    Result of validating a batch of charging stations.
+
+    Attributes:
+        size (int): Number of rows in the batch.
+        reason_codes (bytes): Per row 0 if valid, otherwise 1 + the index of the
+            first failing rule in `REASONS`.
+        reason_counts (dict[str, int]): Number of rejected rows per reason.
+    """
+
+    def __init__(self, size: int, reason_codes: bytes, reason_counts: dict[str, int]):
+        self.size = size
+        self.reason_codes = reason_codes
+        self.reason_counts = reason_counts
+
+    @property
+    def mask(self) -> bytes:
+        """
+        Returns:
+            bytes: Per row 1 if rejected, 0 if valid.
+        """
+        return bytes(map(bool, self.reason_codes))
+
+    @property
+    def rows_rejected(self) -> int:
+        """
+        Returns:
+            int: Number of rejected rows.
+        """
+        return sum(self.reason_counts.values())
+
+    def reason(self, index: int) -> Optional[str]:
+        """
+        Reject reason of one row.
+
+        Args:
+            index (int): Position of the row in the batch.
+
+        Returns:
+            Optional[str]: The reason, None for a valid row.
+        """
+        code = self.reason_codes[index]
+        return REASONS[code - 1] if code else None
+
+    def accepted(self, rows: Sequence) -> list:
+        """
+        Keep the valid rows of the batch.
+
+        Args:
+            rows (Sequence): The rows in the order they were validated.
+
+        Returns:
+            list: The rows that passed all rules.
+        """
+        if not self.rows_rejected:
+            return list(rows)
+        return [row for row, code in zip(rows, self.reason_codes) if not code]
+
+
+def _mask(flags) -> int:
+    """
+    Pack an iterable of booleans into an integer with one byte per row.
+    """
+    return int.from_bytes(bytes(flags), "little")
+
+
+def _is_finite_sum(values: Sequence) -> bool:
+    # The sum is NaN or infinite as soon as a single value is
+    try:
+        return math.isfinite(sum(values))
+    except TypeError:  # None or another non-number in the column
+        return False
+
+
+def _range_failures(values: Sequence, low: float, high: float, ones: int) -> int:
+    if not values or (
+        _is_finite_sum(values) and low <= min(values) and max(values) <= high
+    ):
+        return 0
+    size = len(values)
+    valid = _mask(map(le, repeat(low, size), values)) & _mask(
+        map(ge, repeat(high, size), values)
+    )
+    return valid ^ ones
+
+
+def _positive_failures(values: Sequence, ones: int) -> int:
+    if not values or (_is_finite_sum(values) and min(values) > 0):
+        return 0
+    return _mask(value is not None and value > 0 for value in values) ^ ones
+
+
+def _positive_int_failures(values: Sequence, ones: int) -> int:
+    if not values or (set(map(type, values)) == {int} and min(values) > 0):
+        return 0
+    return _mask(isinstance(value, int) and value > 0 for value in values) ^ ones
+
+
+def _operator_failures(values: Sequence, ones: int) -> int:
+    if not values or (set(map(type, values)) == {str} and all(map(str.strip, values))):
+        return 0
+    return (
+        _mask(isinstance(value, str) and len(value.strip()) > 0 for value in values)
+        ^ ones
+    )
+
+
+def _address_suffix_failures(values: Sequence, ones: int) -> int:
+    if set(map(type, values)) <= {str, type(None)}:
+        return 0
+    return _mask(value is None or isinstance(value, str) for value in values) ^ ones
+
+
+def station_columns(rows: Sequence[dict]) -> dict[str, Sequence]:
+    """
+    Transpose row mappings into the columns checked by `validate_station_columns`.
+
+    Args:
+        rows (Sequence[dict]): Column values per row, e.g. from `parse_charging_station_row`.
+
+    Returns:
+        dict[str, list]: The validated columns by name.
+    """
+    return {
+        column: list(map(itemgetter(column), rows))
+        for column in (
+            "latitude",
+            "longitude",
+            "nominal_power",
+            "num_charging_points",
+            "operator",
+            "address_suffix",
+        )
+    }
+
+
+def validate_station_columns(columns: dict[str, Sequence]) -> StationBatchReport:
+    """
+    Validate a batch of charging stations column by column.
+
+    The rules and their order are the same as in `ChargingStation.__init__`,
+    every rejected row is reported with the first rule it fails.
+
+    Args:
+        columns (dict[str, Sequence]): Equally long columns as returned by
+            `station_columns`, lists or `array` objects.
+
+    Returns:
+        StationBatchReport: The reject mask and reasons.
+
+    Raises:
+        TypeError: If a coordinate is not a number.
+    """
+    size = len(columns["latitude"])
+    ones = _mask(repeat(True, size))
+    failures = (
+        _range_failures(columns["latitude"], -90, 90, ones),
+        _range_failures(columns["longitude"], -180, 180, ones),
+        _positive_failures(columns["nominal_power"], ones),
+        _positive_int_failures(columns["num_charging_points"], ones),
+        _operator_failures(columns["operator"], ones),
+        _address_suffix_failures(columns["address_suffix"], ones),
+    )
+
+    rejected = codes = 0
+    reason_counts = {}
+    for code, (reason, failed) in enumerate(zip(REASONS, failures), start=1):
+        first_failure = failed & (rejected ^ ones)
+        if first_failure:
+            reason_counts[reason] = first_failure.bit_count()
+            codes |= first_failure * code  # Each byte is 0 or 1, no carries
+            rejected |= failed
+    return StationBatchReport(size, codes.to_bytes(size, "little"), reason_counts)
+
+
+def validate_station_rows(rows: Sequence[dict]) -> StationBatchReport:
+    """
+    Validate a batch of charging station row mappings.
+
+    Args:
+        rows (Sequence[dict]): Column values per row.
+
+    Returns:
+        StationBatchReport: The reject mask and reasons.
+
+    Raises:
+        TypeError: If a coordinate is not a number.
+    """
+    return validate_station_columns(station_columns(rows))
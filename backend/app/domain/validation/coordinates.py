@@ -0,0 +1,92 @@
+"""Validation of coordinates given in requests.
+
+Functions:
+    parse_coordinate: convert and range check one coordinate
+    parse_bbox:       convert and check the edges of a bounding box
+    parse_zoom:       convert and range check a map zoom level
+"""
+
+import math
+
+from werkzeug.exceptions import BadRequest
+
+# Query arguments of a bounding box, in the order of `parse_bbox`
+BBOX_ARGS = ("min_lat", "min_lon", "max_lat", "max_lon")
+# Largest zoom level of common web maps
+MAX_MAP_ZOOM = 24
+
+
+def parse_coordinate(value, low: float, high: float, name: str) -> float:
+    """
+    Validate one coordinate, e.g. a query argument or a JSON value.
+
+    Args:
+        value: The coordinate as number or string.
+        low (float): Smallest valid value.
+        high (float): Largest valid value.
+        name (str): Name of the argument in error messages.
+
+    Returns:
+        float: The coordinate.
+
+    Raises:
+        BadRequest: If the value is not a finite number between low and high.
+    """
+    if isinstance(value, bool):
+        raise BadRequest(f"'{name}' must be a number.")
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"'{name}' must be a number.")
+    if not (math.isfinite(value) and low <= value <= high):
+        raise BadRequest(f"'{name}' must be between {low} and {high}.")
+    return value
+
+
+def parse_bbox(min_lat, min_lon, max_lat, max_lon) -> tuple[float, float, float, float]:
+    """
+    Validate the edges of a bounding box, e.g. a map viewport.
+
+    Args:
+        min_lat: South edge of the box in degrees.
+        min_lon: West edge of the box in degrees.
+        max_lat: North edge of the box in degrees.
+        max_lon: East edge of the box in degrees.
+
+    Returns:
+        tuple[float, float, float, float]: min lon, min lat, max lon, max lat.
+
+    Raises:
+        BadRequest: If an edge is invalid or the box is inverted.
+    """
+    min_lat = parse_coordinate(min_lat, -90, 90, "min_lat")
+    max_lat = parse_coordinate(max_lat, -90, 90, "max_lat")
+    min_lon = parse_coordinate(min_lon, -180, 180, "min_lon")
+    max_lon = parse_coordinate(max_lon, -180, 180, "max_lon")
+    if min_lat > max_lat or min_lon > max_lon:
+        raise BadRequest(
+            "'min_lat' and 'min_lon' must not exceed 'max_lat' and 'max_lon'."
+        )
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def parse_zoom(value) -> int:
+    """
+    Validate the zoom level of a web map.
+
+    Args:
+        value: The zoom level as integer or string.
+
+    Returns:
+        int: The zoom level.
+
+    Raises:
+        BadRequest: If the value is not an integer from 0 to `MAX_MAP_ZOOM`.
+    """
+    try:
+        zoom = int(value)
+    except (TypeError, ValueError):
+        raise BadRequest("'zoom' must be an integer.")
+    if not 0 <= zoom <= MAX_MAP_ZOOM:
+        raise BadRequest(f"'zoom' must be between 0 and {MAX_MAP_ZOOM}.")
+    return zoom
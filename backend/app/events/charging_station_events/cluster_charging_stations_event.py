@@ -0,0 +1,38 @@
+"""Routes for clustered map views of charging stations.
+
+Endpoints:
+    - GET /clusters?min_lat=<float>&min_lon=<float>&max_lat=<float>&max_lon=<float>&zoom=<int>:
+      Station clusters with counts and the single stations of a viewport.
+"""
+
+from app.domain.services.charging_staion_services.cluster_search_service import (
+    search_clusters_service,
+)
+from app.domain.validation.coordinates import BBOX_ARGS
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/clusters", methods=["GET"])
+def cluster_charging_stations_event():
+    """
+    Retrieve the station clusters of a map viewport.
+
+    Returns:
+        JSON: The clusters and the stations not in a cluster.
+        JSON: An error message with status 400 for invalid arguments.
+    """
+    try:
+        edges = [request.args.get(name) for name in BBOX_ARGS]
+        zoom = request.args.get("zoom")
+        if any(edge is None for edge in edges) or zoom is None:
+            raise BadRequest(f"{', '.join(BBOX_ARGS)} and zoom are required.")
+
+        return jsonify(search_clusters_service(*edges, zoom)), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
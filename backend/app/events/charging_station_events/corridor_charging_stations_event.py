@@ -0,0 +1,40 @@
+"""Routes for corridor searches of charging stations.
+
+Endpoints:
+    - POST /corridor: Charging stations along a route, body
+      {"route": [[lat, lon], ...], "width_m": <float>}, in driving order.
+"""
+
+from app.domain.services.charging_staion_services.corridor_search_service import (
+    search_corridor_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/corridor", methods=["POST"])
+def corridor_charging_stations_event():
+    """
+    Retrieve the charging stations in a corridor along a route.
+
+    Returns:
+        JSON: The stations in driving order, each with its position along
+            the route and its distance from the route in meters.
+        JSON: An error message with status 400 for an invalid body.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or "route" not in data or "width_m" not in data:
+            raise BadRequest("'route' and 'width_m' are required.")
+
+        found_charging_stations = search_corridor_service(
+            data["route"], data["width_m"]
+        )
+        return jsonify(found_charging_stations), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,35 @@
+"""Routes for the charging station layer of the map.
+
+Endpoints:
+    - GET /geojson: All charging stations as GeoJSON FeatureCollection.
+"""
+
+from app.domain.services.charging_staion_services.geojson_charging_stations_service import (
+    get_charging_stations_geojson_service,
+)
+from app.domain.geometry.geojson import GEOJSON_MIMETYPE
+from flask import Response, jsonify
+from werkzeug.exceptions import InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/geojson", methods=["GET"])
+def geojson_charging_stations_event():
+    """
+    Retrieve all charging stations as GeoJSON.
+
+    Returns:
+        Response: FeatureCollection with one point per charging station.
+        JSON: An error message with status 500 if the stations cannot be read.
+    """
+    try:
+        return (
+            Response(
+                get_charging_stations_geojson_service(), mimetype=GEOJSON_MIMETYPE
+            ),
+            200,
+        )
+
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,46 @@
+"""Routes for finding the closest charging stations.
+
+Endpoints:
+    - GET /nearest?lat=<float>&lon=<float>&k=<int>: The k charging stations
+      closest to a position, optionally filtered by `functional`,
+      `charging_type` and `min_nominal_power`.
+"""
+
+from app.domain.services.charging_staion_services.nearest_search_service import (
+    search_nearest_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/nearest", methods=["GET"])
+def nearest_charging_stations_event():
+    """
+    Retrieve the charging stations closest to a position.
+
+    Returns:
+        JSON: The stations closest first, each with its distance in meters.
+        JSON: An error message with status 400 for invalid arguments.
+    """
+    try:
+        latitude = request.args.get("lat")
+        longitude = request.args.get("lon")
+        if latitude is None or longitude is None:
+            raise BadRequest("Both 'lat' and 'lon' are required.")
+
+        found_charging_stations = search_nearest_service(
+            latitude,
+            longitude,
+            k=request.args.get("k"),
+            functional=request.args.get("functional"),
+            charging_type=request.args.get("charging_type"),
+            min_nominal_power=request.args.get("min_nominal_power"),
+        )
+        return jsonify(found_charging_stations), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,39 @@
+"""Routes for radius searches of charging stations.
+
+Endpoints:
+    - GET /within?lat=<float>&lon=<float>&radius_m=<float>: Charging stations
+      within a radius of a position, closest first.
+"""
+
+from app.domain.services.charging_staion_services.radius_search_service import (
+    search_radius_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import charging_stations
+
+
+@charging_stations.route("/within", methods=["GET"])
+def radius_charging_stations_event():
+    """
+    Retrieve the charging stations within a radius of a position.
+
+    Returns:
+        JSON: The stations closest first, each with its distance in meters.
+        JSON: An error message with status 400 for invalid arguments.
+    """
+    try:
+        latitude = request.args.get("lat")
+        longitude = request.args.get("lon")
+        radius_m = request.args.get("radius_m")
+        if latitude is None or longitude is None or radius_m is None:
+            raise BadRequest("'lat', 'lon' and 'radius_m' are required.")
+
+        found_charging_stations = search_radius_service(latitude, longitude, radius_m)
+        return jsonify(found_charging_stations), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,8 @@
+from flask import Blueprint
+
+districts = Blueprint("districts", __name__)
+
+# Import all events to register routes
+from app.events.district_events.district_polygons_event import (
+    district_polygons_event,
+)  # noqa
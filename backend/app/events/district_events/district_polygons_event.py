@@ -0,0 +1,31 @@
+"""Routes for the district boundaries of the map.
+
+Endpoints:
+    - GET /polygons?zoom=<int>: Boundaries of all districts, simplified for the zoom level.
+"""
+
+from app.domain.services.district_services.district_polygons_service import (
+    get_district_polygons_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import districts
+
+
+@districts.route("/polygons", methods=["GET"])
+def district_polygons_event():
+    """
+    Retrieve the boundaries of all districts, in full resolution without zoom.
+
+    Returns:
+        JSON: The simplified level and the districts with their WKT boundary.
+        JSON: An error message with status 400 for an invalid zoom level.
+    """
+    try:
+        return jsonify(get_district_polygons_service(request.args.get("zoom"))), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,6 @@
+from flask import Blueprint
+
+map_tiles = Blueprint("map_tiles", __name__)
+
+# Import all events to register routes
+from app.events.map_tile_events.map_tile_event import map_tile_event  # noqa
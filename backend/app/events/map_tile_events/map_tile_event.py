@@ -0,0 +1,33 @@
+"""Routes for vector tiles of the map.
+
+Endpoints:
+    - GET /<z>/<x>/<y>.mvt: Mapbox Vector Tile of the postal codes and charging stations.
+"""
+
+from app.domain.services.map_tile_services.map_tile_service import (
+    get_map_tile_service,
+)
+from flask import Response, jsonify
+from werkzeug.exceptions import InternalServerError, NotFound
+
+from . import map_tiles
+
+MVT_MIMETYPE = "application/vnd.mapbox-vector-tile"
+
+
+@map_tiles.route("/<int:z>/<int:x>/<int:y>.mvt", methods=["GET"])
+def map_tile_event(z: int, x: int, y: int):
+    """
+    Retrieve a vector tile.
+
+    Returns:
+        Response: The tile, empty if it shows nothing.
+        JSON: An error message with status 404 for tiles outside the pyramid.
+    """
+    try:
+        return Response(get_map_tile_service(z, x, y), mimetype=MVT_MIMETYPE), 200
+
+    except NotFound as e:
+        return jsonify({"error": str(e)}), 404
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,17 @@
+from flask import Blueprint
+
+postal_codes = Blueprint("postal_codes", __name__)
+
+# Import all events to register routes
+from app.events.postal_code_events.locate_postal_code_event import (
+    locate_postal_code_event,
+)  # noqa
+from app.events.postal_code_events.postal_code_polygons_event import (
+    postal_code_polygons_event,
+)  # noqa
+from app.events.postal_code_events.postal_code_topology_event import (
+    postal_code_topology_event,
+)  # noqa
+from app.events.postal_code_events.postal_code_geojson_event import (
+    postal_code_geojson_event,
+)  # noqa
@@ -0,0 +1,63 @@
+"""Routes for locating postal codes by coordinates.
+
+Endpoints:
+    - GET /locate?lat=<float>&lon=<float>: Postal code containing a point.
+    - POST /locate: Postal codes of many points, body {"points": [[lat, lon], ...]}.
+"""
+
+from app.domain.services.postal_code_services.locate_postal_code_service import (
+    locate_postal_code_service,
+    locate_postal_codes_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError, NotFound
+
+from . import postal_codes
+
+
+@postal_codes.route("/locate", methods=["GET"])
+def locate_postal_code_event():
+    """
+    Find the postal code containing a point.
+
+    Returns:
+        JSON: The coordinates and the postal code number.
+        JSON: An error message with status 400 for invalid coordinates or
+            404 if the point is outside of Berlin.
+    """
+    try:
+        latitude = request.args.get("lat")
+        longitude = request.args.get("lon")
+        if latitude is None or longitude is None:
+            raise BadRequest("Both 'lat' and 'lon' are required.")
+
+        return jsonify(locate_postal_code_service(latitude, longitude)), 200
+
+    except NotFound as e:
+        return jsonify({"error": str(e)}), 404
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
+
+
+@postal_codes.route("/locate", methods=["POST"])
+def locate_postal_codes_event():
+    """
+    Find the postal codes of many points.
+
+    Returns:
+        JSON: The postal code number per point, null for points outside of Berlin.
+        JSON: An error message with status 400 for an invalid body.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or "points" not in data:
+            raise BadRequest("'points' is required.")
+
+        return jsonify(locate_postal_codes_service(data["points"])), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,33 @@
+"""Routes for the postal code layer of the map.
+
+Endpoints:
+    - GET /geojson: Polygons of all postal codes as GeoJSON FeatureCollection.
+"""
+
+from app.domain.geometry.geojson import GEOJSON_MIMETYPE
+from app.domain.services.postal_code_services.postal_code_geojson_service import (
+    get_postal_code_geojson_service,
+)
+from flask import Response, jsonify
+from werkzeug.exceptions import InternalServerError
+
+from . import postal_codes
+
+
+@postal_codes.route("/geojson", methods=["GET"])
+def postal_code_geojson_event():
+    """
+    Retrieve the polygons of all postal codes as GeoJSON.
+
+    Returns:
+        Response: FeatureCollection with one Feature per postal code.
+        JSON: An error message with status 500 if the postal codes cannot be read.
+    """
+    try:
+        return (
+            Response(get_postal_code_geojson_service(), mimetype=GEOJSON_MIMETYPE),
+            200,
+        )
+
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
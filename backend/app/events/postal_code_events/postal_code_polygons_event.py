@@ -0,0 +1,31 @@
+"""Routes for the postal code polygons of the map.
+
+Endpoints:
+    - GET /polygons?zoom=<int>: Polygons of all postal codes, simplified for the zoom level.
+"""
+
+from app.domain.services.postal_code_services.postal_code_polygons_service import (
+    get_postal_code_polygons_service,
+)
+from flask import jsonify, request
+from werkzeug.exceptions import BadRequest, InternalServerError
+
+from . import postal_codes
+
+
+@postal_codes.route("/polygons", methods=["GET"])
+def postal_code_polygons_event():
+    """
+    Retrieve the polygons of all postal codes, in full resolution without zoom.
+
+    Returns:
+        JSON: The simplified level and the postal codes with their WKT polygon.
+        JSON: An error message with status 400 for an invalid zoom level.
+    """
+    try:
+        return jsonify(get_postal_code_polygons_service(request.args.get("zoom"))), 200
+
+    except BadRequest as e:
+        return jsonify({"error": str(e)}), 400
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -0,0 +1,32 @@
+"""Routes for the postal code topology of the map.
+
+Endpoints:
+    - GET /topology: Polygons of all postal codes as TopoJSON with shared borders.
+"""
+
+from app.domain.services.postal_code_services.postal_code_topology_service import (
+    get_postal_code_topology_service,
+)
+from flask import Response, jsonify
+from werkzeug.exceptions import InternalServerError
+
+from . import postal_codes
+
+
+@postal_codes.route("/topology", methods=["GET"])
+def postal_code_topology_event():
+    """
+    Retrieve the polygons of all postal codes as quantized TopoJSON.
+
+    Returns:
+        Response: The TopoJSON topology.
+        JSON: An error message with status 500 if the postal codes cannot be read.
+    """
+    try:
+        return (
+            Response(get_postal_code_topology_service(), mimetype="application/json"),
+            200,
+        )
+
+    except InternalServerError as e:
+        return jsonify({"error": "An unexpected error occurred."}), 500
@@ -1,9 +1,24 @@
-"""Used to test the connection to the backend"""
+"""Used to test the connection to the backend and its readiness"""
 
-from flask import Blueprint, jsonify
+from app.infrastructure.ingestion.ingestion_progress import (
+    PHASE_FAILED,
+    get_ingestion_progress,
+)
+from flask import Blueprint, current_app, jsonify, request
 
 home = Blueprint("hello", __name__)
 
+# Seconds a client should wait before asking again while the data is loading
+RETRY_AFTER_SECONDS = 5
+
+
+def _not_ready_response(progress):
+    response = jsonify(progress.as_dict())
+    response.status_code = 503
+    if progress.phase != PHASE_FAILED:  # Asking again will not help
+        response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+    return response
+
 
 @home.route("/", methods=["GET"])
 def hello_world():
@@ -14,3 +29,40 @@ def hello_world():
         JSON: A message indicating the application is running.
     """
     return jsonify({"message": "Welcome to the backend"}), 200
+
+
+@home.route("/ready", methods=["GET"])
+def readiness():
+    """
+    Report if the datasets are loaded and the API can serve requests.
+
+    Returns:
+        JSON: The ingestion progress with phase, rows done and total and ETA,
+        status 200 once ready, otherwise 503 with a Retry-After header, or
+        503 with the error if the ingestion failed.
+    """
+    progress = get_ingestion_progress(current_app)
+    if progress is None:
+        return jsonify({"ready": True}), 200
+    if not progress.ready:
+        return _not_ready_response(progress)
+    return jsonify(progress.as_dict()), 200
+
+
+def require_ready():
+    """
+    Answer API requests with 503 and the ingestion progress until the data is loaded.
+
+    Registered with `before_request`, so the API never serves a partially
+    loaded database, neither while loading nor after a failed ingestion.
+    The welcome and readiness routes stay available.
+
+    Returns:
+        Optional[Response]: The 503 response, None to handle the request.
+    """
+    if not request.path.startswith("/api/"):
+        return None
+    progress = get_ingestion_progress(current_app)
+    if progress is None or progress.ready:
+        return None
+    return _not_ready_response(progress)
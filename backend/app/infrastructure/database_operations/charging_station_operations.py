@@ -1,12 +1,68 @@
 from app.domain.entities.charging_station import ChargingStation, OperationStatus
+from app.domain.geometry.caches import MAP_TILES, STATION_INDEX
+from app.domain.geometry.station_index import StationIndex
 from app.infrastructure.database_operations.template.template_operations import (
     TemplateOperations,
 )
+from sqlalchemy import bindparam, delete, event, insert, inspect, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+# Session flags set by writes to the charging stations
+STATIONS_ADDED = "charging_stations_added"
+STATIONS_CHANGED = "charging_stations_changed"
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_station_changes(session: Session, flush_context) -> None:
+    """
+    Flag ORM writes that add, delete or move charging stations. Status
+    changes are applied to the kept index by `update_charging_station_status`.
+    """
+    if any(isinstance(station, ChargingStation) for station in session.new):
+        session.info[STATIONS_ADDED] = True
+    if any(isinstance(station, ChargingStation) for station in session.deleted) or any(
+        isinstance(station, ChargingStation)
+        and any(
+            attribute.history.has_changes()
+            for attribute in inspect(station).attrs
+            if attribute.key != "functional"
+        )
+        for station in session.dirty
+    ):
+        session.info[STATIONS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _update_station_index(session: Session) -> None:
+    """
+    Drop the station index once a transaction moving or deleting stations
+    is committed, so an index built while it was open is not kept. Inserted
+    stations are added to the kept index instead.
+    """
+    added = session.info.pop(STATIONS_ADDED, False)
+    if session.info.pop(STATIONS_CHANGED, False):
+        STATION_INDEX.invalidate()
+    elif added:
+        STATION_INDEX.stations_added()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_station_index(session: Session) -> None:
+    """
+    Drop the station index after a rolled back write, it may hold uncommitted rows.
+    """
+    added = session.info.pop(STATIONS_ADDED, False)
+    if session.info.pop(STATIONS_CHANGED, False) or added:
+        STATION_INDEX.invalidate()
 
 
 class ChargingStationOperations(TemplateOperations):
 
+    def _stations_changed(self) -> None:
+        STATION_INDEX.invalidate()
+        self.session.info[STATIONS_CHANGED] = True
+
     def get_all_charging_stations(self) -> list[dict]:
         """Retrieve all charging stations
 
@@ -16,6 +72,48 @@ class ChargingStationOperations(TemplateOperations):
         stations = self.session.query(ChargingStation).all()
         return [station.get_dict() for station in stations]
 
+    def has_charging_stations(self) -> bool:
+        """
+        Check if any charging station is stored.
+
+        Returns:
+            bool: True if the table holds at least one station, False otherwise.
+        """
+        return self.session.query(ChargingStation.id).first() is not None
+
+    def get_charging_stations_after(self, after_id: int) -> list[dict]:
+        """
+        Retrieve the charging stations with a larger id, e.g. the newly inserted ones.
+
+        Args:
+            after_id (int): Only stations with a larger id are returned.
+
+        Returns:
+            list[dict]: The charging stations as dictionaries, ordered by id.
+        """
+        stations = (
+            self.session.query(ChargingStation)
+            .filter(ChargingStation.id > after_id)
+            .order_by(ChargingStation.id)
+        )
+        return [station.get_dict() for station in stations]
+
+    def get_station_index(self) -> StationIndex:
+        """
+        Retrieve the charging stations with spatial indexes over their locations.
+
+        The index is built from all stations on first use and kept until
+        stations are updated or deleted. Inserted stations are added to the
+        kept index, status changes are applied to it.
+
+        Returns:
+            StationIndex: The memoized station index.
+        """
+        return STATION_INDEX.get(
+            lambda: StationIndex(self.get_all_charging_stations()),
+            self.get_charging_stations_after,
+        )
+
     def get_charging_stations_by_postal_code(
         self, postal_code: [str | int]
     ) -> list[dict]:
@@ -61,9 +159,115 @@ class ChargingStationOperations(TemplateOperations):
             SQLAlchemyError: If the update fails.
         """
         try:
-            station.functional = OperationStatus[new_status.upper()]
+            station_id, status = station.id, OperationStatus[new_status.upper()]
+            location = (station.longitude, station.latitude)
+            station.functional = status
             self.session.commit()
         except SQLAlchemyError as e:
             # allways rollback if an error occurs
             self.session.rollback()
             raise SQLAlchemyError(f"Error updating charging station: {e}")
+        STATION_INDEX.update_station(station_id, {"functional": str(status)})
+        MAP_TILES.discard_point(*location)
+
+    def bulk_insert_charging_stations(self, rows: list[dict]) -> None:
+        """
+        Insert many charging stations with one executemany statement.
+
+        The rows are plain column mappings, no ORM objects are created.
+        The caller is responsible for committing the session.
+
+        Args:
+            rows (list[dict]): Column values of the charging stations.
+        """
+        if rows:
+            self.session.execute(insert(ChargingStation.__table__), rows)
+            self.session.info[STATIONS_ADDED] = True
+
+    def get_station_key_columns(self, columns: list[str]) -> list[tuple]:
+        """
+        Retrieve selected columns of all charging stations without loading ORM objects.
+
+        Args:
+            columns (list[str]): Names of the columns to select, the id is always first.
+
+        Returns:
+            list[tuple]: One tuple per station, ordered by id.
+        """
+        table = ChargingStation.__table__
+        query = self.session.query(
+            table.c.id, *(table.c[name] for name in columns)
+        ).order_by(table.c.id)
+        return [tuple(row) for row in query]
+
+    def get_unassigned_station_locations(self) -> list[tuple[int, int, float, float]]:
+        """
+        Retrieve the location of every charging station without district.
+
+        Returns:
+            list[tuple[int, int, float, float]]: Id, postal code, latitude and longitude.
+        """
+        return [
+            tuple(row)
+            for row in self.session.query(
+                ChargingStation.id,
+                ChargingStation.postal_code_id,
+                ChargingStation.latitude,
+                ChargingStation.longitude,
+            ).filter(ChargingStation.district_id.is_(None))
+        ]
+
+    def get_station_locations(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int, float, float]]:
+        """
+        Retrieve the locations of the next charging stations in id order.
+
+        Args:
+            after_id (int): Only stations with a larger id are returned.
+            limit (int): Maximum number of stations.
+
+        Returns:
+            list[tuple[int, int, float, float]]: Id, postal code, latitude and longitude.
+        """
+        return [
+            tuple(row)
+            for row in self.session.query(
+                ChargingStation.id,
+                ChargingStation.postal_code_id,
+                ChargingStation.latitude,
+                ChargingStation.longitude,
+            )
+            .filter(ChargingStation.id > after_id)
+            .order_by(ChargingStation.id)
+            .limit(limit)
+        ]
+
+    def bulk_update_charging_stations(self, rows: list[dict]) -> None:
+        """
+        Update many charging stations with one executemany statement.
+
+        Every row holds the `station_id` and the new values of the columns to set,
+        all rows must set the same columns. The caller is responsible for committing.
+
+        Args:
+            rows (list[dict]): Station ids and column values.
+        """
+        if rows:
+            table = ChargingStation.__table__
+            self.session.execute(
+                update(table).where(table.c.id == bindparam("station_id")), rows
+            )
+            self._stations_changed()
+
+    def delete_charging_stations(self, station_ids: list[int]) -> None:
+        """
+        Delete charging stations by id. The caller is responsible for committing.
+
+        Args:
+            station_ids (list[int]): Ids of the charging stations to delete.
+        """
+        if station_ids:
+            table = ChargingStation.__table__
+            self.session.execute(delete(table).where(table.c.id.in_(station_ids)))
+            self._stations_changed()
@@ -0,0 +1,43 @@
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.infrastructure.database_operations.template.template_operations import (
+    TemplateOperations,
+)
+
+
+class DatasetMetadataOperations(TemplateOperations):
+
+    def get_metadata(self, dataset: str) -> DatasetMetadata:
+        """
+        Retrieve the stored fingerprint of a dataset.
+
+        Args:
+            dataset (str): Name of the dataset.
+
+        Returns:
+            DatasetMetadata: The metadata, or None if the dataset was never loaded.
+        """
+        return self.session.query(DatasetMetadata).filter_by(dataset=dataset).first()
+
+    def save_metadata(
+        self, dataset: str, source_path: str, size: int, mtime: float, content_hash: str
+    ) -> None:
+        """
+        Create or update the fingerprint of a dataset and commit it.
+
+        Args:
+            dataset (str): Name of the dataset.
+            source_path (str): Path of the source file.
+            size (int): File size in bytes.
+            mtime (float): Modification time of the file.
+            content_hash (str): SHA-256 of the file content.
+        """
+        metadata = self.get_metadata(dataset)
+        if not metadata:
+            metadata = DatasetMetadata(dataset, source_path, size, mtime, content_hash)
+            self.session.add(metadata)
+
+        metadata.source_path = source_path
+        metadata.size = size
+        metadata.mtime = mtime
+        metadata.content_hash = content_hash
+        self.session.commit()
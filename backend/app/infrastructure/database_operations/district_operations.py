@@ -0,0 +1,79 @@
+from app.domain.entities.district import DISTRICT_GEOMETRIES, District
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.simplification import SimplifiedPolygons
+from app.infrastructure.database_operations.template.template_operations import (
+    TemplateOperations,
+)
+from sqlalchemy import insert
+
+
+class DistrictOperations(TemplateOperations):
+
+    def get_all_district_names(self) -> set[str]:
+        """
+        Retrieve the names of all stored districts with a single query.
+
+        Returns:
+            set[str]: All district names in the database.
+        """
+        return {name for (name,) in self.session.query(District.name)}
+
+    def get_district_polygons(self) -> list[tuple[int, str]]:
+        """
+        Retrieve the boundaries of all districts.
+
+        Returns:
+            list[tuple[int, str]]: Id and WKT boundary of every district.
+        """
+        return [
+            (district_id, polygon)
+            for district_id, polygon in self.session.query(
+                District.id, District.polygon
+            ).order_by(District.id)
+        ]
+
+    def get_district_geometries(self) -> dict[str, PolygonGeometry]:
+        """
+        Retrieve the parsed boundaries of all districts.
+
+        Boundaries are parsed once per process and then served from
+        `DISTRICT_GEOMETRIES`.
+
+        Returns:
+            dict[str, PolygonGeometry]: Geometry by district name.
+        """
+        return {
+            name: DISTRICT_GEOMETRIES.get(name, polygon)
+            for name, polygon in self.session.query(District.name, District.polygon)
+        }
+
+    def get_simplified_districts(self) -> SimplifiedPolygons:
+        """
+        Retrieve the district boundaries simplified per zoom level.
+
+        The simplification is computed once per process and again when the
+        district geometries change, e.g. after the districts were reloaded.
+
+        Returns:
+            SimplifiedPolygons: WKT of the boundaries per zoom level by district name.
+        """
+        return DISTRICT_GEOMETRIES.derived(
+            "simplified",
+            lambda: SimplifiedPolygons(
+                {
+                    name: geometry.polygons
+                    for name, geometry in self.get_district_geometries().items()
+                }
+            ),
+        )
+
+    def bulk_insert_districts(self, rows: list[dict]) -> None:
+        """
+        Insert many districts with one executemany statement.
+        The caller is responsible for committing.
+
+        Args:
+            rows (list[dict]): Column values of the districts.
+        """
+        if rows:
+            self.session.execute(insert(District.__table__), rows)
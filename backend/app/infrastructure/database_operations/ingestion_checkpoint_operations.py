@@ -0,0 +1,62 @@
+from app.domain.entities.ingestion_checkpoint import IngestionCheckpoint
+from app.infrastructure.database_operations.template.template_operations import (
+    TemplateOperations,
+)
+
+
+class IngestionCheckpointOperations(TemplateOperations):
+
+    def get_checkpoint(self, dataset: str) -> IngestionCheckpoint:
+        """
+        Retrieve the checkpoint of a dataset.
+
+        Args:
+            dataset (str): Name of the dataset.
+
+        Returns:
+            IngestionCheckpoint: The checkpoint, or None if the dataset was never imported.
+        """
+        return (
+            self.session.query(IngestionCheckpoint).filter_by(dataset=dataset).first()
+        )
+
+    def delete_checkpoint(self, dataset: str) -> None:
+        """
+        Delete the checkpoint of a dataset, so it is imported from the beginning.
+        The caller is responsible for committing.
+
+        Args:
+            dataset (str): Name of the dataset.
+        """
+        self.session.query(IngestionCheckpoint).filter_by(dataset=dataset).delete()
+
+    def save_checkpoint(
+        self,
+        dataset: str,
+        dataset_hash: str,
+        byte_offset: int,
+        rows_committed: int,
+        completed: bool = False,
+    ) -> None:
+        """
+        Create or update the checkpoint of a dataset.
+
+        The checkpoint is not committed, so it is stored in the same
+        transaction as the rows it describes.
+
+        Args:
+            dataset (str): Name of the dataset.
+            dataset_hash (str): SHA-256 of the source file.
+            byte_offset (int): File offset behind the last row of the transaction.
+            rows_committed (int): Number of rows read up to the byte offset.
+            completed (bool): True if the whole file is imported.
+        """
+        checkpoint = self.get_checkpoint(dataset)
+        if not checkpoint:
+            checkpoint = IngestionCheckpoint(dataset=dataset, dataset_hash=dataset_hash)
+            self.session.add(checkpoint)
+
+        checkpoint.dataset_hash = dataset_hash
+        checkpoint.byte_offset = byte_offset
+        checkpoint.rows_committed = rows_committed
+        checkpoint.completed = completed
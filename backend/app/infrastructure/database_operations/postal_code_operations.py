@@ -1,7 +1,15 @@
-from app.domain.entities.postal_code import PostalCode
+from array import array
+
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES, PostalCode
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.point_locator import PolygonLocator
+from app.domain.geometry.simplification import SimplifiedPolygons
+from app.domain.geometry.topojson import QuantizedTopology
+from app.domain.geometry.topology import PolygonTopology
 from app.infrastructure.database_operations.template.template_operations import (
     TemplateOperations,
 )
+from sqlalchemy import bindparam, insert, update
 
 
 class PostalCodeOperations(TemplateOperations):
@@ -50,3 +58,175 @@ class PostalCodeOperations(TemplateOperations):
             )
             return exists is not None
         return False
+
+    def get_all_postal_code_numbers(self) -> set[int]:
+        """
+        Retrieve the numbers of all stored postal codes with a single query.
+
+        Returns:
+            set[int]: All postal code numbers in the database.
+        """
+        return {number for (number,) in self.session.query(PostalCode.number)}
+
+    def get_postal_code_geometries(self) -> dict[int, PolygonGeometry]:
+        """
+        Retrieve the parsed polygons of all postal codes.
+
+        Polygons are parsed once per process and then served from
+        `POSTAL_CODE_GEOMETRIES`.
+
+        Returns:
+            dict[int, PolygonGeometry]: Geometry by postal code number.
+        """
+        return {
+            number: POSTAL_CODE_GEOMETRIES.get(number, polygon)
+            for number, polygon in self.session.query(
+                PostalCode.number, PostalCode.polygon
+            )
+        }
+
+    def get_cached_postal_code_geometries(self) -> dict[int, PolygonGeometry]:
+        """
+        Retrieve the parsed polygons of all postal codes without a query.
+
+        The mapping is built once per process and rebuilt when the postal
+        code geometries change, so its identity tells whether they changed.
+
+        Returns:
+            dict[int, PolygonGeometry]: Geometry by postal code number.
+        """
+        return POSTAL_CODE_GEOMETRIES.derived(
+            "geometries", self.get_postal_code_geometries
+        )
+
+    def get_postal_code_locator(self) -> PolygonLocator:
+        """
+        Retrieve the grid index locating the postal code of a point.
+
+        The index is built once per process and rebuilt when the postal code
+        geometries change, e.g. after the postal codes were reloaded.
+
+        Returns:
+            PolygonLocator: Index of the postal code polygons by number.
+        """
+        return POSTAL_CODE_GEOMETRIES.derived(
+            "locator", lambda: PolygonLocator(self.get_postal_code_geometries())
+        )
+
+    def get_simplified_postal_codes(self) -> SimplifiedPolygons:
+        """
+        Retrieve the postal code polygons simplified per zoom level.
+
+        The simplification is computed once per process and again when the
+        postal code geometries change, e.g. after the postal codes were reloaded.
+
+        Returns:
+            SimplifiedPolygons: WKT of the polygons per zoom level by postal code number.
+        """
+        return POSTAL_CODE_GEOMETRIES.derived(
+            "simplified",
+            lambda: SimplifiedPolygons(
+                {
+                    number: geometry.polygons
+                    for number, geometry in self.get_postal_code_geometries().items()
+                }
+            ),
+        )
+
+    def get_postal_code_topology(self) -> QuantizedTopology:
+        """
+        Retrieve the postal code polygons as quantized topology of shared arcs.
+
+        The topology is built once per process and again when the postal
+        code geometries change, e.g. after the postal codes were reloaded.
+
+        Returns:
+            QuantizedTopology: Delta-encoded arcs and the arcs of every postal code.
+        """
+        return POSTAL_CODE_GEOMETRIES.derived(
+            "topology",
+            lambda: QuantizedTopology.from_geometries(
+                {
+                    number: geometry.polygons
+                    for number, geometry in self.get_postal_code_geometries().items()
+                }
+            ),
+        )
+
+    def get_postal_code_outline(self) -> list[list[array]]:
+        """
+        Retrieve the outline of all postal codes, the city boundary.
+
+        The outline is built once per process and again when the postal
+        code geometries change, so its identity tells whether it changed.
+
+        Returns:
+            list[list[array]]: One list of rings per polygon, the exterior
+            ring first, as `array("d")` of interleaved longitude and latitude values.
+        """
+        return POSTAL_CODE_GEOMETRIES.derived(
+            "outline",
+            lambda: PolygonTopology(
+                {
+                    number: geometry.polygons
+                    for number, geometry in self.get_postal_code_geometries().items()
+                }
+            ).outline(),
+        )
+
+    def bulk_insert_postal_codes(self, rows: list[dict]) -> None:
+        """
+        Insert many postal codes with one executemany statement.
+
+        The rows are plain column mappings and skip the ORM unit of work,
+        so they must already be validated. The caller is responsible for committing.
+
+        Args:
+            rows (list[dict]): Column values of the postal codes.
+        """
+        if rows:
+            self.session.execute(insert(PostalCode.__table__), rows)
+
+    def get_unassigned_postal_codes(self) -> list[tuple[int, str]]:
+        """
+        Retrieve the postal codes without district.
+
+        Returns:
+            list[tuple[int, str]]: Number and WKT polygon of every unassigned postal code.
+        """
+        return [
+            (number, polygon)
+            for number, polygon in self.session.query(
+                PostalCode.number, PostalCode.polygon
+            ).filter(PostalCode.district_id.is_(None))
+        ]
+
+    def get_postal_code_districts(self) -> dict[int, int]:
+        """
+        Retrieve the district of every assigned postal code.
+
+        Returns:
+            dict[int, int]: District id by postal code number.
+        """
+        return dict(
+            self.session.query(PostalCode.number, PostalCode.district_id).filter(
+                PostalCode.district_id.isnot(None)
+            )
+        )
+
+    def bulk_update_postal_codes(self, rows: list[dict]) -> None:
+        """
+        Update many postal codes with one executemany statement.
+
+        Every row holds the `postal_code_number` and the new values of the columns
+        to set, all rows must set the same columns. The caller is responsible for committing.
+
+        Args:
+            rows (list[dict]): Postal code numbers and column values.
+        """
+        if rows:
+            table = PostalCode.__table__
+            self.session.execute(
+                update(table).where(table.c.number == bindparam("postal_code_number")),
+                rows,
+            )
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from app.domain.entities.station_catchment import StationCatchment
+from app.infrastructure.database_operations.template.template_operations import (
+    TemplateOperations,
+)
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+
+class StationCatchmentOperations(TemplateOperations):
+
+    def get_station_catchments(self, fingerprint: str) -> Optional[list[dict]]:
+        """
+        Retrieve the stored catchments of a fingerprint.
+
+        Args:
+            fingerprint (str): Fingerprint of the stations and outline.
+
+        Returns:
+            Optional[list[dict]]: The catchments as returned by
+            `StationCatchments.catchments`, None if none are stored for the
+            fingerprint.
+        """
+        table = StationCatchment.__table__
+        rows = self.session.execute(
+            table.select()
+            .where(table.c.fingerprint == fingerprint)
+            .order_by(table.c.id)
+        ).all()
+        if not rows:
+            return None
+        return [
+            {
+                "station_ids": [int(key) for key in row.station_ids.split(",")],
+                "area": row.area,
+                "polygon": row.polygon,
+            }
+            for row in rows
+        ]
+
+    def replace_station_catchments(
+        self, fingerprint: str, catchments: list[dict]
+    ) -> None:
+        """
+        Replace the stored catchments and commit them.
+
+        Args:
+            fingerprint (str): Fingerprint of the stations and outline.
+            catchments (list[dict]): The catchments in the order to serve them.
+
+        Raises:
+            SQLAlchemyError: If the catchments cannot be stored.
+        """
+        table = StationCatchment.__table__
+        try:
+            self.session.execute(delete(table))
+            if catchments:
+                self.session.execute(
+                    insert(table),
+                    [
+                        {
+                            "fingerprint": fingerprint,
+                            "station_ids": ",".join(map(str, catchment["station_ids"])),
+                            "area": catchment["area"],
+                            "polygon": catchment["polygon"],
+                        }
+                        for catchment in catchments
+                    ],
+                )
+            self.session.commit()
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
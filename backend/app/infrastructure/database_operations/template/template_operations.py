@@ -1,6 +1,7 @@
 from app import db  # Import your database instance
 from flask import current_app
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm import Session
 
 
@@ -20,3 +21,41 @@ class TemplateOperations:
         """
         if self.session is not None:
             self.session.close()
+
+    def supports_copy(self) -> bool:
+        """
+        Check if the database accepts `COPY ... FROM STDIN`, i.e. PostgreSQL through psycopg2.
+
+        Returns:
+            bool: True if `copy_from_csv` can be used.
+        """
+        dialect = self.session.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    def copy_from_csv(self, table_name: str, columns: list[str], buffer) -> None:
+        """
+        Stream CSV rows into a table with `COPY ... FROM STDIN`.
+
+        The rows are written in the transaction of the session, the caller is
+        responsible for committing. `\\N` marks NULL values.
+
+        Args:
+            table_name (str): Name of the target table.
+            columns (list[str]): Columns in the order of the CSV fields.
+            buffer: File-like object holding the CSV rows without header.
+
+        Raises:
+            DatabaseError: If the database rejects the rows.
+        """
+        statement = (
+            f"COPY {table_name} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        dbapi = self.session.get_bind().dialect.loaded_dbapi
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(statement, buffer)
+        except dbapi.Error as copy_err:
+            raise DatabaseError(statement, None, copy_err) from copy_err
+        finally:
+            cursor.close()
@@ -0,0 +1,146 @@
+"""Bulk loader for the charging station register.
+
+Fetches all postal codes with one query, converts the source rows into
+plain column mappings and writes them with batched executemany inserts.
+
+Functions:
+    bulk_load_charging_stations: load the register into the database in batches
+    bulk_load_postal_codes:      load the missing postal codes in batches
+"""
+
+import csv
+
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.ingestion_progress import track_ingestion
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.postal_code_rows import read_postal_code_file
+from app.infrastructure.ingestion.streaming_loader import StaleImportError
+
+DEFAULT_BATCH_SIZE = 5000
+STATIONS_STORED_MESSAGE = (
+    "Charging stations are already stored, apply a new release of the "
+    "register with `flask diff-import` instead"
+)
+
+
+def bulk_load_charging_stations(
+    application,
+    file_path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    append: bool = False,
+) -> IngestionStats:
+    """
+    Load the charging station register with batched inserts.
+
+    Must be called inside an application context. Rows outside of Berlin,
+    with unknown postal codes or failing validation are counted as rejected.
+    The rows cannot be told apart from stored stations, so the register is
+    only loaded into an empty table unless `append` is set.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+        batch_size (int): Number of rows per executemany insert.
+        append (bool): Insert the rows next to the stored stations.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        SQLAlchemyError: If the insert fails.
+        StaleImportError: If stations are stored and `append` is not set.
+    """
+    stats = IngestionStats("charging stations")
+    track_ingestion(application, stats)
+
+    with PostalCodeOperations() as repository:
+        postal_code_numbers = repository.get_all_postal_code_numbers()
+
+    with ChargingStationOperations() as repository:
+        if not append and repository.has_charging_stations():
+            raise StaleImportError(STATIONS_STORED_MESSAGE)
+        with open(file_path, newline="", encoding="utf-8") as csvfile:
+            reader = csv.DictReader(csvfile, delimiter=";")
+            batch = []
+            for row in reader:
+                stats.rows_read += 1
+                try:
+                    batch.append(parse_charging_station_row(row, postal_code_numbers))
+                except ChargingStationRowError as row_err:
+                    stats.reject(str(row_err))
+                    continue
+
+                if len(batch) >= batch_size:
+                    repository.bulk_insert_charging_stations(batch)
+                    stats.rows_inserted += len(batch)
+                    batch = []
+
+            repository.bulk_insert_charging_stations(batch)
+            stats.rows_inserted += len(batch)
+        repository.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
+
+
+def bulk_load_postal_codes(
+    application, file_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> IngestionStats:
+    """
+    Load the postal codes that are not stored yet with batched inserts.
+
+    Must be called inside an application context. The stored numbers are
+    fetched with one query, every polygon is parsed once into the geometry
+    columns.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the postal code CSV file or shapefile.
+        batch_size (int): Number of rows per executemany insert.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        ShapefileError: If the shapefile is corrupt.
+        SQLAlchemyError: If the insert fails.
+    """
+    stats = IngestionStats("postal codes")
+    track_ingestion(application, stats)
+
+    with PostalCodeOperations() as repository:
+        existing_numbers = repository.get_all_postal_code_numbers()
+        batch = []
+        for values in read_postal_code_file(file_path, stats):
+            if values["number"] in existing_numbers:
+                stats.reject("postal code already in database")
+                continue
+
+            existing_numbers.add(values["number"])
+            batch.append(values)
+            if len(batch) >= batch_size:
+                repository.bulk_insert_postal_codes(batch)
+                stats.rows_inserted += len(batch)
+                batch = []
+
+        repository.bulk_insert_postal_codes(batch)
+        stats.rows_inserted += len(batch)
+        repository.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
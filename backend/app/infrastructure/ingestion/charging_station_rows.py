@@ -0,0 +1,161 @@
+"""Row conversion for the charging station register (Ladesäulenregister).
+
+Converts one CSV row of the register into a plain mapping of
+`charging_stations` column values, without creating an ORM object.
+
+Classes:
+    ChargingStationRowError: Raised when a row cannot be imported.
+
+Functions:
+    parse_german_decimal:       convert a decimal with comma separator to float
+    parse_postal_code:          read and check the postal code of a register row
+    parse_charging_station_row: convert a register row to a column mapping
+"""
+
+from app.domain.entities.charging_station import (
+    ChargingStation,
+    ChargingType,
+    OperationStatus,
+)
+from app.domain.entities.postal_code import PostalCode
+from app.domain.validation.charging_station_batch import (
+    REASON_ADDRESS_SUFFIX,
+    REASON_LATITUDE,
+    REASON_LONGITUDE,
+    REASON_NOMINAL_POWER,
+    REASON_NUM_CHARGING_POINTS,
+    REASON_OPERATOR,
+)
+
+COLUMN_OPERATOR = "\ufeffBetreiber"
+COLUMN_STREET = "Straße"
+COLUMN_HOUSE_NUMBER = "Hausnummer"
+COLUMN_ADDRESS_SUFFIX = "Adresszusatz"
+COLUMN_POSTAL_CODE = "Postleitzahl"
+COLUMN_LATITUDE = "Breitengrad"
+COLUMN_LONGITUDE = "Längengrad"
+COLUMN_NOMINAL_POWER = "Nennleistung Ladeeinrichtung [kW]"
+COLUMN_CHARGING_TYPE = "Art der Ladeeinrichung"
+COLUMN_NUM_CHARGING_POINTS = "Anzahl Ladepunkte"
+
+REASON_POSTAL_CODE_MISSING = "postal code not in database"
+
+
+class ChargingStationRowError(Exception):
+    """
+    Custom exception for register rows that cannot be imported.
+    The message is used as reject reason in the ingestion statistics.
+    """
+
+    pass
+
+
+def parse_german_decimal(value: str) -> float:
+    """
+    Convert a decimal number with a comma as decimal separator.
+
+    Args:
+        value (str): Number as written in the register, e.g. "52,5200".
+
+    Returns:
+        float: The converted number.
+
+    Raises:
+        ValueError: If the value is not a number.
+    """
+    return float(value.replace(",", "."))
+
+
+def parse_postal_code(row: dict) -> int:
+    """
+    Read the postal code of a register row.
+
+    Args:
+        row (dict): A row of the register as read by `csv.DictReader`.
+
+    Returns:
+        int: The postal code.
+
+    Raises:
+        ChargingStationRowError: If the postal code is missing or outside Berlin.
+    """
+    try:
+        number = int(row[COLUMN_POSTAL_CODE])
+    except (KeyError, TypeError, ValueError):
+        raise ChargingStationRowError("invalid postal code")
+    if not PostalCode.number_is_valid(number):
+        raise ChargingStationRowError("postal code outside of Berlin")
+    return number
+
+
+def parse_charging_station_row(
+    row: dict, postal_code_numbers: set[int], validate: bool = True
+) -> dict:
+    """
+    Convert a register row into `charging_stations` column values.
+
+    The row passes the same validation rules as `ChargingStation.__init__`,
+    the postal code is looked up in a preloaded set instead of the database.
+
+    Args:
+        row (dict): A row of the register as read by `csv.DictReader`.
+        postal_code_numbers (set[int]): All postal codes stored in the database.
+        validate (bool): Check the rules of `ChargingStation.__init__`, with
+            the reasons of `validate_station_columns`. False for rows that
+            are validated as a batch, e.g. the shards of the parallel loader.
+
+    Returns:
+        dict: Column values ready for a bulk insert.
+
+    Raises:
+        ChargingStationRowError: If the row is not in Berlin or fails validation.
+    """
+    number = parse_postal_code(row)
+    if number not in postal_code_numbers:
+        raise ChargingStationRowError(REASON_POSTAL_CODE_MISSING)
+
+    try:
+        latitude = parse_german_decimal(row[COLUMN_LATITUDE])
+        longitude = parse_german_decimal(row[COLUMN_LONGITUDE])
+        nominal_power = (
+            parse_german_decimal(row[COLUMN_NOMINAL_POWER])
+            if row.get(COLUMN_NOMINAL_POWER)
+            else None
+        )
+        num_charging_points = (
+            int(row[COLUMN_NUM_CHARGING_POINTS])
+            if row.get(COLUMN_NUM_CHARGING_POINTS)
+            else None
+        )
+    except (KeyError, TypeError, ValueError):
+        raise ChargingStationRowError("malformed number")
+
+    operator = row.get(COLUMN_OPERATOR)
+    address_suffix = row.get(COLUMN_ADDRESS_SUFFIX)
+    if validate:
+        if not ChargingStation.is_valid_latitude(latitude):
+            raise ChargingStationRowError(REASON_LATITUDE)
+        if not ChargingStation.is_valid_longitude(longitude):
+            raise ChargingStationRowError(REASON_LONGITUDE)
+        if not ChargingStation.is_valid_nominal_power(nominal_power):
+            raise ChargingStationRowError(REASON_NOMINAL_POWER)
+        if not ChargingStation.is_valid_num_charging_points(num_charging_points):
+            raise ChargingStationRowError(REASON_NUM_CHARGING_POINTS)
+        if not ChargingStation.is_valid_operator(operator):
+            raise ChargingStationRowError(REASON_OPERATOR)
+        if not ChargingStation.is_valid_address_suffix(address_suffix):
+            raise ChargingStationRowError(REASON_ADDRESS_SUFFIX)
+
+    return {
+        "functional": OperationStatus.OPERATIONAL,
+        "postal_code_id": number,
+        "street": row[COLUMN_STREET],
+        "house_number": row[COLUMN_HOUSE_NUMBER],
+        "latitude": latitude,
+        "longitude": longitude,
+        "operator": operator,
+        "address_suffix": address_suffix,
+        "nominal_power": nominal_power,
+        "charging_type": ChargingType.convert(row.get(COLUMN_CHARGING_TYPE)),
+        "num_charging_points": num_charging_points,
+    }
@@ -0,0 +1,242 @@
+"""COPY-based loaders for PostgreSQL deployments.
+
+The parsed rows are encoded as CSV in memory and streamed into the tables
+with `COPY ... FROM STDIN` through psycopg2, one COPY per batch and one
+transaction per file. On databases without COPY support, e.g. SQLite,
+the loaders fall back to the batched-insert path.
+
+Functions:
+    column_value:                convert a parsed value to the type of its column
+    encode_copy_rows:            encode column mappings as CSV for COPY
+    copy_load_charging_stations: load the register with COPY
+    copy_load_postal_codes:      load the postal codes with COPY
+"""
+
+import csv
+import io
+from enum import Enum
+
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.postal_code import PostalCode
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.bulk_loader import (
+    STATIONS_STORED_MESSAGE,
+    bulk_load_charging_stations,
+    bulk_load_postal_codes,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.ingestion_progress import track_ingestion
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.postal_code_rows import read_postal_code_file
+from app.infrastructure.ingestion.streaming_loader import (
+    CHARGING_STATIONS_DATASET,
+    POSTAL_CODES_DATASET,
+    StaleImportError,
+)
+from sqlalchemy import Integer, Table
+
+COPY_NULL = "\\N"
+DEFAULT_BATCH_SIZE = 50000
+
+# Ids are generated, districts are assigned after loading
+DERIVED_COLUMNS = ("id", "district_id")
+STATION_COLUMNS = [
+    column.name
+    for column in ChargingStation.__table__.columns
+    if column.name not in DERIVED_COLUMNS
+]
+POSTAL_CODE_COLUMNS = [
+    column.name
+    for column in PostalCode.__table__.columns
+    if column.name not in DERIVED_COLUMNS
+]
+
+
+def column_value(table: Table, column: str, value):
+    """
+    Convert a parsed value to the type of its column, e.g. the fractional
+    nominal power of the register to the integer stored for it.
+
+    Args:
+        table (Table): The table of the column.
+        column (str): Name of the column.
+        value: The parsed value, None for NULL.
+
+    Returns:
+        The value as stored, values of integer columns rounded.
+    """
+    if value is not None and isinstance(table.c[column].type, Integer):
+        return round(value)
+    return value
+
+
+def _copy_value(table: Table, column: str, value) -> str:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, Enum):
+        return value.name  # SQLAlchemy stores enum members by name
+    return str(column_value(table, column, value))
+
+
+def encode_copy_rows(table: Table, columns: list[str], rows: list[dict]) -> io.StringIO:
+    """
+    Encode column mappings as CSV for `COPY ... WITH (FORMAT csv, NULL '\\N')`.
+
+    Enum members are written by name, values of integer columns are rounded
+    and None becomes the NULL marker.
+
+    Args:
+        table (Table): The target table.
+        columns (list[str]): Columns in the order of the CSV fields.
+        rows (list[dict]): Column values of the rows.
+
+    Returns:
+        io.StringIO: The CSV rows, positioned at the start.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_copy_value(table, column, row[column]) for column in columns])
+    buffer.seek(0)
+    return buffer
+
+
+def copy_load_charging_stations(
+    application,
+    file_path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    append: bool = False,
+) -> IngestionStats:
+    """
+    Load the charging station register with `COPY ... FROM STDIN`.
+
+    Must be called inside an application context. Falls back to
+    `bulk_load_charging_stations` if the database does not support COPY.
+    Like there, the register is only loaded into an empty table unless
+    `append` is set.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+        batch_size (int): Number of rows per COPY.
+        append (bool): Insert the rows next to the stored stations.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        SQLAlchemyError: If the COPY fails. Nothing is written then.
+        StaleImportError: If stations are stored and `append` is not set.
+    """
+    with ChargingStationOperations() as repository:
+        supports_copy = repository.supports_copy()
+    if not supports_copy:
+        application.logger.info("COPY not supported, using batched inserts")
+        return bulk_load_charging_stations(application, file_path, batch_size, append)
+
+    stats = IngestionStats(CHARGING_STATIONS_DATASET)
+    track_ingestion(application, stats)
+    table = ChargingStation.__table__
+
+    with PostalCodeOperations() as repository:
+        postal_code_numbers = repository.get_all_postal_code_numbers()
+
+    with ChargingStationOperations() as repository:
+        if not append and repository.has_charging_stations():
+            raise StaleImportError(STATIONS_STORED_MESSAGE)
+
+        def copy_batch(batch: list[dict]) -> None:
+            if batch:
+                repository.copy_from_csv(
+                    table.name,
+                    STATION_COLUMNS,
+                    encode_copy_rows(table, STATION_COLUMNS, batch),
+                )
+                stats.rows_inserted += len(batch)
+
+        with open(file_path, newline="", encoding="utf-8") as csvfile:
+            batch = []
+            for row in csv.DictReader(csvfile, delimiter=";"):
+                stats.rows_read += 1
+                try:
+                    batch.append(parse_charging_station_row(row, postal_code_numbers))
+                except ChargingStationRowError as row_err:
+                    stats.reject(str(row_err))
+                    continue
+
+                if len(batch) >= batch_size:
+                    copy_batch(batch)
+                    batch = []
+            copy_batch(batch)
+        repository.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
+
+
+def copy_load_postal_codes(
+    application, file_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> IngestionStats:
+    """
+    Load the postal codes and their polygons with `COPY ... FROM STDIN`.
+
+    Must be called inside an application context. Postal codes that are
+    already stored are skipped. Falls back to `bulk_load_postal_codes`
+    if the database does not support COPY.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the postal code CSV file or shapefile.
+        batch_size (int): Number of rows per COPY.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        SQLAlchemyError: If the COPY fails. Nothing is written then.
+    """
+    with PostalCodeOperations() as repository:
+        supports_copy = repository.supports_copy()
+    if not supports_copy:
+        application.logger.info("COPY not supported, using batched inserts")
+        return bulk_load_postal_codes(application, file_path, batch_size)
+
+    stats = IngestionStats(POSTAL_CODES_DATASET)
+    track_ingestion(application, stats)
+    table = PostalCode.__table__
+
+    with PostalCodeOperations() as repository:
+        existing_numbers = repository.get_all_postal_code_numbers()
+        rows = []
+        for values in read_postal_code_file(file_path, stats):
+            if values["number"] in existing_numbers:
+                stats.reject("postal code already in database")
+                continue
+            existing_numbers.add(values["number"])
+            rows.append(values)
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            repository.copy_from_csv(
+                table.name,
+                POSTAL_CODE_COLUMNS,
+                encode_copy_rows(table, POSTAL_CODE_COLUMNS, batch),
+            )
+        stats.rows_inserted = len(rows)
+        repository.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
@@ -0,0 +1,118 @@
+"""Chunked CSV reading with byte offsets.
+
+The source files are read in binary mode so that the file offset behind
+every parsed row is known. A streaming import stores this offset as
+checkpoint and continues from it after an interruption.
+
+Classes:
+    CsvChunkReader: Reads a CSV file in fixed-size chunks of rows.
+
+Functions:
+    file_sha256: hash the content of a file
+"""
+
+import csv
+import hashlib
+from typing import BinaryIO, Iterator
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Hash the content of a file without loading it into memory.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the SHA-256 hash.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        for block in iter(lambda: source.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _OffsetLines:
+    """
+    Iterates over the decoded lines of a binary file and keeps the
+    offset behind the last line handed out.
+    """
+
+    def __init__(self, source: BinaryIO, encoding: str):
+        self.source = source
+        self.encoding = encoding
+        self.offset = source.tell()
+
+    def seek(self, offset: int) -> None:
+        self.source.seek(offset)
+        self.offset = offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self.source.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode(self.encoding)
+
+
+class CsvChunkReader:
+    """
+    Reads the data rows of a CSV file in chunks.
+
+    `csv.reader` only pulls the lines it needs for the next row, so after a
+    row is returned the line offset points exactly behind that row, also
+    for quoted fields spanning several lines.
+
+    Attributes:
+        file_path (str): Path to the CSV file.
+        chunk_size (int): Maximum number of rows per chunk.
+        start_offset (int): File offset to continue from, 0 starts after the header.
+        header (list[str]): Column names, available once iteration started.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        chunk_size: int,
+        start_offset: int = 0,
+        delimiter: str = ";",
+        encoding: str = "utf-8",
+    ):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.start_offset = start_offset
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.header = []
+
+    def chunks(self) -> Iterator[tuple[list[list[str]], int]]:
+        """
+        Read the file chunk by chunk.
+
+        Yields:
+            tuple[list[list[str]], int]: The rows of the chunk and the file
+                offset behind its last row.
+        """
+        with open(self.file_path, "rb") as source:
+            lines = _OffsetLines(source, self.encoding)
+            reader = csv.reader(lines, delimiter=self.delimiter)
+            self.header = next(reader, None) or []
+            if self.start_offset > lines.offset:
+                lines.seek(self.start_offset)
+
+            chunk = []
+            for row in reader:
+                if not row:
+                    continue
+                chunk.append(row)
+                if len(chunk) >= self.chunk_size:
+                    yield chunk, lines.offset
+                    chunk = []
+            if chunk:
+                yield chunk, lines.offset
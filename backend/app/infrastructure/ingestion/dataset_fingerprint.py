@@ -0,0 +1,118 @@
+"""Fingerprints of the source datasets.
+
+A fingerprint consists of size, modification time and content hash of a
+source file. It is stored after a successful load, so a restart against a
+persistent database can skip loaders whose source did not change.
+
+Classes:
+    DatasetFingerprint: Size, mtime and SHA-256 of a source file.
+
+Functions:
+    compute_fingerprint:  fingerprint a file, reusing a known hash if possible
+    dataset_is_unchanged: compare a source file with its stored fingerprint
+    record_fingerprint:   store the fingerprint of a loaded source file
+"""
+
+import os
+
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.infrastructure.database_operations.dataset_metadata_operations import (
+    DatasetMetadataOperations,
+)
+from app.infrastructure.ingestion.csv_chunks import file_sha256
+
+
+class DatasetFingerprint:
+    """
+    Fingerprint of a source file.
+
+    Attributes:
+        source_path (str): Absolute path of the file.
+        size (int): File size in bytes.
+        mtime (float): Modification time of the file.
+        content_hash (str): SHA-256 of the file content.
+    """
+
+    def __init__(self, source_path: str, size: int, mtime: float, content_hash: str):
+        self.source_path = source_path
+        self.size = size
+        self.mtime = mtime
+        self.content_hash = content_hash
+
+
+def compute_fingerprint(
+    file_path: str, known: DatasetMetadata = None
+) -> DatasetFingerprint:
+    """
+    Fingerprint a source file.
+
+    The file is only hashed if size or mtime differ from the known
+    fingerprint, so unchanged files are recognised without reading them.
+
+    Args:
+        file_path (str): Path of the source file.
+        known (DatasetMetadata): The stored fingerprint of the dataset, if any.
+
+    Returns:
+        DatasetFingerprint: The fingerprint of the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(file_path)
+    if known and known.size == stat.st_size and known.mtime == stat.st_mtime:
+        content_hash = known.content_hash
+    else:
+        content_hash = file_sha256(file_path)
+    return DatasetFingerprint(
+        os.path.abspath(file_path), stat.st_size, stat.st_mtime, content_hash
+    )
+
+
+def dataset_is_unchanged(
+    dataset: str, file_path: str
+) -> tuple[bool, DatasetFingerprint]:
+    """
+    Compare a source file with the stored fingerprint of its dataset.
+
+    Must be called inside an application context. If only the mtime changed,
+    e.g. because a deployment copied the file again, the stored mtime is
+    refreshed so the next start does not hash the file again.
+
+    Args:
+        dataset (str): Name of the dataset.
+        file_path (str): Path of the source file.
+
+    Returns:
+        tuple[bool, DatasetFingerprint]: True if the content matches the
+            stored fingerprint, and the current fingerprint.
+    """
+    with DatasetMetadataOperations() as repository:
+        known = repository.get_metadata(dataset)
+        fingerprint = compute_fingerprint(file_path, known)
+        if not known or known.content_hash != fingerprint.content_hash:
+            return False, fingerprint
+
+        if known.mtime != fingerprint.mtime or known.size != fingerprint.size:
+            record_fingerprint(dataset, fingerprint)
+    return True, fingerprint
+
+
+def record_fingerprint(dataset: str, fingerprint: DatasetFingerprint) -> None:
+    """
+    Store the fingerprint of a loaded dataset.
+
+    Must be called inside an application context.
+
+    Args:
+        dataset (str): Name of the dataset.
+        fingerprint (DatasetFingerprint): Fingerprint of the loaded source file.
+    """
+    with DatasetMetadataOperations() as repository:
+        repository.save_metadata(
+            dataset,
+            fingerprint.source_path,
+            fingerprint.size,
+            fingerprint.mtime,
+            fingerprint.content_hash,
+        )
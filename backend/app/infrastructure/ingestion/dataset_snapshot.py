@@ -0,0 +1,491 @@
+"""Versioned binary snapshot of the parsed source datasets.
+
+The snapshot holds the postal codes with their polygon coordinates and
+geometry columns and the parsed charging stations as little-endian typed arrays. A start against a
+fresh database memory-maps it and inserts the rows directly, without
+parsing CSV or WKT, as long as the fingerprints of the source files match.
+The postal code polygons are copied from the coordinate sections into the
+process-wide geometry store, so their WKT is not parsed on first use either.
+
+Layout:
+    8 bytes magic, uint32 format version, uint32 header length, the JSON
+    header (source fingerprints and section table), then the sections,
+    each aligned to 8 bytes.
+
+Classes:
+    SnapshotError: Raised for missing, corrupt or outdated snapshots.
+    DatasetSnapshot: Read-only, memory-mapped snapshot.
+
+Functions:
+    build_dataset_snapshot: parse the source files and write a snapshot
+    open_matching_snapshot: open a snapshot if it matches the source files
+    load_dataset_snapshot:  insert the rows of a snapshot into the database
+"""
+
+import csv
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from app.domain.entities.charging_station import ChargingType, OperationStatus
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES, PostalCode
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.polygon import PolygonMetrics, polygon_metrics
+from app.domain.geometry.wkt import WktError, parse_wkt_polygons
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.dataset_fingerprint import (
+    DatasetFingerprint,
+    compute_fingerprint,
+)
+from app.infrastructure.ingestion.streaming_loader import (
+    CHARGING_STATIONS_DATASET,
+    POSTAL_CODES_DATASET,
+)
+
+MAGIC = b"CHSNAP\x00\x00"
+FORMAT_VERSION = 3
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+STATION_STRING_COLUMNS = ["street", "house_number", "operator", "address_suffix"]
+_CHARGING_TYPES = [None, *ChargingType]
+_OPERATION_STATUSES = list(OperationStatus)
+_INSERT_BATCH_SIZE = 5000
+
+
+class SnapshotError(Exception):
+    """
+    Custom exception for missing, corrupt or outdated snapshots.
+    """
+
+    pass
+
+
+def _string_sections(name: str, values: list) -> dict[str, array]:
+    """
+    Encode a column of optional strings as UTF-8 blob, offsets and null mask.
+    """
+    data, offsets, nulls = bytearray(), array("q", [0]), array("b")
+    for value in values:
+        nulls.append(value is None)
+        data += (value or "").encode("utf-8")
+        offsets.append(len(data))
+    return {
+        f"{name}.data": array("B", data),
+        f"{name}.offsets": offsets,
+        f"{name}.null": nulls,
+    }
+
+
+def _write_snapshot(
+    output_path: str, sources: dict[str, DatasetFingerprint], sections: dict
+) -> None:
+    if sys.byteorder != "little":
+        raise SnapshotError("Snapshots can only be written on little-endian hosts.")
+
+    table, offset = {}, 0
+    for name, values in sections.items():
+        table[name] = [offset, values.typecode, len(values)]
+        offset += -(-len(values) * values.itemsize // _ALIGNMENT) * _ALIGNMENT
+    header = json.dumps(
+        {
+            "sources": {
+                dataset: {
+                    "size": fingerprint.size,
+                    "mtime": fingerprint.mtime,
+                    "content_hash": fingerprint.content_hash,
+                }
+                for dataset, fingerprint in sources.items()
+            },
+            "sections": table,
+        }
+    ).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as snapshot:
+        snapshot.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        snapshot.write(header)
+        for values in sections.values():
+            values.tofile(snapshot)
+            snapshot.write(b"\x00" * (-len(values) * values.itemsize % _ALIGNMENT))
+    os.replace(tmp_path, output_path)
+
+
+def build_dataset_snapshot(
+    postal_code_path: str, charging_station_path: str, output_path: str
+) -> dict[str, int]:
+    """
+    Parse the source files and write a snapshot of the parsed rows.
+
+    Rows are validated like the CSV loaders do, rejected rows are left out.
+
+    Args:
+        postal_code_path (str): Path to the postal code CSV file.
+        charging_station_path (str): Path to the register CSV file.
+        output_path (str): Path of the snapshot file, replaced atomically.
+
+    Returns:
+        dict[str, int]: Number of stored rows per dataset.
+
+    Raises:
+        FileNotFoundError: If a source file does not exist.
+        csv.Error: If a source file cannot be parsed.
+    """
+    sources = {
+        POSTAL_CODES_DATASET: compute_fingerprint(postal_code_path),
+        CHARGING_STATIONS_DATASET: compute_fingerprint(charging_station_path),
+    }
+
+    numbers, polygons, metrics, postal_code_numbers = array("i"), [], [], set()
+    part_offsets, ring_offsets = array("q", [0]), array("q", [0])
+    vertex_offsets, coordinates = array("q", [0]), []
+    csv.field_size_limit(max(csv.field_size_limit(), 1024 * 1024))
+    with open(postal_code_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader, None)  # Skip the header row
+        for row in reader:
+            try:
+                number, polygon = int(row[0]), row[1]
+                parts = parse_wkt_polygons(polygon)
+            except (IndexError, ValueError, WktError):
+                continue
+            valid = PostalCode.number_is_valid(number)
+            if not valid or not PostalCode.polygon_is_valid(polygon):
+                continue
+            if number in postal_code_numbers:
+                continue
+            postal_code_numbers.add(number)
+            numbers.append(number)
+            polygons.append(polygon)
+            metrics.append(polygon_metrics(parts))
+            for part in parts:
+                for ring in part:
+                    coordinates.append(ring)
+                    vertex_offsets.append(vertex_offsets[-1] + len(ring) // 2)
+                ring_offsets.append(len(vertex_offsets) - 1)
+            part_offsets.append(len(ring_offsets) - 1)
+
+    stations = []
+    with open(charging_station_path, newline="", encoding="utf-8") as csvfile:
+        for row in csv.DictReader(csvfile, delimiter=";"):
+            try:
+                stations.append(parse_charging_station_row(row, postal_code_numbers))
+            except ChargingStationRowError:
+                continue
+
+    sections = {
+        "postal_code.number": numbers,
+        "postal_code.part_start": part_offsets,
+        "part.ring_start": ring_offsets,
+        "ring.vertex_start": vertex_offsets,
+        "ring.coordinates": array(
+            "d", b"".join(ring.tobytes() for ring in coordinates)
+        ),
+        **_string_sections("postal_code.polygon", polygons),
+        **{
+            f"postal_code.{column}": array(
+                "i" if column == "vertex_count" else "d",
+                (getattr(m, column) for m in metrics),
+            )
+            for column in PolygonMetrics.COLUMNS
+        },
+        "station.postal_code": array("i", (s["postal_code_id"] for s in stations)),
+        "station.latitude": array("d", (s["latitude"] for s in stations)),
+        "station.longitude": array("d", (s["longitude"] for s in stations)),
+        "station.nominal_power": array(
+            "d",
+            (
+                math.nan if s["nominal_power"] is None else s["nominal_power"]
+                for s in stations
+            ),
+        ),
+        "station.num_charging_points": array(
+            "i",
+            (
+                -1 if s["num_charging_points"] is None else s["num_charging_points"]
+                for s in stations
+            ),
+        ),
+        "station.charging_type": array(
+            "b", (_CHARGING_TYPES.index(s["charging_type"]) for s in stations)
+        ),
+        "station.functional": array(
+            "b", (_OPERATION_STATUSES.index(s["functional"]) for s in stations)
+        ),
+    }
+    for column in STATION_STRING_COLUMNS:
+        sections.update(
+            _string_sections(f"station.{column}", [s[column] for s in stations])
+        )
+
+    _write_snapshot(output_path, sources, sections)
+    return {
+        POSTAL_CODES_DATASET: len(numbers),
+        CHARGING_STATIONS_DATASET: len(stations),
+    }
+
+
+class DatasetSnapshot:
+    """
+    Read-only, memory-mapped dataset snapshot.
+
+    The sections are exposed as typed memoryviews into the mapping, so
+    reading coordinates does not copy the file.
+
+    Attributes:
+        path (str): Path of the snapshot file.
+        sources (dict[str, DatasetFingerprint]): Fingerprints of the source files.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file and read its header.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Raises:
+            SnapshotError: If the file is missing, corrupt or of another format version.
+        """
+        if sys.byteorder != "little":
+            raise SnapshotError("Snapshots can only be read on little-endian hosts.")
+        try:
+            with open(path, "rb") as snapshot:
+                self._mapping = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as open_err:
+            raise SnapshotError(f"Cannot map snapshot {path}: {open_err}")
+
+        try:
+            magic, version, header_length = _PREAMBLE.unpack_from(self._mapping)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                self._mapping.close()
+                raise SnapshotError(f"Unsupported snapshot format in {path}")
+            start = _PREAMBLE.size
+            header = json.loads(self._mapping[start : start + header_length])
+        except (struct.error, ValueError) as header_err:
+            self._mapping.close()
+            raise SnapshotError(f"Corrupt snapshot header in {path}: {header_err}")
+
+        self.path = path
+        self._data_start = start + header_length
+        self._sections = header["sections"]
+        self.sources = {
+            dataset: DatasetFingerprint(
+                None, source["size"], source["mtime"], source["content_hash"]
+            )
+            for dataset, source in header["sources"].items()
+        }
+
+    def section(self, name: str) -> memoryview:
+        """
+        Get a typed view of a section.
+
+        Args:
+            name (str): Name of the section, e.g. "ring.coordinates".
+
+        Returns:
+            memoryview: The values of the section, cast to their type.
+
+        Raises:
+            SnapshotError: If the section does not exist or exceeds the file.
+        """
+        if name not in self._sections:
+            raise SnapshotError(f"Snapshot has no section {name}")
+        offset, typecode, length = self._sections[name]
+        start = self._data_start + offset
+        end = start + length * array(typecode).itemsize
+        if end > len(self._mapping):
+            raise SnapshotError(f"Section {name} exceeds the snapshot file")
+        return memoryview(self._mapping)[start:end].cast(typecode)
+
+    def strings(self, name: str) -> list:
+        """
+        Decode a string column.
+
+        Args:
+            name (str): Name of the column, e.g. "station.street".
+
+        Returns:
+            list[str]: The values, None for NULL.
+        """
+        data = self.section(f"{name}.data")
+        offsets = self.section(f"{name}.offsets")
+        nulls = self.section(f"{name}.null")
+        return [
+            None if nulls[i] else str(data[offsets[i] : offsets[i + 1]], "utf-8")
+            for i in range(len(nulls))
+        ]
+
+    def postal_code_polygons(self, index: int) -> list[list[array]]:
+        """
+        Get the polygons of a postal code, copied from the mapping without
+        parsing WKT.
+
+        Args:
+            index (int): Position of the postal code in the snapshot.
+
+        Returns:
+            list[list[array]]: One list of rings per polygon, the exterior
+            ring first, as `array("d")` of interleaved longitude and latitude values.
+        """
+        part_start = self.section("postal_code.part_start")
+        ring_start = self.section("part.ring_start")
+        vertex_start = self.section("ring.vertex_start")
+        coordinates = self.section("ring.coordinates")
+        polygons = []
+        for part in range(part_start[index], part_start[index + 1]):
+            rings = []
+            for ring in range(ring_start[part], ring_start[part + 1]):
+                rings.append(
+                    array(
+                        "d",
+                        coordinates[
+                            2 * vertex_start[ring] : 2 * vertex_start[ring + 1]
+                        ],
+                    )
+                )
+            polygons.append(rings)
+        return polygons
+
+    def close(self) -> None:
+        """
+        Unmap the snapshot file. While section views are still referenced,
+        the mapping stays open until they are garbage collected.
+        """
+        try:
+            self._mapping.close()
+        except BufferError:
+            pass
+
+
+def open_matching_snapshot(
+    snapshot_path: str, source_paths: dict[str, str]
+) -> DatasetSnapshot:
+    """
+    Open a snapshot if it was built from the given source files.
+
+    Source files are only hashed if their size or mtime differ from the
+    fingerprint in the snapshot. On a match, `sources` of the snapshot hold
+    the current fingerprints of the source files.
+
+    Args:
+        snapshot_path (str): Path of the snapshot file.
+        source_paths (dict[str, str]): Path of the source file per dataset.
+
+    Returns:
+        DatasetSnapshot: The snapshot, or None if a source file changed.
+
+    Raises:
+        SnapshotError: If the snapshot is missing or corrupt.
+        FileNotFoundError: If a source file does not exist.
+    """
+    snapshot = DatasetSnapshot(snapshot_path)
+    for dataset, file_path in source_paths.items():
+        known = snapshot.sources.get(dataset)
+        if not known:
+            snapshot.close()
+            return None
+        fingerprint = compute_fingerprint(file_path, known)
+        if fingerprint.content_hash != known.content_hash:
+            snapshot.close()
+            return None
+        snapshot.sources[dataset] = fingerprint
+    return snapshot
+
+
+def load_dataset_snapshot(snapshot: DatasetSnapshot) -> dict[str, int]:
+    """
+    Insert the postal codes and charging stations of a snapshot.
+
+    Must be called inside an application context. All rows are written in
+    one transaction, the tables are expected to be empty. The postal code
+    polygons replace the entries of `POSTAL_CODE_GEOMETRIES`.
+
+    Args:
+        snapshot (DatasetSnapshot): The snapshot to load.
+
+    Returns:
+        dict[str, int]: Number of inserted rows per dataset.
+
+    Raises:
+        SnapshotError: If the snapshot is missing a section.
+        SQLAlchemyError: If the insert fails. Nothing is written then.
+    """
+    numbers = snapshot.section("postal_code.number")
+    polygons = snapshot.strings("postal_code.polygon")
+    geometry = {
+        column: snapshot.section(f"postal_code.{column}")
+        for column in PolygonMetrics.COLUMNS
+    }
+
+    station_postal_codes = snapshot.section("station.postal_code")
+    latitudes = snapshot.section("station.latitude")
+    longitudes = snapshot.section("station.longitude")
+    nominal_powers = snapshot.section("station.nominal_power")
+    charging_points = snapshot.section("station.num_charging_points")
+    charging_types = snapshot.section("station.charging_type")
+    functional = snapshot.section("station.functional")
+    strings = {
+        column: snapshot.strings(f"station.{column}")
+        for column in STATION_STRING_COLUMNS
+    }
+
+    def station_rows(start: int, end: int) -> list[dict]:
+        return [
+            {
+                "functional": _OPERATION_STATUSES[functional[i]],
+                "postal_code_id": station_postal_codes[i],
+                "latitude": latitudes[i],
+                "longitude": longitudes[i],
+                "nominal_power": (
+                    None if math.isnan(nominal_powers[i]) else nominal_powers[i]
+                ),
+                "num_charging_points": (
+                    None if charging_points[i] < 0 else charging_points[i]
+                ),
+                "charging_type": _CHARGING_TYPES[charging_types[i]],
+                **{column: values[i] for column, values in strings.items()},
+            }
+            for i in range(start, end)
+        ]
+
+    with PostalCodeOperations() as postal_codes, ChargingStationOperations() as stations:
+        postal_codes.bulk_insert_postal_codes(
+            [
+                {
+                    "number": numbers[i],
+                    "polygon": polygons[i],
+                    **{column: values[i] for column, values in geometry.items()},
+                }
+                for i in range(len(numbers))
+            ]
+        )
+        for start in range(0, len(latitudes), _INSERT_BATCH_SIZE):
+            end = min(start + _INSERT_BATCH_SIZE, len(latitudes))
+            stations.bulk_insert_charging_stations(station_rows(start, end))
+        stations.session.commit()
+
+    POSTAL_CODE_GEOMETRIES.clear()
+    for i in range(len(numbers)):
+        POSTAL_CODE_GEOMETRIES.put(
+            numbers[i], polygons[i], PolygonGeometry(snapshot.postal_code_polygons(i))
+        )
+
+    return {
+        POSTAL_CODES_DATASET: len(numbers),
+        CHARGING_STATIONS_DATASET: len(latitudes),
+    }
@@ -0,0 +1,265 @@
+"""Differential import of a new charging station register release.
+
+Stations are matched by a natural key built from operator, address and
+coordinates. Only inserted, changed and removed stations are written, and
+the reported `functional` status of matched stations is never touched.
+
+Classes:
+    StationDiff: Inserts, updates and deletes between register and database.
+
+Functions:
+    station_natural_key:           build the natural key of a station
+    compute_station_diff:          compare register rows with stored stations
+    diff_import_charging_stations: apply a new register release in batches
+"""
+
+import csv
+import os
+from collections import Counter
+from typing import Iterable, Iterator
+
+from app.domain.entities.charging_station import ChargingStation
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.ingestion_checkpoint_operations import (
+    IngestionCheckpointOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.copy_loader import column_value
+from app.infrastructure.ingestion.csv_chunks import file_sha256
+from app.infrastructure.ingestion.dataset_fingerprint import (
+    compute_fingerprint,
+    record_fingerprint,
+)
+from app.infrastructure.ingestion.district_loader import assign_station_districts
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.streaming_loader import CHARGING_STATIONS_DATASET
+from sqlalchemy.exc import SQLAlchemyError
+
+KEY_COLUMNS = [
+    "operator",
+    "street",
+    "house_number",
+    "postal_code_id",
+    "latitude",
+    "longitude",
+]
+UPDATABLE_COLUMNS = [
+    "address_suffix",
+    "nominal_power",
+    "charging_type",
+    "num_charging_points",
+]
+COORDINATE_DECIMALS = 6
+
+
+def station_natural_key(values: dict) -> tuple:
+    """
+    Build the natural key of a station.
+
+    Coordinates are rounded to about 10 cm, so float noise between
+    releases does not change the key.
+
+    Args:
+        values (dict): Column values of the station.
+
+    Returns:
+        tuple: Operator, street, house number, postal code and coordinates.
+    """
+    return (
+        values["operator"],
+        values["street"],
+        values["house_number"],
+        values["postal_code_id"],
+        round(values["latitude"], COORDINATE_DECIMALS),
+        round(values["longitude"], COORDINATE_DECIMALS),
+    )
+
+
+def _with_occurrence(rows: Iterable[dict]) -> Iterator[tuple[tuple, dict]]:
+    """
+    Pair every row with its natural key and the number of earlier rows
+    with the same key. The register lists every charging device of a site
+    as its own row, so several stations can share operator, address and
+    coordinates.
+    """
+    seen = Counter()
+    for values in rows:
+        key = station_natural_key(values)
+        yield (key, seen[key]), values
+        seen[key] += 1
+
+
+class StationDiff:
+    """
+    Changes needed to bring the stored stations in line with a register release.
+
+    Attributes:
+        inserts (list[dict]): Column values of new stations.
+        updates (list[dict]): Station id (`station_id`) and new values of changed stations.
+        deletes (list[int]): Ids of stations missing in the release.
+        unchanged (int): Number of matched stations without changes.
+    """
+
+    def __init__(self):
+        self.inserts = []
+        self.updates = []
+        self.deletes = []
+        self.unchanged = 0
+
+    def __str__(self):
+        return (
+            f"{len(self.inserts)} inserted, {len(self.updates)} updated, "
+            f"{len(self.deletes)} deleted, {self.unchanged} unchanged"
+        )
+
+
+def _stored(column: str, value):
+    """
+    The value as stored in a station column, so a parsed nominal power of
+    11.5 equals the 12 stored for it. Stored values are converted as well,
+    SQLite keeps the fraction in integer columns.
+    """
+    return column_value(ChargingStation.__table__, column, value)
+
+
+def compute_station_diff(
+    register_rows: Iterable[dict], stored_rows: Iterable[tuple]
+) -> StationDiff:
+    """
+    Compare the rows of a register release with the stored stations.
+
+    Args:
+        register_rows (Iterable[dict]): Parsed register rows in file order.
+        stored_rows (Iterable[tuple]): Stored stations as (id, *KEY_COLUMNS,
+            *UPDATABLE_COLUMNS), ordered by id.
+
+    Returns:
+        StationDiff: The changes to apply.
+    """
+    stored = {}
+    stored_values = (
+        dict(zip(["id"] + KEY_COLUMNS + UPDATABLE_COLUMNS, row)) for row in stored_rows
+    )
+    for key, values in _with_occurrence(stored_values):
+        stored[key] = values
+
+    diff = StationDiff()
+    for key, values in _with_occurrence(register_rows):
+        current = stored.pop(key, None)
+        if current is None:
+            diff.inserts.append(values)
+            continue
+
+        if any(
+            _stored(column, current[column]) != _stored(column, values[column])
+            for column in UPDATABLE_COLUMNS
+        ):
+            update = {column: values[column] for column in UPDATABLE_COLUMNS}
+            update["station_id"] = current["id"]
+            diff.updates.append(update)
+        else:
+            diff.unchanged += 1
+
+    diff.deletes = [values["id"] for values in stored.values()]
+    return diff
+
+
+def _read_register(
+    file_path: str, postal_code_numbers: set[int], stats: IngestionStats
+) -> Iterator[dict]:
+    """
+    Parse the register rows, counting rejected rows in the statistics.
+    """
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        for row in csv.DictReader(csvfile, delimiter=";"):
+            stats.rows_read += 1
+            try:
+                yield parse_charging_station_row(row, postal_code_numbers)
+            except ChargingStationRowError as row_err:
+                stats.reject(str(row_err))
+
+
+def _batches(items: list, batch_size: int) -> Iterator[list]:
+    for start in range(0, len(items), batch_size):
+        yield items[start : start + batch_size]
+
+
+def diff_import_charging_stations(
+    application, file_path: str, batch_size: int = 5000, dry_run: bool = False
+) -> StationDiff:
+    """
+    Apply a new register release to the stored charging stations.
+
+    Must be called inside an application context. All changes are applied
+    in one transaction, written with batched executemany statements. The
+    fingerprint of the file and a completed checkpoint are stored, so a
+    restart with this release as `CHARGING_STATION_CSV` does not load it
+    again. Inserted stations are assigned to their district afterwards.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+        batch_size (int): Number of rows per statement.
+        dry_run (bool): Only compute and log the changes.
+
+    Returns:
+        StationDiff: The applied changes.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        SQLAlchemyError: If applying the changes fails. Nothing is written then.
+    """
+    stats = IngestionStats(CHARGING_STATIONS_DATASET)
+    fingerprint = compute_fingerprint(file_path)
+
+    with PostalCodeOperations() as repository:
+        postal_code_numbers = repository.get_all_postal_code_numbers()
+
+    with ChargingStationOperations() as repository:
+        diff = compute_station_diff(
+            _read_register(file_path, postal_code_numbers, stats),
+            repository.get_station_key_columns(KEY_COLUMNS + UPDATABLE_COLUMNS),
+        )
+        application.logger.info(f"Register diff: {diff}")
+        if dry_run:
+            return diff
+
+        try:
+            for batch in _batches(diff.inserts, batch_size):
+                repository.bulk_insert_charging_stations(batch)
+            for batch in _batches(diff.updates, batch_size):
+                repository.bulk_update_charging_stations(batch)
+            for batch in _batches(diff.deletes, batch_size):
+                repository.delete_charging_stations(batch)
+            repository.session.commit()
+        except SQLAlchemyError:
+            repository.session.rollback()
+            raise
+
+    # The stations of the release are stored, so the streaming loaders
+    # continue behind its end instead of refusing the changed file
+    with IngestionCheckpointOperations() as checkpoints:
+        checkpoints.save_checkpoint(
+            CHARGING_STATIONS_DATASET,
+            file_sha256(file_path),
+            os.path.getsize(file_path),
+            stats.rows_read,
+            completed=True,
+        )
+        checkpoints.session.commit()
+
+    stats.rows_inserted = len(diff.inserts)
+    stats.finish()
+    stats.log(application.logger)
+    record_fingerprint(CHARGING_STATIONS_DATASET, fingerprint)
+    assign_station_districts(application)
+    return diff
@@ -0,0 +1,298 @@
+"""Loader for the Berlin districts.
+
+Loads the district boundaries from geodata_berlin_dis.csv or from the
+berlin_bezirke shapefile and precomputes the district of every postal code and
+charging station, so requests never have to intersect polygons.
+A postal code belongs to the district covering most of its area, a station
+to the district containing its location.
+
+Classes:
+    DistrictRowError: Raised when a district row cannot be imported.
+
+Functions:
+    parse_district_row:           convert a district row to a column mapping
+    parse_district_record:        convert a shapefile record to a column mapping
+    read_district_file:           stream the column mappings of a CSV or shapefile
+    bulk_load_districts:          load the missing districts in one batch
+    assign_postal_code_districts: set the district of every unassigned postal code
+    assign_station_districts:     set the district of every unassigned charging station
+"""
+
+import csv
+from typing import Iterator
+
+from app.domain.entities.district import District
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES
+from app.domain.geometry.polygon import polygon_metrics
+from app.domain.geometry.prepared_polygon import (
+    PreparedPolygon,
+    dominant_key,
+    overlap_shares,
+)
+from app.domain.geometry.wkt import (
+    WktError,
+    format_wkt_polygons,
+    parse_wkt_polygons,
+)
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.district_operations import (
+    DistrictOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.ingestion_progress import track_ingestion
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.shapefile import (
+    ShapefileReader,
+    ShapeRecord,
+    is_shapefile,
+)
+
+DISTRICTS_DATASET = "districts"
+DISTRICT_NAME_FIELD = "Gemeinde_n"
+# District boundaries are single CSV fields of up to ~150 kB
+MAX_FIELD_SIZE = 16 * 1024 * 1024
+OVERLAP_GRID = 10
+
+
+class DistrictRowError(Exception):
+    """
+    Custom exception for district rows that cannot be imported.
+    The message is used as reject reason in the ingestion statistics.
+    """
+
+    pass
+
+
+def parse_district_row(row: list[str]) -> dict:
+    """
+    Convert a row of the district file into `districts` column values.
+
+    Args:
+        row (list[str]): The district name and the boundary as WKT.
+
+    Returns:
+        dict: Column values including bounding box, centroid, area and vertex count.
+
+    Raises:
+        DistrictRowError: If the row is malformed or fails validation.
+    """
+    if len(row) < 2:
+        raise DistrictRowError("malformed row")
+    name, polygon = row[0].strip(), row[1]
+    if not District.name_is_valid(name):
+        raise DistrictRowError("invalid district")
+    try:
+        geometry = District.geometry_columns(polygon)
+    except WktError:
+        raise DistrictRowError("invalid district")
+    return {"name": name, "polygon": polygon, **geometry}
+
+
+def parse_district_record(record: ShapeRecord) -> dict:
+    """
+    Convert a record of the district shapefile into `districts` column values.
+
+    Args:
+        record (ShapeRecord): A record with the district name in the `Gemeinde_n` field.
+
+    Returns:
+        dict: Column values including bounding box, centroid, area and vertex count.
+
+    Raises:
+        DistrictRowError: If the record is malformed or fails validation.
+    """
+    name = record.attributes.get(DISTRICT_NAME_FIELD)
+    if name is None:
+        raise DistrictRowError("malformed row")
+    if not District.name_is_valid(name) or not record.polygons:
+        raise DistrictRowError("invalid district")
+    return {
+        "name": name.strip(),
+        "polygon": format_wkt_polygons(record.polygons),
+        **polygon_metrics(record.polygons).as_columns(),
+    }
+
+
+def read_district_file(file_path: str, stats: IngestionStats) -> Iterator[dict]:
+    """
+    Stream the column values of a district CSV file or shapefile.
+
+    Rows that cannot be imported are counted as rejected in the statistics.
+
+    Args:
+        file_path (str): Path to the CSV file or to the .shp file.
+        stats (IngestionStats): Statistics of the running import.
+
+    Yields:
+        dict: Column values of the next valid district.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        ShapefileError: If the shapefile is corrupt.
+    """
+    if is_shapefile(file_path):
+        with ShapefileReader(file_path) as reader:
+            for record in reader:
+                stats.rows_read += 1
+                try:
+                    yield parse_district_record(record)
+                except DistrictRowError as row_err:
+                    stats.reject(str(row_err))
+        return
+
+    csv.field_size_limit(max(csv.field_size_limit(), MAX_FIELD_SIZE))
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader, None)  # Skip the header row
+        for row in reader:
+            if not row:
+                continue
+            stats.rows_read += 1
+            try:
+                yield parse_district_row(row)
+            except DistrictRowError as row_err:
+                stats.reject(str(row_err))
+
+
+def bulk_load_districts(application, file_path: str) -> IngestionStats:
+    """
+    Load the districts that are not stored yet.
+
+    Must be called inside an application context.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the district CSV file or shapefile.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        ShapefileError: If the shapefile is corrupt.
+        SQLAlchemyError: If the insert fails.
+    """
+    stats = IngestionStats("districts")
+    track_ingestion(application, stats)
+
+    with DistrictOperations() as repository:
+        existing_names = repository.get_all_district_names()
+        batch = []
+        for values in read_district_file(file_path, stats):
+            if values["name"] in existing_names:
+                stats.reject("district already in database")
+                continue
+            existing_names.add(values["name"])
+            batch.append(values)
+
+        repository.bulk_insert_districts(batch)
+        stats.rows_inserted += len(batch)
+        repository.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
+
+
+def _prepared_districts(repository: DistrictOperations) -> dict[int, PreparedPolygon]:
+    return {
+        district_id: PreparedPolygon(parse_wkt_polygons(polygon))
+        for district_id, polygon in repository.get_district_polygons()
+    }
+
+
+def assign_postal_code_districts(application) -> int:
+    """
+    Assign every postal code without district to the district covering
+    the largest share of its area.
+
+    The shares are estimated by sampling each postal code on a regular grid.
+    Must be called inside an application context.
+
+    Args:
+        application (Flask): The Flask application instance.
+
+    Returns:
+        int: Number of postal codes assigned.
+
+    Raises:
+        SQLAlchemyError: If the update fails.
+    """
+    with DistrictOperations() as districts, PostalCodeOperations() as postal_codes:
+        unassigned = postal_codes.get_unassigned_postal_codes()
+        prepared = _prepared_districts(districts) if unassigned else {}
+        if not prepared:
+            return 0
+
+        rows = []
+        for number, polygon in unassigned:
+            shares = overlap_shares(
+                POSTAL_CODE_GEOMETRIES.get(number, polygon).prepared,
+                prepared,
+                OVERLAP_GRID,
+            )
+            district_id = dominant_key(shares)
+            if district_id is not None:
+                rows.append({"postal_code_number": number, "district_id": district_id})
+
+        postal_codes.bulk_update_postal_codes(rows)
+        postal_codes.session.commit()
+
+    application.logger.info(f"Assigned {len(rows)} postal codes to districts")
+    return len(rows)
+
+
+def assign_station_districts(application) -> int:
+    """
+    Assign every charging station without district to the district containing it.
+
+    Stations on a district border, where the point test is ambiguous, fall
+    back to the district of their postal code. Must be called inside an
+    application context.
+
+    Args:
+        application (Flask): The Flask application instance.
+
+    Returns:
+        int: Number of charging stations assigned.
+
+    Raises:
+        SQLAlchemyError: If the update fails.
+    """
+    with (
+        DistrictOperations() as districts,
+        PostalCodeOperations() as postal_codes,
+        ChargingStationOperations() as stations,
+    ):
+        locations = stations.get_unassigned_station_locations()
+        prepared = _prepared_districts(districts) if locations else {}
+        if not prepared:
+            return 0
+        postal_code_districts = postal_codes.get_postal_code_districts()
+
+        rows = []
+        last_id = None
+        for station_id, postal_code, lat, lon in locations:
+            # Stations are clustered, the previous hit is usually right again
+            if last_id is not None and prepared[last_id].contains(lon, lat):
+                district_id = last_id
+            else:
+                district_id = next(
+                    (key for key, area in prepared.items() if area.contains(lon, lat)),
+                    postal_code_districts.get(postal_code),
+                )
+            if district_id is not None:
+                last_id = district_id
+                rows.append({"station_id": station_id, "district_id": district_id})
+
+        stations.bulk_update_charging_stations(rows)
+        stations.session.commit()
+
+    application.logger.info(f"Assigned {len(rows)} charging stations to districts")
+    return len(rows)
@@ -0,0 +1,248 @@
+"""Ingestion progress module.
+Tracks the progress of the startup ingestion, which may run on a background
+thread while the application already answers requests.
+
+The progress is stored in `application.extensions["ingestion_progress"]`.
+The loaders register their `IngestionStats` with `track_ingestion`, so the
+rows read so far can be reported while a dataset is loading.
+
+Classes:
+    IngestionProgress: Phase, row counts and ETA of the startup ingestion.
+
+Functions:
+    count_data_rows:         estimate the number of data rows of a source file
+    get_ingestion_progress:  the progress of an application, if any
+    track_ingestion:         register the stats of a running loader
+"""
+
+import threading
+import time
+from typing import Optional
+
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.shapefile import ShapefileReader, is_shapefile
+
+INGESTION_PROGRESS = "ingestion_progress"
+COUNT_BLOCK_SIZE = 1024 * 1024
+
+PHASE_PENDING = "pending"
+PHASE_SNAPSHOT = "snapshot"
+PHASE_POSTAL_CODES = "postal codes"
+PHASE_CHARGING_STATIONS = "charging stations"
+PHASE_DISTRICTS = "districts"
+PHASE_USERS = "users"
+PHASE_READY = "ready"
+PHASE_FAILED = "failed"
+
+
+def count_data_rows(file_path: str) -> int:
+    """
+    Estimate the number of data rows of a CSV file or shapefile.
+
+    CSV files are counted by their line breaks without parsing them, so
+    quoted line breaks count as extra rows.
+
+    Args:
+        file_path (str): Path to the CSV file or shapefile.
+
+    Returns:
+        int: Number of data rows, 0 if the file does not exist.
+    """
+    try:
+        if is_shapefile(file_path):
+            with ShapefileReader(file_path) as reader:
+                return len(reader)
+
+        lines = 0
+        last_block = b""
+        with open(file_path, "rb") as source:
+            for block in iter(lambda: source.read(COUNT_BLOCK_SIZE), b""):
+                lines += block.count(b"\n")
+                last_block = block
+        if last_block and not last_block.endswith(b"\n"):
+            lines += 1  # Last line without line break
+        return max(lines - 1, 0)  # Without the header
+    except FileNotFoundError:
+        return 0
+
+
+class IngestionProgress:
+    """
+    Thread-safe progress of the startup ingestion.
+
+    The ingestion runs in phases, each loading an expected number of rows.
+    Rows of the running phase are read from the `IngestionStats` of its
+    loader, rows of finished phases count as done even if the loader was
+    skipped or rejected some of them.
+
+    A phase whose loader gave up on its dataset is recorded with
+    `fail_phase`, the ingestion then ends as `PHASE_FAILED` as well.
+
+    Attributes:
+        phase (str): The running phase, `PHASE_READY` or `PHASE_FAILED` at the end.
+        error (Optional[str]): Message of the error that stopped the ingestion,
+            or of the failed phases.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self.phase = PHASE_PENDING
+        self.error = None
+        self._failures = []
+        self._rows_total = 0
+        self._rows_finished = 0
+        self._phase_rows = 0
+        self._stats = None
+        self._started_at = time.monotonic()
+        self._finished_at = None
+
+    def start_phase(self, phase: str, rows: int = 0) -> None:
+        """
+        Finish the running phase and start the next one.
+
+        Args:
+            phase (str): Name of the phase.
+            rows (int): Number of rows the phase is expected to load.
+        """
+        with self._lock:
+            self._finish_phase()
+            self.phase = phase
+            self._phase_rows = rows
+            self._rows_total = max(self._rows_total, self._rows_finished + rows)
+
+    def plan(self, rows_total: int) -> None:
+        """
+        Set the number of rows all phases are expected to load, so the total is
+        known before the first phase starts.
+
+        Args:
+            rows_total (int): Expected number of rows of all phases.
+        """
+        with self._lock:
+            self._rows_total = rows_total
+
+    def track(self, stats: IngestionStats) -> None:
+        """
+        Report the rows of the running phase from the stats of its loader.
+
+        Args:
+            stats (IngestionStats): The stats of the running loader.
+        """
+        with self._lock:
+            self._stats = stats
+
+    def fail_phase(self, error: str) -> None:
+        """
+        Record that the running phase could not load its dataset. The
+        ingestion goes on with the next phases, but does not become ready.
+
+        Args:
+            error (str): Message of the error.
+        """
+        with self._lock:
+            if not self._finished.is_set():
+                self._failures.append(f"{self.phase}: {error}")
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """
+        Finish the ingestion, as failed if a phase failed.
+
+        Args:
+            error (Optional[str]): Message of the error that stopped the ingestion.
+        """
+        with self._lock:
+            if error is None and self._failures:
+                error = "; ".join(self._failures)
+            if error is None:
+                # Skipped or snapshot-loaded phases count as done as well
+                self._finish_phase()
+                self._rows_finished = self._rows_total = max(
+                    self._rows_total, self._rows_finished
+                )
+            self.phase = PHASE_FAILED if error is not None else PHASE_READY
+            self.error = error
+            self._finished_at = time.monotonic()
+        self._finished.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the ingestion is finished, successfully or not.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, None waits forever.
+
+        Returns:
+            bool: True if the ingestion finished in time.
+        """
+        return self._finished.wait(timeout)
+
+    def _finish_phase(self) -> None:
+        self._rows_finished += self._phase_rows
+        self._phase_rows = 0
+        self._stats = None
+
+    @property
+    def ready(self) -> bool:
+        """
+        Returns:
+            bool: True once all phases finished successfully.
+        """
+        return self.phase == PHASE_READY
+
+    def as_dict(self) -> dict:
+        """
+        Consistent snapshot of the progress for the readiness endpoint.
+
+        Returns:
+            dict: Phase, rows done and total, elapsed seconds, ETA in
+            seconds (None while unknown) and error.
+        """
+        with self._lock:
+            rows_done = self._rows_finished
+            if self._stats is not None:
+                rows_done += min(self._stats.rows_read, self._phase_rows)
+            end = self._finished_at or time.monotonic()
+            elapsed = end - self._started_at
+            rows_total = max(self._rows_total, rows_done)
+
+            eta = None
+            if self.ready:
+                eta = 0.0
+            elif self.phase != PHASE_FAILED and rows_done > 0:
+                eta = (rows_total - rows_done) * elapsed / rows_done
+
+            return {
+                "ready": self.ready,
+                "phase": self.phase,
+                "rows_done": rows_done,
+                "rows_total": rows_total,
+                "elapsed_seconds": round(elapsed, 2),
+                "eta_seconds": round(eta, 1) if eta is not None else None,
+                "error": self.error,
+            }
+
+
+def get_ingestion_progress(application) -> Optional[IngestionProgress]:
+    """
+    Args:
+        application (Flask): The Flask application instance.
+
+    Returns:
+        Optional[IngestionProgress]: The progress of the startup ingestion, None
+        if the application did not start one.
+    """
+    return application.extensions.get(INGESTION_PROGRESS)
+
+
+def track_ingestion(application, stats: IngestionStats) -> None:
+    """
+    Register the stats of a running loader with the startup ingestion progress.
+
+    Args:
+        application (Flask): The Flask application instance.
+        stats (IngestionStats): The stats of the loader.
+    """
+    progress = get_ingestion_progress(application)
+    if progress is not None:
+        progress.track(stats)
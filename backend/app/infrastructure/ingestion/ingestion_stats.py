@@ -0,0 +1,80 @@
+"""Ingestion statistics module.
+Collects counters and timings while a dataset is loaded into the database.
+
+Classes:
+    IngestionStats: Row counters, reject reasons and throughput of one import run.
+"""
+
+import time
+from collections import Counter
+
+
+class IngestionStats:
+    """
+    Row counters and throughput of a single import run.
+
+    Attributes:
+        dataset (str): Name of the imported dataset, used in log messages.
+        rows_read (int): Number of data rows read from the source.
+        rows_inserted (int): Number of rows written to the database.
+        rows_rejected (int): Number of rows skipped during parsing or validation.
+        reject_reasons (Counter): Number of rejected rows per reason.
+    """
+
+    def __init__(self, dataset: str):
+        self.dataset = dataset
+        self.rows_read = 0
+        self.rows_inserted = 0
+        self.rows_rejected = 0
+        self.reject_reasons = Counter()
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+
+    def reject(self, reason: str) -> None:
+        """
+        Count a rejected row.
+
+        Args:
+            reason (str): Short description why the row was rejected.
+        """
+        self.rows_rejected += 1
+        self.reject_reasons[reason] += 1
+
+    def finish(self) -> None:
+        """
+        Stop the timer of the import run.
+        """
+        self._finished_at = time.perf_counter()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """
+        Returns:
+            float: Seconds since the run started, or the total run time once finished.
+        """
+        end = self._finished_at if self._finished_at else time.perf_counter()
+        return end - self._started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Returns:
+            float: Number of read rows processed per second.
+        """
+        elapsed = self.elapsed_seconds
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    def log(self, logger) -> None:
+        """
+        Write a summary of the run to the given logger.
+
+        Args:
+            logger (logging.Logger): The logger of the Flask application.
+        """
+        logger.info(
+            f"Loaded {self.dataset}: {self.rows_inserted} inserted, "
+            f"{self.rows_rejected} rejected of {self.rows_read} rows "
+            f"in {self.elapsed_seconds:.2f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+        for reason, count in self.reject_reasons.most_common():
+            logger.info(f"Rejected {count} rows of {self.dataset}: {reason}")
@@ -0,0 +1,338 @@
+"""Multi-core parse stage for the charging station register.
+
+The register is split into byte ranges aligned to line breaks. A process
+pool converts the shards into typed column batches, a single writer in the
+calling process inserts them in file order. The offset behind every shard
+is stored as checkpoint, so the import can be resumed like a streaming one.
+
+Shards are aligned to line breaks, so a quoted field must not contain a
+line break. The register does not use multi-line fields.
+
+The rows of a shard are converted without the single-row checks, the
+validation rules of `ChargingStation` run once over the column arrays of
+the whole shard with `validate_station_columns`.
+
+Classes:
+    ChargingStationColumns: Typed column arrays of a parsed shard.
+
+Functions:
+    split_byte_ranges:               split the data rows of a file into shards
+    parse_shard:                     convert one shard into column arrays
+    parallel_load_charging_stations: load the register with a process pool
+"""
+
+import csv
+import io
+import math
+import os
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+from operator import not_
+from typing import Iterator
+
+from app.domain.entities.charging_station import OperationStatus
+from app.domain.validation.charging_station_batch import validate_station_columns
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.ingestion_progress import track_ingestion
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.streaming_loader import (
+    CHARGING_STATIONS_DATASET,
+    run_checkpointed_import,
+)
+
+DEFAULT_SHARD_BYTES = 4 * 1024 * 1024
+
+
+class ChargingStationColumns:
+    """
+    Parsed charging stations of one shard, stored column by column.
+
+    Numbers are kept in `array` columns, which are pickled as raw memory
+    when the batch is sent from a worker process to the writer. A missing
+    nominal power is kept as NaN and a missing number of charging points
+    as 0, both fail validation like the missing value.
+
+    Attributes:
+        rows_read (int): Number of data rows in the shard.
+        reject_reasons (Counter): Number of rejected rows per reason.
+    """
+
+    def __init__(self):
+        self.rows_read = 0
+        self.reject_reasons = Counter()
+        self.postal_code_id = array("l")
+        self.latitude = array("d")
+        self.longitude = array("d")
+        self.nominal_power = array("d")
+        self.num_charging_points = array("l")
+        self.street = []
+        self.house_number = []
+        self.operator = []
+        self.address_suffix = []
+        self.charging_type = []
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    def append(self, values: dict) -> None:
+        """
+        Add the column values of one station, validated or not.
+
+        Args:
+            values (dict): Column values as returned by `parse_charging_station_row`.
+        """
+        nominal_power = values["nominal_power"]
+        num_charging_points = values["num_charging_points"]
+        self.postal_code_id.append(values["postal_code_id"])
+        self.latitude.append(values["latitude"])
+        self.longitude.append(values["longitude"])
+        self.nominal_power.append(math.nan if nominal_power is None else nominal_power)
+        self.num_charging_points.append(num_charging_points or 0)
+        self.street.append(values["street"])
+        self.house_number.append(values["house_number"])
+        self.operator.append(values["operator"])
+        self.address_suffix.append(values["address_suffix"])
+        self.charging_type.append(values["charging_type"])
+
+    def reject_invalid(self) -> None:
+        """
+        Validate all stations at once and drop the rejected ones, counting
+        them with the reason of the first rule they fail.
+        """
+        report = validate_station_columns(
+            {
+                "latitude": self.latitude,
+                "longitude": self.longitude,
+                "nominal_power": self.nominal_power,
+                "num_charging_points": self.num_charging_points,
+                "operator": self.operator,
+                "address_suffix": self.address_suffix,
+            }
+        )
+        if not report.rows_rejected:
+            return
+        self.reject_reasons.update(report.reason_counts)
+        for name in (
+            "postal_code_id",
+            "latitude",
+            "longitude",
+            "nominal_power",
+            "num_charging_points",
+            "street",
+            "house_number",
+            "operator",
+            "address_suffix",
+            "charging_type",
+        ):
+            column = getattr(self, name)
+            kept = compress(column, map(not_, report.reason_codes))
+            if isinstance(column, array):
+                setattr(self, name, array(column.typecode, kept))
+            else:
+                setattr(self, name, list(kept))
+
+    def rows(self) -> list[dict]:
+        """
+        Returns:
+            list[dict]: Column values of every station, ready for a bulk insert.
+        """
+        return [
+            {
+                "functional": OperationStatus.OPERATIONAL,
+                "postal_code_id": self.postal_code_id[i],
+                "street": self.street[i],
+                "house_number": self.house_number[i],
+                "latitude": self.latitude[i],
+                "longitude": self.longitude[i],
+                "operator": self.operator[i],
+                "address_suffix": self.address_suffix[i],
+                "nominal_power": self.nominal_power[i],
+                "charging_type": self.charging_type[i],
+                "num_charging_points": self.num_charging_points[i],
+            }
+            for i in range(len(self))
+        ]
+
+
+def split_byte_ranges(
+    file_path: str, shard_bytes: int, start_offset: int = 0
+) -> tuple[list[str], list[tuple[int, int]]]:
+    """
+    Split the data rows of a CSV file into byte ranges ending at line breaks.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        shard_bytes (int): Approximate size of a shard.
+        start_offset (int): File offset to start at, 0 starts behind the header.
+
+    Returns:
+        tuple[list[str], list[tuple[int, int]]]: The header and the
+            (start, end) offsets of the shards.
+    """
+    with open(file_path, "rb") as source:
+        header_line = source.readline()
+        header = next(csv.reader([header_line.decode("utf-8")], delimiter=";"), [])
+        size = os.fstat(source.fileno()).st_size
+
+        ranges = []
+        position = max(start_offset, len(header_line))
+        while position < size:
+            source.seek(min(position + shard_bytes, size))
+            source.readline()
+            end = source.tell()
+            ranges.append((position, end))
+            position = end
+    return header, ranges
+
+
+def parse_shard(
+    file_path: str,
+    header: list[str],
+    start: int,
+    end: int,
+    postal_code_numbers: set[int],
+) -> ChargingStationColumns:
+    """
+    Convert the rows of one byte range into column arrays.
+
+    Runs in a worker process, so it neither uses the database nor the application.
+
+    Args:
+        file_path (str): Path to the register CSV file.
+        header (list[str]): Column names of the register.
+        start (int): Offset of the first row of the shard.
+        end (int): Offset behind the last row of the shard.
+        postal_code_numbers (set[int]): All postal codes stored in the database.
+
+    Returns:
+        ChargingStationColumns: The valid stations and the reject reasons of the shard.
+    """
+    with open(file_path, "rb") as source:
+        source.seek(start)
+        text = source.read(end - start).decode("utf-8")
+
+    columns = ChargingStationColumns()
+    for row in csv.reader(io.StringIO(text, newline=""), delimiter=";"):
+        if not row:
+            continue
+        columns.rows_read += 1
+        try:
+            columns.append(
+                parse_charging_station_row(
+                    dict(zip(header, row)), postal_code_numbers, validate=False
+                )
+            )
+        except ChargingStationRowError as row_err:
+            columns.reject_reasons[str(row_err)] += 1
+    columns.reject_invalid()
+    return columns
+
+
+def _parsed_shards(
+    file_path: str,
+    shard_bytes: int,
+    workers: int,
+    postal_code_numbers: set[int],
+    start_offset: int,
+) -> Iterator[tuple[ChargingStationColumns, int]]:
+    """
+    Parse the shards in a process pool and yield them in file order.
+
+    At most two shards per worker are in flight, so parsed batches do not
+    pile up when the writer is slower than the workers.
+    """
+    header, ranges = split_byte_ranges(file_path, shard_bytes, start_offset)
+    if workers <= 1:
+        for start, end in ranges:
+            yield parse_shard(file_path, header, start, end, postal_code_numbers), end
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit(byte_range: tuple[int, int]):
+            start, end = byte_range
+            future = executor.submit(
+                parse_shard, file_path, header, start, end, postal_code_numbers
+            )
+            return future, end
+
+        remaining = iter(ranges)
+        pending = deque(
+            submit(byte_range) for byte_range in islice(remaining, 2 * workers)
+        )
+        while pending:
+            future, end = pending.popleft()
+            next_range = next(remaining, None)
+            if next_range:
+                pending.append(submit(next_range))
+            yield future.result(), end
+
+
+def parallel_load_charging_stations(
+    application,
+    file_path: str,
+    workers: int = None,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+) -> IngestionStats:
+    """
+    Load the charging station register, parsing it in a process pool.
+
+    Must be called inside an application context. Every shard is committed
+    with its checkpoint, an interrupted import continues behind the last shard.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+        workers (int): Number of worker processes, defaults to the number of cores.
+        shard_bytes (int): Approximate size of a shard in bytes.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        SQLAlchemyError: If writing a shard fails. Committed shards are kept.
+        StaleImportError: If the file changed after stations of a previous
+            version were imported.
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = IngestionStats(CHARGING_STATIONS_DATASET)
+    track_ingestion(application, stats)
+
+    with PostalCodeOperations() as repository:
+        postal_code_numbers = repository.get_all_postal_code_numbers()
+
+    with ChargingStationOperations() as repository:
+
+        def read_chunks(start_offset: int):
+            return _parsed_shards(
+                file_path, shard_bytes, workers, postal_code_numbers, start_offset
+            )
+
+        def insert_chunk(columns: ChargingStationColumns) -> int:
+            repository.bulk_insert_charging_stations(columns.rows())
+            stats.rows_inserted += len(columns)
+            stats.rows_rejected += sum(columns.reject_reasons.values())
+            stats.reject_reasons.update(columns.reject_reasons)
+            return columns.rows_read
+
+        return run_checkpointed_import(
+            application,
+            stats,
+            file_path,
+            read_chunks,
+            insert_chunk,
+            repository.has_charging_stations,
+        )
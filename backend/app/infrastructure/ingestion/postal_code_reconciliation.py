@@ -0,0 +1,122 @@
+"""Reconciliation of the postal codes of the charging stations.
+
+The register names the postal code of every station, but some rows carry
+the wrong one. This job locates every stored station in the postal code
+polygons and reports, and optionally fixes, the stations whose stored
+postal code differs from the polygon containing them.
+
+Classes:
+    PostalCodeReconciliation: Mismatches found by a reconciliation run.
+
+Functions:
+    reconcile_station_postal_codes: locate all stations and compare their postal codes
+"""
+
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+class PostalCodeReconciliation:
+    """
+    Result of comparing the stored and the located postal codes of the stations.
+
+    Attributes:
+        stations_checked (int): Number of stations located.
+        mismatches (list[dict]): Per mismatching station the `station_id`, the
+            stored `postal_code` and the `located_postal_code`.
+        outside (list[int]): Ids of stations outside of all postal codes, left unchanged.
+        fixed (int): Number of stations updated to their located postal code.
+    """
+
+    def __init__(self):
+        self.stations_checked = 0
+        self.mismatches = []
+        self.outside = []
+        self.fixed = 0
+
+    def __str__(self):
+        return (
+            f"{self.stations_checked} checked, {len(self.mismatches)} mismatched, "
+            f"{len(self.outside)} outside of all postal codes, {self.fixed} fixed"
+        )
+
+
+def reconcile_station_postal_codes(
+    application, fix: bool = False, batch_size: int = DEFAULT_BATCH_SIZE
+) -> PostalCodeReconciliation:
+    """
+    Locate every charging station in the postal code polygons and compare
+    the result with its stored postal code.
+
+    Stations are read in batches in id order and located with the grid index
+    of the postal codes, so a run takes a few microseconds per station plus
+    the database reads. With `fix` all mismatching stations are updated to
+    their located postal code in one transaction. Stations outside of all
+    postal codes are only reported. Must be called inside an application context.
+
+    Args:
+        application (Flask): The Flask application instance.
+        fix (bool): Update the postal code of mismatching stations.
+        batch_size (int): Number of stations read and updated per statement.
+
+    Returns:
+        PostalCodeReconciliation: The mismatches and the number of fixed stations.
+
+    Raises:
+        SQLAlchemyError: If reading or fixing fails. Nothing is written then.
+    """
+    result = PostalCodeReconciliation()
+    with (
+        PostalCodeOperations() as postal_codes,
+        ChargingStationOperations() as stations,
+    ):
+        locator = postal_codes.get_postal_code_locator()
+
+        last_id = 0
+        while batch := stations.get_station_locations(last_id, batch_size):
+            station_ids, stored, lats, lons = zip(*batch)
+            last_id = station_ids[-1]
+            result.stations_checked += len(batch)
+            located = locator.locate_many(lons, lats)
+            for station_id, postal_code, located_postal_code in zip(
+                station_ids, stored, located
+            ):
+                if located_postal_code is None:
+                    result.outside.append(station_id)
+                elif located_postal_code != postal_code:
+                    result.mismatches.append(
+                        {
+                            "station_id": station_id,
+                            "postal_code": postal_code,
+                            "located_postal_code": located_postal_code,
+                        }
+                    )
+
+        if fix and result.mismatches:
+            try:
+                rows = [
+                    {
+                        "station_id": mismatch["station_id"],
+                        "postal_code_id": mismatch["located_postal_code"],
+                    }
+                    for mismatch in result.mismatches
+                ]
+                for start in range(0, len(rows), batch_size):
+                    stations.bulk_update_charging_stations(
+                        rows[start : start + batch_size]
+                    )
+                stations.session.commit()
+            except SQLAlchemyError:
+                stations.session.rollback()
+                raise
+            result.fixed = len(rows)
+
+    application.logger.info(f"Postal code reconciliation: {result}")
+    return result
@@ -0,0 +1,137 @@
+"""Row conversion for the postal code files.
+
+Converts one row of geodata_berlin_plz.csv, or one record of the
+berlin_postleitzahlen shapefile, into a plain mapping of `postal_codes`
+column values, including the geometry columns derived from the polygon,
+without creating an ORM object.
+
+Classes:
+    PostalCodeRowError: Raised when a row cannot be imported.
+
+Functions:
+    parse_postal_code_row:    convert a postal code row to a column mapping
+    parse_postal_code_record: convert a shapefile record to a column mapping
+    read_postal_code_file:    stream the column mappings of a CSV or shapefile
+"""
+
+import csv
+from typing import Iterator
+
+from app.domain.entities.postal_code import PostalCode
+from app.domain.geometry.polygon import polygon_metrics
+from app.domain.geometry.wkt import format_wkt_polygons
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.shapefile import (
+    ShapefileReader,
+    ShapeRecord,
+    is_shapefile,
+)
+
+POSTAL_CODE_FIELD = "PLZ99"
+
+
+class PostalCodeRowError(Exception):
+    """
+    Custom exception for postal code rows that cannot be imported.
+    The message is used as reject reason in the ingestion statistics.
+    """
+
+    pass
+
+
+def parse_postal_code_row(row: list[str]) -> dict:
+    """
+    Convert a row of the postal code file into `postal_codes` column values.
+
+    Args:
+        row (list[str]): The postal code number and the polygon as WKT.
+
+    Returns:
+        dict: Column values including bounding box, centroid, area and vertex count.
+
+    Raises:
+        PostalCodeRowError: If the row is malformed or fails validation.
+    """
+    try:
+        number, polygon = int(row[0]), row[1]
+    except (IndexError, ValueError):
+        raise PostalCodeRowError("malformed row")
+    valid = PostalCode.number_is_valid(number)
+    if not valid or not PostalCode.polygon_is_valid(polygon):
+        raise PostalCodeRowError("invalid postal code")
+    return {
+        "number": number,
+        "polygon": polygon,
+        **PostalCode.geometry_columns(polygon),
+    }
+
+
+def parse_postal_code_record(record: ShapeRecord) -> dict:
+    """
+    Convert a record of the postal code shapefile into `postal_codes` column values.
+
+    The geometry columns are measured on the coordinates read from the
+    shapefile, the polygon is stored as WKT like in the CSV file.
+
+    Args:
+        record (ShapeRecord): A record with the postal code in the `PLZ99` field.
+
+    Returns:
+        dict: Column values including bounding box, centroid, area and vertex count.
+
+    Raises:
+        PostalCodeRowError: If the record is malformed or fails validation.
+    """
+    try:
+        number = int(record.attributes[POSTAL_CODE_FIELD])
+    except (KeyError, TypeError, ValueError):
+        raise PostalCodeRowError("malformed row")
+    if not PostalCode.number_is_valid(number) or not record.polygons:
+        raise PostalCodeRowError("invalid postal code")
+    return {
+        "number": number,
+        "polygon": format_wkt_polygons(record.polygons),
+        **polygon_metrics(record.polygons).as_columns(),
+    }
+
+
+def read_postal_code_file(file_path: str, stats: IngestionStats) -> Iterator[dict]:
+    """
+    Stream the column values of a postal code CSV file or shapefile.
+
+    Rows that cannot be imported are counted as rejected in the statistics.
+
+    Args:
+        file_path (str): Path to the CSV file or to the .shp file.
+        stats (IngestionStats): Statistics of the running import.
+
+    Yields:
+        dict: Column values of the next valid postal code.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        ShapefileError: If the shapefile is corrupt.
+    """
+    if is_shapefile(file_path):
+        with ShapefileReader(file_path) as reader:
+            for record in reader:
+                stats.rows_read += 1
+                try:
+                    yield parse_postal_code_record(record)
+                except PostalCodeRowError as row_err:
+                    stats.reject(str(row_err))
+        return
+
+    csv.field_size_limit(max(csv.field_size_limit(), 1024 * 1024))
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader, None)  # Skip the header row
+        for row in reader:
+            if not row:
+                continue
+            stats.rows_read += 1
+            try:
+                yield parse_postal_code_row(row)
+            except PostalCodeRowError as row_err:
+                stats.reject(str(row_err))
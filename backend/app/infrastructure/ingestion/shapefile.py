@@ -0,0 +1,313 @@
+"""Streaming reader for ESRI shapefiles (.shp, .shx, .dbf).
+
+Reads the polygon shapefiles bundled in `data/datasets` record by record.
+Coordinates are copied from the file straight into `array("d")` rings,
+without a detour through decimal text, and the attributes come from the
+dBASE table next to it. Only the shape types of the bundled files
+(null and polygon shapes) are supported.
+
+Classes:
+    ShapefileError: Raised when a file is not a supported shapefile.
+    ShapeRecord:    The polygons and attributes of one record.
+    ShapefileReader: Reader streaming the records of a shapefile.
+
+Functions:
+    is_shapefile: check if a path names a shapefile
+"""
+
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator
+
+from app.domain.geometry.polygon import ring_signed_area
+
+SHAPEFILE_EXTENSION = ".shp"
+FILE_CODE = 9994
+HEADER_SIZE = 100
+SHAPE_NULL = 0
+SHAPE_POLYGON = 5
+# dBASE language driver ids of the code pages used for German texts
+DBF_CODE_PAGES = {0x01: "cp437", 0x02: "cp850", 0x03: "cp1252", 0x57: "cp1252"}
+DBF_DEFAULT_ENCODING = "latin-1"
+
+_SHP_HEADER = struct.Struct(">7i")
+_SHP_HEADER_LE = struct.Struct("<2i4d")
+_RECORD_HEADER = struct.Struct(">2i")
+_POLYGON_HEADER = struct.Struct("<i4d2i")
+_DBF_HEADER = struct.Struct("<4xIHH17xB2x")
+_DBF_FIELD = struct.Struct("<11sc4xBB14x")
+
+
+class ShapefileError(Exception):
+    """
+    Custom exception for missing, corrupt or unsupported shapefiles.
+    """
+
+    pass
+
+
+class ShapeRecord:
+    """
+    The geometry and attributes of one shapefile record.
+
+    Attributes:
+        index (int): Position of the record in the file, starting at 0.
+        polygons (list[list[array]]): One list of rings per polygon, the exterior
+            ring first, as interleaved longitude and latitude values. Empty for
+            null shapes.
+        attributes (dict): Values of the dBASE fields by field name.
+    """
+
+    def __init__(self, index: int, polygons: list[list[array]], attributes: dict):
+        self.index = index
+        self.polygons = polygons
+        self.attributes = attributes
+
+
+def is_shapefile(path: str) -> bool:
+    """
+    Check if a path names a shapefile by its extension.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        bool: True for a .shp file.
+    """
+    return path.lower().endswith(SHAPEFILE_EXTENSION)
+
+
+def _group_rings(rings: list[array]) -> list[list[array]]:
+    """
+    Group the parts of a polygon shape into polygons.
+
+    Shapefiles store exterior rings clockwise and holes counterclockwise,
+    every hole belongs to the exterior ring before it.
+    """
+    polygons = []
+    for ring in rings:
+        if ring_signed_area(ring) <= 0 or not polygons:
+            polygons.append([ring])
+        else:
+            polygons[-1].append(ring)
+    return polygons
+
+
+def _parse_polygon(content: memoryview) -> list[list[array]]:
+    """
+    Parse the content of a polygon record into rings.
+    """
+    *_, part_count, point_count = _POLYGON_HEADER.unpack_from(content)
+    points_start = _POLYGON_HEADER.size + 4 * part_count
+    if len(content) < points_start + 16 * point_count:
+        raise ShapefileError("Truncated polygon record.")
+    starts = struct.unpack_from(f"<{part_count}i", content, _POLYGON_HEADER.size)
+
+    coordinates = array("d")
+    coordinates.frombytes(content[points_start : points_start + 16 * point_count])
+    if sys.byteorder == "big":
+        coordinates.byteswap()
+
+    bounds = list(starts[1:]) + [point_count]
+    rings = [coordinates[2 * start : 2 * end] for start, end in zip(starts, bounds)]
+    return _group_rings([ring for ring in rings if ring])
+
+
+def _parse_shape(content: memoryview) -> list[list[array]]:
+    if len(content) < 4:
+        raise ShapefileError("Truncated record.")
+    (shape_type,) = struct.unpack_from("<i", content)
+    if shape_type == SHAPE_NULL:
+        return []
+    if shape_type != SHAPE_POLYGON:
+        raise ShapefileError(f"Unsupported shape type: {shape_type}")
+    return _parse_polygon(content)
+
+
+class ShapefileReader:
+    """
+    Reader streaming the records of a polygon shapefile.
+
+    The reader holds the open .shp and .dbf files and should be used as a
+    context manager. Records are read one at a time, so memory use does not
+    depend on the size of the file.
+
+    Attributes:
+        path (str): Path of the .shp file.
+        bbox (tuple[float, float, float, float]): min x, min y, max x, max y of all shapes.
+        fields (list[tuple[str, str, int, int]]): Name, type, length and decimals
+            of the dBASE fields.
+        encoding (str): Encoding of the dBASE texts.
+    """
+
+    def __init__(self, path: str, encoding: str = None):
+        """
+        Open a shapefile and read its headers.
+
+        Args:
+            path (str): Path of the .shp file or of the shapefile without extension.
+            encoding (str): Encoding of the dBASE texts, by default read from the
+                .cpg file or the language driver of the .dbf file.
+
+        Raises:
+            FileNotFoundError: If the .shp or .dbf file does not exist.
+            ShapefileError: If a header is invalid.
+        """
+        base = path[: -len(SHAPEFILE_EXTENSION)] if is_shapefile(path) else path
+        self.path = base + SHAPEFILE_EXTENSION
+        self._shp = open(self.path, "rb")
+        try:
+            self._dbf = open(base + ".dbf", "rb")
+        except FileNotFoundError:
+            self._shp.close()
+            raise
+        self._shx_path = base + ".shx"
+
+        try:
+            self.bbox = self._read_shp_header()
+            self._read_dbf_header(base, encoding)
+        except Exception:
+            self.close()
+            raise
+
+    def _read_shp_header(self) -> tuple[float, float, float, float]:
+        header = self._shp.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ShapefileError(f"Not a shapefile: {self.path}")
+        file_code, *_ = _SHP_HEADER.unpack_from(header)
+        version, shape_type, *bbox = _SHP_HEADER_LE.unpack_from(header, 28)
+        if file_code != FILE_CODE or version != 1000:
+            raise ShapefileError(f"Not a shapefile: {self.path}")
+        if shape_type not in (SHAPE_NULL, SHAPE_POLYGON):
+            raise ShapefileError(f"Unsupported shape type: {shape_type}")
+        return tuple(bbox)
+
+    def _read_dbf_header(self, base: str, encoding: str) -> None:
+        header = self._dbf.read(_DBF_HEADER.size)
+        if len(header) < _DBF_HEADER.size:
+            raise ShapefileError(f"Not a dBASE file: {base}.dbf")
+        self._record_count, self._dbf_header_size, self._record_size, language = (
+            _DBF_HEADER.unpack(header)
+        )
+
+        descriptors = self._dbf.read(self._dbf_header_size - _DBF_HEADER.size)
+        self.fields = []
+        for offset in range(0, len(descriptors) - 1, _DBF_FIELD.size):
+            if descriptors[offset] == 0x0D:  # End of the field descriptors
+                break
+            name, field_type, length, decimals = _DBF_FIELD.unpack_from(
+                descriptors, offset
+            )
+            self.fields.append(
+                (
+                    name.split(b"\0")[0].decode("ascii"),
+                    field_type.decode(),
+                    length,
+                    decimals,
+                )
+            )
+
+        if encoding is None and os.path.exists(base + ".cpg"):
+            with open(base + ".cpg", encoding="ascii") as cpg:
+                encoding = cpg.read().strip() or None
+        self.encoding = encoding or DBF_CODE_PAGES.get(language, DBF_DEFAULT_ENCODING)
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the .shp and .dbf files.
+        """
+        self._shp.close()
+        if hasattr(self, "_dbf"):
+            self._dbf.close()
+
+    def _decode_field(self, raw: bytes, field_type: str, decimals: int):
+        if field_type in ("N", "F"):
+            text = raw.strip(b" \0*")
+            if not text:
+                return None
+            return float(text) if decimals or b"." in text else int(text)
+        if field_type == "L":
+            return {b"Y": True, b"y": True, b"T": True, b"t": True}.get(
+                raw.strip(), False
+            )
+        return raw.decode(self.encoding).strip(" \0")
+
+    def _read_attributes(self) -> dict:
+        record = self._dbf.read(self._record_size)
+        if len(record) < self._record_size:
+            raise ShapefileError("Truncated dBASE record.")
+        attributes, offset = {}, 1  # The first byte is the deletion flag
+        for name, field_type, length, decimals in self.fields:
+            attributes[name] = self._decode_field(
+                record[offset : offset + length], field_type, decimals
+            )
+            offset += length
+        return attributes
+
+    def _read_content(self, position: int = None) -> memoryview:
+        if position is not None:
+            self._shp.seek(position)
+        header = self._shp.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            raise ShapefileError("Truncated record header.")
+        _, content_length = _RECORD_HEADER.unpack(header)
+        content = self._shp.read(2 * content_length)
+        if len(content) < 2 * content_length:
+            raise ShapefileError("Truncated record.")
+        return memoryview(content)
+
+    def __iter__(self) -> Iterator[ShapeRecord]:
+        """
+        Stream all records in file order.
+
+        Yields:
+            ShapeRecord: The polygons and attributes of the next record.
+
+        Raises:
+            ShapefileError: If a record is corrupt or has an unsupported shape type.
+        """
+        self._shp.seek(HEADER_SIZE)
+        self._dbf.seek(self._dbf_header_size)
+        for index in range(self._record_count):
+            polygons = _parse_shape(self._read_content())
+            yield ShapeRecord(index, polygons, self._read_attributes())
+
+    def shape(self, index: int) -> list[list[array]]:
+        """
+        Read the polygons of one record, located with the .shx index file.
+
+        Args:
+            index (int): Position of the record, starting at 0.
+
+        Returns:
+            list[list[array]]: The polygons of the record.
+
+        Raises:
+            IndexError: If there is no record at this position.
+            FileNotFoundError: If the .shx file does not exist.
+            ShapefileError: If the record is corrupt.
+        """
+        if not 0 <= index < self._record_count:
+            raise IndexError(f"Record {index} out of range")
+        with open(self._shx_path, "rb") as shx:
+            shx.seek(HEADER_SIZE + 8 * index)
+            entry = shx.read(8)
+        if len(entry) < 8:
+            raise ShapefileError("Truncated index file.")
+        offset, _ = _RECORD_HEADER.unpack(entry)
+        position = self._shp.tell()  # Keep the position of a running iteration
+        try:
+            return _parse_shape(self._read_content(2 * offset))
+        finally:
+            self._shp.seek(position)
@@ -0,0 +1,257 @@
+"""Streaming loaders with periodic commits and resume.
+
+The source files are read in fixed-size chunks. Every chunk is written,
+committed and expunged from the session together with a checkpoint
+(file offset and dataset hash), so memory stays bounded and an
+interrupted import continues behind the last committed chunk.
+
+A source that changed after rows of it were committed is not imported
+again on top of them, which would store every row twice. Loaders whose
+rows cannot be told apart raise `StaleImportError` instead, a new
+release of the register is applied with `flask diff-import`.
+
+Classes:
+    StaleImportError: The source changed after rows of the previous version were stored.
+
+Functions:
+    run_checkpointed_import:       commit the chunks of a source with checkpoints
+    stream_load_charging_stations: load the register chunk by chunk
+    stream_load_postal_codes:      load the postal codes chunk by chunk
+"""
+
+from typing import Any, Callable, Iterator, Optional
+
+from app.domain.entities.postal_code import PostalCode, PostalCodeValidationError
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from app.infrastructure.database_operations.ingestion_checkpoint_operations import (
+    IngestionCheckpointOperations,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from app.infrastructure.ingestion.csv_chunks import CsvChunkReader, file_sha256
+from app.infrastructure.ingestion.ingestion_progress import track_ingestion
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+
+CHARGING_STATIONS_DATASET = "charging_stations"
+POSTAL_CODES_DATASET = "postal_codes"
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class StaleImportError(Exception):
+    """
+    Custom exception for a source that changed after rows of its previous
+    version were stored, so importing it from the beginning would store
+    the rows twice.
+    """
+
+    pass
+
+
+def run_checkpointed_import(
+    application,
+    stats: IngestionStats,
+    file_path: str,
+    read_chunks: Callable[[int], Iterator[tuple[Any, int]]],
+    insert_chunk: Callable[[Any], int],
+    rows_stored: Optional[Callable[[], bool]] = None,
+) -> IngestionStats:
+    """
+    Write the chunks of a source file and commit every chunk with its checkpoint.
+
+    Args:
+        application (Flask): The Flask application instance.
+        stats (IngestionStats): Statistics of the run, `stats.dataset` names the checkpoint.
+        file_path (str): Path to the source file.
+        read_chunks (Callable): Yields the chunks and the file offset behind each
+            chunk, starting at the given offset.
+        insert_chunk (Callable): Adds one chunk to the session and returns the
+            number of rows read for it.
+        rows_stored (Optional[Callable]): Returns True if the target already
+            holds rows. If given, a changed source is refused while rows are
+            stored, None imports it from the beginning, e.g. for loaders that
+            skip stored rows.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        StaleImportError: If the source changed and `rows_stored` returns True.
+    """
+    dataset_hash = file_sha256(file_path)
+
+    with IngestionCheckpointOperations() as checkpoints:
+        checkpoint = checkpoints.get_checkpoint(stats.dataset)
+        start_offset, rows_committed = 0, 0
+        if checkpoint and checkpoint.dataset_hash == dataset_hash:
+            start_offset = checkpoint.byte_offset
+            rows_committed = checkpoint.rows_committed
+            if start_offset and not checkpoint.completed:
+                application.logger.info(
+                    f"Resuming import of {stats.dataset} at row {rows_committed}"
+                )
+        elif checkpoint and rows_stored is not None and rows_stored():
+            raise StaleImportError(
+                f"Source of {stats.dataset} changed after {checkpoint.rows_committed} "
+                "rows of the previous version were imported, apply it with "
+                "`flask diff-import` instead"
+            )
+        elif checkpoint:
+            application.logger.warning(
+                f"Source of {stats.dataset} changed, importing from the beginning"
+            )
+
+        end_offset = start_offset
+        for chunk, end_offset in read_chunks(start_offset):
+            rows_read = insert_chunk(chunk)
+            stats.rows_read += rows_read
+            rows_committed += rows_read
+            checkpoints.save_checkpoint(
+                stats.dataset, dataset_hash, end_offset, rows_committed
+            )
+            db.session.commit()
+            db.session.expunge_all()
+
+        checkpoints.save_checkpoint(
+            stats.dataset, dataset_hash, end_offset, rows_committed, completed=True
+        )
+        db.session.commit()
+
+    stats.finish()
+    stats.log(application.logger)
+    return stats
+
+
+def _csv_chunks(
+    file_path: str, chunk_size: int
+) -> Callable[[int], Iterator[tuple[tuple[list[str], list[list[str]]], int]]]:
+    """
+    Create a chunk source for `run_checkpointed_import` reading a CSV file.
+    Every chunk is the header together with the rows of the chunk.
+    """
+
+    def read_chunks(start_offset: int):
+        reader = CsvChunkReader(file_path, chunk_size, start_offset=start_offset)
+        for rows, end_offset in reader.chunks():
+            yield (reader.header, rows), end_offset
+
+    return read_chunks
+
+
+def stream_load_charging_stations(
+    application, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IngestionStats:
+    """
+    Load the charging station register chunk by chunk.
+
+    Must be called inside an application context.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the register CSV file.
+        chunk_size (int): Number of rows per transaction.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        csv.Error: If the CSV file cannot be parsed.
+        SQLAlchemyError: If writing a chunk fails. Committed chunks are kept.
+        StaleImportError: If the file changed after stations of a previous
+            version were imported.
+    """
+    stats = IngestionStats(CHARGING_STATIONS_DATASET)
+    track_ingestion(application, stats)
+
+    with PostalCodeOperations() as repository:
+        postal_code_numbers = repository.get_all_postal_code_numbers()
+
+    with ChargingStationOperations() as repository:
+
+        def insert_chunk(chunk: tuple[list[str], list[list[str]]]) -> int:
+            header, rows = chunk
+            batch = []
+            for row in rows:
+                try:
+                    batch.append(
+                        parse_charging_station_row(
+                            dict(zip(header, row)), postal_code_numbers
+                        )
+                    )
+                except ChargingStationRowError as row_err:
+                    stats.reject(str(row_err))
+            repository.bulk_insert_charging_stations(batch)
+            stats.rows_inserted += len(batch)
+            return len(rows)
+
+        return run_checkpointed_import(
+            application,
+            stats,
+            file_path,
+            _csv_chunks(file_path, chunk_size),
+            insert_chunk,
+            repository.has_charging_stations,
+        )
+
+
+def stream_load_postal_codes(
+    application, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IngestionStats:
+    """
+    Load the postal codes and their polygons chunk by chunk.
+
+    Must be called inside an application context. Postal codes that are
+    already stored are skipped.
+
+    Args:
+        application (Flask): The Flask application instance.
+        file_path (str): Path to the postal code CSV file.
+        chunk_size (int): Number of rows per transaction.
+
+    Returns:
+        IngestionStats: Counters and throughput of the run.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+        SQLAlchemyError: If writing a chunk fails. Committed chunks are kept.
+    """
+    stats = IngestionStats(POSTAL_CODES_DATASET)
+    track_ingestion(application, stats)
+
+    with PostalCodeOperations() as repository:
+        existing_numbers = repository.get_all_postal_code_numbers()
+
+        def insert_chunk(chunk: tuple[list[str], list[list[str]]]) -> int:
+            _, rows = chunk
+            for row in rows:
+                try:
+                    number = int(row[0])
+                    if number in existing_numbers:
+                        stats.reject("postal code already in database")
+                        continue
+                    repository.session.add(PostalCode(number=number, polygon=row[1]))
+                except (IndexError, ValueError):
+                    stats.reject("malformed row")
+                    continue
+                except PostalCodeValidationError:
+                    stats.reject("invalid postal code")
+                    continue
+                existing_numbers.add(number)
+                stats.rows_inserted += 1
+            return len(rows)
+
+        return run_checkpointed_import(
+            application,
+            stats,
+            file_path,
+            _csv_chunks(file_path, chunk_size),
+            insert_chunk,
+        )
@@ -0,0 +1,117 @@
+"""Benchmark of the vector tiles of the map.
+
+Encodes the tiles covering the bundled postal codes at several zoom
+levels, with random stations spread over Berlin, and prints the time and
+size per tile, the time of a cached lookup and, for comparison, the size
+of the stations and postal codes as JSON.
+
+Usage:
+    ```bash
+    python -m benchmarks.map_tile_benchmark --stations 20000 --zooms 10 12 14
+    ```
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.config import Config
+from app.domain.geometry.station_index import StationIndex
+from app.domain.geometry.tile_cache import TileCache
+from app.domain.geometry.vector_tile import tiles_containing
+from app.domain.services.map_tile_services.map_tile_service import build_map_tile
+from benchmarks.postal_code_locator_benchmark import _read_geometries
+from benchmarks.station_bbox_benchmark import BERLIN_BBOX
+
+
+def run_benchmark(stations: int, zooms: list[int], max_tiles: int) -> dict:
+    """
+    Encode the tiles of every zoom level and measure time and size.
+
+    Args:
+        stations (int): Number of random stations.
+        zooms (list[int]): Zoom levels of the tiles.
+        max_tiles (int): Largest number of tiles encoded per zoom level.
+
+    Returns:
+        dict: Seconds per tile by zoom level and per cached lookup.
+    """
+    postal_codes = _read_geometries(Config.POSTAL_CODE_CSV)
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    index = StationIndex(
+        [
+            {
+                "id": station_id,
+                "longitude": random.uniform(min_lon, max_lon),
+                "latitude": random.uniform(min_lat, max_lat),
+                "functional": "operational",
+                "charging_type": "normal",
+                "nominal_power": 22,
+                "operator": f"Operator {station_id % 7}",
+            }
+            for station_id in range(1, stations + 1)
+        ]
+    )
+
+    results = {}
+    cache = TileCache()
+    # Builds the R-tree once, like the app does on first use
+    sources = (index.rtree, postal_codes)
+    encoded = []
+    for z in zooms:
+        (west, north), (east, south) = (
+            tiles_containing(min_lon, max_lat, z, buffer=0)[0],
+            tiles_containing(max_lon, min_lat, z, buffer=0)[-1],
+        )
+        tiles = [
+            (z, x, y) for x in range(west, east + 1) for y in range(north, south + 1)
+        ]
+        random.shuffle(tiles)
+        tiles = tiles[:max_tiles]
+        encoded += tiles
+
+        start = time.perf_counter()
+        sizes = [
+            len(
+                cache.get(
+                    tile, sources, lambda: build_map_tile(*tile, index, postal_codes)
+                )
+            )
+            for tile in tiles
+        ]
+        results[z] = (time.perf_counter() - start) / len(tiles)
+        print(
+            f"zoom {z:>2}: {results[z] * 1e3:8.1f} ms per tile, "
+            f"{sum(sizes) / len(sizes) / 1024:7.1f} KiB per tile, {len(tiles)} tiles"
+        )
+
+    start = time.perf_counter()
+    for tile in encoded:
+        cache.get(tile, sources, lambda: b"")
+    results["cached"] = (time.perf_counter() - start) / len(encoded)
+    print(f"  cached: {results['cached'] * 1e6:8.1f} us per tile")
+
+    stations_json = json.dumps(index.stations)
+    postal_json = json.dumps(
+        {
+            number: [[list(ring) for ring in rings] for rings in geometry.polygons]
+            for number, geometry in postal_codes.items()
+        }
+    )
+    print(
+        f"    json: {len(stations_json) / 1024:.0f} KiB of stations, "
+        f"{len(postal_json) / 1024:.0f} KiB of postal codes"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the map tiles.")
+    parser.add_argument("--stations", type=int, default=20000)
+    parser.add_argument("--zooms", type=int, nargs="+", default=[10, 12, 14, 16])
+    parser.add_argument("--max-tiles", type=int, default=50)
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.zooms, args.max_tiles)
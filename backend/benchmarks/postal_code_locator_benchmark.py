@@ -0,0 +1,84 @@
+"""Benchmark of the postal code lookup by coordinates.
+
+Locates random points in the bounding box of the bundled postal codes,
+once by testing every polygon after a bounding box check and once with
+the grid index of `PolygonLocator`, and prints the time per point.
+
+Usage:
+    ```bash
+    python -m benchmarks.postal_code_locator_benchmark --points 100000
+    ```
+"""
+
+import argparse
+import csv
+import random
+import time
+
+from app.config import Config
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.point_locator import DEFAULT_GRID, PolygonLocator
+
+
+def _read_geometries(file_path: str) -> dict[int, PolygonGeometry]:
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader, None)
+        return {int(row[0]): PolygonGeometry.from_wkt(row[1]) for row in reader}
+
+
+def _locate_linear(geometries: dict, lons: list, lats: list) -> list:
+    items = list(geometries.items())
+    return [
+        next((key for key, g in items if g.contains(lon, lat)), None)
+        for lon, lat in zip(lons, lats)
+    ]
+
+
+def run_benchmark(points: int, grid: int) -> dict:
+    """
+    Locate random points with both methods and measure the time.
+
+    Args:
+        points (int): Number of random points.
+        grid (int): Number of grid cells per axis of the locator.
+
+    Returns:
+        dict: Seconds per point by method and the build time of the index.
+    """
+    geometries = _read_geometries(Config.POSTAL_CODE_CSV)
+    start = time.perf_counter()
+    locator = PolygonLocator(geometries, grid)
+    build_seconds = time.perf_counter() - start
+
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = locator.bbox
+    lons = [random.uniform(min_lon, max_lon) for _ in range(points)]
+    lats = [random.uniform(min_lat, max_lat) for _ in range(points)]
+
+    results = {"build": build_seconds}
+    found = {}
+    methods = {
+        "linear": lambda: _locate_linear(geometries, lons, lats),
+        "grid": lambda: locator.locate_many(lons, lats),
+    }
+    for name, method in methods.items():
+        start = time.perf_counter()
+        found[name] = method()
+        results[name] = (time.perf_counter() - start) / points
+        print(f"{name:>8}: {results[name] * 1e6:6.2f} us per point")
+    print(
+        f"   index: {build_seconds * 1000:.0f} ms to build, "
+        f"{locator.resolved_share:.0%} of the cells without point-in-polygon test"
+    )
+    assert found["linear"] == found["grid"]
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the postal code lookup.")
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--grid", type=int, default=DEFAULT_GRID)
+    args = parser.parse_args()
+
+    run_benchmark(args.points, args.grid)
@@ -0,0 +1,123 @@
+"""Benchmark of the shapefile reader against the CSV and WKT path.
+
+Reads the bundled postal code and district datasets repeatedly, once from
+the CSV files with WKT parsing and once from the shapefiles, and prints the
+throughput of two stages:
+
+    geometry: decoding the coordinates into rings only
+    rows:     producing the complete column values the loaders insert
+
+Usage:
+    ```bash
+    python -m benchmarks.shapefile_benchmark --repeat 20
+    ```
+"""
+
+import argparse
+import csv
+import os
+import time
+
+from app.config import Config
+from app.domain.geometry.wkt import parse_wkt_polygons
+from app.infrastructure.ingestion.district_loader import (
+    MAX_FIELD_SIZE,
+    read_district_file,
+)
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.postal_code_rows import read_postal_code_file
+from app.infrastructure.ingestion.shapefile import ShapefileReader
+
+DATASETS = {
+    "postal codes": (
+        Config.POSTAL_CODE_CSV,
+        Config.POSTAL_CODE_SHAPEFILE,
+        read_postal_code_file,
+    ),
+    "districts": (Config.DISTRICT_CSV, Config.DISTRICT_SHAPEFILE, read_district_file),
+}
+
+
+def _csv_geometry(file_path: str) -> int:
+    points = 0
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader, None)
+        for row in reader:
+            for rings in parse_wkt_polygons(row[1]):
+                points += sum(len(ring) // 2 for ring in rings)
+    return points
+
+
+def _shapefile_geometry(file_path: str) -> int:
+    points = 0
+    with ShapefileReader(file_path) as reader:
+        for record in reader:
+            for rings in record.polygons:
+                points += sum(len(ring) // 2 for ring in rings)
+    return points
+
+
+def _rows(read_file):
+    def read(file_path: str) -> int:
+        return sum(1 for _ in read_file(file_path, IngestionStats("benchmark")))
+
+    return read
+
+
+def _measure(read, file_path: str, repeat: int) -> tuple[int, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        count = read(file_path)
+    return count, (time.perf_counter() - start) / repeat
+
+
+def run_benchmark(repeat: int) -> dict:
+    """
+    Read every dataset from both sources and measure the time.
+
+    Args:
+        repeat (int): Number of reads per dataset, source and stage.
+
+    Returns:
+        dict: Seconds per read by (dataset, stage, source).
+    """
+    csv.field_size_limit(max(csv.field_size_limit(), MAX_FIELD_SIZE))
+    results = {}
+    for dataset, (csv_path, shapefile_path, read_file) in DATASETS.items():
+        megabytes = {
+            "csv": os.path.getsize(csv_path) / 1e6,
+            "shapefile": (
+                os.path.getsize(shapefile_path)
+                + os.path.getsize(shapefile_path[:-4] + ".dbf")
+            )
+            / 1e6,
+        }
+        stages = {
+            "geometry": {"csv": _csv_geometry, "shapefile": _shapefile_geometry},
+            "rows": {"csv": _rows(read_file), "shapefile": _rows(read_file)},
+        }
+        for stage, readers in stages.items():
+            for source, path in (("csv", csv_path), ("shapefile", shapefile_path)):
+                count, seconds = _measure(readers[source], path, repeat)
+                results[(dataset, stage, source)] = seconds
+                unit = "points" if stage == "geometry" else "rows"
+                print(
+                    f"{dataset:>12} {stage:>8} {source:>9}: {seconds * 1000:7.1f} ms "
+                    f"({count / seconds:10.0f} {unit}/s, "
+                    f"{megabytes[source] / seconds:6.1f} MB/s)"
+                )
+            speedup = (
+                results[(dataset, stage, "csv")]
+                / results[(dataset, stage, "shapefile")]
+            )
+            print(f"{dataset:>12} {stage:>8}   speedup: {speedup:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the shapefile reader.")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    run_benchmark(args.repeat)
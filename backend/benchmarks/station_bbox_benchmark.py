@@ -0,0 +1,88 @@
+"""Benchmark of the map viewport query of charging stations.
+
+Builds the STR-packed R-tree of `PointRTree` over random stations spread
+over Berlin and queries random viewports of a given size, once by
+testing every station and once with the R-tree, and prints the time per query.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_bbox_benchmark --stations 100000 --viewport 0.01
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from app.domain.geometry.rtree import DEFAULT_NODE_CAPACITY, PointRTree
+
+# Bounding box of Berlin: min lon, min lat, max lon, max lat
+BERLIN_BBOX = (13.08, 52.33, 13.77, 52.68)
+
+
+def _query_linear(lons: list, lats: list, box: tuple) -> list:
+    min_lon, min_lat, max_lon, max_lat = box
+    return [
+        index
+        for index, (lon, lat) in enumerate(zip(lons, lats))
+        if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat
+    ]
+
+
+def run_benchmark(
+    stations: int, viewport: float, queries: int, node_capacity: int
+) -> dict:
+    """
+    Query random viewports with both methods and measure the time.
+
+    Args:
+        stations (int): Number of random stations.
+        viewport (float): Width and height of the viewports in degrees.
+        queries (int): Number of viewports.
+        node_capacity (int): Maximum number of entries per R-tree node.
+
+    Returns:
+        dict: Seconds per query by method and the build time of the tree.
+    """
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    lons = [random.uniform(min_lon, max_lon) for _ in range(stations)]
+    lats = [random.uniform(min_lat, max_lat) for _ in range(stations)]
+    boxes = []
+    for _ in range(queries):
+        lon = random.uniform(min_lon, max_lon - viewport)
+        lat = random.uniform(min_lat, max_lat - viewport)
+        boxes.append((lon, lat, lon + viewport, lat + viewport))
+
+    start = time.perf_counter()
+    tree = PointRTree(lons, lats, node_capacity)
+    build_seconds = time.perf_counter() - start
+
+    results = {"build": build_seconds}
+    found = {}
+    methods = {
+        "linear": lambda box: _query_linear(lons, lats, box),
+        "rtree": lambda box: sorted(tree.query(*box)),
+    }
+    for name, method in methods.items():
+        start = time.perf_counter()
+        found[name] = [method(box) for box in boxes]
+        results[name] = (time.perf_counter() - start) / queries
+        print(f"{name:>8}: {results[name] * 1e3:8.3f} ms per query")
+    matches = sum(len(indices) for indices in found["rtree"]) / queries
+    print(
+        f"    tree: {build_seconds * 1000:.0f} ms to build, {matches:.0f} stations per query"
+    )
+    assert found["linear"] == found["rtree"]
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the viewport query.")
+    parser.add_argument("--stations", type=int, default=100000)
+    parser.add_argument("--viewport", type=float, default=0.01)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--node-capacity", type=int, default=DEFAULT_NODE_CAPACITY)
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.viewport, args.queries, args.node_capacity)
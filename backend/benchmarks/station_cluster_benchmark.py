@@ -0,0 +1,95 @@
+"""Benchmark of the clustering of charging stations.
+
+Builds `PointClusters` over random stations spread over Berlin, queries the
+clusters of a viewport of a 1280 by 800 pixel screen at random positions
+per zoom level, and times status changes of random stations. Prints the
+build time, the time per query with the number of items returned and the
+time per status change.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_cluster_benchmark --stations 100000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from app.domain.geometry.clustering import PointClusters
+from benchmarks.station_bbox_benchmark import BERLIN_BBOX
+
+STATUSES = ["operational", "used", "malfunctioning"]
+SCREEN = (1280, 800)
+TILE_SIZE = 256
+
+
+def _viewport(lon: float, lat: float, zoom: int) -> tuple:
+    # Degrees per pixel at Berlin's latitude, a rough factor is enough here
+    lon_span = SCREEN[0] * 360 / (TILE_SIZE * 2**zoom)
+    lat_span = SCREEN[1] * 360 * 0.61 / (TILE_SIZE * 2**zoom)
+    return (
+        lon - lon_span / 2,
+        lat - lat_span / 2,
+        lon + lon_span / 2,
+        lat + lat_span / 2,
+    )
+
+
+def run_benchmark(stations: int, queries: int, zooms: list[int]) -> dict:
+    """
+    Build the clusters and measure the time of viewport queries and status changes.
+
+    Args:
+        stations (int): Number of random stations.
+        queries (int): Number of random viewports per zoom level.
+        zooms (list[int]): Zoom levels of the queries.
+
+    Returns:
+        dict: Seconds of the build, per query by zoom level and per status change.
+    """
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    lons = [random.uniform(min_lon, max_lon) for _ in range(stations)]
+    lats = [random.uniform(min_lat, max_lat) for _ in range(stations)]
+    tags = [random.choice(STATUSES) for _ in range(stations)]
+
+    start = time.perf_counter()
+    clusters = PointClusters(lons, lats, tags)
+    results = {"build": time.perf_counter() - start}
+    print(f"   build: {results['build'] * 1e3:8.0f} ms")
+
+    for zoom in zooms:
+        centers = [
+            (random.uniform(min_lon, max_lon), random.uniform(min_lat, max_lat))
+            for _ in range(queries)
+        ]
+        start = time.perf_counter()
+        found = [
+            clusters.query(*_viewport(lon, lat, zoom), zoom) for lon, lat in centers
+        ]
+        results[zoom] = (time.perf_counter() - start) / queries
+        items = sum(len(c) + len(p) for c, p in found) / queries
+        print(
+            f"zoom {zoom:>3}: {results[zoom] * 1e3:8.3f} ms per query, {items:.0f} items"
+        )
+
+    changes = [
+        (random.randrange(stations), random.choice(STATUSES)) for _ in range(1000)
+    ]
+    start = time.perf_counter()
+    for point, tag in changes:
+        clusters.set_tag(point, tag)
+    results["set_tag"] = (time.perf_counter() - start) / len(changes)
+    print(f" set_tag: {results['set_tag'] * 1e3:8.3f} ms per status change")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the station clusters.")
+    parser.add_argument("--stations", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--zooms", type=int, nargs="+", default=[8, 10, 11, 13, 15, 17])
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.queries, args.zooms)
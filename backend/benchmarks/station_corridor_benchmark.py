@@ -0,0 +1,120 @@
+"""Benchmark of the corridor search of charging stations along a route.
+
+Builds a `StationIndex` over random stations spread over Berlin and finds
+the stations along random routes, once by measuring every station against
+every segment of the route and once with the route pieces queried in the
+R-tree of the index, and prints the time per search.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_corridor_benchmark --stations 100000 --width 1000
+    ```
+"""
+
+import argparse
+import math
+import random
+import time
+
+from app.domain.geometry.corridor import RouteCorridor
+from app.domain.geometry.polygon import METERS_PER_DEGREE
+from app.domain.geometry.station_index import StationIndex
+from benchmarks.station_bbox_benchmark import BERLIN_BBOX
+
+
+def _along_route_linear(stations: list, route: list, distance: float) -> list:
+    corridor = RouteCorridor(route, distance)
+    found = []
+    for station in stations:
+        measured = [
+            corridor.measure(segment, station["longitude"], station["latitude"])
+            for segment in range(len(route) - 1)
+        ]
+        measured = [item for item in measured if item is not None]
+        if measured:
+            from_route, offset = min(measured)
+            found.append((offset, from_route, station["id"]))
+    return [station_id for _, _, station_id in sorted(found)]
+
+
+def _random_route(length: float, points: int) -> list:
+    """
+    A random walk of the given length in meters, turning at most 60 degrees
+    per point and kept inside Berlin.
+    """
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    lon, lat = random.uniform(13.3, 13.55), random.uniform(52.45, 52.58)
+    heading = random.uniform(0, 2 * math.pi)
+    step = length / (points - 1)
+    route = [(lon, lat)]
+    for _ in range(points - 1):
+        heading += random.uniform(-math.pi / 3, math.pi / 3)
+        lon += (
+            step * math.cos(heading) / (METERS_PER_DEGREE * math.cos(math.radians(lat)))
+        )
+        lat += step * math.sin(heading) / METERS_PER_DEGREE
+        lon, lat = min(max(lon, min_lon), max_lon), min(max(lat, min_lat), max_lat)
+        route.append((lon, lat))
+    return route
+
+
+def run_benchmark(
+    stations: int, width: float, length: float, points: int, searches: int
+) -> dict:
+    """
+    Search the stations along random routes with both methods and measure the time.
+
+    Args:
+        stations (int): Number of random stations.
+        width (float): Width of the corridor in meters.
+        length (float): Length of the routes in meters.
+        points (int): Number of points per route.
+        searches (int): Number of random routes.
+
+    Returns:
+        dict: Seconds per search by method.
+    """
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    rows = [
+        {
+            "id": index,
+            "longitude": random.uniform(min_lon, max_lon),
+            "latitude": random.uniform(min_lat, max_lat),
+            "functional": "operational",
+        }
+        for index in range(stations)
+    ]
+    routes = [_random_route(length, points) for _ in range(searches)]
+    index = StationIndex(rows)
+    index.rtree  # built on first use, not part of the searches
+
+    methods = {
+        "linear": lambda route: _along_route_linear(rows, route, width / 2),
+        "pieces": lambda route: [
+            station["id"] for _, _, station in index.along_route(route, width / 2)
+        ],
+    }
+    results = {}
+    found = {}
+    for name, method in methods.items():
+        start = time.perf_counter()
+        found[name] = [method(route) for route in routes]
+        results[name] = (time.perf_counter() - start) / searches
+        print(f"{name:>8}: {results[name] * 1e3:8.3f} ms per search")
+    assert found["linear"] == found["pieces"]
+    matches = sum(len(ids) for ids in found["linear"]) / searches
+    print(f"  {matches:.0f} stations per search")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the corridor search.")
+    parser.add_argument("--stations", type=int, default=100000)
+    parser.add_argument("--width", type=float, default=1000)
+    parser.add_argument("--length", type=float, default=30000)
+    parser.add_argument("--points", type=int, default=60)
+    parser.add_argument("--searches", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.width, args.length, args.points, args.searches)
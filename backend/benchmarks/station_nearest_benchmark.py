@@ -0,0 +1,99 @@
+"""Benchmark of the nearest charging station search.
+
+Builds a `StationIndex` over random stations spread over Berlin and finds
+the closest stations of random positions, once by computing the haversine
+distance to every station and once with the KD-tree of the index, and
+prints the time per search.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_nearest_benchmark --stations 100000 --k 10
+    ```
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.station_index import StationIndex
+from benchmarks.station_bbox_benchmark import BERLIN_BBOX
+
+STATUSES = ["operational", "used", "malfunctioning"]
+
+
+def _nearest_linear(stations: list, lon: float, lat: float, k: int, status) -> list:
+    return heapq.nsmallest(
+        k,
+        (
+            (haversine_distance(lon, lat, s["longitude"], s["latitude"]), s["id"])
+            for s in stations
+            if status is None or s["functional"] in status
+        ),
+    )
+
+
+def run_benchmark(stations: int, k: int, searches: int) -> dict:
+    """
+    Search the closest stations with both methods and measure the time.
+
+    Args:
+        stations (int): Number of random stations.
+        k (int): Number of stations per search.
+        searches (int): Number of random positions.
+
+    Returns:
+        dict: Seconds per search by method and the build time of the index.
+    """
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    rows = [
+        {
+            "id": index,
+            "longitude": random.uniform(min_lon, max_lon),
+            "latitude": random.uniform(min_lat, max_lat),
+            "functional": random.choices(STATUSES, weights=[8, 1, 1])[0],
+        }
+        for index in range(stations)
+    ]
+    positions = [
+        (random.uniform(min_lon, max_lon), random.uniform(min_lat, max_lat))
+        for _ in range(searches)
+    ]
+
+    start = time.perf_counter()
+    index = StationIndex(rows)
+    build_seconds = time.perf_counter() - start
+
+    results = {"build": build_seconds}
+    for status in (None, ["malfunctioning"]):
+        found = {}
+        methods = {
+            "linear": lambda lon, lat: [
+                station_id
+                for _, station_id in _nearest_linear(rows, lon, lat, k, status)
+            ],
+            "kdtree": lambda lon, lat: [
+                station["id"] for _, station in index.nearest(lon, lat, k, status)
+            ],
+        }
+        for name, method in methods.items():
+            start = time.perf_counter()
+            found[name] = [method(lon, lat) for lon, lat in positions]
+            seconds = (time.perf_counter() - start) / searches
+            results[f"{name} {status or 'all'}"] = seconds
+            print(f"{name:>8}: {seconds * 1e3:8.3f} ms per search, status {status}")
+        assert found["linear"] == found["kdtree"]
+    print(f"   index: {build_seconds * 1000:.0f} ms to build")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the nearest search.")
+    parser.add_argument("--stations", type=int, default=100000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--searches", type=int, default=50)
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.k, args.searches)
@@ -0,0 +1,100 @@
+"""Benchmark of the radius search of charging stations.
+
+Fills `GeohashGrid`s of several precisions with random stations spread over
+Berlin and searches the stations within a radius of random positions, once
+by computing the haversine distance to every station and once per grid,
+and prints the time per search with the number of cells touched.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_radius_benchmark --stations 100000 --radius 2000
+    ```
+"""
+
+import argparse
+import random
+import time
+
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.geohash_grid import GeohashGrid
+from benchmarks.station_bbox_benchmark import BERLIN_BBOX
+
+
+def _within_linear(points: list, lon: float, lat: float, radius: float) -> list:
+    found = []
+    for key, (point_lon, point_lat) in enumerate(points):
+        distance = haversine_distance(lon, lat, point_lon, point_lat)
+        if distance <= radius:
+            found.append((distance, key))
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def run_benchmark(
+    stations: int, radius: float, searches: int, precisions: list[int]
+) -> dict:
+    """
+    Search the stations within a radius with all methods and measure the time.
+
+    Args:
+        stations (int): Number of random stations.
+        radius (float): Radius of the searches in meters.
+        searches (int): Number of random positions.
+        precisions (list[int]): Geohash precisions of the grids.
+
+    Returns:
+        dict: Seconds per search by method.
+    """
+    random.seed(0)
+    min_lon, min_lat, max_lon, max_lat = BERLIN_BBOX
+    points = [
+        (random.uniform(min_lon, max_lon), random.uniform(min_lat, max_lat))
+        for _ in range(stations)
+    ]
+    positions = [
+        (random.uniform(min_lon, max_lon), random.uniform(min_lat, max_lat))
+        for _ in range(searches)
+    ]
+
+    methods = {"linear": lambda lon, lat: _within_linear(points, lon, lat, radius)}
+    cells = {}
+    for precision in precisions:
+        grid = GeohashGrid(precision)
+        start = time.perf_counter()
+        for key, (lon, lat) in enumerate(points):
+            grid.add(key, lon, lat)
+        print(
+            f"  grid {precision}: {(time.perf_counter() - start) * 1000:.0f} ms to fill"
+        )
+        methods[f"grid {precision}"] = lambda lon, lat, grid=grid: grid.within(
+            lon, lat, radius
+        )
+        cells[f"grid {precision}"] = sum(
+            len(grid.cells_within(lon, lat, radius)) for lon, lat in positions
+        )
+
+    results = {}
+    found = {}
+    for name, method in methods.items():
+        start = time.perf_counter()
+        found[name] = [
+            sorted(key for _, key in method(lon, lat)) for lon, lat in positions
+        ]
+        results[name] = (time.perf_counter() - start) / searches
+        touched = f", {cells[name] / searches:.0f} cells" if name in cells else ""
+        print(f"{name:>8}: {results[name] * 1e3:8.3f} ms per search{touched}")
+        assert found[name] == found["linear"]
+    matches = sum(len(keys) for keys in found["linear"]) / searches
+    print(f"  {matches:.0f} stations per search")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the radius search.")
+    parser.add_argument("--stations", type=int, default=100000)
+    parser.add_argument("--radius", type=float, default=2000)
+    parser.add_argument("--searches", type=int, default=50)
+    parser.add_argument("--precisions", type=int, nargs="+", default=[5, 6, 7])
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.radius, args.searches, args.precisions)
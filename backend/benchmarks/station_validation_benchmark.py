@@ -0,0 +1,99 @@
+"""Benchmark of the batch validation against the single-row rules.
+
+Parses a synthetic register without validation and checks the rows once
+with the static validators of `ChargingStation` row by row, and once with
+the batch validator, from row mappings and from prepared columns.
+
+Usage:
+    ```bash
+    python -m benchmarks.station_validation_benchmark --rows 100000
+    ```
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import timeit
+
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.validation.charging_station_batch import (
+    station_columns,
+    validate_station_columns,
+    validate_station_rows,
+)
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+)
+from benchmarks.synthetic_register import write_synthetic_register
+
+POSTAL_CODES = [10115, 10117, 10119, 10178, 10179]
+
+
+def _validate_rows_one_by_one(rows: list[dict]) -> int:
+    rejected = 0
+    for values in rows:
+        if not (
+            ChargingStation.is_valid_latitude(values["latitude"])
+            and ChargingStation.is_valid_longitude(values["longitude"])
+            and ChargingStation.is_valid_nominal_power(values["nominal_power"])
+            and ChargingStation.is_valid_num_charging_points(
+                values["num_charging_points"]
+            )
+            and ChargingStation.is_valid_operator(values["operator"])
+            and ChargingStation.is_valid_address_suffix(values["address_suffix"])
+        ):
+            rejected += 1
+    return rejected
+
+
+def _read_rows(file_path: str) -> list[dict]:
+    rows = []
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        for row in csv.DictReader(csvfile, delimiter=";"):
+            try:
+                rows.append(
+                    parse_charging_station_row(row, set(POSTAL_CODES), validate=False)
+                )
+            except ChargingStationRowError:
+                continue
+    return rows
+
+
+def run_benchmark(rows: int, repeat: int) -> dict:
+    """
+    Validate a synthetic batch with every method and measure the best time.
+
+    Args:
+        rows (int): Number of stations in the batch.
+        repeat (int): Number of runs per method, the fastest counts.
+
+    Returns:
+        dict: Seconds per method.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        register_path = os.path.join(tmp_dir, "register.csv")
+        write_synthetic_register(register_path, rows, POSTAL_CODES)
+        batch = _read_rows(register_path)
+    columns = station_columns(batch)
+
+    methods = {
+        "row by row": lambda: _validate_rows_one_by_one(batch),
+        "batch (rows)": lambda: validate_station_rows(batch),
+        "batch (columns)": lambda: validate_station_columns(columns),
+    }
+    results = {}
+    for name, method in methods.items():
+        results[name] = min(timeit.repeat(method, number=1, repeat=repeat))
+        print(f"{name:>16}: {results[name] * 1000:7.1f} ms for {len(batch)} rows")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the batch validation.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.repeat)
@@ -0,0 +1,79 @@
+"""Synthetic charging station registers for the benchmarks.
+
+Functions:
+    write_synthetic_register: write a register with random stations in Berlin
+"""
+
+import csv
+import random
+
+from app.infrastructure.ingestion.charging_station_rows import (
+    COLUMN_ADDRESS_SUFFIX,
+    COLUMN_CHARGING_TYPE,
+    COLUMN_HOUSE_NUMBER,
+    COLUMN_LATITUDE,
+    COLUMN_LONGITUDE,
+    COLUMN_NOMINAL_POWER,
+    COLUMN_NUM_CHARGING_POINTS,
+    COLUMN_OPERATOR,
+    COLUMN_POSTAL_CODE,
+    COLUMN_STREET,
+)
+
+BERLIN_BBOX = (52.34, 13.09, 52.67, 13.76)  # min lat, min lon, max lat, max lon
+
+
+def _german_decimal(value: float, digits: int) -> str:
+    return f"{value:.{digits}f}".replace(".", ",")
+
+
+def write_synthetic_register(
+    file_path: str, rows: int, postal_codes: list[int], seed: int = 0
+) -> None:
+    """
+    Write a register in the format of the Ladesäulenregister.
+
+    Args:
+        file_path (str): Path of the CSV file to write.
+        rows (int): Number of stations.
+        postal_codes (list[int]): Postal codes to draw the stations from.
+        seed (int): Seed of the random generator, equal seeds give equal files.
+    """
+    generator = random.Random(seed)
+    min_lat, min_lon, max_lat, max_lon = BERLIN_BBOX
+    columns = [
+        COLUMN_OPERATOR,
+        COLUMN_STREET,
+        COLUMN_HOUSE_NUMBER,
+        COLUMN_ADDRESS_SUFFIX,
+        COLUMN_POSTAL_CODE,
+        "Ort",
+        "Bundesland",
+        COLUMN_LATITUDE,
+        COLUMN_LONGITUDE,
+        COLUMN_NOMINAL_POWER,
+        COLUMN_CHARGING_TYPE,
+        COLUMN_NUM_CHARGING_POINTS,
+    ]
+
+    with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile, delimiter=";")
+        writer.writerow(columns)
+        for index in range(rows):
+            fast = generator.random() < 0.2
+            writer.writerow(
+                [
+                    f"Operator {generator.randrange(250)}",
+                    f"Straße {generator.randrange(5000)}",
+                    str(generator.randrange(1, 200)),
+                    "Parkhaus" if generator.random() < 0.1 else "",
+                    str(generator.choice(postal_codes)),
+                    "Berlin",
+                    "Berlin",
+                    _german_decimal(generator.uniform(min_lat, max_lat), 6),
+                    _german_decimal(generator.uniform(min_lon, max_lon), 6),
+                    _german_decimal(150.0 if fast else 22.0, 1),
+                    "Schnellladeeinrichtung" if fast else "Normalladeeinrichtung",
+                    str(generator.randrange(1, 5)),
+                ]
+            )
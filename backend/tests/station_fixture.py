@@ -0,0 +1,59 @@
+"""Test case with a test app whose charging stations are loaded from registers."""
+
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.bulk_loader import bulk_load_charging_stations
+from tests.test_ingestion.register_csv import write_register_csv
+
+
+def coordinates(lon: float, lat: float) -> dict:
+    """
+    Get the register columns of a position.
+    """
+    return {
+        "Breitengrad": str(lat).replace(".", ","),
+        "Längengrad": str(lon).replace(".", ","),
+    }
+
+
+class StationFixtureTestCase(unittest.TestCase):
+    """
+    Test case with a test app whose stations are loaded from registers.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app, a test client and a directory for the registers.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.client = self.app.test_client()
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def load_stations(self, *rows: dict) -> list[int]:
+        """
+        Bulk load the rows from a new register, needs an app context.
+
+        Returns:
+            list[int]: Ids of all stored stations in ascending order.
+        """
+        csv_path = os.path.join(
+            self.tmp_dir.name, f"register_{len(os.listdir(self.tmp_dir.name))}.csv"
+        )
+        write_register_csv(csv_path, list(rows))
+        bulk_load_charging_stations(self.app, csv_path, append=True)
+        return [station.id for station in ChargingStation.query.order_by("id")]
@@ -106,6 +106,36 @@ class TestChargingStationOperations(unittest.TestCase):
                 station_updated = db.session.query(ChargingStation).first()
                 self.assertEqual(str(station_updated.functional).upper(), "USED")
 
+    def test_bulk_insert_charging_stations(self):
+        """
+        Test inserting charging stations from plain column mappings.
+        """
+        rows = [
+            {
+                "functional": OperationStatus.OPERATIONAL,
+                "postal_code_id": 10117,
+                "street": f"Bulk Street {i}",
+                "house_number": str(i),
+                "latitude": 52.51,
+                "longitude": 13.39,
+                "operator": "Operator C",
+                "address_suffix": None,
+                "nominal_power": 11,
+                "charging_type": ChargingType.NORMAL,
+                "num_charging_points": 2,
+            }
+            for i in range(3)
+        ]
+        with self.app.app_context():
+            with ChargingStationOperations() as repository:
+                repository.bulk_insert_charging_stations(rows)
+                repository.bulk_insert_charging_stations([])
+                repository.session.commit()
+
+                stations = repository.get_charging_stations_by_postal_code(10117)
+                self.assertEqual(len(stations), 3)
+                self.assertEqual(stations[0]["functional"], "operational")
+
 
 if __name__ == "__main__":
     unittest.main()
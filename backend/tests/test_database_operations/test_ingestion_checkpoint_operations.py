@@ -0,0 +1,49 @@
+import unittest
+
+from app import create_app
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.ingestion_checkpoint_operations import (
+    IngestionCheckpointOperations,
+)
+
+
+class TestIngestionCheckpointOperations(unittest.TestCase):
+    """
+    Integration tests for the `IngestionCheckpointOperations` class.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app and database for testing.
+        """
+        self.app = create_app(config_class="app.config.TestingConfigSimple")
+        self.app.testing = True
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_save_and_get_checkpoint(self):
+        """
+        Test creating and updating a checkpoint.
+        """
+        with self.app.app_context():
+            with IngestionCheckpointOperations() as repository:
+                self.assertIsNone(repository.get_checkpoint("test"))
+
+                repository.save_checkpoint("test", "a" * 64, 100, 10)
+                repository.save_checkpoint("test", "a" * 64, 250, 25, completed=True)
+                repository.session.commit()
+
+                checkpoint = repository.get_checkpoint("test")
+                self.assertEqual(checkpoint.byte_offset, 250)
+                self.assertEqual(checkpoint.rows_committed, 25)
+                self.assertTrue(checkpoint.completed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from app import create_app
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES
 from app.domain.entities.templates.base import db
 from app.infrastructure.database_operations.postal_code_operations import (
     PostalCodeOperations,
@@ -63,6 +64,32 @@ class TestPostalCodeOperations(unittest.TestCase):
                 # Empty postal code
                 self.assertFalse(repository.is_valid(""))
 
+    def test_get_all_postal_code_numbers(self):
+        """
+        Test retrieving all postal code numbers at once.
+        """
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                numbers = repository.get_all_postal_code_numbers()
+
+                self.assertEqual(len(numbers), 190)
+                self.assertIn(10115, numbers)
+                self.assertNotIn(99999, numbers)
+
+    def test_get_postal_code_geometries(self):
+        """
+        Test that the parsed polygons come from the process-wide store.
+        """
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                geometries = repository.get_postal_code_geometries()
+                again = repository.get_postal_code_geometries()
+
+        self.assertEqual(len(geometries), 190)
+        self.assertIs(again[10115], geometries[10115])
+        self.assertIs(POSTAL_CODE_GEOMETRIES.peek(10115), geometries[10115])
+        self.assertGreaterEqual(POSTAL_CODE_GEOMETRIES.info()["entries"], 190)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,41 @@
+"""Unit tests for the District entity.
+
+Classes:
+    - TestDistrict: Tests for District validation and the derived geometry columns.
+"""
+
+import unittest
+
+from app.domain.entities.district import District, DistrictValidationError
+
+POLYGON = "POLYGON ((13.3 52.5, 13.4 52.5, 13.4 52.6, 13.3 52.6, 13.3 52.5))"
+
+
+class TestDistrict(unittest.TestCase):
+    """
+    Tests for District validation and instance creation.
+    """
+
+    def test_valid_district_creation(self):
+        """
+        Test that a district stores its boundary and geometry columns.
+        """
+        district = District(name="Mitte", polygon=POLYGON)
+
+        self.assertEqual(district.name, "Mitte")
+        self.assertEqual(district.polygon, POLYGON)
+        self.assertEqual((district.min_longitude, district.max_latitude), (13.3, 52.6))
+        self.assertGreater(district.area, 0)
+
+    def test_invalid_district(self):
+        """
+        Test that empty names and invalid boundaries raise errors.
+        """
+        with self.assertRaises(DistrictValidationError):
+            District(name=" ", polygon=POLYGON)
+        with self.assertRaises(DistrictValidationError):
+            District(name="Mitte", polygon="POLYGON ((13.3 52.5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -91,6 +91,41 @@ class TestPostalCodeData(unittest.TestCase):
             "POLYGON ((13.426850722330673 52.5447395629012, 13.427585122330674 52.5446708929012))",
         )
 
+    def test_geometry_columns(self):
+        """
+        Test that the polygon is parsed into bounding box, centroid and vertex count.
+        """
+        postal_code = PostalCode(
+            number=10405,
+            polygon="POLYGON ((13.4 52.5, 13.5 52.5, 13.5 52.6, 13.4 52.6, 13.4 52.5))",
+        )
+        self.assertEqual(postal_code.min_longitude, 13.4)
+        self.assertEqual(postal_code.max_latitude, 52.6)
+        self.assertAlmostEqual(postal_code.centroid_longitude, 13.45)
+        self.assertAlmostEqual(postal_code.centroid_latitude, 52.55)
+        self.assertAlmostEqual(postal_code.area / 1e6, 75.2, places=1)
+        self.assertEqual(postal_code.vertex_count, 5)
+
+    def test_geometry(self):
+        """
+        Test that the parsed polygon is memoized until the polygon changes.
+        """
+        postal_code = PostalCode(
+            number=10405,
+            polygon="POLYGON ((13.4 52.5, 13.5 52.5, 13.5 52.6, 13.4 52.6, 13.4 52.5))",
+        )
+
+        geometry = postal_code.geometry
+        self.assertIs(postal_code.geometry, geometry)
+        self.assertEqual(geometry.bbox, (13.4, 52.5, 13.5, 52.6))
+        self.assertEqual(list(geometry.polygons[0][0][:2]), [13.4, 52.5])
+        self.assertTrue(geometry.contains(13.45, 52.55))
+
+        postal_code.set_geometry(
+            "POLYGON ((13.3 52.5, 13.5 52.5, 13.5 52.6, 13.3 52.6, 13.3 52.5))"
+        )
+        self.assertEqual(postal_code.geometry.bbox[0], 13.3)
+
     def test_invalid_postal_code_number(self):
         """
         Test creating a PostalCode with an invalid number.
@@ -0,0 +1,108 @@
+import unittest
+
+from app.domain.entities.charging_station import (
+    ChargingStation,
+    ChargingType,
+    OperationStatus,
+)
+from app.domain.entities.templates.base import db
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+VIEWPORT = {"min_lat": 52.52, "min_lon": 13.40, "max_lat": 52.53, "max_lon": 13.41}
+
+
+class TestBboxChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `bbox_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with two stations inside and one outside the viewport.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.station_ids = self.load_stations(
+                make_register_row(0, **coordinates(13.405, 52.525)),
+                make_register_row(1, **coordinates(13.41, 52.52)),
+                make_register_row(2, **coordinates(13.5, 52.525)),
+            )
+
+    def bbox_ids(self, **viewport) -> list[int]:
+        response = self.client.get(
+            "/api/charging_stations/bbox", query_string=viewport or VIEWPORT
+        )
+        self.assertEqual(response.status_code, 200)
+        return sorted(station["id"] for station in response.json["stations"])
+
+    def test_stations_in_viewport(self):
+        """
+        Test that the stations inside the box, borders included, are returned.
+        """
+        response = self.client.get("/api/charging_stations/bbox", query_string=VIEWPORT)
+
+        self.assertEqual(response.status_code, 200)
+        stations = sorted(response.json["stations"], key=lambda station: station["id"])
+        self.assertEqual([station["id"] for station in stations], self.station_ids[:2])
+        self.assertEqual(stations[0]["latitude"], 52.525)
+        self.assertEqual(stations[0]["functional"], "operational")
+
+    def test_index_follows_changes(self):
+        """
+        Test that status changes, new stations and deleted stations are visible.
+        """
+        self.assertEqual(self.bbox_ids(), self.station_ids[:2])
+
+        response = self.client.post(
+            "/api/charging_stations/change_status",
+            query_string={"station_id": self.station_ids[0], "new_status": "used"},
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get("/api/charging_stations/bbox", query_string=VIEWPORT)
+        functional = {
+            station["id"]: station["functional"]
+            for station in response.json["stations"]
+        }
+        self.assertEqual(functional[self.station_ids[0]], "used")
+
+        with self.app.app_context():
+            station = ChargingStation(
+                functional=OperationStatus.OPERATIONAL,
+                postal_code_id=10115,
+                street="Sample Street",
+                house_number="1",
+                latitude=52.521,
+                longitude=13.401,
+                operator="Operator A",
+                charging_type=ChargingType.FAST,
+                num_charging_points=2,
+                nominal_power=50,
+            )
+            db.session.add(station)
+            db.session.delete(db.session.get(ChargingStation, self.station_ids[1]))
+            db.session.commit()
+            new_id = station.id
+
+        self.assertEqual(self.bbox_ids(), [self.station_ids[0], new_id])
+
+    def test_invalid_boxes(self):
+        """
+        Test that missing, invalid and inverted boxes are rejected.
+        """
+        for viewport in (
+            {"min_lat": 52.52, "min_lon": 13.40, "max_lat": 52.53},
+            {**VIEWPORT, "min_lat": "north"},
+            {**VIEWPORT, "max_lon": 181},
+            {**VIEWPORT, "min_lat": 52.54},
+        ):
+            response = self.client.get(
+                "/api/charging_stations/bbox", query_string=viewport
+            )
+            self.assertEqual(response.status_code, 400, viewport)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+
+from app.domain.entities.station_catchment import StationCatchment
+from app.domain.entities.templates.base import db
+from app.domain.geometry.caches import STATION_CATCHMENTS, STATION_INDEX
+from app.domain.geometry.prepared_polygon import PreparedPolygon
+from app.domain.geometry.wkt import parse_wkt_polygons
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+MITTE = (13.4, 52.52)
+SPANDAU = (13.2, 52.535)
+KREUZBERG = (13.42, 52.49)
+
+
+class TestCatchmentChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `catchment_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with a station in Mitte and one in Spandau.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.mitte, self.spandau = self.load_stations(
+                make_register_row(0, **coordinates(*MITTE)),
+                make_register_row(1, **coordinates(*SPANDAU)),
+            )
+
+    def catchments(self) -> dict:
+        response = self.client.get("/api/charging_stations/catchments")
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["message"], "Successfully computed catchments.")
+        return {
+            tuple(catchment["station_ids"]): catchment
+            for catchment in data["catchments"]
+        }
+
+    def assert_contains(self, catchment: dict, lon: float, lat: float) -> None:
+        prepared = PreparedPolygon(parse_wkt_polygons(catchment["polygon"]))
+        self.assertTrue(prepared.contains(lon, lat))
+
+    def test_catchments_cover_berlin(self):
+        """
+        Test that the catchments split Berlin and contain their stations.
+        """
+        catchments = self.catchments()
+
+        self.assertEqual(catchments.keys(), {(self.mitte,), (self.spandau,)})
+        self.assert_contains(catchments[(self.mitte,)], *MITTE)
+        self.assert_contains(catchments[(self.spandau,)], *SPANDAU)
+        total = sum(catchment["area"] for catchment in catchments.values())
+        self.assertAlmostEqual(total / 1e6, 889, delta=10)
+        self.assertGreater(
+            catchments[(self.mitte,)]["area"], catchments[(self.spandau,)]["area"]
+        )
+
+    def test_malfunctioning_stations_have_no_catchment(self):
+        """
+        Test that a station reported as malfunctioning gives its area to its neighbours.
+        """
+        total = sum(catchment["area"] for catchment in self.catchments().values())
+
+        response = self.client.post(
+            "/api/charging_stations/change_status"
+            f"?station_id={self.mitte}&new_status=malfunctioning"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        catchments = self.catchments()
+        self.assertEqual(list(catchments), [(self.spandau,)])
+        self.assertAlmostEqual(catchments[(self.spandau,)]["area"] / total, 1, places=5)
+        self.assert_contains(catchments[(self.spandau,)], *MITTE)
+
+    def test_added_stations(self):
+        """
+        Test that inserted stations get a catchment from their neighbours.
+        """
+        before = self.catchments()
+        with self.app.app_context():
+            *_, kreuzberg = self.load_stations(
+                make_register_row(2, postal_code="10999", **coordinates(*KREUZBERG))
+            )
+
+        catchments = self.catchments()
+        self.assertEqual(len(catchments), 3)
+        self.assert_contains(catchments[(kreuzberg,)], *KREUZBERG)
+        self.assertLess(
+            catchments[(self.mitte,)]["area"], before[(self.mitte,)]["area"]
+        )
+        self.assertAlmostEqual(
+            sum(catchment["area"] for catchment in catchments.values())
+            / sum(catchment["area"] for catchment in before.values()),
+            1,
+            places=5,
+        )
+
+    def store_catchments(self) -> None:
+        result = self.app.test_cli_runner().invoke(args=["catchments"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("2 catchments covering", result.output)
+        # A new index of the same stations, as in another process
+        STATION_INDEX.invalidate()
+
+    def test_stored_catchments_are_served(self):
+        """
+        Test that the catchments stored by `flask catchments` are served.
+        """
+        self.store_catchments()
+        with self.app.app_context():
+            stored = db.session.query(StationCatchment).order_by("id").all()
+            self.assertEqual(
+                [row.station_ids for row in stored],
+                [str(self.mitte), str(self.spandau)],
+            )
+            # Mark the stored area to tell it from a computed one
+            stored[0].area = 1.0
+            db.session.commit()
+
+        catchments = self.catchments()
+        self.assertEqual(catchments[(self.mitte,)]["area"], 1.0)
+        self.assert_contains(catchments[(self.spandau,)], *SPANDAU)
+
+    def test_stored_catchments_of_changed_stations(self):
+        """
+        Test that the catchments are computed again once the stations changed.
+        """
+        self.store_catchments()
+
+        response = self.client.post(
+            "/api/charging_stations/change_status"
+            f"?station_id={self.mitte}&new_status=malfunctioning"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        catchments = self.catchments()
+        self.assertEqual(list(catchments), [(self.spandau,)])
+        self.assert_contains(catchments[(self.spandau,)], *MITTE)
+
+    def test_stored_catchments_are_updated(self):
+        """
+        Test that the cells behind the served catchments are computed in the
+        background and updated by the next change of the stations.
+        """
+        self.store_catchments()
+        self.catchments()
+        self.assertTrue(STATION_CATCHMENTS.wait(timeout=60))
+        builds = STATION_CATCHMENTS.builds
+
+        response = self.client.post(
+            "/api/charging_stations/change_status"
+            f"?station_id={self.mitte}&new_status=malfunctioning"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        catchments = self.catchments()
+        self.assertEqual(list(catchments), [(self.spandau,)])
+        self.assert_contains(catchments[(self.spandau,)], *MITTE)
+        self.assertEqual(STATION_CATCHMENTS.builds, builds)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+VIEWPORT = {"min_lat": 52.33, "min_lon": 13.08, "max_lat": 52.68, "max_lon": 13.77}
+
+
+class TestClusterChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `cluster_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with three stations in Mitte and one in Spandau.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.mitte = self.load_stations(
+                make_register_row(0, **coordinates(13.400, 52.520)),
+                make_register_row(1, **coordinates(13.401, 52.521)),
+                make_register_row(2, **coordinates(13.402, 52.519)),
+                make_register_row(3, **coordinates(13.200, 52.535)),
+            )
+            self.spandau = self.mitte.pop()
+
+    def clusters(self, **args) -> dict:
+        response = self.client.get(
+            "/api/charging_stations/clusters",
+            query_string={**VIEWPORT, **args},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json
+
+    def test_clusters_per_zoom(self):
+        """
+        Test that nearby stations are clustered when zoomed out and single when zoomed in.
+        """
+        result = self.clusters(zoom=11)
+        self.assertEqual(len(result["clusters"]), 1)
+        cluster = result["clusters"][0]
+        self.assertEqual(cluster["count"], 3)
+        self.assertEqual(cluster["statuses"], {"operational": 3})
+        self.assertAlmostEqual(cluster["longitude"], 13.401, places=4)
+        self.assertEqual(
+            [station["id"] for station in result["stations"]], [self.spandau]
+        )
+
+        result = self.clusters(zoom=18)
+        self.assertEqual(result["clusters"], [])
+        self.assertEqual(
+            sorted(station["id"] for station in result["stations"]),
+            self.mitte + [self.spandau],
+        )
+
+        self.assertEqual(len(self.clusters(zoom=2)["clusters"]), 1)
+        self.assertEqual(self.clusters(zoom=2)["clusters"][0]["count"], 4)
+
+    def test_status_change_updates_the_cluster(self):
+        """
+        Test that a status change is reflected in the counts of the clusters.
+        """
+        self.clusters(zoom=11)
+        response = self.client.post(
+            "/api/charging_stations/change_status",
+            query_string={"station_id": self.mitte[1], "new_status": "malfunctioning"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        cluster = self.clusters(zoom=11)["clusters"][0]
+        self.assertEqual(cluster["statuses"], {"operational": 2, "malfunctioning": 1})
+
+    def test_invalid_arguments(self):
+        """
+        Test that missing and invalid arguments are rejected.
+        """
+        for args in (
+            VIEWPORT,
+            {**VIEWPORT, "zoom": "far"},
+            {**VIEWPORT, "zoom": 30},
+            {**VIEWPORT, "zoom": 10, "min_lat": "south"},
+            {**VIEWPORT, "zoom": 10, "min_lat": 53},
+        ):
+            response = self.client.get(
+                "/api/charging_stations/clusters", query_string=args
+            )
+            self.assertEqual(response.status_code, 400, args)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+# About 17 km from Spandau to Friedrichshain along 52.52° N
+ROUTE = [[52.52, 13.20], [52.52, 13.325], [52.52, 13.45]]
+
+
+class TestCorridorChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `corridor_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with stations 390 m, 220 m and 1.7 km from the route.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.late, self.early, self.off_route = self.load_stations(
+                make_register_row(0, **coordinates(13.40, 52.5235)),
+                make_register_row(1, **coordinates(13.25, 52.518)),
+                make_register_row(2, **coordinates(13.30, 52.535)),
+            )
+
+    def corridor(self, **body) -> list[dict]:
+        response = self.client.post(
+            "/api/charging_stations/corridor",
+            json={"route": ROUTE, "width_m": 1000, **body},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json["stations"]
+
+    def test_stations_in_driving_order(self):
+        """
+        Test that the stations in the corridor are returned in driving order.
+        """
+        stations = self.corridor()
+
+        self.assertEqual(
+            [station["id"] for station in stations], [self.early, self.late]
+        )
+        self.assertAlmostEqual(stations[0]["distance"], 222, delta=2)
+        self.assertAlmostEqual(stations[1]["distance"], 389, delta=2)
+        self.assertAlmostEqual(stations[0]["route_position"], 3390, delta=20)
+        self.assertAlmostEqual(stations[1]["route_position"], 13560, delta=50)
+
+        wide = self.corridor(width_m=4000)
+        self.assertEqual(
+            [station["id"] for station in wide],
+            [self.early, self.off_route, self.late],
+        )
+
+    def test_reversed_route(self):
+        """
+        Test that the order follows the direction of the route.
+        """
+        stations = self.corridor(route=ROUTE[::-1])
+        self.assertEqual(
+            [station["id"] for station in stations], [self.late, self.early]
+        )
+
+    def test_invalid_body(self):
+        """
+        Test that missing and invalid arguments are rejected.
+        """
+        for body in (
+            None,
+            {"route": ROUTE},
+            {"route": [[52.52, 13.2]], "width_m": 1000},
+            {"route": [[52.52, 13.2], [52.52]], "width_m": 1000},
+            {"route": [[52.52, 13.2], [95, 13.3]], "width_m": 1000},
+            {"route": "52.52,13.2;52.52,13.3", "width_m": 1000},
+            {"route": ROUTE, "width_m": 0},
+            {"route": ROUTE, "width_m": 50000},
+            {"route": ROUTE, "width_m": True},
+            {"route": ROUTE, "width_m": "wide"},
+        ):
+            response = self.client.post("/api/charging_stations/corridor", json=body)
+            self.assertEqual(response.status_code, 400, body)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from app.domain.geometry.caches import STATION_FEATURES
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+
+class TestGeojsonChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `geojson_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with a station in Mitte and one in Spandau.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.mitte, self.spandau = self.load_stations(
+                make_register_row(0, **coordinates(13.4, 52.52)),
+                make_register_row(1, **coordinates(13.2, 52.535)),
+            )
+
+    def features(self) -> dict:
+        response = self.client.get("/api/charging_stations/geojson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/geo+json")
+        collection = response.get_json()
+        self.assertEqual(collection["type"], "FeatureCollection")
+        return {feature["id"]: feature for feature in collection["features"]}
+
+    def test_stations(self):
+        """
+        Test that every station is a point with its attributes as properties.
+        """
+        features = self.features()
+
+        self.assertEqual(features.keys(), {self.mitte, self.spandau})
+        mitte = features[self.mitte]
+        self.assertEqual(
+            mitte["geometry"], {"type": "Point", "coordinates": [13.4, 52.52]}
+        )
+        self.assertEqual(mitte["properties"]["functional"], "operational")
+        self.assertEqual(mitte["properties"]["postal_code_id"], 10115)
+        self.assertNotIn("latitude", mitte["properties"])
+
+    def test_kept_until_stations_change(self):
+        """
+        Test that the bytes are built once and again after a status change.
+        """
+        self.features()
+        builds = STATION_FEATURES.builds
+        self.features()
+        self.assertEqual(STATION_FEATURES.builds, builds)
+
+        response = self.client.post(
+            "/api/charging_stations/change_status"
+            f"?station_id={self.mitte}&new_status=malfunctioning"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        features = self.features()
+        self.assertEqual(STATION_FEATURES.builds, builds + 1)
+        self.assertEqual(
+            features[self.mitte]["properties"]["functional"], "malfunctioning"
+        )
+        self.assertEqual(
+            features[self.spandau]["properties"]["functional"], "operational"
+        )
+
+    def test_added_stations(self):
+        """
+        Test that inserted stations are part of the next response.
+        """
+        self.features()
+        with self.app.app_context():
+            self.load_stations(
+                make_register_row(2, postal_code="10117", **coordinates(13.39, 52.51))
+            )
+
+        self.assertEqual(len(self.features()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+POSITION = {"lat": 52.52, "lon": 13.40}
+
+
+class TestNearestChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `nearest_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with stations 100 m, 300 m and 1 km east of the position.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.far, self.near, self.fast = self.load_stations(
+                make_register_row(0, **coordinates(13.4147, 52.52)),
+                make_register_row(1, **coordinates(13.4015, 52.52)),
+                make_register_row(
+                    2,
+                    **coordinates(13.4044, 52.52),
+                    **{
+                        "Art der Ladeeinrichung": "Schnellladeeinrichtung",
+                        "Nennleistung Ladeeinrichtung [kW]": "150,0",
+                    },
+                ),
+            )
+
+    def nearest(self, **args):
+        response = self.client.get(
+            "/api/charging_stations/nearest", query_string={**POSITION, **args}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json["stations"]
+
+    def test_closest_first(self):
+        """
+        Test that the stations are returned closest first with their distance.
+        """
+        stations = self.nearest()
+
+        self.assertEqual(
+            [station["id"] for station in stations], [self.near, self.fast, self.far]
+        )
+        self.assertAlmostEqual(stations[0]["distance"], 102, delta=1)
+        self.assertAlmostEqual(stations[2]["distance"], 995, delta=1)
+        self.assertEqual([station["id"] for station in self.nearest(k=1)], [self.near])
+
+    def test_filters(self):
+        """
+        Test the filters on charging type, nominal power and status.
+        """
+        self.assertEqual(
+            [station["id"] for station in self.nearest(charging_type="fast")],
+            [self.fast],
+        )
+        self.assertEqual(
+            [station["id"] for station in self.nearest(min_nominal_power=50)],
+            [self.fast],
+        )
+
+        response = self.client.post(
+            "/api/charging_stations/change_status",
+            query_string={"station_id": self.near, "new_status": "malfunctioning"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        stations = self.nearest(functional="operational", k=1)
+        self.assertEqual([station["id"] for station in stations], [self.fast])
+        stations = self.nearest(functional="malfunctioning")
+        self.assertEqual([station["id"] for station in stations], [self.near])
+        self.assertEqual(stations[0]["functional"], "malfunctioning")
+
+    def test_invalid_arguments(self):
+        """
+        Test that missing and invalid arguments are rejected.
+        """
+        for args in (
+            {"lat": 52.52},
+            {**POSITION, "lat": 91},
+            {**POSITION, "k": 0},
+            {**POSITION, "k": 1000},
+            {**POSITION, "k": "many"},
+            {**POSITION, "functional": "broken"},
+            {**POSITION, "charging_type": "slow"},
+            {**POSITION, "min_nominal_power": -5},
+        ):
+            response = self.client.get(
+                "/api/charging_stations/nearest", query_string=args
+            )
+            self.assertEqual(response.status_code, 400, args)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from app.infrastructure.database_operations.charging_station_operations import (
+    ChargingStationOperations,
+)
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+SEARCH = {"lat": 52.52, "lon": 13.40, "radius_m": 2000}
+
+
+class TestRadiusChargingStationsEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `radius_charging_stations_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with stations 1.5 km, 0.5 km and 3 km from the position.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.far_inside, self.near, self.outside = self.load_stations(
+                make_register_row(0, **coordinates(13.40, 52.5335)),
+                make_register_row(1, **coordinates(13.40, 52.5245)),
+                make_register_row(2, **coordinates(13.444, 52.52)),
+            )
+
+    def within(self, **args) -> list[dict]:
+        response = self.client.get(
+            "/api/charging_stations/within", query_string={**SEARCH, **args}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json["stations"]
+
+    def test_stations_within_radius(self):
+        """
+        Test that the stations within the radius are returned closest first.
+        """
+        stations = self.within()
+
+        self.assertEqual(
+            [station["id"] for station in stations], [self.near, self.far_inside]
+        )
+        self.assertAlmostEqual(stations[0]["distance"], 500, delta=1)
+        self.assertAlmostEqual(stations[1]["distance"], 1501, delta=1)
+        self.assertEqual(len(self.within(radius_m=3500)), 3)
+
+    def test_inserted_stations_extend_the_index(self):
+        """
+        Test that inserted stations are found without rebuilding the index.
+        """
+        self.within()
+        with self.app.app_context():
+            with ChargingStationOperations() as repository:
+                index = repository.get_station_index()
+
+            *_, added = self.load_stations(
+                make_register_row(3, **coordinates(13.401, 52.52))
+            )
+
+        stations = self.within()
+        self.assertEqual(stations[0]["id"], added)
+        self.assertEqual(len(stations), 3)
+        with self.app.app_context():
+            with ChargingStationOperations() as repository:
+                self.assertIs(repository.get_station_index(), index)
+
+    def test_invalid_arguments(self):
+        """
+        Test that missing and invalid arguments are rejected.
+        """
+        for args in (
+            {"lat": 52.52, "lon": 13.40},
+            {**SEARCH, "lon": "east"},
+            {**SEARCH, "radius_m": 0},
+            {**SEARCH, "radius_m": 50000},
+            {**SEARCH, "radius_m": "nan"},
+        ):
+            response = self.client.get(
+                "/api/charging_stations/within", query_string=args
+            )
+            self.assertEqual(response.status_code, 400, args)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
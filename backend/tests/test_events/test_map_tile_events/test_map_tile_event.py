@@ -0,0 +1,89 @@
+import unittest
+
+from app.domain.geometry.caches import MAP_TILES
+from app.domain.geometry.vector_tile import tiles_containing
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_geometry.mvt import decode_tile
+from tests.test_ingestion.register_csv import make_register_row
+
+ZOOM = 14
+
+
+class TestMapTileEvent(StationFixtureTestCase):
+    """
+    Integration tests for the `map_tile_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with a station in Mitte and one in Spandau.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            self.mitte, self.spandau = self.load_stations(
+                make_register_row(0, **coordinates(13.4, 52.52)),
+                make_register_row(1, **coordinates(13.2, 52.535)),
+            )
+        [self.mitte_tile] = tiles_containing(13.4, 52.52, ZOOM)
+        [self.spandau_tile] = tiles_containing(13.2, 52.535, ZOOM)
+
+    def tile(self, x: int, y: int, z: int = ZOOM) -> bytes:
+        response = self.client.get(f"/api/tiles/{z}/{x}/{y}.mvt")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/vnd.mapbox-vector-tile")
+        return response.data
+
+    def test_tile_layers(self):
+        """
+        Test that a tile holds its stations and the postal codes it overlaps.
+        """
+        layers = decode_tile(self.tile(*self.mitte_tile))
+
+        [station] = layers["charging_stations"]["features"]
+        self.assertEqual(station["id"], self.mitte)
+        self.assertEqual(station["properties"]["functional"], "operational")
+        self.assertEqual(station["type"], 1)
+
+        postal_codes = layers["postal_codes"]["features"]
+        self.assertTrue(postal_codes)
+        for feature in postal_codes:
+            self.assertEqual(feature["properties"], {"postal_code": feature["id"]})
+            self.assertEqual(feature["type"], 3)
+
+    def test_cache_and_status_change(self):
+        """
+        Test that tiles are cached and a status change only rebuilds its tiles.
+        """
+        mitte = self.tile(*self.mitte_tile)
+        spandau = self.tile(*self.spandau_tile)
+        hits = MAP_TILES.hits
+        self.assertEqual(self.tile(*self.mitte_tile), mitte)
+        self.assertEqual(MAP_TILES.hits, hits + 1)
+
+        response = self.client.post(
+            "/api/charging_stations/change_status",
+            query_string={"station_id": self.mitte, "new_status": "malfunctioning"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        misses = MAP_TILES.misses
+        self.assertEqual(self.tile(*self.spandau_tile), spandau)
+        self.assertEqual(MAP_TILES.misses, misses)
+        layers = decode_tile(self.tile(*self.mitte_tile))
+        self.assertEqual(MAP_TILES.misses, misses + 1)
+        [station] = layers["charging_stations"]["features"]
+        self.assertEqual(station["properties"]["functional"], "malfunctioning")
+
+    def test_tile_outside_the_pyramid(self):
+        """
+        Test that tiles that do not exist are rejected.
+        """
+        for path in ("3/8/0", "3/0/8", "25/0/0"):
+            response = self.client.get(f"/api/tiles/{path}.mvt")
+            self.assertEqual(response.status_code, 404, path)
+            self.assertIn("error", response.json)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from app import create_app
+from app.domain.entities.templates.base import db
+from app.domain.services.postal_code_services.locate_postal_code_service import (
+    MAX_LOCATE_POINTS,
+)
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+
+
+class TestLocatePostalCodeEvent(unittest.TestCase):
+    """
+    Integration tests for the `locate_postal_code_event` endpoints.
+    """
+
+    def setUp(self):
+        """
+        Set up a Flask test app and one point inside every postal code.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.client = self.app.test_client()
+        self.app.testing = True
+
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                geometries = repository.get_postal_code_geometries()
+        self.points = {
+            number: geometry.prepared.interior_samples(8)[0]
+            for number, geometry in geometries.items()
+        }
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_locate(self):
+        """
+        Test locating a single point.
+        """
+        lon, lat = self.points[10115]
+        response = self.client.get(f"/api/postal_codes/locate?lat={lat}&lon={lon}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["postal_code"], 10115)
+
+    def test_locate_errors(self):
+        """
+        Test missing and invalid coordinates and points outside of Berlin.
+        """
+        cases = {
+            "/api/postal_codes/locate?lat=52.5": 400,
+            "/api/postal_codes/locate?lat=north&lon=13.4": 400,
+            "/api/postal_codes/locate?lat=95&lon=13.4": 400,
+            "/api/postal_codes/locate?lat=nan&lon=13.4": 400,
+            "/api/postal_codes/locate?lat=48.14&lon=11.58": 404,
+        }
+        for url, status in cases.items():
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status)
+                self.assertIn("error", response.get_json())
+
+    def test_locate_batch(self):
+        """
+        Test locating a point in every postal code and one outside of Berlin at once.
+        """
+        numbers = sorted(self.points)
+        points = [[self.points[n][1], self.points[n][0]] for n in numbers]
+
+        response = self.client.post(
+            "/api/postal_codes/locate", json={"points": points + [[48.14, 11.58]]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["postal_codes"], numbers + [None])
+
+    def test_locate_batch_errors(self):
+        """
+        Test invalid bodies and too many points.
+        """
+        bodies = [
+            None,
+            {"points": "52.5,13.4"},
+            {"points": [[52.5]]},
+            {"points": [[52.5, True]]},
+            {"points": [[52.5, 13.4]] * (MAX_LOCATE_POINTS + 1)},
+        ]
+        for body in bodies:
+            with self.subTest(body=str(body)[:40]):
+                response = self.client.post("/api/postal_codes/locate", json=body)
+                self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from app import create_app
+from app.domain.entities.templates.base import db
+
+
+def signed_area(points: list) -> float:
+    return sum(
+        points[index - 1][0] * points[index][1]
+        - points[index][0] * points[index - 1][1]
+        for index in range(len(points))
+    )
+
+
+class TestPostalCodeGeojsonEvent(unittest.TestCase):
+    """
+    Integration tests for the `postal_code_geojson_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a Flask test app.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.client = self.app.test_client()
+        self.app.testing = True
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_postal_codes(self):
+        """
+        Test that every postal code is a counterclockwise polygon.
+        """
+        response = self.client.get("/api/postal_codes/geojson")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/geo+json")
+        features = response.get_json()["features"]
+        self.assertEqual(len(features), 190)
+        self.assertEqual(features[0]["id"], 10115)
+        self.assertEqual(features[0]["properties"], {"number": 10115})
+        for feature in features:
+            self.assertEqual(feature["geometry"]["type"], "Polygon")
+            self.assertGreater(signed_area(feature["geometry"]["coordinates"][0]), 0)
+
+    def test_same_bytes(self):
+        """
+        Test that repeated requests are answered with the same bytes.
+        """
+        first = self.client.get("/api/postal_codes/geojson").data
+        self.assertEqual(self.client.get("/api/postal_codes/geojson").data, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
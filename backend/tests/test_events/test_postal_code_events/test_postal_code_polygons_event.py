@@ -0,0 +1,70 @@
+import unittest
+
+from app import create_app
+from app.domain.entities.templates.base import db
+from app.domain.geometry.wkt import parse_wkt_polygons
+
+
+class TestPostalCodePolygonsEvent(unittest.TestCase):
+    """
+    Integration tests for the `postal_code_polygons_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a Flask test app.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.client = self.app.test_client()
+        self.app.testing = True
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_full_resolution(self):
+        """
+        Test that all postal codes are returned in full resolution without zoom.
+        """
+        response = self.client.get("/api/postal_codes/polygons")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIsNone(data["level"])
+        self.assertEqual(len(data["postal_codes"]), 190)
+        first = data["postal_codes"][0]
+        self.assertEqual(first["number"], 10115)
+        self.assertTrue(parse_wkt_polygons(first["polygon"]))
+
+    def test_zoom_levels(self):
+        """
+        Test that lower zoom levels get smaller payloads of all postal codes.
+        """
+        sizes = {}
+        for zoom, level in ((8, 8), (9, 10), (13, 14), (16, None)):
+            response = self.client.get(f"/api/postal_codes/polygons?zoom={zoom}")
+            self.assertEqual(response.status_code, 200)
+            data = response.get_json()
+            self.assertEqual(data["level"], level)
+            self.assertEqual(len(data["postal_codes"]), 190)
+            sizes[zoom] = len(response.data)
+        self.assertLess(sizes[8], sizes[9])
+        self.assertLess(sizes[9], sizes[13])
+        self.assertLess(sizes[13], sizes[16])
+
+    def test_invalid_zoom(self):
+        """
+        Test that invalid zoom levels are rejected.
+        """
+        for zoom in ("x", "-1", "30"):
+            response = self.client.get(f"/api/postal_codes/polygons?zoom={zoom}")
+            self.assertEqual(response.status_code, 400, zoom)
+            self.assertIn("error", response.get_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from app import create_app
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+
+
+def ring_points(topology: dict, refs: list) -> list:
+    """
+    Decode a ring of a TopoJSON topology to longitude and latitude.
+    """
+    (scale_x, scale_y), (lon0, lat0) = (
+        topology["transform"]["scale"],
+        topology["transform"]["translate"],
+    )
+    points = []
+    for ref in refs:
+        x = y = 0
+        arc = []
+        for dx, dy in topology["arcs"][ref if ref >= 0 else ~ref]:
+            x, y = x + dx, y + dy
+            arc.append((lon0 + x * scale_x, lat0 + y * scale_y))
+        if ref < 0:
+            arc.reverse()
+        points.extend(arc[1:] if points else arc)
+    return points
+
+
+class TestPostalCodeTopologyEvent(unittest.TestCase):
+    """
+    Integration tests for the `postal_code_topology_event` endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up a Flask test app.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.client = self.app.test_client()
+        self.app.testing = True
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_topology(self):
+        """
+        Test that every postal code is a closed ring of shared arcs.
+        """
+        response = self.client.get("/api/postal_codes/topology")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        topology = response.get_json()
+        self.assertEqual(topology["type"], "Topology")
+        geometries = topology["objects"]["postal_codes"]["geometries"]
+        self.assertEqual(len(geometries), 190)
+
+        mitte = next(geometry for geometry in geometries if geometry["id"] == 10115)
+        self.assertEqual(mitte["type"], "Polygon")
+        ring = ring_points(topology, mitte["arcs"][0])
+        self.assertEqual(ring[0], ring[-1])
+        lons, lats = [lon for lon, _ in ring], [lat for _, lat in ring]
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                bbox = repository.get_postal_code_geometries()[10115].bbox
+        for value, expected in zip((min(lons), min(lats), max(lons), max(lats)), bbox):
+            self.assertAlmostEqual(value, expected, places=5)
+
+        # Shared borders are referenced by both postal codes
+        refs = [ref for geometry in geometries for ref in geometry["arcs"][0]]
+        self.assertLess(len(topology["arcs"]), len(refs))
+        self.assertTrue(any(ref < 0 for ref in refs))
+
+    def test_smaller_than_polygons(self):
+        """
+        Test that the topology is a fraction of the full resolution polygons.
+        """
+        topology = self.client.get("/api/postal_codes/topology")
+        polygons = self.client.get("/api/postal_codes/polygons")
+        self.assertLess(len(topology.data), len(polygons.data) / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
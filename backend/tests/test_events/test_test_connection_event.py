@@ -1,12 +1,24 @@
+import os
+import tempfile
 import unittest
 
 from app import create_app
+from app.config import TestingConfig
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.ingestion_progress import (
+    INGESTION_PROGRESS,
+    PHASE_CHARGING_STATIONS,
+    PHASE_FAILED,
+    IngestionProgress,
+)
 from flask import Flask
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
 
 
 class TestTestConnectionEvent(unittest.TestCase):
     """
-    Tests for the `hello_world` event.
+    Tests for the `hello_world` and `readiness` events.
     """
 
     def setUp(self):
@@ -16,6 +28,11 @@ class TestTestConnectionEvent(unittest.TestCase):
         self.app = create_app(config_class="app.config.TestingConfig")
         self.client = self.app.test_client()
 
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
     def test_hello_world(self):
         """
         Test that the `/` endpoint returns the correct welcome message.
@@ -24,6 +41,111 @@ class TestTestConnectionEvent(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.get_json(), {"message": "Welcome to the backend"})
 
+    def test_ready(self):
+        """
+        Test that `/ready` returns 200 once the data is loaded.
+        """
+        response = self.client.get("/ready")
+        body = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(body["ready"])
+        self.assertEqual(body["phase"], "ready")
+        self.assertEqual(body["rows_done"], body["rows_total"])
+        self.assertGreaterEqual(body["rows_total"], 190)
+
+    def test_not_ready(self):
+        """
+        Test that `/ready` and the API return 503 with progress while loading.
+        """
+        progress = IngestionProgress()
+        progress.plan(1000)
+        progress.start_phase(PHASE_CHARGING_STATIONS, 800)
+        self.app.extensions[INGESTION_PROGRESS] = progress
+
+        response = self.client.get("/ready")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "5")
+        self.assertEqual(response.get_json()["phase"], PHASE_CHARGING_STATIONS)
+        self.assertEqual(response.get_json()["rows_total"], 1000)
+        self.assertEqual(self.client.get("/api/charging_stations/").status_code, 503)
+        self.assertEqual(self.client.get("/").status_code, 200)
+
+        progress.finish()
+        self.assertEqual(self.client.get("/ready").status_code, 200)
+        self.assertEqual(self.client.get("/api/charging_stations/").status_code, 200)
+
+
+class BackgroundTestingConfig(TestingConfig):
+    """
+    Testing configuration loading the data on a background thread.
+    """
+
+    BACKGROUND_INGESTION = True
+
+
+class TestBackgroundIngestion(unittest.TestCase):
+    """
+    Integration tests for the background ingestion.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def start_app(self):
+        """
+        Start an app loading the register in `csv_path` on a background thread.
+        """
+        config = type(
+            "RegisterConfig",
+            (BackgroundTestingConfig,),
+            {"CHARGING_STATION_CSV": self.csv_path},
+        )
+        app = create_app(config_class=config)
+        self.addCleanup(self.drop_database, app)
+        return app
+
+    @staticmethod
+    def drop_database(app):
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_background_ingestion(self):
+        """
+        Test that create_app returns before the data is loaded and `/ready` turns 200.
+        """
+        write_register_csv(self.csv_path, [make_register_row(i) for i in range(3)])
+        app = self.start_app()
+        progress = app.extensions[INGESTION_PROGRESS]
+        client = app.test_client()
+
+        self.assertEqual(client.get("/").status_code, 200)
+        self.assertTrue(progress.wait(timeout=300))
+        self.assertEqual(client.get("/ready").status_code, 200)
+        with app.app_context():
+            self.assertEqual(PostalCode.query.count(), 190)
+
+    def test_failed_dataset(self):
+        """
+        Test that a register which cannot be loaded keeps `/ready` and the API at 503.
+        """
+        app = self.start_app()  # The register does not exist
+        progress = app.extensions[INGESTION_PROGRESS]
+        client = app.test_client()
+        self.assertTrue(progress.wait(timeout=300))
+
+        response = client.get("/ready")
+        self.assertEqual(response.status_code, 503)
+        self.assertNotIn("Retry-After", response.headers)
+        self.assertEqual(response.get_json()["phase"], PHASE_FAILED)
+        self.assertIn(self.csv_path, response.get_json()["error"])
+        self.assertEqual(client.get("/api/charging_stations/").status_code, 503)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+"""Minimal Mapbox Vector Tile decoder to check the encoded tiles in tests."""
+
+import struct
+
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _fields(data: bytes) -> list[tuple[int, object]]:
+    fields, pos = [], 0
+    while pos < len(data):
+        key, pos = _varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _varint(data, pos)
+        elif wire_type == 1:
+            value, pos = data[pos : pos + 8], pos + 8
+        else:
+            length, pos = _varint(data, pos)
+            value, pos = data[pos : pos + length], pos + length
+        fields.append((number, value))
+    return fields
+
+
+def _packed(data: bytes) -> list[int]:
+    values, pos = [], 0
+    while pos < len(data):
+        value, pos = _varint(data, pos)
+        values.append(value)
+    return values
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _value(data: bytes):
+    [(number, value)] = _fields(data)
+    if number == 1:
+        return value.decode()
+    if number == 3:
+        return struct.unpack("<d", value)[0]
+    if number == 6:
+        return _unzigzag(value)
+    if number == 7:
+        return bool(value)
+    return value
+
+
+def _geometry(commands: list[int]) -> list[list[tuple[int, int]]]:
+    parts, x, y, i = [], 0, 0, 0
+    while i < len(commands):
+        command, count = commands[i] & 7, commands[i] >> 3
+        i += 1
+        if command == 7:
+            continue
+        if command == 1:
+            parts.append([])
+        for _ in range(count):
+            x += _unzigzag(commands[i])
+            y += _unzigzag(commands[i + 1])
+            i += 2
+            parts[-1].append((x, y))
+    return parts
+
+
+def decode_tile(data: bytes) -> dict:
+    """
+    Decode a tile into its layers by name, every layer with `extent`,
+    `version` and `features`. A feature holds `id`, `type`, `properties`
+    and `geometry` as list of parts (points or rings) in tile coordinates.
+    """
+    layers = {}
+    for _, layer_data in _fields(data):
+        fields = _fields(layer_data)
+        keys = [value.decode() for number, value in fields if number == 3]
+        values = [_value(value) for number, value in fields if number == 4]
+        layer = {"version": None, "extent": 4096, "features": []}
+        for number, value in fields:
+            if number == 1:
+                name = value.decode()
+            elif number == 15:
+                layer["version"] = value
+            elif number == 5:
+                layer["extent"] = value
+            elif number == 2:
+                feature = {"id": None, "properties": {}}
+                for feature_number, feature_value in _fields(value):
+                    if feature_number == 1:
+                        feature["id"] = feature_value
+                    elif feature_number == 2:
+                        tags = _packed(feature_value)
+                        feature["properties"] = {
+                            keys[tags[i]]: values[tags[i + 1]]
+                            for i in range(0, len(tags), 2)
+                        }
+                    elif feature_number == 3:
+                        feature["type"] = feature_value
+                    elif feature_number == 4:
+                        feature["geometry"] = _geometry(_packed(feature_value))
+                layer["features"].append(feature)
+        layers[name] = layer
+    return layers
+
+
+def ring_area(ring: list[tuple[int, int]]) -> int:
+    """
+    Twice the signed area of a ring in tile coordinates, positive if clockwise.
+    """
+    return sum(
+        x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1])
+    )
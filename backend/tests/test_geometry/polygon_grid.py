@@ -0,0 +1,65 @@
+"""Helpers to build grids of neighbouring polygons with jagged shared borders."""
+
+import math
+from array import array
+
+ORIGIN = (13.3, 52.4)
+CELL = 0.01
+POINTS_PER_EDGE = 40
+
+
+def _position(corner: tuple[int, int]) -> tuple[float, float]:
+    return ORIGIN[0] + corner[0] * CELL, ORIGIN[1] + corner[1] * CELL
+
+
+def _edge(start: tuple, end: tuple, jagged: bool) -> list[tuple]:
+    """
+    Points of the edge between two grid corners, from start without end.
+    Jagged edges zigzag the same way from both sides, so neighbours share
+    their border exactly.
+    """
+    low, high = sorted((start, end))
+    (low_lon, low_lat), (high_lon, high_lat) = _position(low), _position(high)
+    points = []
+    for step in range(POINTS_PER_EDGE + 1):
+        t = step / POINTS_PER_EDGE
+        lon = low_lon + (high_lon - low_lon) * t
+        lat = low_lat + (high_lat - low_lat) * t
+        if jagged and 0 < step < POINTS_PER_EDGE:
+            offset = CELL * (0.02 * math.sin(step * 1.7) + 0.05 * math.sin(t * math.pi))
+            if low[0] == high[0]:
+                lon += offset
+            else:
+                lat += offset
+        points.append((lon, lat))
+    if low != start:
+        points.reverse()
+    return points[:-1]
+
+
+def grid_polygons(columns: int, rows: int) -> dict:
+    """
+    Build a grid of cells keyed by (column, row) as single-ring polygons
+    with straight outer edges.
+    """
+    polygons = {}
+    for column in range(columns):
+        for row in range(rows):
+            corners = [
+                (column, row),
+                (column + 1, row),
+                (column + 1, row + 1),
+                (column, row + 1),
+            ]
+            points = []
+            for index, start in enumerate(corners):
+                end = corners[(index + 1) % 4]
+                outer = (start[0] == end[0] and start[0] in (0, columns)) or (
+                    start[1] == end[1] and start[1] in (0, rows)
+                )
+                points += _edge(start, end, not outer)
+            points.append(points[0])
+            polygons[(column, row)] = [
+                [array("d", [value for point in points for value in point])]
+            ]
+    return polygons
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from app.domain.geometry.clustering import PointClusters
+
+STATUSES = ["operational", "used", "malfunctioning"]
+WORLD = (-180, -85, 180, 85)
+
+
+class TestPointClusters(unittest.TestCase):
+    """
+    Tests for the cluster hierarchy.
+    """
+
+    def setUp(self):
+        random.seed(19)
+        self.lons = [random.uniform(13.08, 13.77) for _ in range(2000)]
+        self.lats = [random.uniform(52.33, 52.68) for _ in range(2000)]
+        self.tags = [random.choice(STATUSES) for _ in range(2000)]
+        # Duplicate points
+        self.lons += [13.4, 13.4]
+        self.lats += [52.52, 52.52]
+        self.tags += ["used", "used"]
+        self.clusters = PointClusters(self.lons, self.lats, self.tags)
+
+    def point_tags(self, clusters, points) -> dict:
+        counts = {}
+        for cluster in clusters:
+            for tag, count in cluster["tags"].items():
+                counts[tag] = counts.get(tag, 0) + count
+        for point in points:
+            counts[self.tags[point]] = counts.get(self.tags[point], 0) + 1
+        return counts
+
+    def test_every_point_once_per_zoom(self):
+        """
+        Test that the clusters and single points of a zoom level cover every point once.
+        """
+        expected = {tag: self.tags.count(tag) for tag in STATUSES}
+        for zoom in range(0, 18):
+            clusters, points = self.clusters.query(*WORLD, zoom)
+            self.assertEqual(len(points), len(set(points)))
+            self.assertEqual(
+                sum(cluster["count"] for cluster in clusters) + len(points),
+                len(self.lons),
+            )
+            self.assertEqual(self.point_tags(clusters, points), expected)
+            for cluster in clusters:
+                self.assertEqual(sum(cluster["tags"].values()), cluster["count"])
+                self.assertGreater(cluster["count"], 1)
+
+        self.assertEqual(len(self.clusters.query(*WORLD, 0)[0]), 1)
+        clusters, points = self.clusters.query(*WORLD, 17)
+        self.assertEqual((clusters, sorted(points)), ([], list(range(len(self.lons)))))
+
+    def test_bbox_query(self):
+        """
+        Test that a viewport query finds the items inside it.
+        """
+        bbox = (13.3, 52.45, 13.45, 52.55)
+        for zoom in (9, 12, 14, 17):
+            clusters, points = self.clusters.query(*bbox, zoom)
+            all_clusters, all_points = self.clusters.query(*WORLD, zoom)
+            expected_points = [
+                point
+                for point in all_points
+                if bbox[0] <= self.lons[point] <= bbox[2]
+                and bbox[1] <= self.lats[point] <= bbox[3]
+            ]
+            expected_clusters = [
+                cluster["cluster_id"]
+                for cluster in all_clusters
+                if bbox[0] - 1e-9 <= cluster["longitude"] <= bbox[2] + 1e-9
+                and bbox[1] - 1e-9 <= cluster["latitude"] <= bbox[3] + 1e-9
+            ]
+            self.assertEqual(sorted(points), sorted(expected_points))
+            self.assertEqual(
+                sorted(cluster["cluster_id"] for cluster in clusters),
+                sorted(expected_clusters),
+            )
+
+    def test_set_tag(self):
+        """
+        Test that changing tags gives the counts of rebuilt clusters.
+        """
+        for point in random.sample(range(len(self.lons)), 300):
+            tag = random.choice(STATUSES + ["unknown"])
+            self.clusters.set_tag(point, tag)
+            self.tags[point] = tag
+        rebuilt = PointClusters(self.lons, self.lats, self.tags)
+
+        for zoom in (0, 5, 10, 13, 16):
+            clusters, points = self.clusters.query(*WORLD, zoom)
+            expected_clusters, expected_points = rebuilt.query(*WORLD, zoom)
+            self.assertEqual(clusters, expected_clusters)
+            self.assertEqual(points, expected_points)
+
+    def test_empty(self):
+        """
+        Test clusters without points.
+        """
+        clusters = PointClusters([], [])
+        self.assertEqual(clusters.query(*WORLD, 10), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import random
+import unittest
+
+from app.domain.geometry.corridor import RouteCorridor
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.station_index import StationIndex
+
+# A zigzag route of about 30 km through Berlin, coming back past its start
+ROUTE = [
+    (13.20, 52.45),
+    (13.35, 52.60),
+    (13.45, 52.45),
+    (13.60, 52.55),
+    (13.30, 52.52),
+]
+
+
+class TestRouteCorridor(unittest.TestCase):
+    """
+    Tests for the pieces and distances of a route corridor.
+    """
+
+    def test_boxes_cover_the_corridor(self):
+        """
+        Test that long segments are cut into pieces whose boxes hold every
+        point within the distance.
+        """
+        corridor = RouteCorridor(ROUTE, 300)
+        boxes = list(corridor.boxes())
+        self.assertGreater(len(boxes), 2 * (len(ROUTE) - 1))
+        self.assertEqual(sorted({segment for segment, _ in boxes}), [0, 1, 2, 3])
+
+        random.seed(3)
+        for _ in range(2000):
+            lon, lat = random.uniform(13.1, 13.7), random.uniform(52.4, 52.65)
+            for segment in range(len(ROUTE) - 1):
+                if corridor.measure(segment, lon, lat) is None:
+                    continue
+                self.assertTrue(
+                    any(
+                        min_lon <= lon <= max_lon and min_lat <= lat <= max_lat
+                        for piece_segment, (min_lon, min_lat, max_lon, max_lat) in boxes
+                        if piece_segment == segment
+                    )
+                )
+
+    def test_measure(self):
+        """
+        Test the distance from the route and the position along it.
+        """
+        corridor = RouteCorridor([(13.3, 52.5), (13.4, 52.5), (13.4, 52.6)], 1000)
+        first = haversine_distance(13.3, 52.5, 13.4, 52.5)
+        self.assertAlmostEqual(corridor.length / (first + 11119.5), 1, places=2)
+
+        distance, offset = corridor.measure(0, 13.35, 52.505)
+        self.assertAlmostEqual(distance, 556, delta=2)
+        self.assertAlmostEqual(offset / (first / 2), 1, places=2)
+
+        distance, offset = corridor.measure(1, 13.405, 52.55)
+        self.assertAlmostEqual(offset, corridor.length - 5560, delta=10)
+        self.assertIsNone(corridor.measure(0, 13.35, 52.52))
+        # Beyond the end of the route the distance is to the end point
+        self.assertIsNone(corridor.measure(1, 13.4, 52.61))
+
+    def test_single_point(self):
+        """
+        Test that a route of one point is a circle around it.
+        """
+        corridor = RouteCorridor([(13.4, 52.5)], 500)
+        self.assertEqual(corridor.length, 0)
+        self.assertEqual(len(list(corridor.boxes())), 1)
+        self.assertEqual(corridor.measure(0, 13.4, 52.5), (0.0, 0.0))
+        self.assertIsNone(corridor.measure(0, 13.41, 52.5))
+
+
+class TestStationIndexAlongRoute(unittest.TestCase):
+    """
+    Tests for the corridor search of the station index.
+    """
+
+    def setUp(self):
+        random.seed(8)
+        self.stations = [
+            {
+                "id": index + 1,
+                "latitude": random.uniform(52.4, 52.65),
+                "longitude": random.uniform(13.1, 13.7),
+                "functional": "operational",
+            }
+            for index in range(5000)
+        ]
+        self.index = StationIndex(self.stations)
+
+    def brute_force(self, route, distance) -> list[tuple[float, float, int]]:
+        corridor = RouteCorridor(route, distance)
+        found = []
+        for station in self.stations:
+            measured = [
+                corridor.measure(segment, station["longitude"], station["latitude"])
+                for segment in range(max(len(route) - 1, 1))
+            ]
+            measured = [found for found in measured if found is not None]
+            if measured:
+                from_route, offset = min(measured)
+                found.append((offset, from_route, station["id"]))
+        return sorted(found)
+
+    def test_matches_brute_force(self):
+        """
+        Test that the pieces find the stations of a scan, in driving order.
+        """
+        for distance in (50, 250, 1000):
+            found = self.index.along_route(ROUTE, distance)
+            self.assertEqual(
+                [
+                    (offset, from_route, station["id"])
+                    for offset, from_route, station in found
+                ],
+                self.brute_force(ROUTE, distance),
+            )
+            offsets = [offset for offset, _, _ in found]
+            self.assertEqual(offsets, sorted(offsets))
+            self.assertTrue(all(from_route <= distance for _, from_route, _ in found))
+
+    def test_station_near_the_route_twice(self):
+        """
+        Test that a station passed twice is found once, at its closest segment.
+        """
+        index = StationIndex(
+            [{"id": 1, "latitude": 52.5001, "longitude": 13.4, "functional": "used"}]
+        )
+        route = [(13.3, 52.5), (13.5, 52.5), (13.5, 52.51), (13.3, 52.51)]
+        [(offset, from_route, station)] = index.along_route(route, 200)
+        self.assertEqual(station["id"], 1)
+        self.assertAlmostEqual(from_route, 11.1, delta=0.1)
+        self.assertAlmostEqual(
+            offset / haversine_distance(13.3, 52.5, 13.4, 52.5), 1, places=2
+        )
+
+    def test_empty(self):
+        """
+        Test that an index without stations finds nothing.
+        """
+        self.assertEqual(StationIndex([]).along_route(ROUTE, 500), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
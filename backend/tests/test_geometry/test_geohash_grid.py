@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.geohash_grid import GeohashGrid, geohash
+
+
+class TestGeohash(unittest.TestCase):
+    """
+    Tests for the geohash of a point.
+    """
+
+    def test_known_values(self):
+        """
+        Test geohashes of reference points.
+        """
+        self.assertEqual(geohash(10.40744, 57.64911, 11), "u4pruydqqvj")
+        self.assertEqual(geohash(13.405, 52.52, 6), "u33dc0")
+        self.assertEqual(geohash(-180, -90, 3), "000")
+        self.assertEqual(geohash(180, 90, 3), "zzz")
+
+
+class TestGeohashGrid(unittest.TestCase):
+    """
+    Tests for the radius search of the geohash grid.
+    """
+
+    def setUp(self):
+        random.seed(9)
+        self.points = [
+            (random.uniform(13.1, 13.7), random.uniform(52.35, 52.65))
+            for _ in range(5000)
+        ]
+
+    def test_matches_brute_force(self):
+        """
+        Test that every precision finds the points of the circle, closest first.
+        """
+        for precision in (4, 5, 6, 7):
+            grid = GeohashGrid(precision)
+            for key, (lon, lat) in enumerate(self.points):
+                grid.add(key, lon, lat)
+            self.assertEqual(len(grid), len(self.points))
+
+            for lon, lat, radius in [
+                (13.4, 52.5, 2000),
+                (13.1, 52.35, 5000),
+                (13.41, 52.52, 150),
+            ]:
+                expected = sorted(
+                    (haversine_distance(lon, lat, *point), key)
+                    for key, point in enumerate(self.points)
+                    if haversine_distance(lon, lat, *point) <= radius
+                )
+                found = grid.within(lon, lat, radius)
+                self.assertEqual(
+                    sorted(key for _, key in found), sorted(key for _, key in expected)
+                )
+                distances = [distance for distance, _ in found]
+                self.assertEqual(distances, sorted(distances))
+
+    def test_cells_of_a_2km_search(self):
+        """
+        Test that a 2 km search in Berlin touches a bounded number of cells
+        with the geohashes of the points in them.
+        """
+        grid = GeohashGrid()
+        cells = grid.cells_within(13.405, 52.52, 2000)
+
+        self.assertLessEqual(len(cells), 40)
+        self.assertIn("u33dc0", {grid.geohash(cell) for cell in cells})
+        self.assertEqual(len(GeohashGrid(5).cells_within(13.405, 52.52, 2000)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import unittest
+
+from app.domain.geometry.geojson import (
+    FeatureCollectionCache,
+    encode_feature_collection,
+    point_feature,
+    polygon_feature,
+)
+from tests.test_geometry.test_topology import square
+
+
+def signed_area(points: list) -> float:
+    return sum(
+        points[index - 1][0] * points[index][1]
+        - points[index][0] * points[index - 1][1]
+        for index in range(len(points))
+    )
+
+
+class TestGeoJson(unittest.TestCase):
+    """
+    Tests for encoding features as GeoJSON.
+    """
+
+    def test_point_feature(self):
+        """
+        Test a point with id and properties.
+        """
+        self.assertEqual(
+            point_feature(13.4, 52.5, {"functional": "used"}, 7),
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [13.4, 52.5]},
+                "properties": {"functional": "used"},
+                "id": 7,
+            },
+        )
+        self.assertNotIn("id", point_feature(13.4, 52.5, {}))
+
+    def test_polygon_winding(self):
+        """
+        Test that exterior rings are counterclockwise and holes clockwise.
+        """
+        feature = polygon_feature(
+            [[square(13.0, 52.0, 1.0, reverse=True), square(13.2, 52.2, 0.5)]],
+            {"number": 10115},
+            10115,
+        )
+        self.assertEqual(feature["geometry"]["type"], "Polygon")
+        exterior, hole = feature["geometry"]["coordinates"]
+        self.assertGreater(signed_area(exterior), 0)
+        self.assertLess(signed_area(hole), 0)
+        self.assertEqual(exterior[0], exterior[-1])
+        self.assertEqual(feature["id"], 10115)
+
+    def test_multipolygon(self):
+        """
+        Test that several polygons give a MultiPolygon.
+        """
+        feature = polygon_feature(
+            [[square(13.0, 52.0, 0.5)], [square(14.0, 52.0, 0.5)]], {}
+        )
+        self.assertEqual(feature["geometry"]["type"], "MultiPolygon")
+        self.assertEqual(len(feature["geometry"]["coordinates"]), 2)
+
+    def test_feature_collection(self):
+        """
+        Test the compact encoding of a FeatureCollection.
+        """
+        data = encode_feature_collection(
+            point_feature(13.0 + index, 52.0, {}) for index in range(3)
+        )
+        self.assertNotIn(b" ", data)
+        collection = json.loads(data)
+        self.assertEqual(collection["type"], "FeatureCollection")
+        self.assertEqual(len(collection["features"]), 3)
+
+
+class TestFeatureCollectionCache(unittest.TestCase):
+    """
+    Tests for the memo of an encoded FeatureCollection.
+    """
+
+    def test_built_again_for_other_sources(self):
+        """
+        Test that the bytes are kept until the sources or their revision change.
+        """
+        cache = FeatureCollectionCache()
+        source = object()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return b"%d" % len(builds)
+
+        self.assertEqual(cache.get((source, 1), build), b"1")
+        self.assertEqual(cache.get((source, 1), build), b"1")
+        self.assertEqual(cache.get((source, 2), build), b"2")
+        self.assertEqual(cache.get((object(), 2), build), b"3")
+        self.assertEqual(cache.builds, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
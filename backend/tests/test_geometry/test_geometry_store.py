@@ -0,0 +1,96 @@
+import unittest
+
+from app.domain.geometry.geometry_store import GeometryStore, PolygonGeometry
+from app.domain.geometry.wkt import WktError
+
+SQUARE = "POLYGON ((13.4 52.5, 13.5 52.5, 13.5 52.6, 13.4 52.6, 13.4 52.5))"
+WITH_HOLE = (
+    "MULTIPOLYGON (((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 1 2, 2 2, 2 1, 1 1)), "
+    "((5 5, 6 5, 6 6, 5 5)))"
+)
+
+
+class TestPolygonGeometry(unittest.TestCase):
+    """
+    Tests for the parsed polygon geometry.
+    """
+
+    def test_bbox_and_contains(self):
+        """
+        Test the bounding box, vertex count and point test including holes.
+        """
+        geometry = PolygonGeometry.from_wkt(WITH_HOLE)
+
+        self.assertEqual(geometry.bbox, (0, 0, 6, 6))
+        self.assertEqual(geometry.vertex_count, 14)
+        self.assertTrue(geometry.contains(3, 3))
+        self.assertFalse(geometry.contains(1.5, 1.5))
+        self.assertTrue(geometry.contains(5.7, 5.5))
+        self.assertFalse(geometry.contains(7, 7))
+        self.assertGreater(geometry.nbytes, 14 * 2 * 8)
+
+
+class TestGeometryStore(unittest.TestCase):
+    """
+    Tests for the memoized geometry store.
+    """
+
+    def test_memoized_until_text_changes(self):
+        """
+        Test that a key is parsed once and again only with a different text.
+        """
+        store = GeometryStore("test")
+
+        first = store.get(10115, SQUARE)
+        self.assertIs(store.get(10115, SQUARE), first)
+        self.assertIs(store.peek(10115), first)
+        changed = store.get(10115, SQUARE.replace("13.4 ", "13.3 "))
+
+        self.assertIsNot(changed, first)
+        self.assertEqual(changed.bbox[0], 13.3)
+        self.assertEqual((store.hits, store.misses, len(store)), (1, 2, 1))
+
+    def test_put_without_parsing(self):
+        """
+        Test that a stored geometry answers lookups of its text.
+        """
+        store = GeometryStore("test")
+        geometry = PolygonGeometry.from_wkt(SQUARE)
+
+        store.put(10115, SQUARE, geometry)
+
+        self.assertIs(store.get(10115, SQUARE), geometry)
+        self.assertEqual((store.hits, store.misses), (1, 0))
+
+    def test_clear_and_info(self):
+        """
+        Test the memory report and that clear drops all entries.
+        """
+        store = GeometryStore("test")
+        store.get(10115, SQUARE)
+        store.get(10117, SQUARE)
+
+        info = store.info()
+        self.assertEqual(info["name"], "test")
+        self.assertEqual(info["entries"], 2)
+        self.assertEqual(info["vertices"], 10)
+        self.assertGreater(info["geometry_bytes"], 0)
+        self.assertGreater(info["text_bytes"], 2 * len(SQUARE))
+
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertIsNone(store.peek(10115))
+        self.assertEqual(store.info()["geometry_bytes"], 0)
+
+    def test_invalid_text(self):
+        """
+        Test that invalid WKT raises WktError and is not stored.
+        """
+        store = GeometryStore("test")
+        with self.assertRaises(WktError):
+            store.get(10115, "POINT (1 2)")
+        self.assertEqual(len(store), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
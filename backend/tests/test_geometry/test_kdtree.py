@@ -0,0 +1,160 @@
+import math
+import random
+import unittest
+
+from app.domain.geometry.distance import haversine_distance
+from app.domain.geometry.kdtree import PointKDTree
+from app.domain.geometry.station_index import StationIndex
+
+STATUSES = ["operational", "used", "malfunctioning"]
+
+
+class TestPointKDTree(unittest.TestCase):
+    """
+    Tests for the KD-tree with tag counts.
+    """
+
+    def setUp(self):
+        random.seed(11)
+        self.xs = [random.uniform(0, 1000) for _ in range(3000)]
+        self.ys = [random.uniform(0, 500) for _ in range(3000)]
+        self.tags = [random.choice(STATUSES) for _ in range(3000)]
+        # Duplicate points
+        self.xs += [500.0, 500.0]
+        self.ys += [250.0, 250.0]
+        self.tags += ["used", "used"]
+
+    def brute_force(self, x, y, tags=None) -> list[float]:
+        return sorted(
+            math.sqrt((px - x) ** 2 + (py - y) ** 2)
+            for px, py, tag in zip(self.xs, self.ys, self.tags)
+            if tags is None or tag in tags
+        )
+
+    def assertDistancesEqual(self, found, expected, msg=None):
+        self.assertEqual(len(found), len(expected), msg)
+        for distance, expected_distance in zip(found, expected):
+            self.assertAlmostEqual(distance, expected_distance, msg=msg)
+
+    def test_yields_in_distance_order(self):
+        """
+        Test that all points are yielded in order of their distance.
+        """
+        for leaf_size in (1, 8, 64):
+            tree = PointKDTree(self.xs, self.ys, self.tags, leaf_size)
+            for x, y in [(500, 250), (-100, 900), (1000, 0)]:
+                found = list(tree.iter_nearest(x, y))
+                self.assertEqual(len(found), len(self.xs))
+                self.assertEqual(
+                    sorted({point for _, point in found}), list(range(len(self.xs)))
+                )
+                for distance, point in found:
+                    self.assertAlmostEqual(
+                        distance, math.dist((self.xs[point], self.ys[point]), (x, y))
+                    )
+                self.assertDistancesEqual(
+                    [distance for distance, _ in found], self.brute_force(x, y)
+                )
+
+    def test_tags_and_set_tag(self):
+        """
+        Test that tag filters follow changed tags.
+        """
+        tree = PointKDTree(self.xs, self.ys, self.tags)
+        found = [distance for distance, _ in tree.iter_nearest(500, 250, ["used"])]
+        self.assertDistancesEqual(found, self.brute_force(500, 250, ["used"]))
+
+        random.seed(12)
+        for point in random.sample(range(len(self.xs)), 500):
+            self.tags[point] = random.choice(STATUSES + ["unknown"])
+            tree.set_tag(point, self.tags[point])
+
+        for tags in (
+            ["used"],
+            ["unknown"],
+            ["operational", "malfunctioning"],
+            ["missing"],
+        ):
+            found = [distance for distance, _ in tree.iter_nearest(200, 100, tags)]
+            self.assertDistancesEqual(found, self.brute_force(200, 100, tags), tags)
+
+    def test_empty(self):
+        """
+        Test that an empty tree yields nothing.
+        """
+        self.assertEqual(list(PointKDTree([], []).iter_nearest(0, 0)), [])
+
+
+class TestStationIndexNearest(unittest.TestCase):
+    """
+    Tests for the nearest station search of the station index.
+    """
+
+    def setUp(self):
+        random.seed(5)
+        self.stations = [
+            {
+                "id": index + 1,
+                "latitude": random.uniform(52.3, 52.7),
+                "longitude": random.uniform(13.1, 13.7),
+                "functional": random.choice(STATUSES),
+                "charging_type": random.choice(["fast", "normal", "None"]),
+                "nominal_power": random.choice([None, 11, 22, 50, 150]),
+            }
+            for index in range(2000)
+        ]
+        self.index = StationIndex(self.stations)
+
+    def brute_force(self, lon, lat, k, accept) -> list[int]:
+        distances = sorted(
+            (haversine_distance(lon, lat, s["longitude"], s["latitude"]), s["id"])
+            for s in self.stations
+            if accept(s)
+        )
+        return [station_id for _, station_id in distances[:k]]
+
+    def test_matches_haversine_brute_force(self):
+        """
+        Test that the search finds the closest stations by great-circle distance.
+        """
+        cases = [
+            ({}, lambda s: True),
+            (
+                {"functional": ["operational"]},
+                lambda s: s["functional"] == "operational",
+            ),
+            (
+                {"charging_type": "fast", "min_nominal_power": 50},
+                lambda s: s["charging_type"] == "fast"
+                and s["nominal_power"] is not None
+                and s["nominal_power"] >= 50,
+            ),
+        ]
+        for lon, lat in [(13.4, 52.5), (13.0, 52.9), (10.0, 53.5)]:
+            for filters, accept in cases:
+                found = self.index.nearest(lon, lat, 10, **filters)
+                self.assertEqual(
+                    [station["id"] for _, station in found],
+                    self.brute_force(lon, lat, 10, accept),
+                )
+                self.assertEqual(
+                    [distance for distance, _ in found],
+                    sorted(distance for distance, _ in found),
+                )
+
+    def test_status_change(self):
+        """
+        Test that a changed status is found without rebuilding the index.
+        """
+        found = self.index.nearest(13.4, 52.5, 1, functional=["operational"])
+        closest = found[0][1]
+        self.index.update_station(closest["id"], {"functional": "malfunctioning"})
+
+        found = self.index.nearest(13.4, 52.5, 1, functional=["operational"])
+        self.assertNotEqual(found[0][1]["id"], closest["id"])
+        found = self.index.nearest(13.4, 52.5, 1, functional=["malfunctioning"])
+        self.assertEqual(found[0][1]["id"], closest["id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
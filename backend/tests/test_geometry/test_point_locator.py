@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from app.domain.geometry.geometry_store import PolygonGeometry
+from app.domain.geometry.point_locator import PolygonLocator
+
+
+def square(x: float, y: float, size: float) -> str:
+    return (
+        f"({x} {y}, {x + size} {y}, {x + size} {y + size}, " f"{x} {y + size}, {x} {y})"
+    )
+
+
+class TestPolygonLocator(unittest.TestCase):
+    """
+    Tests for the grid index of polygons.
+    """
+
+    def setUp(self):
+        # Squares sharing their borders, the first one with a hole
+        self.geometries = {
+            "a": PolygonGeometry.from_wkt(
+                f"POLYGON ({square(0, 0, 2)}, {square(0.5, 0.5, 0.5)})"
+            ),
+            "b": PolygonGeometry.from_wkt(f"POLYGON ({square(2, 0, 2)})"),
+            "c": PolygonGeometry.from_wkt(f"POLYGON ({square(0, 2, 2)})"),
+            "d": PolygonGeometry.from_wkt(
+                f"MULTIPOLYGON (({square(2, 2, 1)}), ({square(3, 3, 1)}))"
+            ),
+            # Overlaps the interior of "b", whose points are found first
+            "e": PolygonGeometry.from_wkt(f"POLYGON ({square(2.5, 0.5, 1)})"),
+        }
+
+    def test_matches_point_in_polygon(self):
+        """
+        Test that every grid size finds the same polygon as testing all polygons.
+        """
+        random.seed(7)
+        points = [(random.uniform(-1, 5), random.uniform(-1, 5)) for _ in range(2000)]
+        expected = [
+            next(
+                (key for key, g in self.geometries.items() if g.contains(lon, lat)),
+                None,
+            )
+            for lon, lat in points
+        ]
+
+        for grid in (1, 7, 64):
+            with self.subTest(grid=grid):
+                locator = PolygonLocator(self.geometries, grid)
+                lons, lats = zip(*points)
+                self.assertEqual(locator.locate_many(lons, lats), expected)
+
+    def test_batch_matches_single_points(self):
+        """
+        Test that the batch lookup agrees with single lookups on and next to edges.
+        """
+        locator = PolygonLocator(self.geometries, 8)
+        points = [(x / 8, y / 8) for x in range(-4, 37) for y in range(-4, 37)]
+        lons, lats = zip(*points)
+        self.assertEqual(
+            locator.locate_many(lons, lats),
+            [locator.locate(lon, lat) for lon, lat in points],
+        )
+
+    def test_cells_and_misses(self):
+        """
+        Test holes, gaps of a multipolygon, points outside and the resolved cells.
+        """
+        locator = PolygonLocator(self.geometries, 16)
+
+        self.assertEqual(locator.bbox, (0, 0, 4, 4))
+        self.assertEqual(locator.locate(1.5, 1.5), "a")
+        self.assertIsNone(locator.locate(0.75, 0.75))  # hole
+        self.assertEqual(locator.locate(3.5, 3.5), "d")
+        self.assertEqual(locator.locate(3, 1), "b")
+        self.assertIsNone(locator.locate(2.5, 3.5))  # gap of the multipolygon
+        self.assertIsNone(locator.locate(-0.5, 1))
+        self.assertGreater(locator.resolved_share, 0.5)
+
+    def test_empty(self):
+        """
+        Test that an empty locator finds nothing.
+        """
+        locator = PolygonLocator({})
+        self.assertIsNone(locator.locate(13.4, 52.5))
+        self.assertEqual(locator.locate_many([13.4], [52.5]), [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import math
+import unittest
+from array import array
+
+from app.domain.geometry.polygon import (
+    METERS_PER_DEGREE,
+    polygon_metrics,
+    ring_signed_area,
+)
+
+
+def ring(*points) -> array:
+    return array("d", [value for point in points for value in point])
+
+
+class TestPolygonMetrics(unittest.TestCase):
+    """
+    Unit tests for measuring polygons.
+    """
+
+    def test_ring_signed_area(self):
+        """
+        Test area and orientation of open and closed rings.
+        """
+        square = ring((0, 0), (2, 0), (2, 2), (0, 2))
+        self.assertEqual(ring_signed_area(square), 4)
+        self.assertEqual(
+            ring_signed_area(ring((0, 0), (2, 0), (2, 2), (0, 2), (0, 0))), 4
+        )
+        self.assertEqual(ring_signed_area(ring((0, 0), (0, 2), (2, 2), (2, 0))), -4)
+
+    def test_polygon_with_hole(self):
+        """
+        Test bbox, centroid, area and vertex count of a polygon with a hole.
+        """
+        exterior = ring((0, 0), (4, 0), (4, 4), (0, 4), (0, 0))
+        hole = ring((2, 0), (4, 0), (4, 4), (2, 4), (2, 0))  # clockwise or not
+        metrics = polygon_metrics([[exterior, hole]])
+
+        self.assertEqual(
+            (
+                metrics.min_longitude,
+                metrics.min_latitude,
+                metrics.max_longitude,
+                metrics.max_latitude,
+            ),
+            (0, 0, 4, 4),
+        )
+        self.assertAlmostEqual(metrics.centroid_longitude, 1)
+        self.assertAlmostEqual(metrics.centroid_latitude, 2)
+        self.assertAlmostEqual(
+            metrics.area, 8 * METERS_PER_DEGREE**2 * math.cos(math.radians(2))
+        )
+        self.assertEqual(metrics.vertex_count, 10)
+
+    def test_multipolygon(self):
+        """
+        Test that the parts of a multipolygon add up.
+        """
+        left = ring((0, 0), (1, 0), (1, 1), (0, 1))
+        right = ring((3, 0), (4, 0), (4, 1), (3, 1))
+        metrics = polygon_metrics([[left], [right]])
+
+        self.assertAlmostEqual(metrics.centroid_longitude, 2)
+        self.assertAlmostEqual(
+            metrics.area, 2 * METERS_PER_DEGREE**2 * math.cos(math.radians(0.5))
+        )
+
+    def test_degenerate_polygon(self):
+        """
+        Test that a polygon without area uses the mean of its points.
+        """
+        metrics = polygon_metrics([[ring((13.0, 52.0), (13.2, 52.2))]])
+
+        self.assertEqual(metrics.area, 0)
+        self.assertAlmostEqual(metrics.centroid_longitude, 13.1)
+        self.assertAlmostEqual(metrics.centroid_latitude, 52.1)
+        self.assertEqual(set(metrics.as_columns()), set(metrics.COLUMNS))
+
+
+if __name__ == "__main__":
+    unittest.main()
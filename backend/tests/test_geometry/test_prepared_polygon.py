@@ -0,0 +1,67 @@
+import unittest
+from array import array
+
+from app.domain.geometry.prepared_polygon import (
+    PreparedPolygon,
+    dominant_key,
+    overlap_shares,
+)
+
+
+def square(x: float, y: float, size: float) -> list[array]:
+    return [
+        array("d", [x, y, x + size, y, x + size, y + size, x, y + size, x, y]),
+    ]
+
+
+class TestPreparedPolygon(unittest.TestCase):
+    """
+    Unit tests for point-in-polygon tests and overlap estimates.
+    """
+
+    def test_contains_with_hole(self):
+        """
+        Test points inside, outside and in the hole of a polygon.
+        """
+        outer = square(0, 0, 4)[0]
+        hole = square(1, 1, 2)[0]
+        polygon = PreparedPolygon([[outer, hole]])
+
+        self.assertEqual(polygon.bbox, (0, 0, 4, 4))
+        self.assertTrue(polygon.contains(0.5, 0.5))
+        self.assertTrue(polygon.contains(3.5, 2))
+        self.assertFalse(polygon.contains(2, 2))
+        self.assertFalse(polygon.contains(5, 2))
+
+    def test_contains_multipolygon(self):
+        """
+        Test that every part of a multipolygon is found.
+        """
+        polygon = PreparedPolygon([square(0, 0, 1), square(10, 10, 1)])
+
+        self.assertTrue(polygon.contains(0.5, 0.5))
+        self.assertTrue(polygon.contains(10.5, 10.5))
+        self.assertFalse(polygon.contains(5, 5))
+
+    def test_overlap_shares(self):
+        """
+        Test the split of a rectangle between two neighbours.
+        """
+        rectangle = PreparedPolygon([[array("d", [0, 0, 4, 0, 4, 1, 0, 1, 0, 0])]])
+        candidates = {
+            "left": PreparedPolygon([square(-2, -1, 3)]),
+            "right": PreparedPolygon([square(1, -1, 5)]),
+            "far": PreparedPolygon([square(50, 50, 1)]),
+        }
+
+        shares = overlap_shares(rectangle, candidates, grid=20)
+
+        self.assertEqual(set(shares), {"left", "right"})
+        self.assertAlmostEqual(shares["left"], 0.25)
+        self.assertAlmostEqual(shares["right"], 0.75)
+        self.assertEqual(dominant_key(shares), "right")
+        self.assertIsNone(dominant_key({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import random
+import unittest
+
+from app.domain.geometry.rtree import PointRTree
+from app.domain.geometry.station_index import StationIndex, StationIndexCache
+
+
+def brute_force(xs, ys, min_x, min_y, max_x, max_y) -> list[int]:
+    return [
+        index
+        for index, (x, y) in enumerate(zip(xs, ys))
+        if min_x <= x <= max_x and min_y <= y <= max_y
+    ]
+
+
+class TestPointRTree(unittest.TestCase):
+    """
+    Tests for the STR-packed R-tree.
+    """
+
+    def test_matches_brute_force(self):
+        """
+        Test that random boxes find the same points as testing all points.
+        """
+        random.seed(3)
+        xs = [random.uniform(13.1, 13.7) for _ in range(5000)]
+        ys = [random.uniform(52.3, 52.7) for _ in range(5000)]
+        # Duplicates and points on the box borders
+        xs += [13.4, 13.4, 13.5]
+        ys += [52.5, 52.5, 52.6]
+
+        for node_capacity in (2, 16, 64):
+            tree = PointRTree(xs, ys, node_capacity)
+            boxes = [(13.4, 52.5, 13.5, 52.6), (0, 0, 90, 90), (14, 53, 15, 54)]
+            for _ in range(200):
+                x1, x2 = sorted(random.uniform(13.0, 13.8) for _ in range(2))
+                y1, y2 = sorted(random.uniform(52.2, 52.8) for _ in range(2))
+                boxes.append((x1, y1, x2, y2))
+            for box in boxes:
+                self.assertEqual(
+                    sorted(tree.query(*box)), brute_force(xs, ys, *box), box
+                )
+
+    def test_empty_and_single(self):
+        """
+        Test trees without points and with one point.
+        """
+        self.assertEqual(PointRTree([], []).query(-180, -90, 180, 90), [])
+
+        tree = PointRTree([13.4], [52.5])
+        self.assertEqual(tree.query(13.4, 52.5, 13.4, 52.5), [0])
+        self.assertEqual(tree.query(13.5, 52.5, 13.6, 52.6), [])
+
+
+class TestStationIndexCache(unittest.TestCase):
+    """
+    Tests for the memo of the station index.
+    """
+
+    def setUp(self):
+        self.cache = StationIndexCache()
+        self.builds = 0
+
+    def build(self) -> StationIndex:
+        self.builds += 1
+        return StationIndex(
+            [
+                {"id": 1, "latitude": 52.5, "longitude": 13.4, "functional": "used"},
+                {"id": 2, "latitude": 52.6, "longitude": 13.5, "functional": "used"},
+            ]
+        )
+
+    def test_memoized_until_invalidated(self):
+        """
+        Test that the index is built once and again after an invalidation.
+        """
+        index = self.cache.get(self.build)
+        self.assertIs(self.cache.get(self.build), index)
+        self.assertEqual(self.builds, 1)
+
+        self.cache.invalidate()
+        self.assertIsNot(self.cache.get(self.build), index)
+        self.assertEqual(self.builds, 2)
+
+    def test_update_station(self):
+        """
+        Test that status changes are applied to the kept index.
+        """
+        index = self.cache.get(self.build)
+        before = index.within_bbox(13.4, 52.5, 13.4, 52.5)
+
+        self.cache.update_station(1, {"functional": "operational"})
+
+        self.assertIs(self.cache.get(self.build), index)
+        self.assertEqual(
+            index.within_bbox(13.4, 52.5, 13.4, 52.5)[0]["functional"], "operational"
+        )
+        self.assertEqual(before[0]["functional"], "used")
+
+    def test_update_unknown_station(self):
+        """
+        Test that a change of a station missing in the index drops the index.
+        """
+        self.cache.get(self.build)
+        self.cache.update_station(3, {"functional": "operational"})
+        self.cache.get(self.build)
+        self.assertEqual(self.builds, 2)
+
+    def test_stations_added(self):
+        """
+        Test that added stations extend the kept index instead of a rebuild.
+        """
+        index = self.cache.get(self.build)
+        self.assertEqual(index.within_bbox(13.6, 52.7, 13.6, 52.7), [])
+
+        added = {"id": 3, "latitude": 52.7, "longitude": 13.6, "functional": "used"}
+        self.cache.stations_added()
+        self.assertIs(self.cache.get(self.build, lambda after_id: [added]), index)
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(index.max_id, 3)
+        self.assertEqual(index.within_bbox(13.6, 52.7, 13.6, 52.7), [added])
+        self.assertEqual(index.within(13.6, 52.7, 1)[0][1], added)
+        self.assertEqual(index.nearest(13.6, 52.7, 1)[0][1], added)
+
+    def test_build_overlapping_invalidation(self):
+        """
+        Test that an index read before an invalidation is not kept.
+        """
+
+        def build():
+            self.cache.invalidate()
+            return self.build()
+
+        self.cache.get(build)
+        self.cache.get(self.build)
+        self.assertEqual(self.builds, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import math
+import unittest
+from collections import Counter
+
+from app.domain.geometry.polygon import EARTH_RADIUS_M
+from app.domain.geometry.simplification import (
+    DEFAULT_ZOOMS,
+    SimplifiedPolygons,
+    douglas_peucker,
+    meters_per_pixel,
+)
+from app.domain.geometry.wkt import parse_wkt_polygons
+from tests.test_geometry.polygon_grid import grid_polygons
+
+
+def directed_edges(wkt_texts: dict) -> Counter:
+    edges = Counter()
+    for text in wkt_texts.values():
+        for rings in parse_wkt_polygons(text):
+            for ring in rings:
+                points = list(zip(ring[0::2], ring[1::2]))
+                edges.update(zip(points, points[1:]))
+    return edges
+
+
+class TestDouglasPeucker(unittest.TestCase):
+    """
+    Tests for simplifying a line with Douglas-Peucker.
+    """
+
+    def test_straight_line_keeps_end_points(self):
+        """
+        Test that points on the line between the end points are dropped.
+        """
+        points = [(float(x), 2.0 * x) for x in range(10)]
+        self.assertEqual(douglas_peucker(points, 0.01), [0, 9])
+
+    def test_tolerance(self):
+        """
+        Test that only points farther than the tolerance are kept.
+        """
+        points = [(0.0, 0.0), (1.0, 0.5), (2.0, 0.0), (3.0, 3.0), (4.0, 0.0)]
+        self.assertEqual(douglas_peucker(points, 1.5), [0, 3, 4])
+        self.assertEqual(douglas_peucker(points, 1.0), [0, 2, 3, 4])
+        self.assertEqual(douglas_peucker(points, 0.3), [0, 1, 2, 3, 4])
+
+    def test_min_interior_keeps_farthest_point(self):
+        """
+        Test that `min_interior` keeps the farthest points within the tolerance.
+        """
+        points = [(0.0, 0.0), (1.0, 0.1), (2.0, 0.3), (3.0, 0.0)]
+        self.assertEqual(douglas_peucker(points, 1.0), [0, 3])
+        self.assertEqual(douglas_peucker(points, 1.0, min_interior=1), [0, 2, 3])
+
+    def test_short_lines(self):
+        """
+        Test that lines without interior points are returned as they are.
+        """
+        self.assertEqual(douglas_peucker([(0.0, 0.0), (1.0, 1.0)], 5.0), [0, 1])
+        self.assertEqual(douglas_peucker([(0.0, 0.0)], 5.0), [0])
+
+
+class TestSimplifiedPolygons(unittest.TestCase):
+    """
+    Tests for the per zoom level simplification of neighbouring polygons.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.geometries = grid_polygons(3, 3)
+        cls.simplified = SimplifiedPolygons(cls.geometries)
+
+    def test_levels(self):
+        """
+        Test that coarser levels have fewer vertices and bytes.
+        """
+        levels = self.simplified.levels
+        self.assertEqual(
+            [level["zoom"] for level in levels], [None, *sorted(DEFAULT_ZOOMS)]
+        )
+        full, *coarse = levels
+        for finer, coarser in zip([full, *reversed(coarse)], reversed(coarse)):
+            self.assertLessEqual(coarser["vertices"], finer["vertices"])
+            self.assertLessEqual(coarser["wkt_bytes"], finer["wkt_bytes"])
+        self.assertLess(coarse[0]["wkt_bytes"], full["wkt_bytes"] / 4)
+
+    def test_shared_borders_stay_closed(self):
+        """
+        Test that at every level each inner edge is used by both neighbours,
+        so the simplified polygons have no gaps or overlaps.
+        """
+        for level in (None, *self.simplified.zooms):
+            texts = self.simplified.wkt_at_level(level)
+            self.assertEqual(texts.keys(), self.geometries.keys())
+            edges = directed_edges(texts)
+            # The outer frame is the only part walked in one direction
+            unmatched = [edge for edge in edges if (edge[1], edge[0]) not in edges]
+            self.assertTrue(unmatched)
+            for start, end in unmatched:
+                self.assertTrue(start[0] == end[0] or start[1] == end[1], level)
+            for edge, count in edges.items():
+                self.assertEqual(count, 1, level)
+
+    def test_level_zoom(self):
+        """
+        Test that a zoom level is served by the next finer simplified level.
+        """
+        self.assertEqual(self.simplified.level_zoom(3), 8)
+        self.assertEqual(self.simplified.level_zoom(9), 10)
+        self.assertEqual(self.simplified.level_zoom(14), 14)
+        self.assertIsNone(self.simplified.level_zoom(15))
+
+    def test_meters_per_pixel(self):
+        """
+        Test the ground resolution at the equator and its halving per level.
+        """
+        self.assertAlmostEqual(
+            meters_per_pixel(0, 0.0), 2 * math.pi * EARTH_RADIUS_M / 256
+        )
+        self.assertAlmostEqual(
+            meters_per_pixel(12, 52.5) * 2, meters_per_pixel(11, 52.5)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
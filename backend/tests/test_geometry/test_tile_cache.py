@@ -0,0 +1,85 @@
+import unittest
+
+from app.domain.geometry.tile_cache import TileCache
+from app.domain.geometry.vector_tile import tile_bounds
+
+
+class TestTileCache(unittest.TestCase):
+    """
+    Tests for the LRU cache of encoded tiles.
+    """
+
+    def setUp(self):
+        self.builds = []
+        self.sources = (object(), object())
+
+    def build(self, tile):
+        def build():
+            self.builds.append(tile)
+            return repr(tile).encode()
+
+        return build
+
+    def test_hits_and_lru_eviction(self):
+        """
+        Test that tiles are kept until they are the least recently used.
+        """
+        cache = TileCache(max_tiles=2)
+        a, b, c = (10, 0, 0), (10, 1, 0), (10, 2, 0)
+        self.assertEqual(cache.get(a, self.sources, self.build(a)), b"(10, 0, 0)")
+        cache.get(b, self.sources, self.build(b))
+        cache.get(a, self.sources, self.build(a))
+        cache.get(c, self.sources, self.build(c))
+        cache.get(a, self.sources, self.build(a))
+        cache.get(b, self.sources, self.build(b))
+
+        self.assertEqual(self.builds, [a, b, c, b])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.info()["tiles"], 2)
+
+    def test_other_sources_rebuild(self):
+        """
+        Test that a tile built from other objects is built again.
+        """
+        cache = TileCache()
+        tile = (12, 2200, 1343)
+        cache.get(tile, self.sources, self.build(tile))
+        cache.get(tile, (self.sources[0], object()), self.build(tile))
+        cache.get(tile, self.sources, self.build(tile))
+        self.assertEqual(len(self.builds), 3)
+
+    def test_discard_point(self):
+        """
+        Test that only the tiles showing a point are dropped, at every zoom level.
+        """
+        cache = TileCache()
+        tiles = [(14, 8801, 5373), (14, 8802, 5373), (12, 2200, 1343), (5, 17, 10)]
+        for tile in tiles:
+            cache.get(tile, self.sources, self.build(tile))
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(14, 8801, 5373)
+        cache.discard_point((min_lon + max_lon) / 2, (min_lat + max_lat) / 2)
+
+        for tile in tiles:
+            cache.get(tile, self.sources, self.build(tile))
+        self.assertEqual(
+            self.builds[4:], [(14, 8801, 5373), (12, 2200, 1343), (5, 17, 10)]
+        )
+
+    def test_build_overlapping_discard_not_kept(self):
+        """
+        Test that a tile built while tiles were dropped is not kept.
+        """
+        cache = TileCache()
+        tile = (5, 17, 10)
+
+        def build():
+            cache.clear()
+            return b"stale"
+
+        self.assertEqual(cache.get(tile, self.sources, build), b"stale")
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import unittest
+
+from app.domain.geometry.topojson import QuantizedTopology
+from app.domain.geometry.topology import PolygonTopology
+from tests.test_geometry.polygon_grid import CELL, grid_polygons
+from tests.test_geometry.test_topology import square
+
+
+class TestQuantizedTopology(unittest.TestCase):
+    """
+    Tests for the quantized, delta-encoded topology and its TopoJSON.
+    """
+
+    def setUp(self):
+        self.geometries = grid_polygons(3, 2)
+        self.topology = PolygonTopology(self.geometries)
+        self.quantized = QuantizedTopology(self.topology, quantization=10_000)
+
+    def test_arcs_decode_within_a_grid_step(self):
+        """
+        Test that the decoded arcs stay within half a grid step of the input.
+        """
+        scale_x, scale_y = self.quantized.scale
+        for index, arc in enumerate(self.topology.arcs):
+            decoded = self.quantized.decode_arc(index)
+            self.assertEqual(len(decoded), len(arc))
+            for (lon, lat), (decoded_lon, decoded_lat) in zip(arc, decoded):
+                self.assertLessEqual(abs(lon - decoded_lon), scale_x / 2 + 1e-12)
+                self.assertLessEqual(abs(lat - decoded_lat), scale_y / 2 + 1e-12)
+
+    def test_delta_encoding(self):
+        """
+        Test that only the first point of an arc is absolute and the values
+        are on the grid of the bounding box.
+        """
+        self.assertEqual(self.quantized.bbox[:2], (13.3, 52.4))
+        self.assertAlmostEqual(self.quantized.scale[0], 3 * CELL / 9_999)
+        first = self.quantized.arcs[0]
+        self.assertEqual(self.quantized.vertex_count, self.topology.vertex_count)
+        self.assertEqual(self.quantized.nbytes, self.quantized.vertex_count * 8)
+        for values in self.quantized.arcs:
+            steps = list(values[2:])
+            self.assertLess(max(map(abs, steps)), 1_000)
+        self.assertGreaterEqual(min(first[:2]), 0)
+
+    def test_coarse_grid_drops_merged_points(self):
+        """
+        Test that points on the grid point of their predecessor are dropped
+        and arcs keep their end points.
+        """
+        quantized = QuantizedTopology(self.topology, quantization=10)
+        self.assertLess(quantized.vertex_count, self.topology.vertex_count)
+        for index, arc in enumerate(self.topology.arcs):
+            decoded = quantized.decode_arc(index)
+            self.assertGreaterEqual(len(decoded), 2)
+            self.assertEqual(arc[0] == arc[-1], decoded[0] == decoded[-1])
+
+    def test_topojson(self):
+        """
+        Test the TopoJSON document, with the keys as ids and MultiPolygons.
+        """
+        quantized = QuantizedTopology.from_geometries(
+            {
+                "single": [[square(13.0, 52.0, 0.5)]],
+                "multi": [[square(14.0, 52.0, 0.5)], [square(15.0, 52.0, 0.5)]],
+            }
+        )
+        topojson = json.loads(quantized.encode("areas"))
+
+        self.assertEqual(topojson["type"], "Topology")
+        self.assertEqual(topojson["transform"]["translate"], [13.0, 52.0])
+        single, multi = topojson["objects"]["areas"]["geometries"]
+        self.assertEqual(single, {"type": "Polygon", "arcs": [[0]], "id": "single"})
+        self.assertEqual(
+            multi, {"type": "MultiPolygon", "arcs": [[[1]], [[2]]], "id": "multi"}
+        )
+        self.assertEqual(len(topojson["arcs"]), 3)
+        self.assertEqual(topojson["arcs"][0][0], [0, 0])
+        self.assertNotIn(b" ", quantized.encode("areas"))
+
+
+if __name__ == "__main__":
+    unittest.main()
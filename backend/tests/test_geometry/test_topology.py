@@ -0,0 +1,146 @@
+import unittest
+from array import array
+
+from app.domain.geometry.polygon import ring_signed_area
+from app.domain.geometry.topology import PolygonTopology
+from tests.test_geometry.polygon_grid import (
+    CELL,
+    POINTS_PER_EDGE,
+    grid_polygons,
+)
+
+
+def square(min_lon: float, min_lat: float, size: float, reverse: bool = False):
+    points = [
+        (min_lon, min_lat),
+        (min_lon + size, min_lat),
+        (min_lon + size, min_lat + size),
+        (min_lon, min_lat + size),
+    ]
+    if reverse:
+        points.reverse()
+    points.append(points[0])
+    return array("d", [value for point in points for value in point])
+
+
+def ring_points(ring) -> list:
+    return list(zip(ring[0::2], ring[1::2]))[:-1]
+
+
+def same_ring(a, b) -> bool:
+    """
+    Compare two closed rings independent of their start point.
+    """
+    points_a, points_b = ring_points(a), ring_points(b)
+    if len(points_a) != len(points_b) or not points_a:
+        return False
+    start = points_b.index(points_a[0]) if points_a[0] in points_b else -1
+    return start >= 0 and points_b[start:] + points_b[:start] == points_a
+
+
+class TestPolygonTopology(unittest.TestCase):
+    """
+    Tests for splitting neighbouring polygons into shared arcs.
+    """
+
+    def setUp(self):
+        self.geometries = grid_polygons(3, 2)
+        self.topology = PolygonTopology(self.geometries)
+
+    def test_shared_borders_are_one_arc(self):
+        """
+        Test that every inner border is stored once and walked both ways.
+        """
+        input_vertices = sum(
+            len(ring) // 2 - 1
+            for polygons in self.geometries.values()
+            for rings in polygons
+            for ring in rings
+        )
+        # 7 inner borders, and the outer frame cut into 6 arcs where they meet it
+        self.assertEqual(len(self.topology.arcs), 13)
+        self.assertEqual(self.topology.vertex_count, (7 + 10) * POINTS_PER_EDGE + 13)
+        self.assertLess(self.topology.vertex_count, input_vertices)
+
+        refs = [
+            ref
+            for polygons in self.topology.polygons.values()
+            for polygon in polygons
+            for ring in polygon
+            for ref in ring
+        ]
+        arc_uses = {}
+        for ref in refs:
+            arc_uses.setdefault(ref if ref >= 0 else ~ref, []).append(ref >= 0)
+        self.assertTrue(any(ref < 0 for ref in refs))
+        for uses in arc_uses.values():
+            self.assertIn(uses, ([True], [True, False]))
+
+    def test_roundtrip(self):
+        """
+        Test that the rings rebuilt from the arcs equal the input rings.
+        """
+        rebuilt = self.topology.geometries()
+        self.assertEqual(rebuilt.keys(), self.geometries.keys())
+        for key, polygons in self.geometries.items():
+            [[ring]] = polygons
+            [[rebuilt_ring]] = rebuilt[key]
+            self.assertTrue(same_ring(ring, rebuilt_ring), key)
+
+    def test_enclave_shares_its_ring_with_the_hole(self):
+        """
+        Test that an enclave and the hole around it become one closed arc.
+        """
+        topology = PolygonTopology(
+            {
+                "outer": [[square(13.0, 52.0, 1.0), square(13.2, 52.2, 0.5, True)]],
+                "enclave": [[square(13.2, 52.2, 0.5)]],
+            }
+        )
+        self.assertEqual(len(topology.arcs), 2)
+        [[_, [hole]]] = topology.polygons["outer"]
+        [[[enclave]]] = topology.polygons["enclave"]
+        self.assertEqual(hole, ~enclave)
+        arc = topology.arcs[enclave]
+        self.assertEqual(arc[0], arc[-1])
+        self.assertEqual(len(arc), 5)
+
+    def test_outline_of_the_grid(self):
+        """
+        Test that the outline of the grid is the frame around all cells.
+        """
+        [[ring]] = self.topology.outline()
+        lons, lats = ring[0::2], ring[1::2]
+        self.assertEqual((min(lons), max(lons)), (13.3, 13.3 + 3 * CELL))
+        self.assertEqual((min(lats), max(lats)), (52.4, 52.4 + 2 * CELL))
+        self.assertEqual(ring[:2], ring[-2:])
+        self.assertAlmostEqual(ring_signed_area(ring), 6 * CELL * CELL)
+
+    def test_outline_keeps_holes(self):
+        """
+        Test that a hole not filled by another polygon stays a hole of the outline.
+        """
+        topology = PolygonTopology(
+            {
+                "outer": [[square(13.0, 52.0, 1.0), square(13.2, 52.2, 0.5, True)]],
+                "west": [[square(12.0, 52.0, 1.0, True)]],
+            }
+        )
+        [[exterior, hole]] = topology.outline()
+        self.assertGreater(ring_signed_area(exterior), 0)
+        self.assertLess(ring_signed_area(hole), 0)
+        self.assertTrue(same_ring(hole, square(13.2, 52.2, 0.5, True)))
+        self.assertAlmostEqual(ring_signed_area(exterior), 2.0)
+
+        filled = PolygonTopology(
+            {
+                "outer": [[square(13.0, 52.0, 1.0), square(13.2, 52.2, 0.5, True)]],
+                "enclave": [[square(13.2, 52.2, 0.5)]],
+            }
+        )
+        [[ring]] = filled.outline()
+        self.assertTrue(same_ring(ring, square(13.0, 52.0, 1.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+from array import array
+
+from app.domain.geometry.distance import web_mercator
+from app.domain.geometry.vector_tile import VectorTile, tile_bounds, tiles_containing
+from tests.test_geometry.mvt import decode_tile, ring_area
+
+# Tile 14/8801/5373 covers Berlin Mitte
+MITTE = (14, 8801, 5373)
+
+
+def square(min_lon, min_lat, max_lon, max_lat, clockwise=False) -> array:
+    points = [
+        (min_lon, min_lat),
+        (max_lon, min_lat),
+        (max_lon, max_lat),
+        (min_lon, max_lat),
+    ]
+    if clockwise:
+        points.reverse()
+    return array("d", [value for point in points + points[:1] for value in point])
+
+
+class TestVectorTile(unittest.TestCase):
+    """
+    Tests for the Mapbox Vector Tile encoder.
+    """
+
+    def test_tile_bounds(self):
+        """
+        Test the bounds of the world tile and of neighbouring tiles.
+        """
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(0, 0, 0)
+        self.assertEqual((min_lon, max_lon), (-180, 180))
+        self.assertAlmostEqual(max_lat, 85.0511287798, places=8)
+        self.assertAlmostEqual(min_lat, -max_lat)
+
+        west, east = tile_bounds(*MITTE), tile_bounds(14, 8802, 5373)
+        self.assertAlmostEqual(west[2], east[0])
+        self.assertTrue(west[0] < 13.4 < west[2] and west[1] < 52.52 < west[3])
+
+    def test_tiles_containing(self):
+        """
+        Test that a point near a tile border is also shown by the neighbouring tile.
+        """
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(*MITTE)
+        center = ((min_lon + max_lon) / 2, (min_lat + max_lat) / 2)
+        self.assertEqual(tiles_containing(*center, 14), [(8801, 5373)])
+        near_east = (max_lon - (max_lon - min_lon) * 0.001, center[1])
+        self.assertEqual(tiles_containing(*near_east, 14), [(8801, 5373), (8802, 5373)])
+        self.assertEqual(tiles_containing(*center, 0), [(0, 0)])
+
+    def test_points_and_properties(self):
+        """
+        Test the encoding of point features with their properties.
+        """
+        tile = VectorTile(*MITTE)
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(*MITTE)
+        self.assertTrue(
+            tile.add_point(
+                "stations",
+                min_lon,
+                max_lat,
+                {"name": "a", "power": 22, "delta": -3, "share": 0.5, "free": True},
+                7,
+            )
+        )
+        self.assertTrue(
+            tile.add_point("stations", max_lon, min_lat, {"name": "a", "none": None})
+        )
+        self.assertFalse(tile.add_point("stations", 13.0, 52.0, {}))
+
+        layer = decode_tile(tile.encode())["stations"]
+        self.assertEqual((layer["version"], layer["extent"]), (2, 4096))
+        first, second = layer["features"]
+        self.assertEqual((first["id"], first["type"]), (7, 1))
+        self.assertEqual(
+            first["properties"],
+            {"name": "a", "power": 22, "delta": -3, "share": 0.5, "free": True},
+        )
+        self.assertEqual(first["geometry"], [[(0, 0)]])
+        self.assertEqual(second["properties"], {"name": "a"})
+        self.assertEqual(second["geometry"], [[(4096, 4096)]])
+
+    def test_empty_tile(self):
+        """
+        Test that a tile without features encodes to no bytes.
+        """
+        self.assertEqual(VectorTile(*MITTE).encode(), b"")
+
+    def test_polygon_clipping_and_winding(self):
+        """
+        Test that polygons are clipped to the buffer and wound as required.
+        """
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(*MITTE)
+        width, height = max_lon - min_lon, max_lat - min_lat
+        center_lon, center_lat = min_lon + width / 2, min_lat + height / 2
+        for clockwise in (False, True):
+            tile = VectorTile(*MITTE)
+            exterior = square(13.0, 52.0, 14.0, 53.0, clockwise)
+            hole = square(
+                center_lon - width / 4,
+                center_lat - height / 4,
+                center_lon + width / 4,
+                center_lat + height / 4,
+                clockwise,
+            )
+            self.assertTrue(tile.add_polygons("areas", [[exterior, hole]], {}, 1))
+
+            [feature] = decode_tile(tile.encode())["areas"]["features"]
+            self.assertEqual(feature["type"], 3)
+            outer, inner = feature["geometry"]
+            self.assertEqual(
+                sorted(outer), [(-64, -64), (-64, 4160), (4160, -64), (4160, 4160)]
+            )
+            self.assertGreater(ring_area(outer), 0)
+            self.assertLess(ring_area(inner), 0)
+            self.assertAlmostEqual(-ring_area(inner) / 2, 2048 * 2048, delta=2048 * 8)
+
+    def test_polygon_outside_or_collapsed(self):
+        """
+        Test that polygons outside the tile or smaller than a grid unit are left out.
+        """
+        tile = VectorTile(*MITTE)
+        self.assertFalse(
+            tile.add_polygons("areas", [[square(12.0, 51.0, 12.1, 51.1)]], {})
+        )
+        lon, lat = 13.4, 52.52
+        tiny = square(lon, lat, lon + 1e-7, lat + 1e-7)
+        self.assertFalse(tile.add_polygons("areas", [[tiny]], {}))
+        self.assertEqual(tile.encode(), b"")
+
+    def test_quantization_matches_projection(self):
+        """
+        Test that polygon vertices land on the rounded projected position.
+        """
+        z, x, y = MITTE
+        tile = VectorTile(z, x, y)
+        ring = square(13.39, 52.515, 13.40, 52.52)
+        tile.add_polygons("areas", [[ring]], {"postal_code": 10115}, 10115)
+
+        [feature] = decode_tile(tile.encode())["areas"]["features"]
+        self.assertEqual(feature["properties"], {"postal_code": 10115})
+        expected = set()
+        for lon, lat in zip(ring[0::2], ring[1::2]):
+            mercator_x, mercator_y = web_mercator(lon, lat)
+            expected.add(
+                (
+                    round((mercator_x * 2**z - x) * 4096),
+                    round((mercator_y * 2**z - y) * 4096),
+                )
+            )
+        self.assertEqual(set(feature["geometry"][0]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
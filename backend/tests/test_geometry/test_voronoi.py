@@ -0,0 +1,128 @@
+import random
+import unittest
+from array import array
+
+from app.domain.geometry.polygon import polygon_metrics
+from app.domain.geometry.prepared_polygon import PreparedPolygon
+from app.domain.geometry.voronoi import VoronoiCells
+
+# An L-shaped outline of about 2 x 2 km with the north-east quarter missing
+L_SHAPE = [
+    [
+        array(
+            "d",
+            [
+                13.40, 52.50,
+                13.43, 52.50,
+                13.43, 52.51,
+                13.415, 52.51,
+                13.415, 52.52,
+                13.40, 52.52,
+                13.40, 52.50,
+            ],
+        )
+    ]
+]  # fmt: skip
+
+
+def random_points(count: int, seed: int) -> list[tuple[int, float, float]]:
+    prepared = PreparedPolygon(L_SHAPE)
+    generator = random.Random(seed)
+    points = []
+    while len(points) < count:
+        lon = generator.uniform(13.40, 13.43)
+        lat = generator.uniform(52.50, 52.52)
+        if prepared.contains(lon, lat):
+            points.append((len(points), lon, lat))
+    return points
+
+
+class TestVoronoiCells(unittest.TestCase):
+    """
+    Tests for the Voronoi cells clipped to an outline.
+    """
+
+    def setUp(self):
+        self.outline_area = polygon_metrics(L_SHAPE).area
+
+    def test_cells_cover_the_outline(self):
+        """
+        Test that the cells split the outline without gaps or overlaps and
+        contain their sites.
+        """
+        points = random_points(60, seed=1)
+        cells = VoronoiCells(L_SHAPE, points, bucket_size=300)
+
+        self.assertEqual(len(cells), 60)
+        self.assertAlmostEqual(
+            sum(area for _, _, area in cells.cells()) / self.outline_area, 1, places=6
+        )
+        for key, lon, lat in points:
+            polygons, area = cells.cell(key)
+            self.assertGreater(area, 0)
+            self.assertTrue(PreparedPolygon(polygons).contains(lon, lat))
+
+    def test_two_sites_split_at_the_bisector(self):
+        """
+        Test that two sites split the outline at their bisector.
+        """
+        cells = VoronoiCells(
+            L_SHAPE, [("west", 13.405, 52.505), ("east", 13.425, 52.505)]
+        )
+        west, _ = cells.cell("west")
+        lons = [lon for rings in west for ring in rings for lon in ring[0::2]]
+        self.assertAlmostEqual(max(lons), 13.415)
+        self.assertAlmostEqual(
+            (cells.cell("west")[1] + cells.cell("east")[1]) / self.outline_area,
+            1,
+            places=6,
+        )
+        # The west half also holds the northern arm of the L
+        self.assertAlmostEqual(
+            cells.cell("west")[1] / cells.cell("east")[1], 2, places=3
+        )
+
+    def test_incremental_updates(self):
+        """
+        Test that adding and removing sites gives the cells of a new diagram.
+        """
+        points = random_points(80, seed=2)
+        cells = VoronoiCells(L_SHAPE, points[:50], bucket_size=300)
+        for point in points[50:]:
+            cells.add(*point)
+        for key in range(0, 80, 3):
+            self.assertTrue(cells.remove(key))
+        self.assertFalse(cells.remove(0))
+
+        remaining = [point for point in points if point[0] % 3]
+        expected = VoronoiCells(L_SHAPE, remaining, bucket_size=300)
+        for key, _, _ in remaining:
+            self.assertAlmostEqual(
+                cells.cell(key)[1] / expected.cell(key)[1], 1, places=6
+            )
+        self.assertNotIn(0, cells)
+
+    def test_shared_location(self):
+        """
+        Test that keys at the same location share a cell until the last is removed.
+        """
+        cells = VoronoiCells(
+            L_SHAPE, [(1, 13.405, 52.505), (2, 13.405, 52.505), (3, 13.425, 52.505)]
+        )
+        self.assertEqual([keys for keys, _, _ in cells.cells()], [[1, 2], [3]])
+        cells.remove(1)
+        self.assertEqual([keys for keys, _, _ in cells.cells()], [[2], [3]])
+        cells.remove(2)
+        self.assertAlmostEqual(cells.cell(3)[1] / self.outline_area, 1, places=6)
+
+    def test_site_outside_the_outline(self):
+        """
+        Test that a site far outside the outline gets an empty cell.
+        """
+        cells = VoronoiCells(L_SHAPE, [(1, 13.41, 52.51), (2, 13.6, 52.7)])
+        self.assertEqual(cells.cell(2), ([], 0.0))
+        self.assertAlmostEqual(cells.cell(1)[1] / self.outline_area, 1, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
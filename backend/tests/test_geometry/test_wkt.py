@@ -0,0 +1,80 @@
+import unittest
+
+from app.domain.geometry.wkt import (
+    WktError,
+    format_wkt_polygons,
+    parse_wkt_polygons,
+)
+
+
+class TestParseWktPolygons(unittest.TestCase):
+    """
+    Unit tests for parsing WKT polygons.
+    """
+
+    def test_polygon(self):
+        """
+        Test a polygon with a hole.
+        """
+        polygons = parse_wkt_polygons(
+            "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 2 1, 2 2, 1 1))"
+        )
+        self.assertEqual(len(polygons), 1)
+        self.assertEqual(len(polygons[0]), 2)
+        self.assertEqual(list(polygons[0][0]), [0, 0, 4, 0, 4, 4, 0, 4, 0, 0])
+
+    def test_multipolygon(self):
+        """
+        Test a multipolygon with two parts.
+        """
+        polygons = parse_wkt_polygons(
+            "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), ((13.1 52.5, 13.2 52.5, "
+            "13.2 52.6, 13.1 52.5)))"
+        )
+        self.assertEqual(len(polygons), 2)
+        self.assertEqual(polygons[1][0][:2].tolist(), [13.1, 52.5])
+
+    def test_invalid(self):
+        """
+        Test that malformed WKT raises WktError.
+        """
+        for text in [
+            "POINT (1 2)",
+            "POLYGON (())",
+            "POLYGON ((0 0, 1 0, 1 1, 0 0)",
+            "POLYGON ((0 0 1, 1 0 1, 1 1 1, 0 0 1))",
+            "POLYGON ((a b, 1 0, 1 1, 0 0))",
+        ]:
+            with self.subTest(text=text):
+                with self.assertRaises(WktError):
+                    parse_wkt_polygons(text)
+
+
+class TestFormatWktPolygons(unittest.TestCase):
+    """
+    Unit tests for writing WKT polygons.
+    """
+
+    def test_round_trip(self):
+        """
+        Test that polygons and multipolygons are parsed back unchanged.
+        """
+        for text in [
+            "POLYGON ((0.0 0.0, 4.0 0.0, 4.0 4.0, 0.0 0.0), (1.0 1.0, 2.0 1.0, 1.0 1.0))",
+            "MULTIPOLYGON (((13.372394962330674 52.5382088029012, 13.1 52.5, "
+            "13.2 52.6, 13.372394962330674 52.5382088029012)), "
+            "((0.1 0.2, 0.3 0.2, 0.3 0.4, 0.1 0.2)))",
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(format_wkt_polygons(parse_wkt_polygons(text)), text)
+
+    def test_empty(self):
+        """
+        Test that an empty geometry raises WktError.
+        """
+        with self.assertRaises(WktError):
+            format_wkt_polygons([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Helpers to write small charging station registers for the ingestion tests."""
+
+import csv
+
+REGISTER_COLUMNS = [
+    "\ufeffBetreiber",
+    "Straße",
+    "Hausnummer",
+    "Adresszusatz",
+    "Postleitzahl",
+    "Ort",
+    "Bundesland",
+    "Breitengrad",
+    "Längengrad",
+    "Nennleistung Ladeeinrichtung [kW]",
+    "Art der Ladeeinrichung",
+    "Anzahl Ladepunkte",
+]
+
+
+def make_register_row(index: int, postal_code: str = "10115", **overrides) -> dict:
+    """
+    Create a valid register row, the index makes the address unique.
+    """
+    row = {
+        "\ufeffBetreiber": f"Operator {index % 7}",
+        "Straße": f"Teststraße {index}",
+        "Hausnummer": str(index % 200 + 1),
+        "Adresszusatz": "",
+        "Postleitzahl": postal_code,
+        "Ort": "Berlin",
+        "Bundesland": "Berlin",
+        "Breitengrad": f"52,{520000 + index % 9000}",
+        "Längengrad": f"13,{405000 + index % 9000}",
+        "Nennleistung Ladeeinrichtung [kW]": "22,0",
+        "Art der Ladeeinrichung": "Normalladeeinrichtung",
+        "Anzahl Ladepunkte": "2",
+    }
+    row.update(overrides)
+    return row
+
+
+def write_register_csv(file_path: str, rows: list[dict]) -> None:
+    """
+    Write the rows in the format of the Ladesäulenregister.
+    """
+    with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=REGISTER_COLUMNS, delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app, load_charging_stations_data
+from app.domain.entities.charging_station import ChargingStation, OperationStatus
+from app.domain.entities.templates.base import db
+from app.domain.entities.postal_code import PostalCode
+from app.infrastructure.ingestion.bulk_loader import (
+    bulk_load_charging_stations,
+    bulk_load_postal_codes,
+)
+from app.infrastructure.ingestion.streaming_loader import StaleImportError
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class TestBulkLoader(unittest.TestCase):
+    """
+    Integration tests for the batched charging station loader.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and a small register file.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+
+        rows = [make_register_row(i) for i in range(25)]
+        rows.append(make_register_row(100, postal_code="80331"))  # Munich
+        rows.append(make_register_row(101, **{"Anzahl Ladepunkte": "0"}))
+        write_register_csv(self.csv_path, rows)
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_bulk_load(self):
+        """
+        Test loading the register in several batches.
+        """
+        with self.app.app_context():
+            stats = bulk_load_charging_stations(self.app, self.csv_path, batch_size=10)
+
+            self.assertEqual(stats.rows_read, 27)
+            self.assertEqual(stats.rows_inserted, 25)
+            self.assertEqual(stats.rows_rejected, 2)
+            self.assertEqual(stats.reject_reasons["postal code outside of Berlin"], 1)
+            self.assertGreater(stats.rows_per_second, 0)
+
+            stations = ChargingStation.query.all()
+            self.assertEqual(len(stations), 25)
+            self.assertEqual(stations[0].functional, OperationStatus.OPERATIONAL)
+            self.assertEqual(stations[0].postal_code_id, 10115)
+
+    def test_load_charging_stations_data_uses_bulk_mode(self):
+        """
+        Test that the application loader uses the configured bulk mode.
+        """
+        self.app.config["CHARGING_STATION_CSV"] = self.csv_path
+        self.app.config["INGESTION_MODE"] = "bulk"
+        load_charging_stations_data(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 25)
+
+    def test_changed_register_over_stored_stations(self):
+        """
+        Test that a changed register is not inserted on top of the stored stations.
+        """
+        self.app.config["CHARGING_STATION_CSV"] = self.csv_path
+        self.app.config["INGESTION_MODE"] = "bulk"
+        load_charging_stations_data(self.app)
+        write_register_csv(self.csv_path, [make_register_row(i) for i in range(30)])
+
+        load_charging_stations_data(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 25)
+            with self.assertRaises(StaleImportError):
+                bulk_load_charging_stations(self.app, self.csv_path)
+
+    def test_bulk_load_postal_codes(self):
+        """
+        Test that only missing postal codes are inserted, with geometry columns.
+        """
+        with self.app.app_context():
+            PostalCode.query.filter(PostalCode.number < 10200).delete()
+            db.session.commit()
+            missing = 190 - PostalCode.query.count()
+
+            stats = bulk_load_postal_codes(
+                self.app, self.app.config["POSTAL_CODE_CSV"], batch_size=3
+            )
+
+            self.assertEqual(stats.rows_read, 190)
+            self.assertEqual(stats.rows_inserted, missing)
+            self.assertEqual(
+                stats.reject_reasons["postal code already in database"], 190 - missing
+            )
+            postal_code = PostalCode.query.filter_by(number=10115).one()
+            self.assertLess(postal_code.min_longitude, postal_code.centroid_longitude)
+            self.assertLess(postal_code.centroid_longitude, postal_code.max_longitude)
+            self.assertGreater(postal_code.area, 0)
+
+    def test_missing_file(self):
+        """
+        Test that a missing register file is logged and not raised.
+        """
+        self.app.config["CHARGING_STATION_CSV"] = os.path.join(
+            self.tmp_dir.name, "missing.csv"
+        )
+        load_charging_stations_data(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
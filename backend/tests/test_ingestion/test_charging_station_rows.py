@@ -0,0 +1,91 @@
+import unittest
+
+from app.domain.entities.charging_station import ChargingType, OperationStatus
+from app.domain.validation.charging_station_batch import validate_station_rows
+from app.infrastructure.ingestion.charging_station_rows import (
+    ChargingStationRowError,
+    parse_charging_station_row,
+    parse_german_decimal,
+)
+from tests.test_ingestion.register_csv import make_register_row
+
+
+class TestChargingStationRows(unittest.TestCase):
+    """
+    Unit tests for the conversion of register rows into column mappings.
+    """
+
+    def test_parse_german_decimal(self):
+        """
+        Test converting numbers with a decimal comma.
+        """
+        self.assertEqual(parse_german_decimal("52,52"), 52.52)
+        self.assertEqual(parse_german_decimal("22"), 22.0)
+        with self.assertRaises(ValueError):
+            parse_german_decimal("abc")
+
+    def test_parse_valid_row(self):
+        """
+        Test converting a valid row.
+        """
+        row = make_register_row(
+            1, **{"Art der Ladeeinrichung": "Schnellladeeinrichtung"}
+        )
+        values = parse_charging_station_row(row, {10115})
+
+        self.assertEqual(values["postal_code_id"], 10115)
+        self.assertEqual(values["functional"], OperationStatus.OPERATIONAL)
+        self.assertEqual(values["charging_type"], ChargingType.FAST)
+        self.assertEqual(values["nominal_power"], 22.0)
+        self.assertEqual(values["num_charging_points"], 2)
+        self.assertAlmostEqual(values["latitude"], 52.520001)
+
+    def test_reject_reasons(self):
+        """
+        Test that invalid rows are rejected with a reason.
+        """
+        cases = {
+            "postal code outside of Berlin": make_register_row(1, postal_code="80331"),
+            "invalid postal code": make_register_row(1, postal_code=""),
+            "postal code not in database": make_register_row(1, postal_code="10117"),
+            "malformed number": make_register_row(1, Breitengrad="n/a"),
+            "invalid latitude": make_register_row(1, Breitengrad="152,1"),
+            "invalid number of charging points": make_register_row(
+                1, **{"Anzahl Ladepunkte": ""}
+            ),
+            "invalid operator": make_register_row(1, **{"\ufeffBetreiber": " "}),
+        }
+        for reason, row in cases.items():
+            with self.subTest(reason=reason):
+                with self.assertRaises(ChargingStationRowError) as context:
+                    parse_charging_station_row(row, {10115})
+                self.assertEqual(str(context.exception), reason)
+
+    def test_batch_validation_matches_row_validation(self):
+        """
+        Test that batch validation rejects rows with the reasons of the single-row parser.
+        """
+        rows = [
+            make_register_row(1),
+            make_register_row(2, Breitengrad="152,1"),
+            make_register_row(3, **{"Anzahl Ladepunkte": ""}),
+            make_register_row(4, **{"\ufeffBetreiber": " "}),
+            make_register_row(5, **{"Nennleistung Ladeeinrichtung [kW]": ""}),
+        ]
+        converted = [
+            parse_charging_station_row(row, {10115}, validate=False) for row in rows
+        ]
+
+        report = validate_station_rows(converted)
+
+        accepted = report.accepted(converted)
+        self.assertEqual([values["street"] for values in accepted], ["Teststraße 1"])
+        for index, row in enumerate(rows[1:], start=1):
+            with self.assertRaises(ChargingStationRowError) as context:
+                parse_charging_station_row(row, {10115})
+            self.assertEqual(report.reason(index), str(context.exception))
+        self.assertEqual(report.rows_rejected, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
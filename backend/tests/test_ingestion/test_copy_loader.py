@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.config import TestingConfig
+from app.domain.entities.charging_station import (
+    ChargingStation,
+    ChargingType,
+    OperationStatus,
+)
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.copy_loader import (
+    STATION_COLUMNS,
+    copy_load_charging_stations,
+    encode_copy_rows,
+)
+from app.infrastructure.ingestion.streaming_loader import StaleImportError
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class TestEncodeCopyRows(unittest.TestCase):
+    """
+    Unit tests for the CSV encoding of COPY rows.
+    """
+
+    def test_encode_station(self):
+        """
+        Test enum names, rounded integers, NULL markers and quoting.
+        """
+        row = {
+            "functional": OperationStatus.OPERATIONAL,
+            "postal_code_id": 10115,
+            "street": "Straße, Ecke Weg",
+            "house_number": "1",
+            "latitude": 52.52,
+            "longitude": 13.405,
+            "operator": 'Operator "A"',
+            "address_suffix": "",
+            "nominal_power": 22.0,
+            "charging_type": ChargingType.NORMAL,
+            "num_charging_points": None,
+        }
+
+        buffer = encode_copy_rows(ChargingStation.__table__, STATION_COLUMNS, [row])
+
+        self.assertEqual(
+            buffer.getvalue(),
+            'OPERATIONAL,10115,"Straße, Ecke Weg",1,52.52,13.405,'
+            '"Operator ""A""",,22,NORMAL,\\N\n',
+        )
+
+
+class CopyTestingConfig(TestingConfig):
+    """
+    Testing configuration loading the datasets in copy mode.
+    """
+
+    INGESTION_MODE = "copy"
+
+
+class TestCopyLoaderFallback(unittest.TestCase):
+    """
+    Integration tests for the COPY loaders on SQLite, which use batched inserts.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and a small register file.
+        """
+        self.app = create_app(config_class=CopyTestingConfig)
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+        rows = [make_register_row(i) for i in range(10)]
+        rows.append(make_register_row(10, postal_code="80331"))  # Munich
+        write_register_csv(self.csv_path, rows)
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_copy_load_charging_stations(self):
+        """
+        Test that the station loader falls back to batched inserts.
+        """
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                self.assertFalse(repository.supports_copy())
+
+            stats = copy_load_charging_stations(self.app, self.csv_path, batch_size=4)
+
+            self.assertEqual(stats.rows_inserted, 10)
+            self.assertEqual(stats.rows_rejected, 1)
+            self.assertEqual(ChargingStation.query.count(), 10)
+
+    def test_copy_load_over_stored_stations(self):
+        """
+        Test that the register is only appended to stored stations on request.
+        """
+        with self.app.app_context():
+            copy_load_charging_stations(self.app, self.csv_path)
+
+            with self.assertRaises(StaleImportError):
+                copy_load_charging_stations(self.app, self.csv_path)
+            self.assertEqual(ChargingStation.query.count(), 10)
+
+            copy_load_charging_stations(self.app, self.csv_path, append=True)
+            self.assertEqual(ChargingStation.query.count(), 20)
+
+    def test_copy_mode_loads_postal_codes(self):
+        """
+        Test that the postal codes are loaded in copy mode at startup.
+        """
+        with self.app.app_context():
+            self.assertEqual(PostalCode.query.count(), 190)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from app.infrastructure.ingestion.csv_chunks import CsvChunkReader, file_sha256
+
+
+class TestCsvChunkReader(unittest.TestCase):
+    """
+    Unit tests for reading CSV files in chunks with byte offsets.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "data.csv")
+        with open(self.csv_path, "w", encoding="utf-8", newline="") as csvfile:
+            csvfile.write("a;b\n")
+            for i in range(7):
+                csvfile.write(f"{i};Straße {i}\n")
+            csvfile.write('7;"multi\nline"\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_chunks(self):
+        """
+        Test splitting the rows into chunks and reading the header.
+        """
+        reader = CsvChunkReader(self.csv_path, chunk_size=3)
+        chunks = list(reader.chunks())
+
+        self.assertEqual(reader.header, ["a", "b"])
+        self.assertEqual([len(rows) for rows, _ in chunks], [3, 3, 2])
+        self.assertEqual(chunks[-1][0][-1], ["7", "multi\nline"])
+        self.assertEqual(chunks[-1][1], os.path.getsize(self.csv_path))
+
+    def test_resume_from_offset(self):
+        """
+        Test continuing behind the offset of a previous chunk.
+        """
+        first_rows, offset = next(CsvChunkReader(self.csv_path, 3).chunks())
+
+        reader = CsvChunkReader(self.csv_path, chunk_size=100, start_offset=offset)
+        rows = [row for chunk, _ in reader.chunks() for row in chunk]
+
+        self.assertEqual(reader.header, ["a", "b"])
+        self.assertEqual(rows[0], ["3", "Straße 3"])
+        self.assertEqual(len(first_rows) + len(rows), 8)
+
+    def test_file_sha256(self):
+        """
+        Test that the hash changes with the file content.
+        """
+        digest = file_sha256(self.csv_path)
+        self.assertEqual(len(digest), 64)
+        with open(self.csv_path, "a", encoding="utf-8") as csvfile:
+            csvfile.write("8;x\n")
+        self.assertNotEqual(file_sha256(self.csv_path), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
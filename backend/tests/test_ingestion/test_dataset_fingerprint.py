@@ -0,0 +1,200 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app, load_charging_stations_data
+from app.config import TestingConfig
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.dataset_metadata_operations import (
+    DatasetMetadataOperations,
+)
+from app.infrastructure.ingestion.bulk_loader import bulk_load_postal_codes
+from app.infrastructure.ingestion.csv_chunks import file_sha256
+from app.infrastructure.ingestion.dataset_fingerprint import (
+    compute_fingerprint,
+    dataset_is_unchanged,
+    record_fingerprint,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class TestComputeFingerprint(unittest.TestCase):
+    """
+    Unit tests for fingerprinting source files.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "data.csv")
+        with open(self.file_path, "w", encoding="utf-8") as source:
+            source.write("a;b\n1;2\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_compute_fingerprint(self):
+        """
+        Test size, mtime and hash of a new file.
+        """
+        fingerprint = compute_fingerprint(self.file_path)
+        self.assertEqual(fingerprint.size, 8)
+        self.assertEqual(fingerprint.content_hash, file_sha256(self.file_path))
+
+    def test_known_hash_is_reused(self):
+        """
+        Test that a file with known size and mtime is not hashed again.
+        """
+        stat = os.stat(self.file_path)
+        known = DatasetMetadata("test", self.file_path, 8, stat.st_mtime, "cached")
+        self.assertEqual(
+            compute_fingerprint(self.file_path, known).content_hash, "cached"
+        )
+
+        known.mtime -= 10
+        self.assertNotEqual(
+            compute_fingerprint(self.file_path, known).content_hash, "cached"
+        )
+
+
+class PersistentTestingConfig(TestingConfig):
+    """
+    Testing configuration with a database file that survives an app restart.
+    """
+
+    INGESTION_MODE = "orm"
+
+
+class TestSkipUnchangedDatasets(unittest.TestCase):
+    """
+    Integration tests for skipping unchanged datasets at startup.
+    """
+
+    def setUp(self):
+        """
+        Set up a database file shared by several app instances.
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        PersistentTestingConfig.SQLALCHEMY_DATABASE_URI = (
+            f"sqlite:///{os.path.join(self.tmp_dir.name, 'test.db')}"
+        )
+        self.app = create_app(config_class=PersistentTestingConfig)
+        self.app.testing = True
+
+    def tearDown(self):
+        """
+        Remove the database file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_fingerprint_recorded(self):
+        """
+        Test that the postal code fingerprint is stored after loading.
+        """
+        with self.app.app_context():
+            with DatasetMetadataOperations() as repository:
+                metadata = repository.get_metadata("postal_codes")
+                self.assertEqual(
+                    metadata.content_hash,
+                    file_sha256(self.app.config["POSTAL_CODE_CSV"]),
+                )
+
+    def test_restart_skips_unchanged_dataset(self):
+        """
+        Test that a restart does not load an unchanged postal code file again.
+        """
+        with self.app.app_context():
+            PostalCode.query.filter_by(number=10115).delete()
+            db.session.commit()
+
+        restarted = create_app(config_class=PersistentTestingConfig)
+        with restarted.app_context():
+            self.assertEqual(PostalCode.query.count(), 189)
+            db.engine.dispose()
+
+        PersistentTestingConfig.SKIP_UNCHANGED_DATASETS = False
+        try:
+            restarted = create_app(config_class=PersistentTestingConfig)
+        finally:
+            PersistentTestingConfig.SKIP_UNCHANGED_DATASETS = True
+        with restarted.app_context():
+            self.assertEqual(PostalCode.query.count(), 190)
+            db.engine.dispose()
+
+    def test_touched_file_is_unchanged(self):
+        """
+        Test that a new mtime with the same content counts as unchanged.
+        """
+        file_path = self.app.config["POSTAL_CODE_CSV"]
+        with self.app.app_context():
+            unchanged, fingerprint = dataset_is_unchanged("postal_codes", file_path)
+            self.assertTrue(unchanged)
+
+            fingerprint.mtime -= 100
+            record_fingerprint("postal_codes", fingerprint)
+            unchanged, _ = dataset_is_unchanged("postal_codes", file_path)
+            self.assertTrue(unchanged)
+
+            with DatasetMetadataOperations() as repository:
+                metadata = repository.get_metadata("postal_codes")
+                self.assertEqual(metadata.mtime, os.stat(file_path).st_mtime)
+
+
+class TestChargingStationFingerprint(unittest.TestCase):
+    """
+    Integration tests for recording the fingerprint of the register.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app whose register has only stations of a missing postal code.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.app.config["CHARGING_STATION_CSV"] = os.path.join(
+            self.tmp_dir.name, "register.csv"
+        )
+        write_register_csv(
+            self.app.config["CHARGING_STATION_CSV"],
+            [make_register_row(i, postal_code="10117") for i in range(3)],
+        )
+        with self.app.app_context():
+            PostalCode.query.filter_by(number=10117).delete()
+            db.session.commit()
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_rejected_register_is_loaded_again(self):
+        """
+        Test that a register without stored stations is loaded on the next start.
+        """
+        load_charging_stations_data(self.app)
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 0)
+            with DatasetMetadataOperations() as repository:
+                self.assertIsNone(repository.get_metadata("charging_stations"))
+            bulk_load_postal_codes(self.app, self.app.config["POSTAL_CODE_CSV"])
+
+        load_charging_stations_data(self.app)
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 3)
+            with DatasetMetadataOperations() as repository:
+                self.assertIsNotNone(repository.get_metadata("charging_stations"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.config import TestingConfig
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.postal_code import POSTAL_CODE_GEOMETRIES, PostalCode
+from app.domain.entities.templates.base import db
+from app.domain.geometry.wkt import parse_wkt_polygons
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.dataset_snapshot import (
+    DatasetSnapshot,
+    SnapshotError,
+    build_dataset_snapshot,
+    open_matching_snapshot,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class SnapshotTestingConfig(TestingConfig):
+    """
+    Testing configuration with a register and snapshot in a temporary directory.
+    """
+
+
+class TestDatasetSnapshot(unittest.TestCase):
+    """
+    Tests for writing, reading and loading the binary dataset snapshot.
+    """
+
+    def setUp(self):
+        """
+        Write a small register and build a snapshot from it.
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.register_path = os.path.join(self.tmp_dir.name, "register.csv")
+        self.snapshot_path = os.path.join(self.tmp_dir.name, "datasets.snapshot")
+        rows = [make_register_row(i) for i in range(12)]
+        rows[3]["Adresszusatz"] = "Parkhaus Ebene -1"
+        rows[4]["Art der Ladeeinrichung"] = "Schnellladeeinrichtung"
+        rows[5]["Art der Ladeeinrichung"] = ""
+        rows.append(make_register_row(12, postal_code="80331"))  # Munich
+        write_register_csv(self.register_path, rows)
+
+        SnapshotTestingConfig.CHARGING_STATION_CSV = self.register_path
+        SnapshotTestingConfig.DATASET_SNAPSHOT = self.snapshot_path
+        self.counts = build_dataset_snapshot(
+            SnapshotTestingConfig.POSTAL_CODE_CSV,
+            self.register_path,
+            self.snapshot_path,
+        )
+
+    def tearDown(self):
+        """
+        Remove the register and snapshot files.
+        """
+        self.tmp_dir.cleanup()
+
+    def test_build_and_read(self):
+        """
+        Test that postal codes, polygons and station columns survive a round trip.
+        """
+        self.assertEqual(self.counts, {"postal_codes": 190, "charging_stations": 12})
+        with open(SnapshotTestingConfig.POSTAL_CODE_CSV, encoding="utf-8") as source:
+            first_row = next(csv.reader(source.readlines()[1:2], delimiter=";"))
+
+        snapshot = DatasetSnapshot(self.snapshot_path)
+        self.assertEqual(snapshot.section("postal_code.number")[0], int(first_row[0]))
+        self.assertEqual(snapshot.strings("postal_code.polygon")[0], first_row[1])
+        self.assertEqual(
+            snapshot.postal_code_polygons(0), parse_wkt_polygons(first_row[1])
+        )
+        self.assertEqual(
+            snapshot.strings("station.address_suffix")[3], "Parkhaus Ebene -1"
+        )
+        self.assertEqual(snapshot.strings("station.address_suffix")[0], "")
+        self.assertEqual(len(snapshot.section("station.latitude")), 12)
+
+    def test_changed_source_is_not_matching(self):
+        """
+        Test that a snapshot is only used while the source files are unchanged.
+        """
+        sources = {
+            "postal_codes": SnapshotTestingConfig.POSTAL_CODE_CSV,
+            "charging_stations": self.register_path,
+        }
+        self.assertIsNotNone(open_matching_snapshot(self.snapshot_path, sources))
+
+        write_register_csv(self.register_path, [make_register_row(1)])
+        self.assertIsNone(open_matching_snapshot(self.snapshot_path, sources))
+
+    def test_corrupt_snapshot(self):
+        """
+        Test that a file with another format raises SnapshotError.
+        """
+        with open(self.snapshot_path, "r+b") as snapshot:
+            snapshot.write(b"NOTASNAP")
+        with self.assertRaises(SnapshotError):
+            DatasetSnapshot(self.snapshot_path)
+
+    def test_create_app_loads_snapshot(self):
+        """
+        Test that create_app loads the snapshot with the same rows as the CSV loaders.
+        """
+        app = create_app(config_class=SnapshotTestingConfig)
+        with app.app_context():
+            self.assertEqual(PostalCode.query.count(), 190)
+            # The polygons are seeded from the snapshot, not parsed from WKT
+            misses = POSTAL_CODE_GEOMETRIES.misses
+            with PostalCodeOperations() as repository:
+                geometries = repository.get_postal_code_geometries()
+            self.assertEqual(POSTAL_CODE_GEOMETRIES.misses, misses)
+            self.assertTrue(geometries[10115].contains(13.38, 52.53))
+            from_snapshot = [
+                (s.postal_code_id, s.street, s.latitude, s.charging_type, s.functional)
+                for s in ChargingStation.query.order_by(ChargingStation.id)
+            ]
+            db.session.remove()
+            db.drop_all()
+
+        SnapshotTestingConfig.DATASET_SNAPSHOT = None
+        app = create_app(config_class=SnapshotTestingConfig)
+        with app.app_context():
+            from_csv = [
+                (s.postal_code_id, s.street, s.latitude, s.charging_type, s.functional)
+                for s in ChargingStation.query.order_by(ChargingStation.id)
+            ]
+            db.session.remove()
+            db.drop_all()
+
+        self.assertEqual(len(from_snapshot), 12)
+        self.assertEqual(from_snapshot, from_csv)
+
+    def test_build_snapshot_command(self):
+        """
+        Test the build-snapshot command of the Flask CLI.
+        """
+        os.remove(self.snapshot_path)
+        SnapshotTestingConfig.INIT_DATA = False
+        try:
+            app = create_app(config_class=SnapshotTestingConfig)
+        finally:
+            SnapshotTestingConfig.INIT_DATA = True
+
+        result = app.test_cli_runner().invoke(args=["build-snapshot"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.domain.entities.charging_station import (
+    ChargingStation,
+    ChargingType,
+    OperationStatus,
+)
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.bulk_loader import bulk_load_charging_stations
+from app.infrastructure.ingestion.diff_import import (
+    compute_station_diff,
+    diff_import_charging_stations,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+def station_values(street: str, nominal_power: float = 22.0) -> dict:
+    return {
+        "operator": "Operator",
+        "street": street,
+        "house_number": "1",
+        "postal_code_id": 10115,
+        "latitude": 52.52,
+        "longitude": 13.405,
+        "address_suffix": "",
+        "nominal_power": nominal_power,
+        "charging_type": ChargingType.NORMAL,
+        "num_charging_points": 2,
+    }
+
+
+def stored_row(station_id: int, values: dict) -> tuple:
+    return (
+        station_id,
+        values["operator"],
+        values["street"],
+        values["house_number"],
+        values["postal_code_id"],
+        values["latitude"],
+        values["longitude"],
+        values["address_suffix"],
+        values["nominal_power"],
+        values["charging_type"],
+        values["num_charging_points"],
+    )
+
+
+class TestComputeStationDiff(unittest.TestCase):
+    """
+    Unit tests for comparing a register release with the stored stations.
+    """
+
+    def test_insert_update_delete(self):
+        """
+        Test that new, changed and removed stations are detected.
+        """
+        stored = [
+            stored_row(1, station_values("A")),
+            stored_row(2, station_values("B")),
+            stored_row(3, station_values("C")),
+        ]
+        release = [
+            station_values("A"),
+            station_values("B", nominal_power=50.0),
+            station_values("D"),
+        ]
+
+        diff = compute_station_diff(release, stored)
+
+        self.assertEqual(diff.unchanged, 1)
+        self.assertEqual(diff.inserts, [station_values("D")])
+        self.assertEqual(len(diff.updates), 1)
+        self.assertEqual(diff.updates[0]["station_id"], 2)
+        self.assertEqual(diff.updates[0]["nominal_power"], 50.0)
+        self.assertNotIn("functional", diff.updates[0])
+        self.assertEqual(diff.deletes, [3])
+
+    def test_coordinate_noise_is_ignored(self):
+        """
+        Test that tiny coordinate differences do not change the natural key.
+        """
+        moved = station_values("A")
+        moved["latitude"] += 1e-9
+
+        diff = compute_station_diff([moved], [stored_row(1, station_values("A"))])
+
+        self.assertEqual(diff.unchanged, 1)
+        self.assertEqual(diff.inserts, [])
+
+    def test_fractional_nominal_power(self):
+        """
+        Test that a fractional nominal power equals the integer stored for it.
+        """
+        stored = [
+            stored_row(1, station_values("A", nominal_power=12)),
+            stored_row(2, station_values("B", nominal_power=11.5)),  # SQLite
+            stored_row(3, station_values("C", nominal_power=12)),
+        ]
+        release = [
+            station_values("A", nominal_power=11.5),
+            station_values("B", nominal_power=11.5),
+            station_values("C", nominal_power=13.2),
+        ]
+
+        diff = compute_station_diff(release, stored)
+
+        self.assertEqual(diff.unchanged, 2)
+        self.assertEqual(len(diff.updates), 1)
+        self.assertEqual(diff.updates[0]["station_id"], 3)
+
+    def test_duplicate_keys(self):
+        """
+        Test that stations sharing operator, address and coordinates are
+        matched by their order.
+        """
+        stored = [
+            stored_row(1, station_values("A")),
+            stored_row(2, station_values("A")),
+        ]
+        release = [station_values("A"), station_values("A"), station_values("A")]
+
+        diff = compute_station_diff(release, stored)
+
+        self.assertEqual(diff.unchanged, 2)
+        self.assertEqual(len(diff.inserts), 1)
+        self.assertEqual(diff.deletes, [])
+
+
+class TestDiffImport(unittest.TestCase):
+    """
+    Integration tests for the differential register import.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and an imported register release.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+
+        write_register_csv(self.csv_path, [make_register_row(i) for i in range(20)])
+        with self.app.app_context():
+            bulk_load_charging_stations(self.app, self.csv_path)
+
+        release = [make_register_row(i) for i in range(1, 20)]  # station 0 removed
+        release[0]["Nennleistung Ladeeinrichtung [kW]"] = "50,0"  # station 1 changed
+        release.append(make_register_row(20))
+        release.append(make_register_row(21, postal_code="80331"))  # Munich
+        self.release_path = os.path.join(self.tmp_dir.name, "release.csv")
+        write_register_csv(self.release_path, release)
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register files.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_diff_import(self):
+        """
+        Test that only changed stations are written and reported status is kept.
+        """
+        with self.app.app_context():
+            station_ids = [s.id for s in ChargingStation.query.order_by("id")]
+            ChargingStation.query.filter_by(id=station_ids[1]).update(
+                {"functional": OperationStatus.MALFUNCTIONING}
+            )
+            db.session.commit()
+
+            diff = diff_import_charging_stations(
+                self.app, self.release_path, batch_size=1
+            )
+
+            self.assertEqual(len(diff.inserts), 1)
+            self.assertEqual(len(diff.updates), 1)
+            self.assertEqual(diff.deletes, [station_ids[0]])
+            self.assertEqual(diff.unchanged, 18)
+
+            self.assertEqual(ChargingStation.query.count(), 20)
+            self.assertIsNone(db.session.get(ChargingStation, station_ids[0]))
+            changed = db.session.get(ChargingStation, station_ids[1])
+            self.assertEqual(changed.nominal_power, 50.0)
+            self.assertEqual(changed.functional, OperationStatus.MALFUNCTIONING)
+
+    def test_dry_run(self):
+        """
+        Test that a dry run reports the changes without writing them.
+        """
+        with self.app.app_context():
+            diff = diff_import_charging_stations(
+                self.app, self.release_path, dry_run=True
+            )
+
+            self.assertEqual(len(diff.inserts), 1)
+            self.assertEqual(ChargingStation.query.count(), 20)
+            self.assertEqual(
+                ChargingStation.query.filter_by(nominal_power=50.0).count(), 0
+            )
+
+    def test_diff_import_command(self):
+        """
+        Test the diff-import command of the Flask CLI.
+        """
+        result = self.app.test_cli_runner().invoke(
+            args=["diff-import", self.release_path, "--batch-size", "5"]
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("1 inserted, 1 updated, 1 deleted, 18 unchanged", result.output)
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 20)
+
+    def test_repeated_import_changes_nothing(self):
+        """
+        Test that importing the same release twice writes nothing the second time.
+        """
+        with self.app.app_context():
+            diff_import_charging_stations(self.app, self.release_path)
+            diff = diff_import_charging_stations(self.app, self.release_path)
+
+            self.assertEqual(diff.unchanged, 20)
+            self.assertEqual(diff.inserts, [])
+            self.assertEqual(diff.updates, [])
+            self.assertEqual(diff.deletes, [])
+
+    def test_repeated_import_with_fractional_nominal_power(self):
+        """
+        Test that a fractional nominal power is not reported as update on
+        every import of the same release.
+        """
+        release = [make_register_row(i) for i in range(20)]
+        release[3]["Nennleistung Ladeeinrichtung [kW]"] = "11,5"
+        write_register_csv(self.release_path, release)
+        with self.app.app_context():
+            diff = diff_import_charging_stations(self.app, self.release_path)
+            self.assertEqual(len(diff.updates), 1)
+
+            diff = diff_import_charging_stations(self.app, self.release_path)
+            self.assertEqual(diff.updates, [])
+            self.assertEqual(diff.unchanged, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
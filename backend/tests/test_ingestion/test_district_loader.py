@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app, load_district_data
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.district import District
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.bulk_loader import bulk_load_charging_stations
+from app.infrastructure.ingestion.district_loader import (
+    DistrictRowError,
+    assign_station_districts,
+    parse_district_row,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+SQUARE = "POLYGON ((13.3 52.5, 13.4 52.5, 13.4 52.6, 13.3 52.6, 13.3 52.5))"
+
+
+class TestParseDistrictRow(unittest.TestCase):
+    """
+    Unit tests for converting district rows.
+    """
+
+    def test_valid_row(self):
+        """
+        Test that name, polygon and geometry columns are returned.
+        """
+        values = parse_district_row([" Mitte ", SQUARE])
+
+        self.assertEqual(values["name"], "Mitte")
+        self.assertEqual(values["polygon"], SQUARE)
+        self.assertEqual(values["vertex_count"], 5)
+        self.assertAlmostEqual(values["centroid_longitude"], 13.35)
+
+    def test_invalid_rows(self):
+        """
+        Test the reject reasons of malformed and invalid rows.
+        """
+        for row, reason in (
+            (["Mitte"], "malformed row"),
+            (["", SQUARE], "invalid district"),
+            (["Mitte", "POLYGON (("], "invalid district"),
+        ):
+            with self.assertRaises(DistrictRowError, msg=row) as context:
+                parse_district_row(row)
+            self.assertEqual(str(context.exception), reason)
+
+
+class TestDistrictLoader(unittest.TestCase):
+    """
+    Integration tests for loading districts and assigning postal codes and stations.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and districts.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Tear down the test database.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_districts_loaded(self):
+        """
+        Test that all districts are loaded and every postal code is assigned.
+        """
+        with self.app.app_context():
+            self.assertEqual(District.query.count(), 12)
+            self.assertEqual(
+                PostalCode.query.filter(PostalCode.district_id.is_(None)).count(), 0
+            )
+            for number, name in (
+                (10115, "Mitte"),
+                (10999, "Friedrichshain-Kreuzberg"),
+                (13591, "Spandau"),
+                (14195, "Steglitz-Zehlendorf"),
+            ):
+                postal_code = PostalCode.query.filter_by(number=number).first()
+                district = db.session.get(District, postal_code.district_id)
+                self.assertEqual(district.name, name)
+
+    def test_reload_keeps_districts(self):
+        """
+        Test that loading again neither duplicates nor reassigns districts.
+        """
+        load_district_data(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(District.query.count(), 12)
+
+    def test_assign_station_districts(self):
+        """
+        Test that loaded stations are assigned to the district containing them.
+        """
+        csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+        write_register_csv(csv_path, [make_register_row(i) for i in range(5)])
+
+        with self.app.app_context():
+            bulk_load_charging_stations(self.app, csv_path)
+
+            self.assertEqual(assign_station_districts(self.app), 5)
+            self.assertEqual(assign_station_districts(self.app), 0)
+            mitte = District.query.filter_by(name="Mitte").first()
+            self.assertEqual(
+                ChargingStation.query.filter_by(district_id=mitte.id).count(), 5
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+from app.config import TestingConfig
+from app.infrastructure.ingestion.ingestion_progress import (
+    PHASE_CHARGING_STATIONS,
+    PHASE_FAILED,
+    PHASE_PENDING,
+    PHASE_POSTAL_CODES,
+    PHASE_READY,
+    IngestionProgress,
+    count_data_rows,
+)
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+
+
+class TestIngestionProgress(unittest.TestCase):
+    """
+    Tests for the progress of the startup ingestion.
+    """
+
+    def test_phases(self):
+        """
+        Test rows done of finished and running phases and the end of the ingestion.
+        """
+        progress = IngestionProgress()
+        self.assertEqual(progress.as_dict()["phase"], PHASE_PENDING)
+        self.assertIsNone(progress.as_dict()["eta_seconds"])
+
+        progress.plan(300)
+        progress.start_phase(PHASE_POSTAL_CODES, 100)
+        progress.start_phase(PHASE_CHARGING_STATIONS, 200)
+        stats = IngestionStats("charging stations")
+        progress.track(stats)
+        stats.rows_read = 50
+
+        running = progress.as_dict()
+        self.assertEqual(running["phase"], PHASE_CHARGING_STATIONS)
+        self.assertEqual((running["rows_done"], running["rows_total"]), (150, 300))
+        self.assertFalse(running["ready"])
+        self.assertGreaterEqual(running["eta_seconds"], 0)
+
+        stats.rows_read = 500  # More rows than estimated
+        self.assertEqual(progress.as_dict()["rows_done"], 300)
+
+        progress.finish()
+        finished = progress.as_dict()
+        self.assertTrue(progress.ready)
+        self.assertTrue(progress.wait(timeout=0))
+        self.assertEqual(finished["phase"], PHASE_READY)
+        self.assertEqual(finished["eta_seconds"], 0)
+
+    def test_failure(self):
+        """
+        Test that an error finishes the ingestion without becoming ready.
+        """
+        progress = IngestionProgress()
+        self.assertFalse(progress.wait(timeout=0))
+        progress.start_phase(PHASE_POSTAL_CODES, 10)
+
+        progress.finish(error="RuntimeError: broken")
+
+        self.assertFalse(progress.ready)
+        self.assertTrue(progress.wait(timeout=0))
+        self.assertEqual(progress.as_dict()["phase"], PHASE_FAILED)
+        self.assertEqual(progress.as_dict()["error"], "RuntimeError: broken")
+        self.assertIsNone(progress.as_dict()["eta_seconds"])
+
+    def test_failed_phase(self):
+        """
+        Test that a failed phase lets the ingestion go on, but not become ready.
+        """
+        progress = IngestionProgress()
+        progress.start_phase(PHASE_CHARGING_STATIONS, 10)
+        progress.fail_phase("CSV file not found")
+        progress.start_phase(PHASE_POSTAL_CODES, 10)
+        self.assertEqual(progress.phase, PHASE_POSTAL_CODES)
+
+        progress.finish()
+
+        self.assertFalse(progress.ready)
+        self.assertEqual(progress.as_dict()["phase"], PHASE_FAILED)
+        self.assertEqual(
+            progress.as_dict()["error"],
+            f"{PHASE_CHARGING_STATIONS}: CSV file not found",
+        )
+
+    def test_count_data_rows(self):
+        """
+        Test counting the data rows of CSV files and shapefiles.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with_newline = os.path.join(tmp_dir, "with_newline.csv")
+            without_newline = os.path.join(tmp_dir, "without_newline.csv")
+            with open(with_newline, "w", encoding="utf-8") as csv_file:
+                csv_file.write("a;b\n1;2\n3;4\n")
+            with open(without_newline, "w", encoding="utf-8") as csv_file:
+                csv_file.write("a;b\n1;2\n3;4")
+
+            self.assertEqual(count_data_rows(with_newline), 2)
+            self.assertEqual(count_data_rows(without_newline), 2)
+            self.assertEqual(count_data_rows(os.path.join(tmp_dir, "missing.csv")), 0)
+
+        self.assertEqual(count_data_rows(TestingConfig.POSTAL_CODE_SHAPEFILE), 190)
+        self.assertEqual(count_data_rows(TestingConfig.DISTRICT_SHAPEFILE), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
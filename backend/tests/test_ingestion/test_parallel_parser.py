@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app, load_charging_stations_data
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.parallel_parser import (
+    parallel_load_charging_stations,
+    parse_shard,
+    split_byte_ranges,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class TestParallelParser(unittest.TestCase):
+    """
+    Tests for the sharded multi-process parse stage.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and a register file.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+
+        rows = [make_register_row(i) for i in range(60)]
+        rows[10]["Postleitzahl"] = "80331"
+        write_register_csv(self.csv_path, rows)
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_split_byte_ranges(self):
+        """
+        Test that the shards cover all data rows and end at line breaks.
+        """
+        header, ranges = split_byte_ranges(self.csv_path, shard_bytes=500)
+
+        self.assertEqual(header[1], "Straße")
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.csv_path))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+
+        rows = 0
+        for start, end in ranges:
+            columns = parse_shard(self.csv_path, header, start, end, {10115})
+            rows += columns.rows_read
+        self.assertEqual(rows, 60)
+
+    def test_parse_shard_columns(self):
+        """
+        Test the typed columns and the reject reasons of a shard.
+        """
+        header, ranges = split_byte_ranges(self.csv_path, shard_bytes=10**6)
+        columns = parse_shard(self.csv_path, header, *ranges[0], {10115})
+
+        self.assertEqual(len(columns), 59)
+        self.assertEqual(columns.reject_reasons["postal code outside of Berlin"], 1)
+        self.assertEqual(columns.latitude.typecode, "d")
+        self.assertEqual(columns.rows()[0]["street"], "Teststraße 0")
+
+    def test_parse_shard_rejects_invalid_stations(self):
+        """
+        Test that the batch validation drops invalid stations from every column.
+        """
+        rows = [make_register_row(i) for i in range(6)]
+        rows[1]["Nennleistung Ladeeinrichtung [kW]"] = ""
+        rows[2]["Anzahl Ladepunkte"] = "0"
+        rows[3]["Breitengrad"] = "95,0"
+        rows[4]["Anzahl Ladepunkte"] = ""
+        write_register_csv(self.csv_path, rows)
+        header, ranges = split_byte_ranges(self.csv_path, shard_bytes=10**6)
+
+        columns = parse_shard(self.csv_path, header, *ranges[0], {10115})
+
+        self.assertEqual(columns.rows_read, 6)
+        self.assertEqual(
+            [row["street"] for row in columns.rows()],
+            ["Teststraße 0", "Teststraße 5"],
+        )
+        self.assertEqual(columns.num_charging_points.typecode, "l")
+        self.assertEqual(
+            columns.reject_reasons,
+            {
+                "invalid nominal power": 1,
+                "invalid number of charging points": 2,
+                "invalid latitude": 1,
+            },
+        )
+
+    def test_parallel_load_keeps_row_order(self):
+        """
+        Test loading with worker processes in file order.
+        """
+        with self.app.app_context():
+            stats = parallel_load_charging_stations(
+                self.app, self.csv_path, workers=2, shard_bytes=700
+            )
+            self.assertEqual(stats.rows_read, 60)
+            self.assertEqual(stats.rows_inserted, 59)
+            self.assertEqual(stats.rows_rejected, 1)
+
+            streets = [
+                station.street
+                for station in ChargingStation.query.order_by(ChargingStation.id)
+            ]
+            expected = [f"Teststraße {i}" for i in range(60) if i != 10]
+            self.assertEqual(streets, expected)
+
+    def test_load_charging_stations_data_parallel_mode(self):
+        """
+        Test that the application loader uses the configured parallel mode.
+        """
+        self.app.config["CHARGING_STATION_CSV"] = self.csv_path
+        self.app.config["INGESTION_MODE"] = "parallel"
+        self.app.config["INGESTION_WORKERS"] = 1
+        load_charging_stations_data(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(ChargingStation.query.count(), 59)
+
+
+if __name__ == "__main__":
+    unittest.main()
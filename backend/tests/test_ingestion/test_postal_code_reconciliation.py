@@ -0,0 +1,93 @@
+import unittest
+
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.postal_code_operations import (
+    PostalCodeOperations,
+)
+from app.infrastructure.ingestion.postal_code_reconciliation import (
+    reconcile_station_postal_codes,
+)
+from tests.station_fixture import StationFixtureTestCase, coordinates
+from tests.test_ingestion.register_csv import make_register_row
+
+
+class TestPostalCodeReconciliation(StationFixtureTestCase):
+    """
+    Integration tests for reconciling the postal codes of the stations.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with a correct, a mislabeled and a foreign station.
+        """
+        super().setUp()
+
+        with self.app.app_context():
+            with PostalCodeOperations() as repository:
+                geometries = repository.get_postal_code_geometries()
+            inside = {
+                number: geometries[number].prepared.interior_samples(8)[0]
+                for number in (10115, 10117)
+            }
+            self.station_ids = self.load_stations(
+                make_register_row(0, "10115", **coordinates(*inside[10115])),
+                make_register_row(1, "10115", **coordinates(*inside[10117])),
+                make_register_row(2, "10115", **coordinates(11.58, 48.14)),
+            )
+
+    def test_report(self):
+        """
+        Test that mismatches and stations outside are reported without changes.
+        """
+        correct, mislabeled, foreign = self.station_ids
+
+        with self.app.app_context():
+            result = reconcile_station_postal_codes(self.app, batch_size=2)
+
+            self.assertEqual(result.stations_checked, 3)
+            self.assertEqual(
+                result.mismatches,
+                [
+                    {
+                        "station_id": mislabeled,
+                        "postal_code": 10115,
+                        "located_postal_code": 10117,
+                    }
+                ],
+            )
+            self.assertEqual(result.outside, [foreign])
+            self.assertEqual(result.fixed, 0)
+            self.assertEqual(
+                db.session.get(ChargingStation, mislabeled).postal_code_id, 10115
+            )
+
+    def test_fix(self):
+        """
+        Test that fixing sets the located postal code and a second run finds nothing.
+        """
+        mislabeled = self.station_ids[1]
+
+        with self.app.app_context():
+            self.assertEqual(
+                reconcile_station_postal_codes(self.app, fix=True).fixed, 1
+            )
+
+            self.assertEqual(
+                db.session.get(ChargingStation, mislabeled).postal_code_id, 10117
+            )
+            self.assertEqual(reconcile_station_postal_codes(self.app).mismatches, [])
+
+    def test_command(self):
+        """
+        Test that the CLI command lists the mismatches.
+        """
+        result = self.app.test_cli_runner().invoke(args=["reconcile-postal-codes"])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(f"Station {self.station_ids[1]}: 10115 -> 10117", result.output)
+        self.assertIn("1 mismatched", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
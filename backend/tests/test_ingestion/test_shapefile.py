@@ -0,0 +1,169 @@
+import csv
+import os
+import struct
+import tempfile
+import unittest
+
+from app import create_app
+from app.config import TestingConfig
+from app.domain.entities.district import District
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.ingestion.district_loader import MAX_FIELD_SIZE
+from app.infrastructure.ingestion.ingestion_stats import IngestionStats
+from app.infrastructure.ingestion.postal_code_rows import read_postal_code_file
+from app.infrastructure.ingestion.shapefile import ShapefileError, ShapefileReader
+
+
+def read_geodata_csv(file_path: str) -> dict[str, str]:
+    csv.field_size_limit(max(csv.field_size_limit(), MAX_FIELD_SIZE))
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile, delimiter=";")
+        next(reader)
+        return {row[0]: row[1] for row in reader}
+
+
+def polygon_content(rings: list[list[tuple]]) -> bytes:
+    points = [point for ring in rings for point in ring]
+    starts, start = [], 0
+    for ring in rings:
+        starts.append(start)
+        start += len(ring)
+    content = struct.pack("<i4d2i", 5, 0, 0, 0, 0, len(rings), len(points))
+    content += struct.pack(f"<{len(rings)}i", *starts)
+    return content + b"".join(struct.pack("<2d", *point) for point in points)
+
+
+def write_shapefile(base: str, shapes: list[bytes], names: list[str]) -> None:
+    """
+    Write a polygon shapefile with one text field `NAME`.
+    """
+    records = b"".join(
+        struct.pack(">2i", number, len(content) // 2) + content
+        for number, content in enumerate(shapes, start=1)
+    )
+    header = struct.pack(">7i", 9994, 0, 0, 0, 0, 0, (100 + len(records)) // 2)
+    header += struct.pack("<2i4d", 1000, 5, 0, 0, 1, 1) + bytes(32)
+    with open(base + ".shp", "wb") as shp:
+        shp.write(header + records)
+
+    field = struct.pack("<11sc4xBB14x", b"NAME", b"C", 20, 0)
+    dbf_header = struct.pack(
+        "<4BIHH17xB2x", 3, 124, 1, 1, len(names), 32 + 32 + 1, 21, 0x57
+    )
+    with open(base + ".dbf", "wb") as dbf:
+        dbf.write(dbf_header + field + b"\r")
+        for name in names:
+            dbf.write(b" " + name.encode("cp1252").ljust(20))
+
+
+class TestShapefileReader(unittest.TestCase):
+    """
+    Tests for reading the bundled and synthetic shapefiles.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_postal_codes_match_csv(self):
+        """
+        Test that the shapefile holds the same postal codes and polygons as the CSV file.
+        """
+        polygons = read_geodata_csv(TestingConfig.POSTAL_CODE_CSV)
+        stats = IngestionStats("postal codes")
+
+        rows = list(read_postal_code_file(TestingConfig.POSTAL_CODE_SHAPEFILE, stats))
+
+        self.assertEqual(len(rows), 190)
+        self.assertEqual(stats.rows_rejected, 0)
+        for values in rows:
+            self.assertEqual(values["polygon"], polygons[str(values["number"])])
+
+    def test_districts(self):
+        """
+        Test the cp1252 attributes, multipolygons and random access by index.
+        """
+        with ShapefileReader(TestingConfig.DISTRICT_SHAPEFILE) as reader:
+            self.assertEqual(len(reader), 12)
+            self.assertEqual(reader.encoding, "cp1252")
+            records = {record.attributes["Gemeinde_n"]: record for record in reader}
+            pankow = records["Pankow"]
+            self.assertEqual(reader.shape(pankow.index), pankow.polygons)
+
+        self.assertEqual(
+            set(records), set(read_geodata_csv(TestingConfig.DISTRICT_CSV))
+        )
+        self.assertIn("Treptow-Köpenick", records)
+        self.assertGreater(len(pankow.polygons), 1)
+
+    def test_holes_and_null_shapes(self):
+        """
+        Test that holes are grouped with their exterior and null shapes are empty.
+        """
+        base = os.path.join(self.tmp_dir.name, "synthetic")
+        exterior = [(0, 0), (0, 4), (4, 4), (4, 0), (0, 0)]  # clockwise
+        hole = [(1, 1), (2, 1), (2, 2), (1, 1)]
+        second = [(5, 5), (5, 6), (6, 6), (5, 5)]
+        write_shapefile(
+            base,
+            [polygon_content([exterior, hole, second]), struct.pack("<i", 0)],
+            ["Köpenick", "leer"],
+        )
+
+        with ShapefileReader(base + ".shp") as reader:
+            first, empty = list(reader)
+
+        self.assertEqual(first.attributes, {"NAME": "Köpenick"})
+        self.assertEqual([len(rings) for rings in first.polygons], [2, 1])
+        self.assertEqual(first.polygons[0][1].tolist(), [1, 1, 2, 1, 2, 2, 1, 1])
+        self.assertEqual(empty.polygons, [])
+
+    def test_invalid_files(self):
+        """
+        Test that other files raise ShapefileError and missing files FileNotFoundError.
+        """
+        base = os.path.join(self.tmp_dir.name, "broken")
+        with open(base + ".shp", "wb") as shp:
+            shp.write(b"not a shapefile")
+        with open(base + ".dbf", "wb") as dbf:
+            dbf.write(bytes(64))
+
+        with self.assertRaises(ShapefileError):
+            ShapefileReader(base + ".shp")
+        with self.assertRaises(FileNotFoundError):
+            ShapefileReader(os.path.join(self.tmp_dir.name, "missing.shp"))
+
+
+class ShapefileTestingConfig(TestingConfig):
+    """
+    Testing configuration loading the geodata from the shapefiles.
+    """
+
+    GEODATA_SOURCE = "shapefile"
+
+
+class TestShapefileSource(unittest.TestCase):
+    """
+    Integration test for loading postal codes and districts from the shapefiles.
+    """
+
+    def test_create_app_loads_shapefiles(self):
+        """
+        Test that create_app loads and assigns the geodata from the shapefiles.
+        """
+        app = create_app(config_class=ShapefileTestingConfig)
+        with app.app_context():
+            self.assertEqual(PostalCode.query.count(), 190)
+            self.assertEqual(District.query.count(), 12)
+            self.assertEqual(
+                PostalCode.query.filter(PostalCode.district_id.is_(None)).count(), 0
+            )
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
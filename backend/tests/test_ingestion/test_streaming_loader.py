@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.entities.postal_code import PostalCode
+from app.domain.entities.templates.base import db
+from app.infrastructure.database_operations.ingestion_checkpoint_operations import (
+    IngestionCheckpointOperations,
+)
+from app.infrastructure.ingestion.csv_chunks import CsvChunkReader, file_sha256
+from app.infrastructure.ingestion.diff_import import diff_import_charging_stations
+from app.infrastructure.ingestion.streaming_loader import (
+    CHARGING_STATIONS_DATASET,
+    POSTAL_CODES_DATASET,
+    StaleImportError,
+    stream_load_charging_stations,
+    stream_load_postal_codes,
+)
+from tests.test_ingestion.register_csv import make_register_row, write_register_csv
+
+
+class TestStreamingLoader(unittest.TestCase):
+    """
+    Integration tests for the chunked loaders with checkpoints.
+    """
+
+    def setUp(self):
+        """
+        Set up a test app with postal codes and a small register file.
+        """
+        self.app = create_app(config_class="app.config.TestingConfig")
+        self.app.testing = True
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, "register.csv")
+        write_register_csv(self.csv_path, [make_register_row(i) for i in range(20)])
+
+    def tearDown(self):
+        """
+        Tear down the test database and the register file.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        self.tmp_dir.cleanup()
+
+    def test_stream_load_records_checkpoint(self):
+        """
+        Test that every row is loaded and the checkpoint is completed.
+        """
+        with self.app.app_context():
+            stats = stream_load_charging_stations(self.app, self.csv_path, chunk_size=6)
+            self.assertEqual(stats.rows_inserted, 20)
+            self.assertEqual(ChargingStation.query.count(), 20)
+
+            with IngestionCheckpointOperations() as repository:
+                checkpoint = repository.get_checkpoint(CHARGING_STATIONS_DATASET)
+                self.assertTrue(checkpoint.completed)
+                self.assertEqual(checkpoint.rows_committed, 20)
+                self.assertEqual(checkpoint.byte_offset, os.path.getsize(self.csv_path))
+
+            # A second run with the same file continues at the end of the file
+            stats = stream_load_charging_stations(self.app, self.csv_path, chunk_size=6)
+            self.assertEqual(stats.rows_read, 0)
+            self.assertEqual(ChargingStation.query.count(), 20)
+
+    def test_resume_interrupted_import(self):
+        """
+        Test that an interrupted import continues behind the last chunk.
+        """
+        rows, offset = next(CsvChunkReader(self.csv_path, 8).chunks())
+        with self.app.app_context():
+            with IngestionCheckpointOperations() as repository:
+                repository.save_checkpoint(
+                    CHARGING_STATIONS_DATASET,
+                    file_sha256(self.csv_path),
+                    offset,
+                    len(rows),
+                )
+                repository.session.commit()
+
+            stats = stream_load_charging_stations(self.app, self.csv_path, chunk_size=5)
+            self.assertEqual(stats.rows_read, 12)
+            self.assertEqual(ChargingStation.query.count(), 12)
+            self.assertEqual(
+                ChargingStation.query.order_by(ChargingStation.id).first().street,
+                "Teststraße 8",
+            )
+
+    def test_changed_dataset_restarts(self):
+        """
+        Test that a checkpoint of another file version is not resumed.
+        """
+        with self.app.app_context():
+            with IngestionCheckpointOperations() as repository:
+                repository.save_checkpoint(
+                    CHARGING_STATIONS_DATASET, "0" * 64, 500, 10, completed=True
+                )
+                repository.session.commit()
+
+            stats = stream_load_charging_stations(self.app, self.csv_path, chunk_size=6)
+            self.assertEqual(stats.rows_read, 20)
+
+    def test_changed_dataset_after_partial_import(self):
+        """
+        Test that a file changed after a partial import is refused instead of
+        stored twice, and continued behind its end after a diff import.
+        """
+        rows, offset = next(CsvChunkReader(self.csv_path, 8).chunks())
+        first_chunk_path = os.path.join(self.tmp_dir.name, "first_chunk.csv")
+        write_register_csv(first_chunk_path, [make_register_row(i) for i in range(8)])
+        with self.app.app_context():
+            # The state of an import of the file interrupted after its first chunk
+            stream_load_charging_stations(self.app, first_chunk_path, chunk_size=8)
+            with IngestionCheckpointOperations() as repository:
+                repository.save_checkpoint(
+                    CHARGING_STATIONS_DATASET,
+                    file_sha256(self.csv_path),
+                    offset,
+                    len(rows),
+                )
+                repository.session.commit()
+
+            write_register_csv(self.csv_path, [make_register_row(i) for i in range(25)])
+            with self.assertRaises(StaleImportError) as context:
+                stream_load_charging_stations(self.app, self.csv_path, chunk_size=8)
+            self.assertIn("flask diff-import", str(context.exception))
+            self.assertEqual(ChargingStation.query.count(), 8)
+
+            diff = diff_import_charging_stations(self.app, self.csv_path)
+            self.assertEqual((len(diff.inserts), diff.unchanged), (17, 8))
+            stats = stream_load_charging_stations(self.app, self.csv_path, chunk_size=8)
+            self.assertEqual(stats.rows_read, 0)
+            self.assertEqual(ChargingStation.query.count(), 25)
+
+    def test_stream_load_postal_codes_skips_existing(self):
+        """
+        Test that already stored postal codes are not inserted again.
+        """
+        with self.app.app_context():
+            # Invalidate the checkpoint written while the app was created
+            with IngestionCheckpointOperations() as repository:
+                repository.save_checkpoint(POSTAL_CODES_DATASET, "0" * 64, 0, 0)
+                repository.session.commit()
+
+            stats = stream_load_postal_codes(
+                self.app, self.app.config["POSTAL_CODE_CSV"], chunk_size=50
+            )
+            self.assertEqual(stats.rows_read, 190)
+            self.assertEqual(stats.rows_inserted, 0)
+            self.assertEqual(
+                stats.reject_reasons["postal code already in database"], 190
+            )
+            self.assertEqual(PostalCode.query.count(), 190)
+
+
+if __name__ == "__main__":
+    unittest.main()
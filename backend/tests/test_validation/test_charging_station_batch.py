@@ -0,0 +1,129 @@
+import math
+import unittest
+
+from app.domain.entities.charging_station import ChargingStation
+from app.domain.validation.charging_station_batch import (
+    REASON_LATITUDE,
+    REASON_NOMINAL_POWER,
+    REASON_OPERATOR,
+    REASONS,
+    validate_station_rows,
+)
+
+
+def station(**overrides) -> dict:
+    values = {
+        "latitude": 52.52,
+        "longitude": 13.405,
+        "nominal_power": 22.0,
+        "num_charging_points": 2,
+        "operator": "Operator",
+        "address_suffix": "",
+    }
+    values.update(overrides)
+    return values
+
+
+def scalar_reason(values: dict):
+    """
+    First rule of ChargingStation.__init__ the values fail, None if valid.
+    """
+    rules = (
+        ChargingStation.is_valid_latitude(values["latitude"]),
+        ChargingStation.is_valid_longitude(values["longitude"]),
+        ChargingStation.is_valid_nominal_power(values["nominal_power"]),
+        ChargingStation.is_valid_num_charging_points(values["num_charging_points"]),
+        ChargingStation.is_valid_operator(values["operator"]),
+        ChargingStation.is_valid_address_suffix(values["address_suffix"]),
+    )
+    return next((REASONS[i] for i, valid in enumerate(rules) if not valid), None)
+
+
+class TestValidateStationRows(unittest.TestCase):
+    """
+    Unit tests for the batch validation of charging stations.
+    """
+
+    def test_clean_batch(self):
+        """
+        Test that a valid batch has an empty mask and report.
+        """
+        rows = [station(latitude=52 + i / 1000) for i in range(100)]
+
+        report = validate_station_rows(rows)
+
+        self.assertEqual(report.mask, bytes(100))
+        self.assertEqual(report.rows_rejected, 0)
+        self.assertEqual(report.reason_counts, {})
+        self.assertEqual(report.accepted(rows), rows)
+
+    def test_same_result_as_scalar_rules(self):
+        """
+        Test that every row gets the first reason of the single-row rules.
+        """
+        rows = [
+            station(),
+            station(latitude=90.0, longitude=-180),
+            station(latitude=-90.5),
+            station(latitude=math.nan),
+            station(longitude=180.1),
+            station(longitude=math.inf),
+            station(nominal_power=None),
+            station(nominal_power=0),
+            station(nominal_power=-1.5),
+            station(nominal_power=math.nan),
+            station(nominal_power=math.inf),
+            station(num_charging_points=None),
+            station(num_charging_points=2.0),
+            station(num_charging_points=0),
+            station(num_charging_points=True),
+            station(operator=None),
+            station(operator=" \t"),
+            station(operator=7),
+            station(address_suffix=None),
+            station(address_suffix=3),
+            station(latitude=100, nominal_power=None, operator=""),
+            station(nominal_power=None, operator=""),
+        ]
+
+        report = validate_station_rows(rows)
+
+        expected = [scalar_reason(values) for values in rows]
+        self.assertEqual([report.reason(i) for i in range(len(rows))], expected)
+        self.assertEqual(report.mask, bytes(reason is not None for reason in expected))
+        self.assertEqual(
+            report.rows_rejected, sum(reason is not None for reason in expected)
+        )
+
+    def test_reason_counts_and_accepted(self):
+        """
+        Test that every rejected row is counted once with its first failing rule.
+        """
+        rows = [
+            station(),
+            station(latitude=100, nominal_power=None),
+            station(nominal_power=None, operator=" "),
+            station(operator=""),
+            station(),
+        ]
+
+        report = validate_station_rows(rows)
+
+        self.assertEqual(
+            report.reason_counts,
+            {REASON_LATITUDE: 1, REASON_NOMINAL_POWER: 1, REASON_OPERATOR: 1},
+        )
+        self.assertEqual(report.accepted(rows), [rows[0], rows[4]])
+
+    def test_empty_batch(self):
+        """
+        Test that an empty batch is valid.
+        """
+        report = validate_station_rows([])
+
+        self.assertEqual(report.size, 0)
+        self.assertEqual(report.mask, b"")
+
+
+if __name__ == "__main__":
+    unittest.main()